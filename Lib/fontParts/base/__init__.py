@@ -15,3 +15,4 @@ from fontParts.base.component import BaseComponent
 from fontParts.base.anchor import BaseAnchor
 from fontParts.base.guideline import BaseGuideline
 from fontParts.base.image import BaseImage
+from fontParts.base.imageReference import ImageReference
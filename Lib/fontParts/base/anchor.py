@@ -396,6 +396,7 @@ class BaseAnchor(BaseObject, TransformationMixin, DeprecatedAnchor):
         * x
         * y
         """
+        self._willChange()
         self._round()
 
     def _round(self):
@@ -3,6 +3,7 @@ from copy import deepcopy
 from fontTools.misc import transform
 from fontParts.base.errors import FontPartsError
 from fontParts.base import normalizers
+from fontParts.base.transaction import openTransactions, willChange, UndoHistory
 
 
 # ------------
@@ -108,6 +109,48 @@ class BaseObject(object):
             >>> obj.changed()
         """
 
+    def holdChanges(self):
+        """
+        Return a context manager that holds the change
+        notifications of the object, and of the font that
+        it belongs to, until the block ends. The held
+        notifications are sent once, so anything that
+        observes the object is updated once instead of
+        after every change.
+
+            >>> with font.holdChanges():
+            ...     for glyph in font:
+            ...         glyph.moveBy((10, 0))
+
+        Blocks may be nested. The notifications are sent
+        when the outermost block ends. Only the change
+        notifications are held. The object stays up to
+        date inside of the block, so glyphs can be added,
+        renamed and measured as usual.
+        """
+        return _HeldChanges(self)
+
+    def _holdChanges(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseObject.holdChanges`. It is called
+        when the block begins.
+
+        Subclasses may override this method.
+        """
+        pass
+
+    def _releaseHeldChanges(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseObject.holdChanges`. It is called
+        when the block ends, even if the block raised
+        an exception.
+
+        Subclasses may override this method.
+        """
+        pass
+
     def naked(self):
         """
         Return the environment's native object
@@ -117,6 +160,47 @@ class BaseObject(object):
         """
         self.raiseNotImplementedError()
 
+    def _willChange(self, attr=None, value=None):
+        """
+        Tell the open font transactions that the
+        object is about to change. The methods that
+        change the object call this before the change.
+        """
+        if openTransactions:
+            willChange(self, attr, value)
+
+    def _getGlyphLocation(self):
+        """
+        Get the font, the layer name and the glyph name
+        of the glyph that the object belongs to as a tuple,
+        or None if the object does not belong to a glyph
+        in a font. Font transactions use this to find the
+        glyph that a changed object is part of. The parents
+        of the object may no longer be available, so the
+        environment should find the glyph through its own
+        objects.
+
+        Subclasses may override this method.
+        """
+        glyph = getattr(self, "glyph", None)
+        if glyph is None:
+            return None
+        return glyph._getGlyphLocation()
+
+
+class _HeldChanges(object):
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __enter__(self):
+        self._obj._holdChanges()
+        return self._obj
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._obj._releaseHeldChanges()
+        return False
+
 
 class BaseDict(BaseObject):
 
@@ -194,6 +278,7 @@ class BaseDict(BaseObject):
             key = self.keyNormalizer.__func__(key)
         if self.valueNormalizer is not None:
             value = self.valueNormalizer.__func__(value)
+        self._willChange()
         self._setItem(key, value)
 
     def _setItem(self, key, value):
@@ -231,6 +316,7 @@ class BaseDict(BaseObject):
     def __delitem__(self, key):
         if self.keyNormalizer is not None:
             key = self.keyNormalizer.__func__(key)
+        self._willChange()
         self._delItem(key)
 
     def _delItem(self, key):
@@ -244,6 +330,7 @@ class BaseDict(BaseObject):
             key = self.keyNormalizer.__func__(key)
         if default is not None and self.valueNormalizer is not None:
             default = self.valueNormalizer.__func__(default)
+        self._willChange()
         return self._pop(key, default=default)
 
     def _pop(self, key, default=None):
@@ -270,14 +357,15 @@ class BaseDict(BaseObject):
             keys = keys[1:]
 
     def update(self, other):
-        other = deepcopy(other)
+        other = deepcopy(dict(other))
         if self.keyNormalizer is not None and self.valueNormalizer is not None:
             d = {}
             for key, value in other.items():
                 key = self.keyNormalizer.__func__(key)
                 value = self.valueNormalizer.__func__(value)
                 d[key] = value
-            value = d
+            other = d
+        self._willChange()
         self._update(other)
 
     def _update(self, other):
@@ -288,6 +376,7 @@ class BaseDict(BaseObject):
             self[key] = value
 
     def clear(self):
+        self._willChange()
         self._clear()
 
     def _clear(self):
@@ -329,6 +418,7 @@ class TransformationMixin(object):
             ax, ay = t.transformPoint((bx, by))
             originOffset = (bx - ax, by - ay)
         # apply
+        self._willChange()
         self._transformBy(matrix, origin=origin, originOffset=originOffset)
 
     def _transformBy(self, matrix, origin=None, originOffset=None, **kwargs):
@@ -587,10 +677,270 @@ class dynamicProperty(object):
     def __set__(self, obj, value):
         setter = getattr(obj, self.setterName, None)
         if setter is not None:
+            if openTransactions:
+                willChange(obj, self.name, value)
             setter(value)
         else:
             raise FontPartsError("no setter for %r" % self.name)
 
 
+class TransactionMixin(object):
+
+    """
+    This class provides transactions with
+    undo and redo to BaseFont and BaseGlyph.
+    Subclasses must set **transactionClass**.
+    See :mod:`fontParts.base.transaction`.
+    """
+
+    transactionClass = None
+
+    # ------------
+    # Transactions
+    # ------------
+
+    def transaction(self, name):
+        """
+        Return a context manager that records the
+        changes made to the object in the block.
+
+            >>> with glyph.transaction("Move"):
+            ...     glyph.moveBy((10, 0))
+
+        **name** must be a :ref:`type-string`. Only the
+        values that change are kept, so a transaction
+        uses little memory. If the block raises an
+        exception the changes made in the block are
+        undone and the exception is raised. Blocks may
+        be nested. Only the outermost block is added
+        to the undo history.
+        """
+        name = normalizers.normalizeTransactionName(name)
+        return _Transaction(self, name)
+
+    def _beginTransaction(self, name):
+        """
+        This is the environment implementation of
+        :meth:`BaseObject.transaction`. It is called
+        when the block begins. **name** will be a
+        :ref:`type-string`. It will have been normalized
+        with :func:`normalizers.normalizeTransactionName`.
+
+        Subclasses may override this method.
+        """
+        history = self._getUndoHistory()
+        transaction = self.transactionClass(self)
+        transaction.begin()
+        history.openTransactions.append((name, transaction))
+
+    def _endTransaction(self, rollBack):
+        """
+        This is the environment implementation of
+        :meth:`BaseObject.transaction`. It is called
+        when the block ends. **rollBack** will be
+        ``True`` if the block raised an exception.
+
+        Subclasses may override this method.
+        """
+        history = self._getUndoHistory()
+        name, transaction = history.openTransactions.pop()
+        changes = transaction.end()
+        if not changes:
+            return
+        if rollBack:
+            self.transactionClass.apply(self, changes, 0)
+        elif not history.openTransactions:
+            history.add(name, changes)
+
+    def _getUndoHistory(self):
+        """
+        Get the :class:`fontParts.base.transaction.UndoHistory`
+        of the object. It must be the same for every object
+        that represents the same font or glyph.
+
+        Subclasses may override this method.
+        """
+        history = getattr(self, "_undoHistory", None)
+        if history is None:
+            history = self._undoHistory = UndoHistory()
+        return history
+
+    # ---------
+    # Undo/Redo
+    # ---------
+
+    def undo(self):
+        """
+        Undo the last transaction.
+
+            >>> glyph.undo()
+            u'Move'
+
+        The name of the transaction is returned.
+        ``None`` is returned if there is nothing
+        to undo.
+        """
+        return self._undo()
+
+    def _undo(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseObject.undo`.
+
+        Subclasses may override this method.
+        """
+        return self._applyHistory(0)
+
+    def redo(self):
+        """
+        Redo the last undone transaction.
+
+            >>> glyph.redo()
+            u'Move'
+
+        The name of the transaction is returned.
+        ``None`` is returned if there is nothing
+        to redo.
+        """
+        return self._redo()
+
+    def _redo(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseObject.redo`.
+
+        Subclasses may override this method.
+        """
+        return self._applyHistory(1)
+
+    def _applyHistory(self, index):
+        history = self._getUndoHistory()
+        if history.openTransactions:
+            raise FontPartsError("Transactions can not be undone or redone in a transaction.")
+        if index == 0:
+            source, destination = history.undoStack, history.redoStack
+        else:
+            source, destination = history.redoStack, history.undoStack
+        if not source:
+            return None
+        item = source.pop()
+        self.transactionClass.apply(self, item[1], index)
+        destination.append(item)
+        return item[0]
+
+    def canUndo(self):
+        """
+        Return a ``bool`` indicating if there
+        is a transaction that can be undone.
+
+            >>> glyph.canUndo()
+            True
+        """
+        return self._canUndo()
+
+    def _canUndo(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseObject.canUndo`.
+
+        Subclasses may override this method.
+        """
+        return bool(self._getUndoHistory().undoStack)
+
+    def canRedo(self):
+        """
+        Return a ``bool`` indicating if there
+        is a transaction that can be redone.
+
+            >>> glyph.canRedo()
+            False
+        """
+        return self._canRedo()
+
+    def _canRedo(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseObject.canRedo`.
+
+        Subclasses may override this method.
+        """
+        return bool(self._getUndoHistory().redoStack)
+
+    def clearUndoHistory(self):
+        """
+        Remove all transactions from the undo history.
+
+            >>> font.clearUndoHistory()
+        """
+        self._clearUndoHistory()
+
+    def _clearUndoHistory(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseObject.clearUndoHistory`.
+
+        Subclasses may override this method.
+        """
+        self._getUndoHistory().clear()
+
+    undoSizeLimit = dynamicProperty(
+        "base_undoSizeLimit",
+        """
+        The approximate size in bytes that the undo
+        history may use. The oldest transactions are
+        dropped when the history is larger. ::
+
+            >>> font.undoSizeLimit = 1000000
+        """
+    )
+
+    def _get_base_undoSizeLimit(self):
+        value = self._get_undoSizeLimit()
+        value = normalizers.normalizeUndoSizeLimit(value)
+        return value
+
+    def _set_base_undoSizeLimit(self, value):
+        value = normalizers.normalizeUndoSizeLimit(value)
+        self._set_undoSizeLimit(value)
+
+    def _get_undoSizeLimit(self):
+        """
+        This is the environment implementation of
+        :attr:`BaseObject.undoSizeLimit`. This must
+        return an ``int``.
+
+        Subclasses may override this method.
+        """
+        return self._getUndoHistory().sizeLimit
+
+    def _set_undoSizeLimit(self, value):
+        """
+        This is the environment implementation of
+        :attr:`BaseObject.undoSizeLimit`. **value**
+        will be an ``int``. It will have been normalized
+        with :func:`normalizers.normalizeUndoSizeLimit`.
+
+        Subclasses may override this method.
+        """
+        history = self._getUndoHistory()
+        history.sizeLimit = value
+        history.trim()
+
+
+class _Transaction(object):
+
+    def __init__(self, obj, name):
+        self._obj = obj
+        self._name = name
+
+    def __enter__(self):
+        self._obj._beginTransaction(self._name)
+        return self._obj
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._obj._endTransaction(exc_type is not None)
+        return False
+
+
 def interpolate(a, b, v):
     return a + (b - a) * v
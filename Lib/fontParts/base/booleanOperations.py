@@ -0,0 +1,636 @@
+"""
+Boolean operations on outlines.
+
+The operations work on contours given as lists of
+``(x, y, segmentType)`` tuples, as collected by
+:class:`fontParts.base.geometry.ContourPointsPen`,
+and return new contours in the same form. Open
+contours are ignored.
+
+    >>> from fontParts.base.geometry import ContourPointsPen
+    >>> pen = ContourPointsPen()
+    >>> glyph.drawPoints(pen)
+    >>> contours = union(pen.contours)
+    >>> drawContours(contours, otherGlyph.getPointPen())
+
+The contours are flattened to polygons and all edge
+intersections are found with a sweep over the edges
+sorted by their minimum x. After the edges have been
+split at the intersections a second sweep determines
+the winding numbers on both sides of every edge, which
+decides which edges are part of the result. Curves are
+restored from the curves that the edges were flattened
+from, so curves that are not cut keep their original
+control points.
+"""
+
+import math
+from heapq import heappush, heappop
+from fontParts.base.errors import FontPartsError
+from fontParts.base import geometry
+
+# edge coordinates are snapped to this grid so
+# that edges flattened from the same curve in
+# different contours line up exactly.
+_snapGrid = 1024.0
+_tolerance = 1.0 / _snapGrid
+_fillRules = ("nonZero", "evenOdd")
+
+
+def _snap(x, y):
+    return (round(x * _snapGrid) / _snapGrid, round(y * _snapGrid) / _snapGrid)
+
+# ----------
+# Operations
+# ----------
+
+
+def union(contours, fillRule="nonZero"):
+    """
+    Combine **contours** into contours without overlaps.
+    This is a remove overlap operation. If there are no
+    overlaps the given list is returned.
+
+    **fillRule** may be ``"nonZero"`` or ``"evenOdd"``.
+    """
+    return _performOperation("union", contours, [], fillRule)
+
+
+def difference(subjectContours, clipContours, fillRule="nonZero"):
+    """
+    Subtract **clipContours** from **subjectContours**.
+    """
+    return _performOperation("difference", subjectContours, clipContours, fillRule)
+
+
+def intersection(subjectContours, clipContours, fillRule="nonZero"):
+    """
+    Get the areas covered by both
+    **subjectContours** and **clipContours**.
+    """
+    return _performOperation("intersection", subjectContours, clipContours, fillRule)
+
+
+def xor(subjectContours, clipContours, fillRule="nonZero"):
+    """
+    Get the areas covered by either
+    **subjectContours** or **clipContours**,
+    but not by both.
+    """
+    return _performOperation("xor", subjectContours, clipContours, fillRule)
+
+
+def _performOperation(operation, subjectContours, clipContours, fillRule):
+    if fillRule not in _fillRules:
+        raise FontPartsError("Unknown fill rule: %s." % fillRule)
+    segments = []
+    edges = []
+    contourIndex = 0
+    for operand, contours in enumerate((subjectContours, clipContours)):
+        for points in contours:
+            if not points or geometry.isOpen(points):
+                continue
+            _flattenContour(points, operand, contourIndex, segments, edges)
+            contourIndex += 1
+    splitEdges, didSplit = _splitEdges(edges)
+    if operation == "union" and not didSplit and not _hasNestedBounds(edges) and not _hasCoincidentEdges(edges):
+        # nothing overlaps, the contours are the result.
+        return subjectContours
+    mergedEdges = _mergeEdges(splitEdges)
+    _calculateWinding(mergedEdges)
+    if fillRule == "nonZero":
+        fill = _fillNonZero
+    else:
+        fill = _fillEvenOdd
+    test = _operations[operation]
+    directedEdges = []
+    for edge in mergedEdges:
+        insideBelow = test(fill(edge.below[0]), fill(edge.below[1]))
+        insideAbove = test(fill(edge.above[0]), fill(edge.above[1]))
+        if insideBelow == insideAbove:
+            continue
+        # the inside of the result must be on the left
+        directedEdges.append((edge, not insideAbove))
+    loops = _traceLoops(directedEdges)
+    return [_loopToContour(loop, segments) for loop in loops]
+
+
+def _fillNonZero(winding):
+    return winding != 0
+
+
+def _fillEvenOdd(winding):
+    return winding % 2 == 1
+
+
+_operations = dict(
+    union=lambda a, b: a or b,
+    difference=lambda a, b: a and not b,
+    intersection=lambda a, b: a and b,
+    xor=lambda a, b: a != b
+)
+
+# ----------
+# Flattening
+# ----------
+
+
+class _Edge(object):
+
+    __slots__ = (
+        "start", "end", "operand", "contour", "segment", "startT", "endT",
+        "contributions", "below", "above"
+    )
+
+    def __init__(self, start, end, operand, contour, segment, startT, endT):
+        self.start = start
+        self.end = end
+        self.operand = operand
+        self.contour = contour
+        self.segment = segment
+        self.startT = startT
+        self.endT = endT
+        self.contributions = None
+        self.below = None
+        self.above = None
+
+
+def _curveSteps(segment):
+    length = 0
+    for i in range(len(segment) - 1):
+        (x0, y0), (x1, y1) = segment[i], segment[i + 1]
+        length += math.hypot(x1 - x0, y1 - y0)
+    return max(2, min(64, int(math.sqrt(length))))
+
+
+def _flattenContour(points, operand, contour, segments, edges):
+    for segment in geometry.contourSegments(points):
+        segmentIndex = len(segments)
+        segments.append(segment)
+        if len(segment) == 2:
+            samples = [(0.0, segment[0]), (1.0, segment[1])]
+        else:
+            steps = _curveSteps(segment)
+            polygon = geometry.flattenSegments([segment], steps)
+            samples = [(0.0, segment[0])]
+            for i, point in enumerate(polygon):
+                samples.append(((i + 1) / float(steps), point))
+        previousT, previous = samples[0]
+        previous = _snap(*previous)
+        for t, point in samples[1:]:
+            point = _snap(*point)
+            if point != previous:
+                edges.append(_Edge(previous, point, operand, contour, segmentIndex, previousT, t))
+            previous = point
+            previousT = t
+
+# -------------
+# Intersections
+# -------------
+
+
+def _splitEdges(edges):
+    """
+    Find the intersections of all edges and split
+    the edges at them. Only edges with overlapping
+    x ranges are tested against each other.
+    """
+    splits = [[] for edge in edges]
+    order = sorted(range(len(edges)), key=lambda i: min(edges[i].start[0], edges[i].end[0]))
+    heap = []
+    active = set()
+    for index in order:
+        edge = edges[index]
+        (x0, y0), (x1, y1) = edge.start, edge.end
+        xMin = min(x0, x1)
+        while heap and heap[0][0] < xMin - _tolerance:
+            active.discard(heappop(heap)[1])
+        yMin = min(y0, y1) - _tolerance
+        yMax = max(y0, y1) + _tolerance
+        for otherIndex in active:
+            other = edges[otherIndex]
+            oy0 = other.start[1]
+            oy1 = other.end[1]
+            if (oy0 < yMin and oy1 < yMin) or (oy0 > yMax and oy1 > yMax):
+                continue
+            _intersectEdges(edge, other, splits[index], splits[otherIndex])
+        active.add(index)
+        heappush(heap, (max(x0, x1), index))
+    didSplit = False
+    result = []
+    for edge, edgeSplits in zip(edges, splits):
+        if not edgeSplits:
+            result.append(edge)
+            continue
+        didSplit = True
+        edgeSplits.sort()
+        previous = edge.start
+        previousT = edge.startT
+        tDelta = edge.endT - edge.startT
+        for u, point in edgeSplits + [(1.0, edge.end)]:
+            if point == previous:
+                continue
+            t = edge.startT + u * tDelta
+            if point == edge.end:
+                t = edge.endT
+            result.append(_Edge(previous, point, edge.operand, edge.contour, edge.segment, previousT, t))
+            previous = point
+            previousT = t
+    return result, didSplit
+
+
+def _pointOnEdge(point, start, end, lengthSquared):
+    # get the parameter of point on the edge if
+    # it is within the tolerance of the edge.
+    px, py = point
+    x0, y0 = start
+    dx = end[0] - x0
+    dy = end[1] - y0
+    u = ((px - x0) * dx + (py - y0) * dy) / lengthSquared
+    if u <= 0 or u >= 1:
+        return None
+    distance = abs((px - x0) * dy - (py - y0) * dx) / math.sqrt(lengthSquared)
+    if distance > _tolerance:
+        return None
+    return u
+
+
+def _intersectEdges(edge, other, edgeSplits, otherSplits):
+    (ax0, ay0), (ax1, ay1) = edge.start, edge.end
+    (bx0, by0), (bx1, by1) = other.start, other.end
+    adx = ax1 - ax0
+    ady = ay1 - ay0
+    bdx = bx1 - bx0
+    bdy = by1 - by0
+    aLength = adx * adx + ady * ady
+    bLength = bdx * bdx + bdy * bdy
+    # end points touching the other edge
+    touched = False
+    for point in (other.start, other.end):
+        if point == edge.start or point == edge.end:
+            touched = True
+            continue
+        u = _pointOnEdge(point, edge.start, edge.end, aLength)
+        if u is not None:
+            edgeSplits.append((u, point))
+            touched = True
+    for point in (edge.start, edge.end):
+        if point == other.start or point == other.end:
+            touched = True
+            continue
+        u = _pointOnEdge(point, other.start, other.end, bLength)
+        if u is not None:
+            otherSplits.append((u, point))
+            touched = True
+    if touched:
+        return
+    # crossing edges
+    denominator = adx * bdy - ady * bdx
+    if denominator == 0:
+        return
+    ox = bx0 - ax0
+    oy = by0 - ay0
+    s = (ox * bdy - oy * bdx) / denominator
+    t = (ox * ady - oy * adx) / denominator
+    if s <= 0 or s >= 1 or t <= 0 or t >= 1:
+        return
+    point = _snap(ax0 + s * adx, ay0 + s * ady)
+    if point != edge.start and point != edge.end:
+        edgeSplits.append((s, point))
+    if point != other.start and point != other.end:
+        otherSplits.append((t, point))
+
+
+def _hasNestedBounds(edges):
+    bounds = {}
+    for edge in edges:
+        (x0, y0), (x1, y1) = edge.start, edge.end
+        contourBounds = bounds.get(edge.contour)
+        if contourBounds is None:
+            bounds[edge.contour] = [min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)]
+        else:
+            contourBounds[0] = min(contourBounds[0], x0, x1)
+            contourBounds[1] = min(contourBounds[1], y0, y1)
+            contourBounds[2] = max(contourBounds[2], x0, x1)
+            contourBounds[3] = max(contourBounds[3], y0, y1)
+    bounds = sorted(bounds.values())
+    for index, (xMin, yMin, xMax, yMax) in enumerate(bounds):
+        for otherXMin, otherYMin, otherXMax, otherYMax in bounds[:index]:
+            if otherXMax >= xMax and otherYMin <= yMin and otherYMax >= yMax:
+                return True
+    return False
+
+
+def _hasCoincidentEdges(edges):
+    keys = set()
+    for edge in edges:
+        start = edge.start
+        end = edge.end
+        if end < start:
+            start, end = end, start
+        key = (start, end)
+        if key in keys:
+            return True
+        keys.add(key)
+    return False
+
+# -------
+# Merging
+# -------
+
+
+def _mergeEdges(edges):
+    """
+    Merge coincident edges and orient all edges from
+    left to right, or upwards for vertical edges. The
+    contributions of the merged edges to the winding
+    numbers of each operand are summed.
+    """
+    merged = {}
+    for edge in edges:
+        start = edge.start
+        end = edge.end
+        if start < end:
+            direction = 1
+        else:
+            direction = -1
+            edge.start, edge.end = end, start
+            edge.startT, edge.endT = edge.endT, edge.startT
+        key = (edge.start, edge.end)
+        existing = merged.get(key)
+        if existing is None:
+            edge.contributions = [0, 0]
+            edge.contributions[edge.operand] = direction
+            merged[key] = edge
+        else:
+            existing.contributions[edge.operand] += direction
+    return list(merged.values())
+
+# -------
+# Winding
+# -------
+
+
+def _yAt(edge, x):
+    (x0, y0), (x1, y1) = edge.start, edge.end
+    if x <= x0:
+        return y0
+    if x >= x1:
+        return y1
+    return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+
+
+def _slope(edge):
+    (x0, y0), (x1, y1) = edge.start, edge.end
+    return (y1 - y0) / (x1 - x0)
+
+
+def _calculateWinding(edges):
+    """
+    Set the winding numbers of each operand below and
+    above all edges. The edges are swept from left to
+    right while a list of the edges crossing the sweep
+    line is kept sorted from bottom to top. The winding
+    numbers below an edge are the winding numbers above
+    the edge that is below it in this list. For vertical
+    edges the left side is stored as above and the right
+    side as below.
+    """
+    starts = {}
+    ends = {}
+    verticals = {}
+    for edge in edges:
+        x0 = edge.start[0]
+        x1 = edge.end[0]
+        if x0 == x1:
+            verticals.setdefault(x0, []).append(edge)
+        else:
+            starts.setdefault(x0, []).append(edge)
+            ends.setdefault(x1, []).append(edge)
+    xs = set(starts)
+    xs.update(ends)
+    xs.update(verticals)
+    active = []
+    for x in sorted(xs):
+        for edge in verticals.get(x, ()):
+            y = (edge.start[1] + edge.end[1]) * .5
+            low = 0
+            high = len(active)
+            while low < high:
+                middle = (low + high) // 2
+                if _yAt(active[middle], x) < y:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low:
+                left = active[low - 1].above
+            else:
+                left = (0, 0)
+            contributions = edge.contributions
+            edge.above = left
+            edge.below = (left[0] - contributions[0], left[1] - contributions[1])
+        for edge in ends.get(x, ()):
+            active.remove(edge)
+        newEdges = [(edge.start[1], _slope(edge), edge) for edge in starts.get(x, ())]
+        newEdges.sort(key=lambda item: item[:2])
+        for y, slope, edge in newEdges:
+            low = 0
+            high = len(active)
+            while low < high:
+                middle = (low + high) // 2
+                other = active[middle]
+                otherY = _yAt(other, x)
+                if otherY < y or (otherY == y and _slope(other) < slope):
+                    low = middle + 1
+                else:
+                    high = middle
+            if low:
+                below = active[low - 1].above
+            else:
+                below = (0, 0)
+            contributions = edge.contributions
+            edge.below = below
+            edge.above = (below[0] + contributions[0], below[1] + contributions[1])
+            active.insert(low, edge)
+
+# -----
+# Loops
+# -----
+
+
+def _traceLoops(directedEdges):
+    """
+    Connect the directed edges into closed loops. At
+    vertices with more than one outgoing edge the edge
+    that turns furthest to the left is followed. Loops
+    that pass through a vertex more than once are split
+    into separate loops at that vertex.
+    """
+    outgoing = {}
+    for item in directedEdges:
+        edge, reverse = item
+        if reverse:
+            start = edge.end
+        else:
+            start = edge.start
+        outgoing.setdefault(start, []).append(item)
+    used = set()
+    loops = []
+    for item in directedEdges:
+        if id(item) in used:
+            continue
+        loop = []
+        current = item
+        while current is not None and id(current) not in used:
+            used.add(id(current))
+            loop.append(current)
+            start, end = _directedPoints(current)
+            candidates = [
+                other for other in outgoing.get(end, ())
+                if id(other) not in used or other is item
+            ]
+            if not candidates:
+                current = None
+            elif len(candidates) == 1:
+                current = candidates[0]
+            else:
+                dx = end[0] - start[0]
+                dy = end[1] - start[1]
+                best = None
+                bestAngle = None
+                for other in candidates:
+                    otherStart, otherEnd = _directedPoints(other)
+                    ox = otherEnd[0] - otherStart[0]
+                    oy = otherEnd[1] - otherStart[1]
+                    angle = math.atan2(dx * oy - dy * ox, dx * ox + dy * oy)
+                    if bestAngle is None or angle > bestAngle:
+                        best = other
+                        bestAngle = angle
+                current = best
+        loops.extend(_splitLoop(loop))
+    return [loop for loop in loops if len(loop) > 1]
+
+
+def _directedPoints(item):
+    edge, reverse = item
+    if reverse:
+        return edge.end, edge.start
+    return edge.start, edge.end
+
+
+def _splitLoop(loop):
+    loops = []
+    stack = []
+    positions = {}
+    for item in loop:
+        start, end = _directedPoints(item)
+        if start in positions:
+            index = positions[start]
+            loops.append(stack[index:])
+            for other in stack[index:]:
+                del positions[_directedPoints(other)[0]]
+            del stack[index:]
+        positions[start] = len(stack)
+        stack.append(item)
+    if stack:
+        loops.append(stack)
+    return loops
+
+# --------------
+# Reconstruction
+# --------------
+
+
+def _splitBezier(points, t):
+    left = [points[0]]
+    right = [points[-1]]
+    while len(points) > 1:
+        points = [
+            (x0 + (x1 - x0) * t, y0 + (y1 - y0) * t)
+            for (x0, y0), (x1, y1) in zip(points[:-1], points[1:])
+        ]
+        left.append(points[0])
+        right.append(points[-1])
+    right.reverse()
+    return left, right
+
+
+def _segmentPart(segment, startT, endT):
+    if startT > endT:
+        part = _segmentPart(segment, endT, startT)
+        part.reverse()
+        return part
+    if startT == 0 and endT == 1:
+        return list(segment)
+    part = list(segment)
+    if endT < 1:
+        part = _splitBezier(part, endT)[0]
+    if startT > 0:
+        part = _splitBezier(part, startT / endT)[1]
+    return part
+
+
+def _number(value):
+    if value == int(value):
+        return int(value)
+    return value
+
+
+def _loopToContour(loop, segments):
+    """
+    Convert a loop of directed edges to a contour. Runs
+    of edges that were flattened from consecutive parts
+    of the same segment are converted back to one segment.
+    """
+    pieces = []
+    for item in loop:
+        edge, reverse = item
+        if reverse:
+            pieces.append((edge.end, edge.start, edge.segment, edge.endT, edge.startT))
+        else:
+            pieces.append((edge.start, edge.end, edge.segment, edge.startT, edge.endT))
+    # start at the beginning of a run
+    count = len(pieces)
+    for index in range(count):
+        previous = pieces[index - 1]
+        piece = pieces[index]
+        if previous[2] != piece[2] or previous[4] != piece[3]:
+            pieces = pieces[index:] + pieces[:index]
+            break
+    runs = []
+    for start, end, segmentIndex, startT, endT in pieces:
+        if runs:
+            run = runs[-1]
+            if run[2] == segmentIndex and run[4] == startT:
+                run[1] = end
+                run[4] = endT
+                continue
+        runs.append([start, end, segmentIndex, startT, endT])
+    points = []
+    for start, end, segmentIndex, startT, endT in runs:
+        segment = segments[segmentIndex]
+        x = _number(end[0])
+        y = _number(end[1])
+        if len(segment) == 2:
+            points.append((x, y, "line"))
+            continue
+        part = _segmentPart(segment, startT, endT)
+        for offCurve in part[1:-1]:
+            points.append((offCurve[0], offCurve[1], None))
+        if len(segment) == 4:
+            segmentType = "curve"
+        else:
+            segmentType = "qcurve"
+        points.append((x, y, segmentType))
+    return points
+
+
+def drawContours(contours, pointPen):
+    """
+    Draw **contours** into **pointPen**.
+    """
+    for points in contours:
+        pointPen.beginPath()
+        for x, y, segmentType in points:
+            pointPen.addPoint((x, y), segmentType=segmentType)
+        pointPen.endPath()
@@ -0,0 +1,192 @@
+"""
+The character map of a layer.
+
+    >>> cmap = layer.getCharacterMap()
+    >>> cmap.getGlyphName(0x41)
+    'A'
+    >>> cmap.getGlyphNamesForText("Ab")
+    ['A', 'b']
+    >>> cmap.getUnicodesInBlock("Basic Latin")
+    (65, 66, 97, 98)
+
+A unicode value may be assigned to more than one glyph.
+:meth:`CharacterMap.getGlyphName` then returns the first of
+these glyphs in name order and :meth:`CharacterMap.getDuplicates`
+lists all of them.
+"""
+
+from bisect import bisect_left, bisect_right
+from fontTools.misc.py23 import unichr
+from fontTools.unicodedata import block, Blocks
+
+
+class CharacterMap(object):
+
+    """
+    A map between unicode values and glyph names. The map is
+    built and updated with :meth:`CharacterMap.update` and
+    :meth:`CharacterMap.remove`.
+    """
+
+    def __init__(self):
+        # glyph name -> unicode values
+        self._unicodes = {}
+        # unicode value -> glyph names
+        self._glyphNames = {}
+        # unicode value -> first glyph name
+        self._glyphName = {}
+        self._sortedValues = None
+
+    def __contains__(self, value):
+        return value in self._glyphName
+
+    def __len__(self):
+        return len(self._glyphName)
+
+    def keys(self):
+        """
+        Get the unicode values in the map.
+        """
+        return list(self._glyphName.keys())
+
+    # -------
+    # Editing
+    # -------
+
+    def update(self, glyphName, unicodes):
+        """
+        Set the unicode values of the glyph named
+        **glyphName** to **unicodes**.
+        """
+        unicodes = tuple(unicodes)
+        old = self._unicodes.get(glyphName, ())
+        if old == unicodes:
+            return
+        if unicodes:
+            self._unicodes[glyphName] = unicodes
+        else:
+            self._unicodes.pop(glyphName, None)
+        old = set(old)
+        new = set(unicodes)
+        glyphNames = self._glyphNames
+        for value in old - new:
+            names = glyphNames[value]
+            names.discard(glyphName)
+            if names:
+                self._glyphName[value] = min(names)
+            else:
+                del glyphNames[value]
+                del self._glyphName[value]
+                self._sortedValues = None
+        for value in new - old:
+            names = glyphNames.get(value)
+            if names is None:
+                glyphNames[value] = set([glyphName])
+                self._glyphName[value] = glyphName
+                self._sortedValues = None
+            else:
+                names.add(glyphName)
+                self._glyphName[value] = min(names)
+
+    def remove(self, glyphName):
+        """
+        Remove the unicode values of the glyph
+        named **glyphName** from the map.
+        """
+        self.update(glyphName, ())
+
+    # -------
+    # Queries
+    # -------
+
+    def getGlyphName(self, value):
+        """
+        Get the name of the glyph for the unicode **value**.
+        If no glyph has the value, None is returned.
+        """
+        return self._glyphName.get(value)
+
+    def getGlyphNames(self, value):
+        """
+        Get the names of all glyphs with the unicode **value**.
+        """
+        return tuple(sorted(self._glyphNames.get(value, ())))
+
+    def getUnicodes(self, glyphName):
+        """
+        Get the unicode values of the glyph named **glyphName**.
+        """
+        return self._unicodes.get(glyphName, ())
+
+    def getGlyphNamesForText(self, text):
+        """
+        Get the names of the glyphs for the characters
+        in **text**. None is given for characters that
+        are not in the map.
+        """
+        get = self._glyphName.get
+        return [get(ord(character)) for character in text]
+
+    def getCharacterMapping(self):
+        """
+        Get a dictionary mapping unicode values
+        to tuples of glyph names.
+        """
+        return dict(
+            (value, tuple(sorted(names)))
+            for value, names in self._glyphNames.items()
+        )
+
+    def getDuplicates(self):
+        """
+        Get a dictionary mapping the unicode values that are
+        assigned to more than one glyph to tuples of the
+        names of these glyphs.
+        """
+        return dict(
+            (value, tuple(sorted(names)))
+            for value, names in self._glyphNames.items()
+            if len(names) > 1
+        )
+
+    # ------
+    # Ranges
+    # ------
+
+    def _getSortedValues(self):
+        if self._sortedValues is None:
+            self._sortedValues = sorted(self._glyphName)
+        return self._sortedValues
+
+    def getUnicodesInRange(self, minimum, maximum):
+        """
+        Get the sorted unicode values in the map
+        from **minimum** to **maximum**, inclusive.
+        """
+        values = self._getSortedValues()
+        start = bisect_left(values, minimum)
+        end = bisect_right(values, maximum)
+        return tuple(values[start:end])
+
+    def getBlocks(self):
+        """
+        Get a dictionary mapping the names of the unicode
+        blocks used by the map to sorted tuples of the
+        unicode values in them.
+        """
+        blocks = {}
+        for value in self._getSortedValues():
+            blocks.setdefault(block(unichr(value)), []).append(value)
+        return dict((name, tuple(values)) for name, values in blocks.items())
+
+    def getUnicodesInBlock(self, blockName):
+        """
+        Get the sorted unicode values in the map that
+        are in the unicode block named **blockName**.
+        """
+        values = []
+        ranges = list(Blocks.RANGES) + [0x110000]
+        for index, name in enumerate(Blocks.VALUES):
+            if name == blockName:
+                values.extend(self.getUnicodesInRange(ranges[index], ranges[index + 1] - 1))
+        return tuple(values)
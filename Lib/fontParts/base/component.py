@@ -5,6 +5,7 @@ from fontParts.base.errors import FontPartsError
 from fontParts.base.base import (
     BaseObject, TransformationMixin, dynamicProperty)
 from fontParts.base.deprecated import DeprecatedComponent
+from fontParts.base.decomposition import getGlyphIdentifiers
 
 
 class BaseComponent(BaseObject, TransformationMixin, DeprecatedComponent):
@@ -308,6 +309,7 @@ class BaseComponent(BaseObject, TransformationMixin, DeprecatedComponent):
         """
         Round offset coordinates.
         """
+        self._willChange()
         self._round()
 
     def _round(self):
@@ -326,13 +328,35 @@ class BaseComponent(BaseObject, TransformationMixin, DeprecatedComponent):
         glyph = self.glyph
         if glyph is None:
             raise FontPartsError("The component does not belong to a glyph.")
+        self._willChange()
         self._decompose()
 
     def _decompose(self):
         """
-        Subclasses must override this method.
+        Subclasses may override this method.
         """
-        self.raiseNotImplementedError()
+        glyph = self.glyph
+        outline = self._getBaseGlyphOutline()
+        transformation = self.transformation
+        glyph.removeComponent(self)
+        if outline is not None:
+            outline.drawPoints(
+                glyph.getPointPen(),
+                transformation=transformation,
+                usedIdentifiers=getGlyphIdentifiers(glyph)
+            )
+
+    def _getBaseGlyphOutline(self):
+        """
+        Get the decomposed outline of the base glyph from the
+        decomposed outline cache of the layer, or None if the
+        base glyph is not in the layer.
+        """
+        layer = self.layer
+        baseGlyph = self.baseGlyph
+        if layer is None or baseGlyph not in layer:
+            return None
+        return layer._getDecomposedOutlineCache().getOutline(baseGlyph)
 
     # ------------
     # Data Queries
@@ -351,10 +375,16 @@ class BaseComponent(BaseObject, TransformationMixin, DeprecatedComponent):
         """
         Subclasses may override this method.
         """
-        from fontTools.pens.pointInsidePen import PointInsidePen
-        pen = PointInsidePen(glyphSet=None, testPoint=point, evenOdd=False)
-        self.draw(pen)
-        return pen.getResult()
+        outline = self._getBaseGlyphOutline()
+        if outline is None:
+            return False
+        # test the point in the base glyph
+        try:
+            t = transform.Transform(*self.transformation).inverse()
+        except ZeroDivisionError:
+            return False
+        point = t.transformPoint(point)
+        return outline.flattenedOutline.pointsInside([point])[0]
 
     bounds = dynamicProperty("bounds", "The bounds of the component: (xMin, yMin, xMax, yMax) or None.")
 
@@ -369,6 +399,9 @@ class BaseComponent(BaseObject, TransformationMixin, DeprecatedComponent):
         Subclasses may override this method.
         """
         from fontTools.pens.boundsPen import BoundsPen
-        pen = BoundsPen(self.layer)
-        self.draw(pen)
+        outline = self._getBaseGlyphOutline()
+        if outline is None:
+            return None
+        pen = BoundsPen(None)
+        outline.draw(pen, transformation=self.transformation)
         return pen.bounds
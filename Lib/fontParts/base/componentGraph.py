@@ -0,0 +1,224 @@
+"""
+The component dependency graph of a layer.
+
+    >>> graph = layer.getComponentGraph()
+    >>> graph.getBaseGlyphs("Aacute")
+    ('A', 'acute')
+    >>> graph.getAllComposites("A")
+    ('Aacute', 'Aring', 'Aringacute')
+    >>> graph.getTopologicalOrder()
+    ['A', 'acute', 'ring', 'Aacute', 'Aring', 'Aringacute']
+
+The graph has a node for every glyph in the layer and an
+edge from every composite glyph to each of its base glyphs.
+Base glyphs that are not in the layer are kept as the
+targets of edges, so the composites that use a missing
+glyph can still be found.
+"""
+
+from heapq import heapify, heappush, heappop
+from fontParts.base.errors import FontPartsError
+
+
+class ComponentGraph(object):
+
+    """
+    A component dependency graph. The graph is built and
+    updated with :meth:`ComponentGraph.update` and
+    :meth:`ComponentGraph.remove`.
+    """
+
+    def __init__(self):
+        # glyph name -> names of the base glyphs
+        self._baseGlyphs = {}
+        # base glyph name -> names of the composites
+        self._composites = {}
+
+    def __contains__(self, glyphName):
+        return glyphName in self._baseGlyphs
+
+    def __len__(self):
+        return len(self._baseGlyphs)
+
+    def keys(self):
+        """
+        Get the names of the glyphs in the graph.
+        """
+        return list(self._baseGlyphs.keys())
+
+    # -------
+    # Editing
+    # -------
+
+    def update(self, glyphName, baseGlyphNames):
+        """
+        Set the base glyphs of the glyph named **glyphName**
+        to **baseGlyphNames**. The glyph is added to the
+        graph if it is not in the graph.
+        """
+        baseGlyphNames = frozenset(baseGlyphNames)
+        old = self._baseGlyphs.get(glyphName, frozenset())
+        if glyphName in self._baseGlyphs and old == baseGlyphNames:
+            return
+        composites = self._composites
+        for baseGlyphName in old - baseGlyphNames:
+            references = composites[baseGlyphName]
+            references.discard(glyphName)
+            if not references:
+                del composites[baseGlyphName]
+        for baseGlyphName in baseGlyphNames - old:
+            composites.setdefault(baseGlyphName, set()).add(glyphName)
+        self._baseGlyphs[glyphName] = baseGlyphNames
+
+    def remove(self, glyphName):
+        """
+        Remove the glyph named **glyphName** from the graph.
+        Composites using the glyph keep their edges to it.
+        """
+        if glyphName not in self._baseGlyphs:
+            return
+        self.update(glyphName, ())
+        del self._baseGlyphs[glyphName]
+
+    # -------
+    # Queries
+    # -------
+
+    def getBaseGlyphs(self, glyphName):
+        """
+        Get the names of the glyphs used by the
+        components of the glyph named **glyphName**.
+        """
+        return tuple(sorted(self._baseGlyphs.get(glyphName, ())))
+
+    def getComposites(self, glyphName):
+        """
+        Get the names of the glyphs with components
+        using the glyph named **glyphName**.
+        """
+        return tuple(sorted(self._composites.get(glyphName, ())))
+
+    def getAllBaseGlyphs(self, glyphName):
+        """
+        Get the names of all glyphs used by the glyph
+        named **glyphName**, directly or through other
+        components.
+        """
+        return tuple(sorted(self._walk(glyphName, self._baseGlyphs)))
+
+    def getAllComposites(self, glyphName):
+        """
+        Get the names of all glyphs using the glyph named
+        **glyphName**, directly or through other components.
+        """
+        return tuple(sorted(self._walk(glyphName, self._composites)))
+
+    def _walk(self, glyphName, edges):
+        found = set()
+        stack = [glyphName]
+        while stack:
+            for other in edges.get(stack.pop(), ()):
+                if other not in found:
+                    found.add(other)
+                    stack.append(other)
+        found.discard(glyphName)
+        return found
+
+    def getReverseComponentMapping(self):
+        """
+        Get a dictionary mapping base glyph names
+        to tuples of the names of the composites
+        using them.
+        """
+        return dict(
+            (baseGlyphName, tuple(sorted(composites)))
+            for baseGlyphName, composites in self._composites.items()
+        )
+
+    # -----
+    # Order
+    # -----
+
+    def getTopologicalOrder(self, glyphNames=None):
+        """
+        Get the names of the glyphs in the graph ordered
+        so that every glyph comes after the glyphs used
+        by its components. Glyphs that do not depend on
+        each other are sorted by name. **glyphNames** may
+        be a list of glyph names to limit the result to.
+
+        A :class:`FontPartsError` is raised if the
+        components contain a cycle.
+        """
+        if glyphNames is None:
+            glyphNames = self._baseGlyphs.keys()
+        glyphNames = set(glyphName for glyphName in glyphNames if glyphName in self._baseGlyphs)
+        waiting = {}
+        for glyphName in glyphNames:
+            waiting[glyphName] = len(self._baseGlyphs[glyphName] & glyphNames)
+        ready = [glyphName for glyphName, count in waiting.items() if not count]
+        heapify(ready)
+        order = []
+        while ready:
+            glyphName = heappop(ready)
+            order.append(glyphName)
+            for composite in self._composites.get(glyphName, ()):
+                if composite in waiting:
+                    waiting[composite] -= 1
+                    if not waiting[composite]:
+                        heappush(ready, composite)
+        if len(order) != len(glyphNames):
+            raise FontPartsError("The components contain a cycle.")
+        return order
+
+    def getCycles(self):
+        """
+        Get the cycles in the graph as a list of sorted
+        lists of glyph names. Each list contains glyphs
+        that use each other through their components.
+        """
+        # Tarjan's strongly connected components,
+        # without recursion
+        baseGlyphs = self._baseGlyphs
+        index = {}
+        lowLink = {}
+        stack = []
+        onStack = set()
+        cycles = []
+        for root in sorted(baseGlyphs):
+            if root in index:
+                continue
+            work = [(root, iter(sorted(baseGlyphs[root])))]
+            index[root] = lowLink[root] = len(index)
+            stack.append(root)
+            onStack.add(root)
+            while work:
+                glyphName, children = work[-1]
+                for child in children:
+                    if child not in baseGlyphs:
+                        continue
+                    if child not in index:
+                        index[child] = lowLink[child] = len(index)
+                        stack.append(child)
+                        onStack.add(child)
+                        work.append((child, iter(sorted(baseGlyphs[child]))))
+                        break
+                    if child in onStack:
+                        lowLink[glyphName] = min(lowLink[glyphName], index[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowLink[parent] = min(lowLink[parent], lowLink[glyphName])
+                    if lowLink[glyphName] == index[glyphName]:
+                        component = []
+                        while True:
+                            other = stack.pop()
+                            onStack.discard(other)
+                            component.append(other)
+                            if other == glyphName:
+                                break
+                        if len(component) > 1 or glyphName in baseGlyphs[glyphName]:
+                            cycles.append(sorted(component))
+        cycles.sort()
+        return cycles
@@ -3,6 +3,7 @@ from fontParts.base.errors import FontPartsError
 from fontParts.base.base import (
     BaseObject, TransformationMixin, dynamicProperty)
 from fontParts.base import normalizers
+from fontParts.base import geometry
 from fontParts.base.bPoint import absoluteBCPIn, absoluteBCPOut
 from fontParts.base.deprecated import DeprecatedContour
 
@@ -212,21 +213,35 @@ class BaseContour(BaseObject, TransformationMixin, DeprecatedContour):
         """
         Automatically set the segment with on curve in the
         lower left of the contour as the first segment.
+
+        The on curve point with the lowest y, and of those
+        the lowest x, becomes the first on curve point of
+        the contour. Open contours are not changed.
         """
+        self._willChange()
         self._autoStartSegment(**kwargs)
 
     def _autoStartSegment(self, **kwargs):
         """
         Subclasses may override this method.
-
-        XXX port this from robofab
         """
-        self.raiseNotImplementedError()
+        points = geometry.getContourPoints(self)
+        if geometry.isOpen(points):
+            return
+        onCurves = [(y, x, i) for i, (x, y, segmentType) in enumerate(points) if segmentType is not None]
+        if len(onCurves) < 2:
+            return
+        start = onCurves.index(min(onCurves))
+        if start == 0:
+            return
+        # the segment ending at the new first on curve point
+        self._setStartSegment(start - 1)
 
     def round(self, **kwargs):
         """
         Round coordinates in all points.
         """
+        self._willChange()
         self._round(**kwargs)
 
     def _round(self, **kwargs):
@@ -281,9 +296,9 @@ class BaseContour(BaseObject, TransformationMixin, DeprecatedContour):
 
     def _get_clockwise(self):
         """
-        Subclasses must override this method.
+        Subclasses may override this method.
         """
-        self.raiseNotImplementedError()
+        return self.area < 0
 
     def _set_clockwise(self, value):
         """
@@ -296,6 +311,7 @@ class BaseContour(BaseObject, TransformationMixin, DeprecatedContour):
         """
         Reverse the direction of the contour.
         """
+        self._willChange()
         self._reverseContour()
 
     def _reverse(self, **kwargs):
@@ -343,6 +359,86 @@ class BaseContour(BaseObject, TransformationMixin, DeprecatedContour):
         self.draw(pen)
         return pen.bounds
 
+    def _getSegmentGeometry(self):
+        points = geometry.getContourPoints(self)
+        return points, geometry.contourSegments(points)
+
+    area = dynamicProperty(
+        "base_area",
+        """
+        The signed area of the contour. The area is positive
+        for counter-clockwise contours and negative for
+        clockwise contours. Open contours have an area of 0.
+        """
+    )
+
+    def _get_base_area(self):
+        return self._get_area()
+
+    def _get_area(self):
+        """
+        Subclasses may override this method.
+        """
+        points, segments = self._getSegmentGeometry()
+        if geometry.isOpen(points):
+            return 0
+        return geometry.segmentsSignedArea(segments)
+
+    length = dynamicProperty("base_length", "The arc length of the contour.")
+
+    def _get_base_length(self):
+        return self._get_length()
+
+    def _get_length(self):
+        """
+        Subclasses may override this method.
+        """
+        points, segments = self._getSegmentGeometry()
+        return geometry.segmentsLength(segments)
+
+    centroid = dynamicProperty(
+        "base_centroid",
+        """
+        The centroid of the area of the contour: (x, y)
+        or None if the contour is open or has no area.
+        """
+    )
+
+    def _get_base_centroid(self):
+        value = self._get_centroid()
+        if value is not None:
+            value = normalizers.normalizeCoordinateTuple(value)
+        return value
+
+    def _get_centroid(self):
+        """
+        Subclasses may override this method.
+        """
+        points, segments = self._getSegmentGeometry()
+        if geometry.isOpen(points):
+            return None
+        return geometry.segmentsCentroid(segments)
+
+    curvatureExtrema = dynamicProperty(
+        "base_curvatureExtrema",
+        """
+        The points within curves where the curvature has
+        a local maximum, as a tuple of ((x, y), curvature)
+        tuples. The curvature is positive where the contour
+        turns counter-clockwise.
+        """
+    )
+
+    def _get_base_curvatureExtrema(self):
+        return tuple(self._get_curvatureExtrema())
+
+    def _get_curvatureExtrema(self):
+        """
+        Subclasses may override this method.
+        """
+        points, segments = self._getSegmentGeometry()
+        return geometry.segmentsCurvatureExtrema(segments)
+
     # --------
     # Segments
     # --------
@@ -431,6 +527,7 @@ class BaseContour(BaseObject, TransformationMixin, DeprecatedContour):
             pts.append(pt)
         points = pts
         smooth = normalizers.normalizeBoolean(smooth)
+        self._willChange()
         self._appendSegment(type=type, points=points, smooth=smooth, **kwargs)
 
     def _appendSegment(self, type=None, points=None, smooth=False, **kwargs):
@@ -451,6 +548,7 @@ class BaseContour(BaseObject, TransformationMixin, DeprecatedContour):
             pts.append(pt)
         points = pts
         smooth = normalizers.normalizeBoolean(smooth)
+        self._willChange()
         self._insertSegment(index=index, type=type, points=points, smooth=smooth, **kwargs)
 
     def _insertSegment(self, index=None, type=None, points=None, smooth=False, **kwargs):
@@ -472,6 +570,7 @@ class BaseContour(BaseObject, TransformationMixin, DeprecatedContour):
         segment = normalizers.normalizeIndex(segment)
         if segment >= self._len__segments():
             raise FontPartsError("No segment located at index %d." % segment)
+        self._willChange()
         self._removeSegment(segment, **kwargs)
 
     def _removeSegment(self, segment, **kwargs):
@@ -500,6 +599,7 @@ class BaseContour(BaseObject, TransformationMixin, DeprecatedContour):
             return
         if segmentIndex >= len(segments):
             raise FontPartsError("The contour does not contain a segment at index %d" % segmentIndex)
+        self._willChange()
         self._setStartSegment(segmentIndex, **kwargs)
 
     def _setStartSegment(self, segmentIndex, **kwargs):
@@ -571,6 +671,7 @@ class BaseContour(BaseObject, TransformationMixin, DeprecatedContour):
         if bcpOut is None:
             bcpOut = (0, 0)
         bcpOut = normalizers.normalizeCoordinateTuple(bcpOut)
+        self._willChange()
         self._appendBPoint(type, anchor, bcpIn=bcpIn, bcpOut=bcpOut, **kwargs)
 
     def _appendBPoint(self, type, anchor, bcpIn=None, bcpOut=None, **kwargs):
@@ -592,6 +693,7 @@ class BaseContour(BaseObject, TransformationMixin, DeprecatedContour):
         if bcpOut is None:
             bcpOut = (0, 0)
         bcpOut = normalizers.normalizeCoordinateTuple(bcpOut)
+        self._willChange()
         self._insertBPoint(index=index, type=type, anchor=anchor, bcpIn=bcpIn, bcpOut=bcpOut, **kwargs)
 
     def _insertBPoint(self, index, type, anchor, bcpIn, bcpOut, **kwargs):
@@ -696,6 +798,7 @@ class BaseContour(BaseObject, TransformationMixin, DeprecatedContour):
         bPoint = normalizers.normalizeIndex(bPoint)
         if bPoint >= self._len__points():
             raise FontPartsError("No bPoint located at index %d." % bPoint)
+        self._willChange()
         self._removeBPoint(bPoint, **kwargs)
 
     def _removeBPoint(self, index, **kwargs):
@@ -790,6 +893,7 @@ class BaseContour(BaseObject, TransformationMixin, DeprecatedContour):
             name = normalizers.normalizePointName(name)
         if identifier is not None:
             identifier = normalizers.normalizeIdentifier(identifier)
+        self._willChange()
         self._insertPoint(index, position=position, type=type, smooth=smooth, name=name, identifier=identifier, **kwargs)
 
     def _insertPoint(self, index, position, type="line", smooth=False, name=None, identifier=None, **kwargs):
@@ -815,6 +919,7 @@ class BaseContour(BaseObject, TransformationMixin, DeprecatedContour):
         point = normalizers.normalizeIndex(point)
         if point >= self._len__points():
             raise FontPartsError("No point located at index %d." % point)
+        self._willChange()
         self._removePoint(point, **kwargs)
 
     def _removePoint(self, index, **kwargs):
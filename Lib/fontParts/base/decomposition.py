@@ -0,0 +1,281 @@
+"""
+Decomposed outlines of composite glyphs.
+
+A :class:`DecomposedOutline` holds the contours of a glyph
+together with the transformed contours of all of its
+components, with nested components resolved. The outlines
+of the glyphs in a layer are kept in a
+:class:`DecomposedOutlineCache`, so every base glyph is only
+resolved once, no matter how many composites use it.
+
+    >>> cache = layer._getDecomposedOutlineCache()
+    >>> outline = cache.getOutline("Aacute")
+    >>> outline.draw(pen)
+
+The cache records which glyphs every outline was built
+from. When a glyph changes, :meth:`DecomposedOutlineCache.invalidate`
+removes the outline of that glyph and the outlines of all
+glyphs that use it, directly or through other components.
+"""
+
+import math
+from fontTools.misc.transform import Transform
+from fontTools.pens.boundsPen import BoundsPen
+from ufoLib.pointPen import PointToSegmentPen
+from fontParts.base import geometry
+
+
+class _OutlinePointPen(object):
+
+    """
+    A point pen that records contours as ``(identifier, points)``
+    tuples, with the points given as ``(x, y, segmentType, smooth,
+    name, identifier)`` tuples, and components as
+    ``(baseGlyph, transformation)``.
+    """
+
+    def __init__(self):
+        self.contours = []
+        self.components = []
+        self._identifier = None
+        self._contour = None
+
+    def beginPath(self, identifier=None, **kwargs):
+        self._identifier = identifier
+        self._contour = []
+
+    def addPoint(self, pt, segmentType=None, smooth=False, name=None, identifier=None, **kwargs):
+        self._contour.append((pt[0], pt[1], segmentType, smooth, name, identifier))
+
+    def endPath(self):
+        self.contours.append((self._identifier, tuple(self._contour)))
+        self._identifier = None
+        self._contour = None
+
+    def addComponent(self, baseGlyphName, transformation, identifier=None, **kwargs):
+        self.components.append((baseGlyphName, tuple(transformation)))
+
+
+def _transformContours(contours, transformation):
+    if transformation == (1, 0, 0, 1, 0, 0):
+        return list(contours)
+    transformPoint = Transform(*transformation).transformPoint
+    transformed = []
+    for identifier, contour in contours:
+        points = []
+        for x, y, segmentType, smooth, name, pointIdentifier in contour:
+            x, y = transformPoint((x, y))
+            points.append((x, y, segmentType, smooth, name, pointIdentifier))
+        transformed.append((identifier, tuple(points)))
+    return transformed
+
+
+def _claimIdentifier(identifier, usedIdentifiers):
+    # an identifier that is already used is dropped
+    if identifier is None or identifier in usedIdentifiers:
+        return None
+    usedIdentifiers.add(identifier)
+    return identifier
+
+
+def getGlyphIdentifiers(glyph):
+    """
+    Get the set of identifiers used by the contours,
+    points, components, anchors and guidelines of
+    **glyph**.
+    """
+    pen = _OutlinePointPen()
+    glyph.drawPoints(pen)
+    identifiers = set()
+    for identifier, contour in pen.contours:
+        identifiers.add(identifier)
+        identifiers.update(point[5] for point in contour)
+    for obj in glyph.components + glyph.anchors + glyph.guidelines:
+        identifiers.add(obj.identifier)
+    identifiers.discard(None)
+    return identifiers
+
+
+class DecomposedOutline(object):
+
+    """
+    The outline of a glyph with all components decomposed.
+
+    **contours** are the contours of the glyph and
+    **componentContours** are the transformed contours
+    of its components. Both are tuples of contours given
+    as ``(identifier, points)`` tuples, with the points
+    given as ``(x, y, segmentType, smooth, name, identifier)``
+    tuples.
+    **dependencies** are the names of all glyphs used by
+    the components, including nested and missing glyphs.
+    """
+
+    def __init__(self, contours, componentContours, dependencies):
+        self.contours = tuple(contours)
+        self.componentContours = tuple(componentContours)
+        self.dependencies = frozenset(dependencies)
+        self._bounds = None
+        self._skewedBounds = {}
+        self._flattenedOutline = None
+
+    def drawPoints(self, pointPen, contours=True, components=True, transformation=None, usedIdentifiers=None):
+        """
+        Draw the outline with **pointPen**. Components
+        are drawn as contours. Point names and identifiers
+        are kept, but identifiers in **usedIdentifiers**
+        and identifiers that were already drawn are dropped.
+        """
+        drawn = []
+        if contours:
+            drawn.extend(self.contours)
+        if components:
+            drawn.extend(self.componentContours)
+        if transformation is not None:
+            drawn = _transformContours(drawn, tuple(transformation))
+        if usedIdentifiers is None:
+            usedIdentifiers = set()
+        for identifier, contour in drawn:
+            pointPen.beginPath(identifier=_claimIdentifier(identifier, usedIdentifiers))
+            for x, y, segmentType, smooth, name, pointIdentifier in contour:
+                pointPen.addPoint(
+                    (x, y), segmentType=segmentType, smooth=smooth, name=name,
+                    identifier=_claimIdentifier(pointIdentifier, usedIdentifiers)
+                )
+            pointPen.endPath()
+
+    def draw(self, pen, contours=True, components=True, transformation=None):
+        """
+        Draw the outline with **pen**. Components
+        are drawn as contours.
+        """
+        self.drawPoints(PointToSegmentPen(pen), contours, components, transformation)
+
+    def _get_bounds(self):
+        if self._bounds is None:
+            pen = BoundsPen(None)
+            self.draw(pen)
+            # cache the absence of bounds too
+            self._bounds = (pen.bounds,)
+        return self._bounds[0]
+
+    bounds = property(_get_bounds, doc="The bounds of the outline or None.")
+
+    def getSkewedBounds(self, italicAngle):
+        """
+        Get the bounds of the outline measured along
+        **italicAngle**. The outline is skewed around the
+        baseline, so that lines at the angle are vertical,
+        before it is measured. The bounds are kept for
+        every angle.
+        """
+        if not italicAngle:
+            return self.bounds
+        try:
+            return self._skewedBounds[italicAngle]
+        except KeyError:
+            pass
+        slope = math.tan(math.radians(-italicAngle))
+        pen = BoundsPen(None)
+        self.draw(pen, transformation=(1, 0, -slope, 1, 0, 0))
+        self._skewedBounds[italicAngle] = pen.bounds
+        return pen.bounds
+
+    def _get_flattenedOutline(self):
+        if self._flattenedOutline is None:
+            pen = geometry.FlattenPen()
+            self.draw(pen)
+            self._flattenedOutline = geometry.FlattenedOutline(pen.polygons)
+        return self._flattenedOutline
+
+    flattenedOutline = property(
+        _get_flattenedOutline,
+        doc="The outline as a :class:`fontParts.base.geometry.FlattenedOutline`."
+    )
+
+
+class DecomposedOutlineCache(object):
+
+    """
+    The decomposed outlines of the glyphs in **layer**.
+    **layer** may be None, in which case components
+    can not be resolved and are ignored.
+    """
+
+    def __init__(self, layer):
+        self.layer = layer
+        self._outlines = {}
+        # glyph name -> names of the glyphs using it
+        self._dependents = {}
+
+    def getOutline(self, glyphName):
+        """
+        Get the :class:`DecomposedOutline` of the
+        glyph named **glyphName** in the layer.
+        """
+        outline = self._outlines.get(glyphName)
+        if outline is None:
+            outline = self._buildOutline(self.layer[glyphName], set())
+        return outline
+
+    def getGlyphOutline(self, glyph):
+        """
+        Get the :class:`DecomposedOutline` of **glyph**.
+        The outline is only cached if the glyph is
+        in the layer.
+        """
+        layer = self.layer
+        if layer is not None and glyph.layer is not None and glyph.name in layer:
+            return self.getOutline(glyph.name)
+        return self._buildOutline(glyph, set(), cache=False)
+
+    def _buildOutline(self, glyph, inProgress, cache=True):
+        glyphName = glyph.name
+        inProgress.add(glyphName)
+        pen = _OutlinePointPen()
+        glyph.drawPoints(pen)
+        componentContours = []
+        dependencies = set()
+        layer = self.layer
+        for baseGlyphName, transformation in pen.components:
+            dependencies.add(baseGlyphName)
+            # missing base glyphs and component
+            # loops are skipped
+            if layer is None or baseGlyphName in inProgress or baseGlyphName not in layer:
+                continue
+            baseOutline = self._outlines.get(baseGlyphName)
+            if baseOutline is None:
+                baseOutline = self._buildOutline(layer[baseGlyphName], inProgress)
+            dependencies.update(baseOutline.dependencies)
+            contours = baseOutline.contours + baseOutline.componentContours
+            componentContours.extend(_transformContours(contours, transformation))
+        inProgress.discard(glyphName)
+        outline = DecomposedOutline(pen.contours, componentContours, dependencies)
+        if cache:
+            self._outlines[glyphName] = outline
+            for name in dependencies:
+                self._dependents.setdefault(name, set()).add(glyphName)
+        return outline
+
+    def invalidate(self, glyphName):
+        """
+        Remove the outline of the glyph named **glyphName**
+        and the outlines of all glyphs using it.
+        """
+        names = self._dependents.pop(glyphName, set())
+        names.add(glyphName)
+        for name in names:
+            outline = self._outlines.pop(name, None)
+            if outline is None:
+                continue
+            for dependency in outline.dependencies:
+                dependents = self._dependents.get(dependency)
+                if dependents is not None:
+                    dependents.discard(name)
+
+    def clear(self):
+        """
+        Remove all outlines.
+        """
+        self._outlines.clear()
+        self._dependents.clear()
@@ -0,0 +1,81 @@
+"""
+Glyph fingerprints.
+
+    >>> glyph.getFingerprint()
+    '5b2c7e0e4d0b6d8e1f3c3a9a1f0b8b6c2f1c9f0a'
+
+A fingerprint is a SHA-1 hash of the content of a glyph:
+the width, the height, the contours, the components, the
+anchors and, optionally, the lib. The name, the unicodes
+and the identifiers of the glyph and its objects are not
+part of the fingerprint, so glyphs with different names
+in different layers and fonts can be compared. Numbers
+are written in one form, so ``100`` and ``100.0`` give
+the same fingerprint, and the fingerprint is the same in
+every session.
+
+The data is written to the hash while the glyph is
+drawn, so no copy of the outline is made.
+"""
+
+import hashlib
+import json
+from fontTools.misc.py23 import tobytes
+
+
+def _formatNumber(value):
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return repr(value)
+
+
+class FingerprintPointPen(object):
+
+    """
+    A point pen that writes the drawn
+    contours and components to **hasher**.
+    """
+
+    def __init__(self, hasher):
+        self.hasher = hasher
+
+    def write(self, *values):
+        self.hasher.update(tobytes(" ".join(values) + ";", encoding="utf-8"))
+
+    def beginPath(self, identifier=None, **kwargs):
+        self.write("beginPath")
+
+    def addPoint(self, pt, segmentType=None, smooth=False, name=None, identifier=None, **kwargs):
+        self.write(
+            _formatNumber(pt[0]),
+            _formatNumber(pt[1]),
+            str(segmentType),
+            str(bool(smooth))
+        )
+
+    def endPath(self):
+        self.write("endPath")
+
+    def addComponent(self, baseGlyphName, transformation, identifier=None, **kwargs):
+        self.write(
+            "component",
+            baseGlyphName,
+            *[_formatNumber(value) for value in transformation]
+        )
+
+
+def makeGlyphFingerprint(glyph, lib=False):
+    """
+    Make the fingerprint of **glyph**. If **lib**
+    is True the lib of the glyph is included.
+    **glyph** may be any object with the glyph
+    attributes and methods used here.
+    """
+    pen = FingerprintPointPen(hashlib.sha1())
+    pen.write("metrics", _formatNumber(glyph.width), _formatNumber(glyph.height))
+    glyph.drawPoints(pen)
+    for anchor in glyph.anchors:
+        pen.write("anchor", "%s" % (anchor.name,), _formatNumber(anchor.x), _formatNumber(anchor.y))
+    if lib:
+        pen.write("lib", json.dumps(dict(glyph.lib), sort_keys=True, default=repr))
+    return pen.hasher.hexdigest()
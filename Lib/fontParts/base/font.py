@@ -2,13 +2,15 @@ import os
 import fontMath
 from fontTools.misc.py23 import basestring
 from fontParts.base.errors import FontPartsError
-from fontParts.base.base import BaseObject, dynamicProperty
+from fontParts.base.base import BaseObject, TransactionMixin, dynamicProperty
 from fontParts.base.layer import _BaseGlyphVendor
 from fontParts.base import normalizers
 from fontParts.base.deprecated import DeprecatedFont
+from fontParts.base.fontDiff import diffFonts, patchFont
+from fontParts.base.transaction import FontTransaction, willChangeLayer
 
 
-class BaseFont(_BaseGlyphVendor, DeprecatedFont):
+class BaseFont(_BaseGlyphVendor, TransactionMixin, DeprecatedFont):
 
     """
     A font object. This object is almost always
@@ -54,7 +56,9 @@ class BaseFont(_BaseGlyphVendor, DeprecatedFont):
         "glyphOrder"
     )
 
-    def copy(self):
+    transactionClass = FontTransaction
+
+    def copy(self, shareGlyphs=False):
         """
         Copy the font into a new font. ::
 
@@ -72,26 +76,106 @@ class BaseFont(_BaseGlyphVendor, DeprecatedFont):
         * defaultLayer
         * glyphOrder
         * guidelines
+
+        If **shareGlyphs** is ``True``, glyphs that have not
+        been changed since the font was read may be read by
+        the copy when they are first used instead of being
+        copied. Environments that can not share glyph data
+        copy all glyphs. ::
+
+            >>> copiedFont = font.copy(shareGlyphs=True)
         """
-        return super(BaseFont, self).copy()
+        copyClass = self.copyClass
+        if copyClass is None:
+            copyClass = self.__class__
+        copied = copyClass()
+        copied.copyData(self, shareGlyphs=shareGlyphs)
+        return copied
 
-    def copyData(self, source):
+    def copyData(self, source, shareGlyphs=False):
         """
         Copy data from **source** into this font.
         Refer to :meth:`BaseFont.copy` for a list
         of values that will be copied.
         """
+        shareGlyphs = bool(shareGlyphs)
+        self._copyData(source, shareGlyphs=shareGlyphs)
+
+    def _copyData(self, source, shareGlyphs=False):
+        """
+        Copy data from **source** into this font.
+        **shareGlyphs** will be a boolean indicating
+        if the glyph data may be shared with **source**.
+        This copies the data with the public API and
+        copies all glyphs.
+
+        Subclasses may override this method.
+        """
         for layerName in source.layerOrder:
             if layerName in self.layerOrder:
                 layer = self.getLayer(layerName)
             else:
                 layer = self.newLayer(layerName)
             layer.copyData(source.getLayer(layerName))
-        for sourceGuideline in self.guidelines:
+        for sourceGuideline in source.guidelines:
             selfGuideline = self.appendGuideline((0, 0), 0)
             selfGuideline.copyData(sourceGuideline)
         super(BaseFont, self).copyData(source)
 
+    # -----------
+    # Differences
+    # -----------
+
+    def diff(self, other):
+        """
+        Compare the font with **other**. ::
+
+            >>> changes = font.diff(otherFont)
+            >>> changes["glyphOrder"]
+            ['A', 'B', 'C']
+
+        The info, groups, kerning, features, lib, guidelines,
+        layers and glyphs are compared. A change set that turns
+        this font into **other** when it is given to
+        :meth:`BaseFont.patch` is returned. The change set only
+        holds the data that is different and can be written as
+        JSON. See
+        :mod:`fontParts.base.fontDiff` for a description of it.
+        """
+        if not isinstance(other, BaseFont):
+            raise FontPartsError("A font can not be compared with an instance of %r." % other.__class__.__name__)
+        return self._diff(other)
+
+    def _diff(self, other):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.diff`. Glyphs are compared
+        by their fingerprints.
+
+        Subclasses may override this method.
+        """
+        return diffFonts(self, other)
+
+    def patch(self, changes):
+        """
+        Apply a change set made by :meth:`BaseFont.diff`
+        to the font. ::
+
+            >>> font.patch(changes)
+        """
+        if not isinstance(changes, dict):
+            raise FontPartsError("A change set must be a dictionary, not %s." % type(changes).__name__)
+        self._patch(changes)
+
+    def _patch(self, changes):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.patch`.
+
+        Subclasses may override this method.
+        """
+        patchFont(self, changes)
+
     # ---------------
     # File Operations
     # ---------------
@@ -675,6 +759,7 @@ class BaseFont(_BaseGlyphVendor, DeprecatedFont):
             return layer
         if color is not None:
             color = normalizers.normalizeColor(color)
+        willChangeLayer(self, name)
         layer = self._newLayer(name=name, color=color)
         self._setFontInLayer(layer)
         return layer
@@ -709,6 +794,7 @@ class BaseFont(_BaseGlyphVendor, DeprecatedFont):
         name = normalizers.normalizeLayerName(name)
         if name not in self.layerOrder:
             raise FontPartsError("No layer with the name '%s' exists." % name)
+        willChangeLayer(self, name)
         self._removeLayer(name)
 
     def _removeLayer(self, name, **kwargs):
@@ -871,28 +957,76 @@ class BaseFont(_BaseGlyphVendor, DeprecatedFont):
         for guideline in self.guidelines():
             guideline.round()
 
-    def autoUnicodes(self):
+    def autoUnicodes(self, overrides=None):
         """
         Use heuristics to set Unicode values in all glyphs.
 
             >>> font.autoUnicodes()
 
+        **overrides** may be a dictionary mapping glyph names
+        to lists of Unicode values. See :meth:`BaseLayer.autoUnicodes`.
+
         Environments will define their own heuristics for
         automatically determining values.
 
         This applies only to the default layer.
         """
-        self._autoUnicodes()
+        self._autoUnicodes(overrides)
 
-    def _autoUnicodes(self):
+    def _autoUnicodes(self, overrides):
         """
         This is the environment implementation of
         :meth:`BaseFont.autoUnicodes`.
 
         Subclasses may override this method.
         """
-        layer = self.getLayer(self.defaultLayer())
-        layer.autoUnicodes()
+        layer = self.getLayer(self.defaultLayer)
+        layer.autoUnicodes(overrides)
+
+    def autoContourOrder(self):
+        """
+        Sort the contours of all glyphs based on their centers.
+
+            >>> font.autoContourOrder()
+
+        See :meth:`BaseGlyph.autoContourOrder`.
+
+        This applies only to the default layer.
+        """
+        self._autoContourOrder()
+
+    def _autoContourOrder(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.autoContourOrder`.
+
+        Subclasses may override this method.
+        """
+        layer = self.getLayer(self.defaultLayer)
+        layer.autoContourOrder()
+
+    def autoStartSegment(self):
+        """
+        Set the lower left on curve point as the
+        start of all contours in all glyphs.
+
+            >>> font.autoStartSegment()
+
+        See :meth:`BaseContour.autoStartSegment`.
+
+        This applies only to the default layer.
+        """
+        self._autoStartSegment()
+
+    def _autoStartSegment(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.autoStartSegment`.
+
+        Subclasses may override this method.
+        """
+        layer = self.getLayer(self.defaultLayer)
+        layer.autoStartSegment()
 
     # ----------
     # Guidelines
@@ -985,6 +1119,7 @@ class BaseFont(_BaseGlyphVendor, DeprecatedFont):
             name = normalizers.normalizeGuidelineName(name)
         if color is not None:
             color = normalizers.normalizeColor(color)
+        self._willChange("guidelines")
         return self._appendGuideline(position, angle, name=name, color=color)
 
     def _appendGuideline(self, position, angle, name=None, color=None, **kwargs):
@@ -1019,6 +1154,7 @@ class BaseFont(_BaseGlyphVendor, DeprecatedFont):
         index = normalizers.normalizeGuidelineIndex(index)
         if index >= self._len__guidelines():
             raise FontPartsError("No guideline located at index %d." % index)
+        self._willChange("guidelines")
         self._removeGuideline(index)
 
     def _removeGuideline(self, index, **kwargs):
@@ -1037,6 +1173,7 @@ class BaseFont(_BaseGlyphVendor, DeprecatedFont):
 
             >>> font.clearGuidelines()
         """
+        self._willChange("guidelines")
         self._clearGuidelines()
 
     def _clearGuidelines(self):
@@ -1157,9 +1294,14 @@ class BaseFont(_BaseGlyphVendor, DeprecatedFont):
 
     def getReverseComponentMapping(self):
         """
-        Create a dictionary of unicode -> [glyphname, ...] mappings.
-        All glyphs are loaded. Note that one glyph can have multiple unicode values,
-        and a unicode value can have multiple glyphs pointing to it.
+        Get a reversed map of component references in the
+        default layer of the font.
+        {
+        'A' : ('Aacute', 'Aring')
+        'acute' : ('Aacute',)
+        'ring' : ('Aring',)
+        etc.
+        }
         """
         return self._getReverseComponentMapping()
 
@@ -1170,18 +1312,15 @@ class BaseFont(_BaseGlyphVendor, DeprecatedFont):
 
         Subclasses may override this method.
         """
-        layer = self.getLayer(self.defaultLayer())
+        layer = self.getLayer(self.defaultLayer)
         return layer.getReverseComponentMapping()
 
     def getCharacterMapping(self):
         """
-        Get a reversed map of component references in the font.
-        {
-        'A' : ['Aacute', 'Aring']
-        'acute' : ['Aacute']
-        'ring' : ['Aring']
-        etc.
-        }
+        Create a dictionary of unicode -> (glyphname, ...) mappings
+        for the default layer of the font. Note that one glyph can
+        have multiple unicode values, and a unicode value can have
+        multiple glyphs pointing to it.
         """
         return self._getCharacterMapping()
 
@@ -1192,5 +1331,145 @@ class BaseFont(_BaseGlyphVendor, DeprecatedFont):
 
         Subclasses may override this method.
         """
-        layer = self.getLayer(self.defaultLayer())
+        layer = self.getLayer(self.defaultLayer)
         return layer.getCharacterMapping()
+
+    def getCharacterMap(self):
+        """
+        Get the character map of the default layer of the font
+        as a :class:`fontParts.base.characterMap.CharacterMap`.
+
+            >>> font.getCharacterMap().getGlyphName(0x41)
+            'A'
+        """
+        return self._getCharacterMap()
+
+    def _getCharacterMap(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.getCharacterMap`.
+
+        Subclasses may override this method.
+        """
+        layer = self.getLayer(self.defaultLayer)
+        return layer.getCharacterMap()
+
+    # -------
+    # Metrics
+    # -------
+
+    def getMetrics(self, glyphNames=None):
+        """
+        Get the metrics of all glyphs in the default layer.
+
+            >>> metrics = font.getMetrics()
+            >>> metrics["width"]
+            [500, 550, 520]
+
+        See :meth:`BaseLayer.getMetrics`.
+        """
+        return self._getMetrics(glyphNames)
+
+    def _getMetrics(self, glyphNames):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.getMetrics`.
+
+        Subclasses may override this method.
+        """
+        layer = self.getLayer(self.defaultLayer)
+        return layer.getMetrics(glyphNames)
+
+    def setMetrics(self, metrics):
+        """
+        Set the metrics of glyphs in the default layer.
+
+            >>> metrics = font.getMetrics()
+            >>> metrics["rightMargin"] = [40, 40, 40]
+            >>> font.setMetrics(metrics)
+
+        See :meth:`BaseLayer.setMetrics`.
+        """
+        self._setMetrics(metrics)
+
+    def _setMetrics(self, metrics):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.setMetrics`.
+
+        Subclasses may override this method.
+        """
+        layer = self.getLayer(self.defaultLayer)
+        layer.setMetrics(metrics)
+
+    # ------------
+    # Fingerprints
+    # ------------
+
+    def getFingerprints(self, glyphNames=None, lib=False):
+        """
+        Get the fingerprints of all glyphs in the default layer.
+
+            >>> fingerprints = font.getFingerprints()
+
+        See :meth:`BaseLayer.getFingerprints`.
+        """
+        return self._getFingerprints(glyphNames, lib)
+
+    def _getFingerprints(self, glyphNames, lib):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.getFingerprints`.
+
+        Subclasses may override this method.
+        """
+        layer = self.getLayer(self.defaultLayer)
+        return layer.getFingerprints(glyphNames, lib=lib)
+
+    def findDuplicateGlyphs(self, lib=False):
+        """
+        Find the glyphs in the default layer that have
+        the same content.
+
+            >>> font.findDuplicateGlyphs()
+            [('A', 'A.alt')]
+
+        See :meth:`BaseLayer.findDuplicateGlyphs`.
+        """
+        return self._findDuplicateGlyphs(lib)
+
+    def _findDuplicateGlyphs(self, lib):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.findDuplicateGlyphs`.
+
+        Subclasses may override this method.
+        """
+        layer = self.getLayer(self.defaultLayer)
+        return layer.findDuplicateGlyphs(lib=lib)
+
+    def findIdenticalGlyphs(self, other, lib=False):
+        """
+        Find the glyphs that have the same content in the
+        default layers of the font and **other**.
+
+            >>> font.findIdenticalGlyphs(otherFont)
+            ['period', 'space']
+
+        **other** must be a :class:`BaseFont`.
+        See :meth:`BaseLayer.findIdenticalGlyphs`.
+        """
+        if not isinstance(other, BaseFont):
+            raise FontPartsError("Glyphs can not be compared with an instance of %r." % other.__class__.__name__)
+        return self._findIdenticalGlyphs(other, lib)
+
+    def _findIdenticalGlyphs(self, other, lib):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.findIdenticalGlyphs`.
+
+        Subclasses may override this method.
+        """
+        layer = self.getLayer(self.defaultLayer)
+        otherLayer = other.getLayer(other.defaultLayer)
+        return layer.findIdenticalGlyphs(otherLayer, lib=lib)
@@ -0,0 +1,374 @@
+"""
+Differences between fonts.
+
+    >>> changes = font.diff(otherFont)
+    >>> changes["kerning"]
+    {'set': [['A', 'V', -40]], 'remove': [['T', 'o']]}
+    >>> font.patch(changes)
+
+:func:`diffFonts` makes a change set that turns one font into
+another and :func:`patchFont` applies a change set to a font.
+A change set is a dictionary that only holds the data that is
+different. It is made of dictionaries, lists, strings, numbers,
+booleans and None, plus whatever the libs hold, so it can be
+written as JSON. It can not be written as a property list
+because property lists do not have None.
+
+Glyphs are compared by their fingerprints, see
+:mod:`fontParts.base.fingerprint`, together with the data
+that is not in the fingerprint: the unicodes, the note, the
+mark color, the guidelines, the point names, the anchor colors
+and the contour, point and component identifiers. Only the
+glyphs that differ are read in full. Glyph images are not
+compared.
+
+The keys of a change set are:
+
++------------------+-----------------------------------------------------+
+| ``info``         | A dictionary of changed info attributes.            |
++------------------+-----------------------------------------------------+
+| ``groups``       | ``set``: a dictionary of groups,                    |
+|                  | ``remove``: a list of group names.                  |
++------------------+-----------------------------------------------------+
+| ``kerning``      | ``set``: a list of ``[first, second, value]``,      |
+|                  | ``remove``: a list of ``[first, second]``.          |
++------------------+-----------------------------------------------------+
+| ``features``     | The feature text.                                   |
++------------------+-----------------------------------------------------+
+| ``lib``          | ``set``: a dictionary of lib items,                 |
+|                  | ``remove``: a list of lib keys.                     |
++------------------+-----------------------------------------------------+
+| ``guidelines``   | A list of the font guidelines.                      |
++------------------+-----------------------------------------------------+
+| ``layers``       | A dictionary mapping layer names to dictionaries    |
+|                  | with any of ``color``, ``lib``, ``glyphs`` (a       |
+|                  | dictionary mapping glyph names to glyph data) and   |
+|                  | ``removeGlyphs`` (a list of glyph names).           |
++------------------+-----------------------------------------------------+
+| ``removeLayers`` | A list of layer names.                              |
++------------------+-----------------------------------------------------+
+| ``defaultLayer`` | The name of the default layer.                      |
++------------------+-----------------------------------------------------+
+| ``layerOrder``   | The layer order.                                    |
++------------------+-----------------------------------------------------+
+| ``glyphOrder``   | The glyph order.                                    |
++------------------+-----------------------------------------------------+
+"""
+
+from copy import deepcopy
+
+
+def _color(color):
+    if color is None:
+        return None
+    return list(color)
+
+
+def _guidelineData(guideline):
+    return dict(
+        x=guideline.x,
+        y=guideline.y,
+        angle=guideline.angle,
+        name=guideline.name,
+        color=_color(guideline.color)
+    )
+
+
+def _guidelinesData(guidelines):
+    return [_guidelineData(guideline) for guideline in guidelines]
+
+
+# ----------
+# Dictionary
+# ----------
+
+def _diffDict(items, otherItems):
+    changes = {}
+    changed = dict(
+        (key, deepcopy(value)) for key, value in otherItems.items()
+        if key not in items or items[key] != value
+    )
+    if changed:
+        changes["set"] = changed
+    removed = sorted(key for key in items if key not in otherItems)
+    if removed:
+        changes["remove"] = removed
+    return changes
+
+
+def _patchDict(obj, changes):
+    for key in changes.get("remove", ()):
+        if key in obj:
+            del obj[key]
+    for key, value in changes.get("set", {}).items():
+        obj[key] = deepcopy(value)
+
+
+def _diffKerning(kerning, otherKerning):
+    changes = {}
+    changed = sorted(
+        [pair[0], pair[1], value] for pair, value in otherKerning.items()
+        if pair not in kerning or kerning[pair] != value
+    )
+    if changed:
+        changes["set"] = changed
+    removed = sorted([pair[0], pair[1]] for pair in kerning if pair not in otherKerning)
+    if removed:
+        changes["remove"] = removed
+    return changes
+
+
+def _patchKerning(kerning, changes):
+    for first, second in changes.get("remove", ()):
+        pair = (first, second)
+        if pair in kerning:
+            del kerning[pair]
+    for first, second, value in changes.get("set", ()):
+        kerning[first, second] = value
+
+
+# ------
+# Glyphs
+# ------
+
+class _GlyphDataPointPen(object):
+
+    def __init__(self):
+        self.contours = []
+        self.components = []
+
+    def beginPath(self, identifier=None, **kwargs):
+        self.contours.append(dict(identifier=identifier, points=[]))
+
+    def addPoint(self, pt, segmentType=None, smooth=False, name=None, identifier=None, **kwargs):
+        self.contours[-1]["points"].append([pt[0], pt[1], segmentType, smooth, name, identifier])
+
+    def endPath(self):
+        pass
+
+    def addComponent(self, baseGlyphName, transformation, identifier=None, **kwargs):
+        self.components.append([baseGlyphName, list(transformation), identifier])
+
+
+def _outlineAttributes(glyph):
+    """
+    Get the point names and the identifiers
+    that are not in the fingerprint of **glyph**.
+    """
+    pen = _GlyphDataPointPen()
+    glyph.drawPoints(pen)
+    contours = [
+        (contour["identifier"], [point[4:] for point in contour["points"]])
+        for contour in pen.contours
+    ]
+    components = [component[2] for component in pen.components]
+    return contours, components
+
+
+def _glyphKeys(layer):
+    """
+    Get a dictionary mapping the glyph names in **layer**
+    to values that are equal if the glyphs are equal.
+    """
+    fingerprints = layer.getFingerprints(lib=True)
+    keys = {}
+    for glyphName, fingerprint in fingerprints.items():
+        glyph = layer[glyphName]
+        keys[glyphName] = (
+            fingerprint,
+            tuple(glyph.unicodes),
+            glyph.note,
+            glyph.markColor,
+            _guidelinesData(glyph.guidelines),
+            _outlineAttributes(glyph),
+            [anchor.color for anchor in glyph.anchors]
+        )
+    return keys
+
+
+def _glyphData(glyph):
+    pen = _GlyphDataPointPen()
+    glyph.drawPoints(pen)
+    return dict(
+        width=glyph.width,
+        height=glyph.height,
+        unicodes=list(glyph.unicodes),
+        note=glyph.note,
+        markColor=_color(glyph.markColor),
+        contours=pen.contours,
+        components=pen.components,
+        anchors=[
+            dict(name=anchor.name, x=anchor.x, y=anchor.y, color=_color(anchor.color))
+            for anchor in glyph.anchors
+        ],
+        guidelines=_guidelinesData(glyph.guidelines),
+        lib=deepcopy(dict(glyph.lib))
+    )
+
+
+def _drawOutlineData(glyph, contours, components):
+    pen = glyph.getPointPen()
+    for contour in contours:
+        pen.beginPath(identifier=contour["identifier"])
+        for x, y, segmentType, smooth, name, identifier in contour["points"]:
+            pen.addPoint((x, y), segmentType=segmentType, smooth=smooth, name=name, identifier=identifier)
+        pen.endPath()
+    for baseGlyphName, transformation, identifier in components:
+        pen.addComponent(baseGlyphName, transformation, identifier=identifier)
+
+
+def _appendAnchorsData(glyph, anchors):
+    for anchor in anchors:
+        glyph.appendAnchor(anchor["name"], (anchor["x"], anchor["y"]), color=anchor["color"])
+
+
+def _appendGuidelinesData(obj, guidelines):
+    for guideline in guidelines:
+        obj.appendGuideline((guideline["x"], guideline["y"]), guideline["angle"], name=guideline["name"], color=guideline["color"])
+
+
+def _patchGlyph(glyph, data):
+    glyph.clear(image=False)
+    glyph.width = data["width"]
+    glyph.height = data["height"]
+    glyph.unicodes = data["unicodes"]
+    glyph.note = data["note"]
+    _drawOutlineData(glyph, data["contours"], data["components"])
+    _appendAnchorsData(glyph, data["anchors"])
+    _appendGuidelinesData(glyph, data["guidelines"])
+    glyph.lib.clear()
+    glyph.lib.update(deepcopy(data["lib"]))
+    # the mark color may be kept in the lib
+    glyph.markColor = data["markColor"]
+
+
+def _diffLayer(layer, otherLayer):
+    changes = {}
+    # a new layer is compared with an empty layer
+    if layer is None:
+        color = None
+        lib = {}
+        keys = {}
+    else:
+        color = layer.color
+        lib = dict(layer.lib)
+        keys = _glyphKeys(layer)
+    if color != otherLayer.color:
+        changes["color"] = _color(otherLayer.color)
+    if lib != dict(otherLayer.lib):
+        changes["lib"] = deepcopy(dict(otherLayer.lib))
+    otherKeys = _glyphKeys(otherLayer)
+    glyphs = {}
+    for glyphName, key in otherKeys.items():
+        if keys.get(glyphName) != key:
+            glyphs[glyphName] = _glyphData(otherLayer[glyphName])
+    if glyphs:
+        changes["glyphs"] = glyphs
+    removed = sorted(glyphName for glyphName in keys if glyphName not in otherKeys)
+    if removed:
+        changes["removeGlyphs"] = removed
+    return changes
+
+
+def _patchLayer(layer, changes):
+    if "color" in changes:
+        layer.color = changes["color"]
+    if "lib" in changes:
+        layer.lib.clear()
+        layer.lib.update(deepcopy(changes["lib"]))
+    for glyphName in changes.get("removeGlyphs", ()):
+        if glyphName in layer:
+            layer.removeGlyph(glyphName)
+    for glyphName, data in changes.get("glyphs", {}).items():
+        if glyphName in layer:
+            glyph = layer[glyphName]
+        else:
+            glyph = layer.newGlyph(glyphName)
+        _patchGlyph(glyph, data)
+
+
+# -----
+# Fonts
+# -----
+
+def diffFonts(font, other):
+    """
+    Make a change set that turns **font** into **other**.
+    """
+    changes = {}
+    # info
+    info = font.info
+    otherInfo = other.info
+    changed = {}
+    for attr in info.copyAttributes:
+        value = getattr(otherInfo, attr)
+        if getattr(info, attr) != value:
+            changed[attr] = deepcopy(value)
+    if changed:
+        changes["info"] = changed
+    # groups, kerning and lib
+    for key, diff in (("groups", _diffDict), ("kerning", _diffKerning), ("lib", _diffDict)):
+        diffed = diff(dict(getattr(font, key)), dict(getattr(other, key)))
+        if diffed:
+            changes[key] = diffed
+    # features
+    if font.features.text != other.features.text:
+        changes["features"] = other.features.text
+    # guidelines
+    guidelines = _guidelinesData(other.guidelines)
+    if _guidelinesData(font.guidelines) != guidelines:
+        changes["guidelines"] = guidelines
+    # layers
+    layers = {}
+    layerOrder = font.layerOrder
+    for layerName in other.layerOrder:
+        layer = None
+        if layerName in layerOrder:
+            layer = font.getLayer(layerName)
+        diffed = _diffLayer(layer, other.getLayer(layerName))
+        if diffed or layer is None:
+            layers[layerName] = diffed
+    if layers:
+        changes["layers"] = layers
+    removed = [layerName for layerName in layerOrder if layerName not in other.layerOrder]
+    if removed:
+        changes["removeLayers"] = removed
+    for attr in ("defaultLayer", "layerOrder", "glyphOrder"):
+        value = getattr(other, attr)
+        if getattr(font, attr) != value:
+            changes[attr] = deepcopy(value)
+    return changes
+
+
+def patchFont(font, changes):
+    """
+    Apply the change set **changes** to **font**.
+    """
+    for attr, value in changes.get("info", {}).items():
+        setattr(font.info, attr, deepcopy(value))
+    if "groups" in changes:
+        _patchDict(font.groups, changes["groups"])
+    if "kerning" in changes:
+        _patchKerning(font.kerning, changes["kerning"])
+    if "lib" in changes:
+        _patchDict(font.lib, changes["lib"])
+    if "features" in changes:
+        font.features.text = changes["features"]
+    if "guidelines" in changes:
+        font.clearGuidelines()
+        _appendGuidelinesData(font, changes["guidelines"])
+    for layerName, layerChanges in changes.get("layers", {}).items():
+        if layerName in font.layerOrder:
+            layer = font.getLayer(layerName)
+        else:
+            layer = font.newLayer(layerName)
+        _patchLayer(layer, layerChanges)
+    # the default layer can not be removed
+    if "defaultLayer" in changes:
+        font.defaultLayer = changes["defaultLayer"]
+    for layerName in changes.get("removeLayers", ()):
+        if layerName in font.layerOrder:
+            font.removeLayer(layerName)
+    for attr in ("layerOrder", "glyphOrder"):
+        if attr in changes:
+            setattr(font, attr, changes[attr])
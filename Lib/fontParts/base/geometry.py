@@ -0,0 +1,666 @@
+"""
+Outline geometry helpers shared by the base objects.
+
+Contours are handled as lists of ``(x, y, segmentType)``
+tuples, as collected by :class:`ContourPointsPen`. Off
+curve points have a ``segmentType`` of ``None``. Signed
+areas follow the usual mathematical convention: they are
+positive for counter-clockwise contours and negative for
+clockwise contours.
+"""
+
+import math
+from bisect import bisect_right
+from fontTools.pens.basePen import BasePen, decomposeSuperBezierSegment, decomposeQuadraticSegment
+
+# -----------------
+# Point Collection
+# -----------------
+
+
+class ContourPointsPen(object):
+
+    """
+    A point pen that collects the points of the
+    contours drawn into it. Components are ignored.
+
+        >>> pen = ContourPointsPen()
+        >>> glyph.drawPoints(pen)
+        >>> pen.contours
+        [[(100, 0, 'line'), (100, 100, 'line'), ...]]
+    """
+
+    def __init__(self):
+        self.contours = []
+
+    def beginPath(self, identifier=None, **kwargs):
+        self.contours.append([])
+
+    def addPoint(self, pt, segmentType=None, smooth=False, name=None, identifier=None, **kwargs):
+        self.contours[-1].append((pt[0], pt[1], segmentType))
+
+    def endPath(self):
+        pass
+
+    def addComponent(self, baseGlyphName, transformation, identifier=None, **kwargs):
+        pass
+
+
+def getContourPoints(contour):
+    """
+    Get the points of **contour** as a list of
+    ``(x, y, segmentType)`` tuples.
+    """
+    pen = ContourPointsPen()
+    contour.drawPoints(pen)
+    if not pen.contours:
+        return []
+    return pen.contours[0]
+
+
+def isOpen(points):
+    """
+    Return a boolean indicating if **points**
+    describe an open contour.
+    """
+    return bool(points) and points[0][2] == "move"
+
+# --------
+# Segments
+# --------
+
+
+def contourSegments(points):
+    """
+    Convert the points of a contour to a list of
+    segments. Each segment is a tuple of coordinates
+    starting with the previous on curve point: two for
+    lines, three for quadratic curves and four for cubic
+    curves. Implied on curve points in quadratic curves
+    and super bezier curves are split into plain segments.
+    Closed contours include the closing segment.
+    """
+    if not points:
+        return []
+    starts = [i for i, point in enumerate(points) if point[2] is not None]
+    if isOpen(points):
+        points = list(points)
+        closing = []
+    elif not starts:
+        # a quadratic contour without on curve points
+        first = points[0]
+        last = points[-1]
+        implied = ((first[0] + last[0]) * .5, (first[1] + last[1]) * .5, "qcurve")
+        points = [implied] + list(points)
+        closing = points[:1]
+    else:
+        start = starts[0]
+        points = points[start:] + points[:start]
+        closing = points[:1]
+    segments = []
+    current = (points[0][0], points[0][1])
+    offCurves = []
+    for x, y, segmentType in points[1:] + closing:
+        if segmentType is None:
+            offCurves.append((x, y))
+            continue
+        point = (x, y)
+        if not offCurves:
+            if point != current:
+                segments.append((current, point))
+        elif segmentType == "curve" and len(offCurves) == 2:
+            segments.append((current, offCurves[0], offCurves[1], point))
+        elif segmentType == "curve" and len(offCurves) > 2:
+            for segment in decomposeSuperBezierSegment(offCurves + [point]):
+                segments.append((current,) + tuple(segment))
+                current = segment[-1]
+        else:
+            for segment in decomposeQuadraticSegment(offCurves + [point]):
+                segments.append((current,) + tuple(segment))
+                current = segment[-1]
+        current = point
+        offCurves = []
+    return segments
+
+
+def _cross(a, b):
+    return a[0] * b[1] - b[0] * a[1]
+
+
+def segmentsSignedArea(segments):
+    """
+    Calculate the exact signed area enclosed by
+    **segments** with Green's theorem.
+    """
+    area = 0
+    for segment in segments:
+        if len(segment) == 2:
+            p0, p1 = segment
+            area += _cross(p0, p1) * 3
+        elif len(segment) == 3:
+            p0, p1, p2 = segment
+            area += (
+                2 * _cross(p0, p1) + 2 * _cross(p1, p2) + _cross(p0, p2)
+            )
+        else:
+            p0, p1, p2, p3 = segment
+            area += (
+                6 * _cross(p0, p1) + 3 * _cross(p0, p2) + _cross(p0, p3)
+                + 3 * _cross(p1, p2) + 3 * _cross(p1, p3) + 6 * _cross(p2, p3)
+            ) * .3
+    return area / 6.0
+
+
+def flattenSegments(segments, steps=8):
+    """
+    Approximate **segments** with a polygon. Curves are
+    split into **steps** lines. The returned list of
+    ``(x, y)`` tuples is implicitly closed.
+    """
+    polygon = []
+    for segment in segments:
+        if len(segment) == 2:
+            polygon.append(segment[1])
+        elif len(segment) == 3:
+            (x0, y0), (x1, y1), (x2, y2) = segment
+            for i in range(1, steps + 1):
+                t = i / float(steps)
+                mt = 1 - t
+                a = mt * mt
+                b = 2 * mt * t
+                c = t * t
+                polygon.append((a * x0 + b * x1 + c * x2, a * y0 + b * y1 + c * y2))
+        else:
+            (x0, y0), (x1, y1), (x2, y2), (x3, y3) = segment
+            for i in range(1, steps + 1):
+                t = i / float(steps)
+                mt = 1 - t
+                a = mt * mt * mt
+                b = 3 * mt * mt * t
+                c = 3 * mt * t * t
+                d = t * t * t
+                polygon.append((
+                    a * x0 + b * x1 + c * x2 + d * x3,
+                    a * y0 + b * y1 + c * y2 + d * y3
+                ))
+    return polygon
+
+
+def polygonBounds(polygon):
+    """
+    Get the bounds of **polygon** as (xMin, yMin, xMax, yMax).
+    """
+    xs = [x for x, y in polygon]
+    ys = [y for x, y in polygon]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def polygonWinding(polygon, point):
+    """
+    Calculate the winding number of **polygon**
+    around **point**. ``None`` is returned if
+    **point** is on the polygon's outline.
+    """
+    x, y = point
+    winding = 0
+    x0, y0 = polygon[-1]
+    for x1, y1 in polygon:
+        if y0 <= y:
+            if y1 > y:
+                side = (x1 - x0) * (y - y0) - (x - x0) * (y1 - y0)
+                if side > 0:
+                    winding += 1
+                elif side == 0:
+                    return None
+            elif y1 == y == y0 and min(x0, x1) <= x <= max(x0, x1):
+                return None
+        elif y1 <= y:
+            side = (x1 - x0) * (y - y0) - (x - x0) * (y1 - y0)
+            if side < 0:
+                winding -= 1
+            elif side == 0:
+                return None
+        x0, y0 = x1, y1
+    return winding
+
+# ------------
+# Measurements
+# ------------
+
+# 8 point Gauss-Legendre quadrature on [0, 1]
+_gaussNodes = (
+    (0.019855071751231856, 0.05061426814518809),
+    (0.10166676129318658, 0.11119051722668723),
+    (0.2372337950418355, 0.1568533229389437),
+    (0.4082826787521751, 0.181341891689181),
+    (0.591717321247825, 0.181341891689181),
+    (0.7627662049581645, 0.1568533229389437),
+    (0.8983332387068135, 0.11119051722668723),
+    (0.9801449282487682, 0.05061426814518809),
+)
+
+
+def _derivatives(segment, t):
+    # first and second derivatives at t
+    if len(segment) == 2:
+        (x0, y0), (x1, y1) = segment
+        return x1 - x0, y1 - y0, 0, 0
+    if len(segment) == 3:
+        (x0, y0), (x1, y1), (x2, y2) = segment
+        mt = 1 - t
+        dx = 2 * (mt * (x1 - x0) + t * (x2 - x1))
+        dy = 2 * (mt * (y1 - y0) + t * (y2 - y1))
+        ddx = 2 * (x2 - 2 * x1 + x0)
+        ddy = 2 * (y2 - 2 * y1 + y0)
+        return dx, dy, ddx, ddy
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = segment
+    mt = 1 - t
+    dx = 3 * (mt * mt * (x1 - x0) + 2 * mt * t * (x2 - x1) + t * t * (x3 - x2))
+    dy = 3 * (mt * mt * (y1 - y0) + 2 * mt * t * (y2 - y1) + t * t * (y3 - y2))
+    ddx = 6 * (mt * (x2 - 2 * x1 + x0) + t * (x3 - 2 * x2 + x1))
+    ddy = 6 * (mt * (y2 - 2 * y1 + y0) + t * (y3 - 2 * y2 + y1))
+    return dx, dy, ddx, ddy
+
+
+def segmentPoint(segment, t):
+    """
+    Get the point at **t** on **segment**.
+    """
+    mt = 1 - t
+    if len(segment) == 2:
+        (x0, y0), (x1, y1) = segment
+        return (mt * x0 + t * x1, mt * y0 + t * y1)
+    if len(segment) == 3:
+        (x0, y0), (x1, y1), (x2, y2) = segment
+        a = mt * mt
+        b = 2 * mt * t
+        c = t * t
+        return (a * x0 + b * x1 + c * x2, a * y0 + b * y1 + c * y2)
+    (x0, y0), (x1, y1), (x2, y2), (x3, y3) = segment
+    a = mt * mt * mt
+    b = 3 * mt * mt * t
+    c = 3 * mt * t * t
+    d = t * t * t
+    return (
+        a * x0 + b * x1 + c * x2 + d * x3,
+        a * y0 + b * y1 + c * y2 + d * y3
+    )
+
+
+def segmentsLength(segments, subdivisions=4):
+    """
+    Calculate the arc length of **segments**. The length
+    of curves is integrated with Gauss-Legendre quadrature
+    over **subdivisions** parts of each curve.
+    """
+    length = 0
+    for segment in segments:
+        if len(segment) == 2:
+            (x0, y0), (x1, y1) = segment
+            length += ((x1 - x0) ** 2 + (y1 - y0) ** 2) ** .5
+            continue
+        step = 1.0 / subdivisions
+        for i in range(subdivisions):
+            for node, weight in _gaussNodes:
+                dx, dy, ddx, ddy = _derivatives(segment, (i + node) * step)
+                length += weight * step * (dx * dx + dy * dy) ** .5
+    return length
+
+
+def segmentsCentroid(segments, area=None):
+    """
+    Calculate the centroid of the area enclosed by
+    **segments**. ``None`` is returned if the area is
+    zero. The integrals of Green's theorem are exact
+    for lines, quadratic and cubic curves.
+    """
+    if area is None:
+        area = segmentsSignedArea(segments)
+    if not area:
+        return None
+    xIntegral = 0
+    yIntegral = 0
+    for segment in segments:
+        if len(segment) == 2:
+            (x0, y0), (x1, y1) = segment
+            xIntegral += (y1 - y0) * (x0 * x0 + x0 * x1 + x1 * x1) / 3.0
+            yIntegral += (x1 - x0) * (y0 * y0 + y0 * y1 + y1 * y1) / 3.0
+            continue
+        for node, weight in _gaussNodes:
+            x, y = segmentPoint(segment, node)
+            dx, dy, ddx, ddy = _derivatives(segment, node)
+            xIntegral += weight * x * x * dy
+            yIntegral += weight * y * y * dx
+    return (xIntegral / (2 * area), -yIntegral / (2 * area))
+
+
+def segmentCurvature(segment, t):
+    """
+    Get the signed curvature of **segment** at **t**.
+    """
+    dx, dy, ddx, ddy = _derivatives(segment, t)
+    speed = dx * dx + dy * dy
+    if not speed:
+        return 0
+    return (dx * ddy - dy * ddx) / speed ** 1.5
+
+
+def segmentsCurvatureExtrema(segments, samples=32):
+    """
+    Find the points inside the curves of **segments**
+    where the magnitude of the curvature has a local
+    maximum. The curvature is sampled at **samples**
+    positions per curve and each maximum is refined
+    with a golden section search. A list of
+    ``((x, y), curvature)`` tuples is returned.
+    """
+    extrema = []
+    for segment in segments:
+        if len(segment) == 2:
+            continue
+        ts = [i / float(samples) for i in range(samples + 1)]
+        values = [abs(segmentCurvature(segment, t)) for t in ts]
+        for i in range(1, samples):
+            if values[i] > values[i - 1] and values[i] >= values[i + 1]:
+                t = _goldenSectionMaximum(segment, ts[i - 1], ts[i + 1])
+                if t <= 0 or t >= 1:
+                    continue
+                extrema.append((segmentPoint(segment, t), segmentCurvature(segment, t)))
+    return extrema
+
+
+_goldenRatio = (5 ** .5 - 1) / 2
+
+
+def _goldenSectionMaximum(segment, low, high, iterations=30):
+    a = high - _goldenRatio * (high - low)
+    b = low + _goldenRatio * (high - low)
+    fa = abs(segmentCurvature(segment, a))
+    fb = abs(segmentCurvature(segment, b))
+    for i in range(iterations):
+        if fa < fb:
+            low = a
+            a = b
+            fa = fb
+            b = low + _goldenRatio * (high - low)
+            fb = abs(segmentCurvature(segment, b))
+        else:
+            high = b
+            b = a
+            fb = fa
+            a = high - _goldenRatio * (high - low)
+            fa = abs(segmentCurvature(segment, a))
+    return (low + high) * .5
+
+
+def measureContours(contours):
+    """
+    Measure the contours in **contours**, a list of point
+    lists. A list with a dictionary for each contour is
+    returned. The dictionaries contain the signed ``area``,
+    ``clockwise``, the arc ``length``, the ``centroid``
+    of the area and the ``curvatureExtrema``. Open contours
+    have no area, direction or centroid.
+    """
+    measurements = []
+    for points in contours:
+        segments = contourSegments(points)
+        if isOpen(points):
+            area = 0
+            clockwise = None
+            centroid = None
+        else:
+            area = segmentsSignedArea(segments)
+            clockwise = area < 0
+            centroid = segmentsCentroid(segments, area)
+        measurements.append(dict(
+            area=area,
+            clockwise=clockwise,
+            length=segmentsLength(segments),
+            centroid=centroid,
+            curvatureExtrema=segmentsCurvatureExtrema(segments)
+        ))
+    return measurements
+
+# ------------------
+# Flattened Outlines
+# ------------------
+
+flatteningTolerance = 0.1
+
+
+def _flatteningSteps(dx, dy, factor):
+    # the number of lines needed to keep the distance
+    # between the curve and the lines below the tolerance.
+    dd = math.hypot(dx, dy)
+    steps = int(math.ceil(math.sqrt(factor * dd / flatteningTolerance)))
+    return max(1, min(256, steps))
+
+
+class FlattenPen(BasePen):
+
+    """
+    A pen that converts the closed contours drawn into
+    it to polygons. Curves are split into enough lines
+    to stay within ``flatteningTolerance`` of the curve.
+    Components are drawn from **glyphSet** and components
+    with a missing base glyph are skipped. Open contours
+    are ignored.
+    """
+
+    def __init__(self, glyphSet=None):
+        BasePen.__init__(self, glyphSet)
+        self.skipMissingComponents = True
+        self.polygons = []
+        self._polygon = None
+
+    def _moveTo(self, pt):
+        self._polygon = [pt]
+
+    def _lineTo(self, pt):
+        self._polygon.append(pt)
+
+    def _curveToOne(self, pt1, pt2, pt3):
+        pt0 = self._getCurrentPoint()
+        steps = _flatteningSteps(
+            max(abs(pt0[0] - 2 * pt1[0] + pt2[0]), abs(pt1[0] - 2 * pt2[0] + pt3[0])),
+            max(abs(pt0[1] - 2 * pt1[1] + pt2[1]), abs(pt1[1] - 2 * pt2[1] + pt3[1])),
+            .75
+        )
+        segment = (pt0, pt1, pt2, pt3)
+        polygon = self._polygon
+        for i in range(1, steps):
+            polygon.append(segmentPoint(segment, i / float(steps)))
+        polygon.append(pt3)
+
+    def _qCurveToOne(self, pt1, pt2):
+        pt0 = self._getCurrentPoint()
+        steps = _flatteningSteps(pt0[0] - 2 * pt1[0] + pt2[0], pt0[1] - 2 * pt1[1] + pt2[1], .25)
+        segment = (pt0, pt1, pt2)
+        polygon = self._polygon
+        for i in range(1, steps):
+            polygon.append(segmentPoint(segment, i / float(steps)))
+        polygon.append(pt2)
+
+    def _closePath(self):
+        polygon = self._polygon
+        if polygon is not None and len(polygon) > 2:
+            self.polygons.append(polygon)
+        self._polygon = None
+
+    def _endPath(self):
+        self._polygon = None
+
+    def addComponent(self, glyphName, transformation):
+        if self.glyphSet is None or glyphName not in self.glyphSet:
+            return
+        BasePen.addComponent(self, glyphName, transformation)
+
+
+class FlattenedOutline(object):
+
+    """
+    Polygons prepared for fast winding number queries.
+    The non-horizontal edges are indexed in horizontal
+    bands, so each query only looks at the edges in the
+    band of the tested point. Points with the same y share
+    one scanline of edge crossings.
+    """
+
+    def __init__(self, polygons):
+        edges = []
+        for polygon in polygons:
+            x0, y0 = polygon[-1]
+            for x1, y1 in polygon:
+                if y0 != y1:
+                    if y0 < y1:
+                        edges.append((y0, y1, x0, (x1 - x0) / float(y1 - y0), 1))
+                    else:
+                        edges.append((y1, y0, x1, (x0 - x1) / float(y0 - y1), -1))
+                x0, y0 = x1, y1
+        self.edges = edges
+        if not edges:
+            self.yMin = self.yMax = 0
+            self._bands = []
+            self._bandHeight = 1
+            return
+        yMin = min(edge[0] for edge in edges)
+        yMax = max(edge[1] for edge in edges)
+        bandCount = max(1, min(1024, len(edges) // 2))
+        bandHeight = (yMax - yMin) / float(bandCount)
+        bands = [[] for i in range(bandCount)]
+        for edge in edges:
+            first = int((edge[0] - yMin) / bandHeight)
+            last = min(bandCount - 1, int((edge[1] - yMin) / bandHeight))
+            for index in range(first, last + 1):
+                bands[index].append(edge)
+        self.yMin = yMin
+        self.yMax = yMax
+        self._bands = bands
+        self._bandHeight = bandHeight
+
+    def crossings(self, y):
+        """
+        Get the edges crossing the horizontal line at **y**
+        as a sorted list of ``(x, direction)`` tuples. The
+        direction is 1 for upward edges and -1 for downward
+        edges.
+        """
+        if not self.yMin <= y < self.yMax:
+            return []
+        bands = self._bands
+        band = bands[min(len(bands) - 1, int((y - self.yMin) / self._bandHeight))]
+        return sorted(
+            (xStart + (y - yLow) * slope, direction)
+            for yLow, yHigh, xStart, slope, direction in band
+            if yLow <= y < yHigh
+        )
+
+    def windings(self, points):
+        """
+        Get the winding number around each point in **points**.
+        """
+        result = [0] * len(points)
+        if not self.edges:
+            return result
+        order = sorted(range(len(points)), key=lambda i: points[i][1])
+        index = 0
+        count = len(order)
+        while index < count:
+            y = points[order[index]][1]
+            end = index + 1
+            while end < count and points[order[end]][1] == y:
+                end += 1
+            crossings = self.crossings(y)
+            if crossings:
+                xs = [x for x, direction in crossings]
+                # winding of a ray from each point to the right
+                totals = [0] * (len(crossings) + 1)
+                total = 0
+                for i in range(len(crossings) - 1, -1, -1):
+                    total += crossings[i][1]
+                    totals[i] = total
+                for i in order[index:end]:
+                    result[i] = totals[bisect_right(xs, points[i][0])]
+            index = end
+        return result
+
+    def pointsInside(self, points, evenOdd=False):
+        """
+        Get a list of booleans indicating if each
+        point in **points** is inside the outline.
+        """
+        if evenOdd:
+            return [winding % 2 == 1 for winding in self.windings(points)]
+        return [winding != 0 for winding in self.windings(points)]
+
+# -------
+# Nesting
+# -------
+
+
+class ContourGeometry(object):
+
+    """
+    The signed area, flattened outline and
+    bounds of one closed contour.
+    """
+
+    __slots__ = ("segments", "area", "polygon", "bounds")
+
+    def __init__(self, points):
+        self.segments = contourSegments(points)
+        self.area = segmentsSignedArea(self.segments)
+        self.polygon = flattenSegments(self.segments)
+        if self.polygon:
+            self.bounds = polygonBounds(self.polygon)
+        else:
+            self.bounds = None
+
+
+def _contains(container, contour):
+    # one winding test for the first point of the
+    # contour that is not on the container's outline.
+    for point in contour.polygon:
+        winding = polygonWinding(container.polygon, point)
+        if winding is not None:
+            return winding != 0
+    return False
+
+
+def nestingDepths(geometries):
+    """
+    Calculate how many of the other contours in
+    **geometries**, a list of :class:`ContourGeometry`
+    objects, enclose each contour. Candidate enclosing
+    contours are found with an index of the bounding
+    boxes sorted by their minimum x, so only contours
+    with enclosing bounds and a larger area need a
+    winding test. ``None`` is returned for contours
+    without area.
+    """
+    indexed = [
+        (geometry.bounds[0], index) for index, geometry in enumerate(geometries)
+        if geometry.bounds is not None and geometry.area
+    ]
+    indexed.sort()
+    xMins = [xMin for xMin, index in indexed]
+    depths = [None] * len(geometries)
+    for xMin, index in indexed:
+        contour = geometries[index]
+        cxMin, cyMin, cxMax, cyMax = contour.bounds
+        area = abs(contour.area)
+        depth = 0
+        for otherXMin, otherIndex in indexed[:bisect_right(xMins, cxMin)]:
+            if otherIndex == index:
+                continue
+            other = geometries[otherIndex]
+            oxMin, oyMin, oxMax, oyMax = other.bounds
+            if oxMax < cxMax or oyMin > cyMin or oyMax < cyMax:
+                continue
+            if abs(other.area) <= area:
+                continue
+            if _contains(other, contour):
+                depth += 1
+        depths[index] = depth
+    return depths
@@ -5,21 +5,28 @@ import fontMath
 from fontTools.misc.py23 import basestring
 from fontParts.base.errors import FontPartsError
 from fontParts.base.base import (
-    BaseObject, TransformationMixin, dynamicProperty, interpolate)
+    BaseObject, TransformationMixin, TransactionMixin, dynamicProperty, interpolate)
 from fontParts.base.image import BaseImage
 from fontParts.base import normalizers
+from fontParts.base import geometry
+from fontParts.base import booleanOperations
+from fontParts.base.rasterizer import Rasterizer
+from fontParts.base.decomposition import DecomposedOutlineCache, getGlyphIdentifiers
+from fontParts.base.glyphMath import GlyphMathExpression
+from fontParts.base.fingerprint import makeGlyphFingerprint
+from fontParts.base.transaction import GlyphTransaction
+from fontParts.base.unicodeNames import defaultUnicodeNameTable
 from fontParts.base.color import Color
 from fontParts.base.deprecated import DeprecatedGlyph
 
 
-class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
+class BaseGlyph(BaseObject, TransformationMixin, TransactionMixin, DeprecatedGlyph):
 
     """
         Glyph object.
     """
 
     copyAttributes = (
-        "name",
         "unicodes",
         "width",
         "height",
@@ -28,6 +35,8 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         "lib"
     )
 
+    transactionClass = GlyphTransaction
+
     def _reprContents(self):
         contents = [
             "'%s'" % self.name,
@@ -61,12 +70,27 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         return super(BaseGlyph, self).copy()
 
     def copyData(self, source):
+        self.name = source.name
+        self._willChange()
+        self._copyData(source)
+
+    def _copyData(self, source):
+        """
+        Copy everything documented in :meth:`BaseGlyph.copy`
+        except the name from **source** into the glyph. The
+        base implementation copies through the public API,
+        so **source** may come from any environment.
+
+        Subclasses may override this method to copy the data
+        of glyphs from the same environment in one step.
+        Other glyphs should be handed to the super.
+        """
         super(BaseGlyph, self).copyData(source)
         pen = self.getPointPen()
         source.drawPoints(pen)
         for sourceAnchor in source.anchors:
             self.appendAnchor(sourceAnchor.name, (sourceAnchor.x, sourceAnchor.y), sourceAnchor.color)
-        for sourceGuideline in self.guidelines:
+        for sourceGuideline in source.guidelines:
             selfGuideline = self.appendGuideline(
                 (sourceGuideline.x, sourceGuideline.y),
                 sourceGuideline.angle,
@@ -74,8 +98,10 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
                 sourceGuideline.color
             )
         sourceImage = source.image
-        if sourceImage.data is not None:
-            selfImage = self.addImage(data=sourceImage.data)
+        reference = sourceImage.reference
+        if reference is not None:
+            selfImage = self.image
+            selfImage.reference = reference
             selfImage.transformation = sourceImage.transformation
             selfImage.color = sourceImage.color
 
@@ -126,6 +152,18 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
             return None
         return self.layer.font
 
+    def _getGlyphLocation(self):
+        """
+        Subclasses may override this method.
+        """
+        layer = self.layer
+        if layer is None:
+            return None
+        font = layer.font
+        if font is None:
+            return None
+        return font, layer.name, self.name
+
     # --------------
     # Identification
     # --------------
@@ -283,13 +321,20 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         Environments will define their own heuristics for
         automatically determining values.
         """
+        self._willChange()
         self._autoUnicodes()
 
     def _autoUnicodes(self):
         """
-        Subclasses must override this method.
+        This is the environment implementation of :meth:`BaseGlyph.autoUnicodes`.
+        The values are derived from the glyph name with
+        :class:`fontParts.base.unicodeNames.UnicodeNameTable`.
+
+        Subclasses may override this method.
         """
-        self.raiseNotImplementedError()
+        unicodes = defaultUnicodeNameTable.getUnicodes(self.name)
+        if unicodes is not None and unicodes != list(self.unicodes):
+            self.unicodes = unicodes
 
     # -------
     # Metrics
@@ -428,6 +473,126 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
             xMin, yMin, xMax, yMax = bounds
             self.width = xMax + value
 
+    # angled
+
+    angledLeftMargin = dynamicProperty(
+        "base_angledLeftMargin",
+        """
+        The glyph's left margin measured along the
+        italic angle of the font.
+
+            >>> glyph.angledLeftMargin
+            42
+            >>> glyph.angledLeftMargin = 50
+
+        If the font has no italic angle this is
+        the same as :attr:`BaseGlyph.leftMargin`.
+        """
+    )
+
+    def _get_base_angledLeftMargin(self):
+        value = self._get_angledLeftMargin()
+        value = normalizers.normalizeGlyphLeftMargin(value)
+        return value
+
+    def _set_base_angledLeftMargin(self, value):
+        value = normalizers.normalizeGlyphLeftMargin(value)
+        self._set_angledLeftMargin(value)
+
+    def _get_angledLeftMargin(self):
+        """
+        This must return an int or float.
+
+        Subclasses may override this method.
+        """
+        bounds = self._getAngledBounds()
+        if bounds is None:
+            return 0
+        xMin, yMin, xMax, yMax = bounds
+        return xMin
+
+    def _set_angledLeftMargin(self, value):
+        """
+        value will be an int or float.
+
+        Subclasses may override this method.
+        """
+        diff = value - self.angledLeftMargin
+        self.moveBy((diff, 0))
+        self.width += diff
+
+    angledRightMargin = dynamicProperty(
+        "base_angledRightMargin",
+        """
+        The glyph's right margin measured along the
+        italic angle of the font.
+
+            >>> glyph.angledRightMargin
+            28
+            >>> glyph.angledRightMargin = 30
+
+        If the font has no italic angle this is
+        the same as :attr:`BaseGlyph.rightMargin`.
+        """
+    )
+
+    def _get_base_angledRightMargin(self):
+        value = self._get_angledRightMargin()
+        value = normalizers.normalizeGlyphRightMargin(value)
+        return value
+
+    def _set_base_angledRightMargin(self, value):
+        value = normalizers.normalizeGlyphRightMargin(value)
+        self._set_angledRightMargin(value)
+
+    def _get_angledRightMargin(self):
+        """
+        This must return an int or float.
+
+        Subclasses may override this method.
+        """
+        bounds = self._getAngledBounds()
+        if bounds is None:
+            return self.width
+        xMin, yMin, xMax, yMax = bounds
+        return self.width - xMax
+
+    def _set_angledRightMargin(self, value):
+        """
+        value will be an int or float.
+
+        Subclasses may override this method.
+        """
+        bounds = self._getAngledBounds()
+        if bounds is None:
+            self.width = value
+        else:
+            xMin, yMin, xMax, yMax = bounds
+            self.width = xMax + value
+
+    def _getItalicAngle(self):
+        """
+        Get the italic angle used by the angled margins.
+        This is the italic angle of the font or 0.
+
+        Subclasses may override this method.
+        """
+        font = self.font
+        if font is None:
+            return 0
+        return font.info.italicAngle or 0
+
+    def _getAngledBounds(self):
+        """
+        Get the bounds of the glyph measured along the
+        italic angle. The bounds are kept with the
+        decomposed outline of the glyph.
+
+        Subclasses may override this method.
+        """
+        italicAngle = self._getItalicAngle()
+        return self._getDecomposedOutline().getSkewedBounds(italicAngle)
+
     # vertical
 
     height = dynamicProperty(
@@ -581,13 +746,21 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         """
         self.raiseNotImplementedError()
 
-    def draw(self, pen, contours=True, components=True):
+    def draw(self, pen, contours=True, components=True, decompose=False):
         """
         Draw the glyph with the given Pen.
 
             >>> glyph.draw(pen)
             >>> glyph.draw(pen, contours=True, components=False)
+            >>> glyph.draw(pen, decompose=True)
+
+        If decompose is True the components are drawn
+        as the contours of their base glyphs.
         """
+        if decompose:
+            outline = self._getDecomposedOutline()
+            outline.draw(pen, contours=contours, components=components)
+            return
         if contours:
             for contour in self:
                 contour.draw(pen)
@@ -595,13 +768,21 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
             for component in self.components:
                 component.draw(pen)
 
-    def drawPoints(self, pen, contours=True, components=True):
+    def drawPoints(self, pen, contours=True, components=True, decompose=False):
         """
         Draw the glyph with the given PointPen.
 
             >>> glyph.drawPoints(pointPen)
             >>> glyph.drawPoints(pointPen, contours=True, components=False)
+            >>> glyph.drawPoints(pointPen, decompose=True)
+
+        If decompose is True the components are drawn
+        as the contours of their base glyphs.
         """
+        if decompose:
+            outline = self._getDecomposedOutline()
+            outline.drawPoints(pen, contours=contours, components=components)
+            return
         if contours:
             for contour in self:
                 contour.drawPoints(pen)
@@ -609,6 +790,22 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
             for component in self.components:
                 component.drawPoints(pen)
 
+    def _getDecomposedOutline(self):
+        """
+        Get the outline of the glyph with all components
+        decomposed as a :class:`fontParts.base.decomposition.DecomposedOutline`.
+        The outline is taken from the decomposed outline
+        cache of the layer.
+
+        Subclasses may override this method.
+        """
+        layer = self.layer
+        if layer is None:
+            cache = DecomposedOutlineCache(None)
+        else:
+            cache = layer._getDecomposedOutlineCache()
+        return cache.getGlyphOutline(self)
+
     # -----------------------------------------
     # Contour, Component and Anchor Interaction
     # -----------------------------------------
@@ -630,6 +827,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         It's possible to selectively turn off the clearing
         of portions of the glyph with the arguments.
         """
+        self._willChange()
         self._clear(contours=contours, components=components, anchors=anchors, guidelines=guidelines, image=image)
 
     def _clear(self, contours=True, components=True, anchors=True, guidelines=True, image=True):
@@ -662,6 +860,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         if offset is None:
             offset = (0, 0)
         offset = normalizers.normalizeTransformationOffset(offset)
+        self._willChange()
         self._appendGlyph(other, offset)
 
     def _appendGlyph(self, other, offset=None):
@@ -791,6 +990,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         if offset is None:
             offset = (0, 0)
         offset = normalizers.normalizeTransformationOffset(offset)
+        self._willChange()
         return self._appendContour(contour, offset)
 
     def _appendContour(self, contour, offset=None, **kwargs):
@@ -826,6 +1026,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         index = normalizers.normalizeContourIndex(index)
         if index >= len(self):
             raise FontPartsError("No contour located at index %d." % index)
+        self._willChange()
         self._removeContour(index)
 
     def _removeContour(self, index, **kwargs):
@@ -842,6 +1043,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
 
             >>> glyph.clearContours()
         """
+        self._willChange()
         self._clearContours()
 
     def _clearContours(self):
@@ -856,13 +1058,60 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         Perform a remove overlap operation on the contours.
 
             >>> glyph.removeOverlap()
+
+        Open contours are not changed. Contours that
+        do not overlap other contours keep their points,
+        but they may be reversed to match the direction
+        of the new contours.
         """
+        self._willChange()
+        self._removeOverlap()
 
     def _removeOverlap(self):
         """
-        Subclasses must implement this method.
+        Subclasses may override this method.
         """
-        self.raiseNotImplementedError()
+        pen = geometry.ContourPointsPen()
+        self.drawPoints(pen, components=False)
+        closedContours = []
+        indexes = {}
+        reversedIndexes = {}
+        for index, points in enumerate(pen.contours):
+            if geometry.isOpen(points):
+                continue
+            closedContours.append(points)
+            segments = geometry.contourSegments(points)
+            indexes[frozenset(segments)] = index
+            reversedIndexes[frozenset([tuple(reversed(segment)) for segment in segments])] = index
+        result = booleanOperations.union(closedContours)
+        if result is closedContours:
+            return
+        keys = [frozenset(geometry.contourSegments(points)) for points in result]
+        # the contours only differ in their start
+        # point or direction, nothing overlaps.
+        matched = set([indexes.get(key, reversedIndexes.get(key)) for key in keys])
+        if len(result) == len(closedContours) and None not in matched and len(matched) == len(result):
+            return
+        # keep the contours that come out unchanged
+        # so that their points keep their attributes.
+        unchanged = set()
+        newContours = []
+        for key, points in zip(keys, result):
+            index = indexes.get(key)
+            if index is not None:
+                unchanged.add(index)
+                continue
+            index = reversedIndexes.get(key)
+            if index is not None:
+                self.contours[index].reverse()
+                unchanged.add(index)
+                continue
+            newContours.append(points)
+        for index in reversed(range(len(pen.contours))):
+            if geometry.isOpen(pen.contours[index]) or index in unchanged:
+                continue
+            self.removeContour(index)
+        booleanOperations.drawContours(newContours, self.getPointPen())
 
     # Components
 
@@ -952,6 +1201,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         ox, oy = offset
         sx, sy = scale
         transformation = (sx, 0, 0, sy, ox, oy)
+        self._willChange()
         return self._appendComponent(baseGlyph, transformation=transformation)
 
     def _appendComponent(self, baseGlyph, transformation=None, **kwargs):
@@ -987,6 +1237,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         index = normalizers.normalizeComponentIndex(index)
         if index >= self._len__components():
             raise FontPartsError("No component located at index %d." % index)
+        self._willChange()
         self._removeComponent(index)
 
     def _removeComponent(self, index, **kwargs):
@@ -1003,6 +1254,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
 
             >>> glyph.clearComponents()
         """
+        self._willChange()
         self._clearComponents()
 
     def _clearComponents(self):
@@ -1018,14 +1270,18 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
 
             >>> glyph.decompose()
         """
+        self._willChange()
         self._decompose()
 
     def _decompose(self):
         """
         Subclasses may override this method.
         """
-        for component in self.components:
-            component.decompose()
+        if not self.components:
+            return
+        outline = self._getDecomposedOutline()
+        self.clearComponents()
+        outline.drawPoints(self.getPointPen(), contours=False, usedIdentifiers=getGlyphIdentifiers(self))
 
     # Anchors
 
@@ -1103,6 +1359,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         position = normalizers.normalizeCoordinateTuple(position)
         if color is not None:
             color = normalizers.normalizeColor(color)
+        self._willChange()
         return self._appendAnchor(name, position=position, color=color)
 
     def _appendAnchor(self, name, position=None, color=None, **kwargs):
@@ -1134,6 +1391,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         index = normalizers.normalizeAnchorIndex(index)
         if index >= self._len__anchors():
             raise FontPartsError("No anchor located at index %d." % index)
+        self._willChange()
         self._removeAnchor(index)
 
     def _removeAnchor(self, index, **kwargs):
@@ -1150,6 +1408,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
 
             >>> glyph.clearAnchors()
         """
+        self._willChange()
         self._clearAnchors()
 
     def _clearAnchors(self):
@@ -1241,6 +1500,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
             name = normalizers.normalizeGuidelineName(name)
         if color is not None:
             color = normalizers.normalizeColor(color)
+        self._willChange()
         return self._appendGuideline(position, angle, name=name, color=color)
 
     def _appendGuideline(self, position, angle, name=None, color=None, **kwargs):
@@ -1273,6 +1533,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         index = normalizers.normalizeGuidelineIndex(index)
         if index >= self._len__guidelines():
             raise FontPartsError("No guideline located at index %d." % index)
+        self._willChange()
         self._removeGuideline(index)
 
     def _removeGuideline(self, index, **kwargs):
@@ -1289,6 +1550,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
 
             >>> glyph.clearGuidelines()
         """
+        self._willChange()
         self._clearGuidelines()
 
     def _clearGuidelines(self):
@@ -1317,6 +1579,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         - anchors
         - guidelines
         """
+        self._willChange()
         self._round()
 
     def _round(self):
@@ -1338,39 +1601,83 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         Correct the direction of the contours in the glyph.
 
             >>> glyph.correctDirection()
+            >>> glyph.correctDirection(trueType=True)
+
+        By default outer contours are set to counter-clockwise,
+        following the PostScript convention. If **trueType**
+        is ``True`` outer contours are set to clockwise.
+        Open contours are ignored.
         """
+        trueType = normalizers.normalizeBoolean(trueType)
+        self._willChange()
         self._correctDirection(trueType=trueType)
 
     def _correctDirection(self, trueType=False, **kwargs):
         """
-        XXX
-
-        This could be ported from RoboFab, however
-        that algorithm is not robust enough. Specifically
-        it relies on boundses and hit testing to
-        determine nesting.
+        Subclasses may override this method.
 
-        XXX
+        The signed areas and nesting of all closed contours
+        are calculated in one pass. Contours that are enclosed
+        by an even number of other contours are outer contours.
+        With the PostScript convention outer contours are
+        counter-clockwise and with the TrueType convention they
+        are clockwise. Inner contours run the other way.
         """
-        self.raiseNotImplementedError()
+        contours = []
+        geometries = []
+        for contour in self.contours:
+            points = geometry.getContourPoints(contour)
+            if not points or geometry.isOpen(points):
+                continue
+            contours.append(contour)
+            geometries.append(geometry.ContourGeometry(points))
+        depths = geometry.nestingDepths(geometries)
+        for contour, contourGeometry, depth in zip(contours, geometries, depths):
+            if depth is None:
+                continue
+            clockwise = depth % 2 == 0
+            if not trueType:
+                clockwise = not clockwise
+            if (contourGeometry.area < 0) != clockwise:
+                contour.reverse()
 
     def autoContourOrder(self):
         """
         Sort the contours based on their centers.
 
             >>> glyph.autoContourOrder()
+
+        The contours are sorted by the center of their
+        control point bounds, first by x and then by y.
+        Contours with the same center are sorted by their
+        number of on curve points and then keep their order.
         """
+        self._willChange()
         self._autoContourOrder()
 
     def _autoContourOrder(self, **kwargs):
         """
-        XXX
-
-        This can be ported from RoboFab.
-
-        XXX
+        Subclasses may override this method.
         """
-        self.raiseNotImplementedError()
+        pen = geometry.ContourPointsPen()
+        self.drawPoints(pen, components=False)
+        keys = []
+        for index, points in enumerate(pen.contours):
+            if points:
+                xMin, yMin, xMax, yMax = geometry.polygonBounds([(x, y) for x, y, segmentType in points])
+                center = ((xMin + xMax) / 2.0, (yMin + yMax) / 2.0)
+            else:
+                center = (0, 0)
+            onCurveCount = len([point for point in points if point[2] is not None])
+            keys.append((center, onCurveCount, index))
+        order = [index for center, onCurveCount, index in sorted(keys)]
+        if order == list(range(len(order))):
+            return
+        # every contour is moved to an earlier position,
+        # so the contours that are already in place stay.
+        contours = self.contours
+        for newIndex, oldIndex in enumerate(order):
+            contours[oldIndex].index = newIndex
 
     # --------------
     # Transformation
@@ -1391,6 +1698,38 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         for guideline in self.guidelines:
             guideline.transformBy(matrix, origin=origin)
 
+    # -----------
+    # Fingerprint
+    # -----------
+
+    def getFingerprint(self, lib=False):
+        """
+        Get a fingerprint of the content of the glyph.
+
+            >>> glyph.getFingerprint()
+            '5b2c7e0e4d0b6d8e1f3c3a9a1f0b8b6c2f1c9f0a'
+
+        Glyphs with the same width, height, contours,
+        components and anchors have the same fingerprint.
+        The name and the unicodes are not included. If
+        **lib** is True the lib is included. The fingerprint
+        is a string that is the same in every session. See
+        :mod:`fontParts.base.fingerprint`.
+        """
+        lib = normalizers.normalizeBoolean(lib)
+        return self._getFingerprint(lib)
+
+    def _getFingerprint(self, lib):
+        """
+        This is the environment implementation of
+        :meth:`BaseGlyph.getFingerprint`. An environment
+        that knows when the glyph changes may keep the
+        fingerprint until the glyph is changed.
+
+        Subclasses may override this method.
+        """
+        return makeGlyphFingerprint(self, lib=lib)
+
     # --------------------
     # Interpolation & Math
     # --------------------
@@ -1420,9 +1759,10 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
             mathGlyph.guidelines.append(d)
         image = self.image
         mathGlyph.image = dict(
-            # MathGlyph works with image file names, hack
-            # around it by using the data as the file name.
-            fileName=image.data,
+            # MathGlyph works with image file names. The
+            # reference is used in place of the file name
+            # so that the data is not copied.
+            fileName=image.reference,
             transformation=image.transformation,
             color=image.color
         )
@@ -1434,6 +1774,17 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         mathGlyph.note = self.note
         return mathGlyph
 
+    def _getMathGlyph(self):
+        """
+        Get a fontMath MathGlyph with the data of the glyph.
+        The math methods only read the returned object, so
+        an environment that knows when the glyph changes may
+        return the same object until the glyph is changed.
+
+        Subclasses may override this method.
+        """
+        return self._toMathGlyph()
+
     def _fromMathGlyph(self, mathGlyph, toThisGlyph=False):
         # make the destination
         if toThisGlyph:
@@ -1462,10 +1813,10 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
                 color=guideline["color"],
                 # XXX identifier is lost
             )
-        data = mathGlyph.image["fileName"]  # see _toMathGlyph
-        if data is not None:
-            image = self.image
-            image.data = data
+        reference = mathGlyph.image["fileName"]  # see _toMathGlyph
+        if reference is not None:
+            image = copied.image
+            image.reference = reference
             image.transformation = mathGlyph.image["transformation"]
             image.color = mathGlyph.image["color"]
         copied.lib.update(mathGlyph.lib)
@@ -1481,7 +1832,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         """
         Subclasses may override this method.
         """
-        mathGlyph = self._toMathGlyph()
+        mathGlyph = self._getMathGlyph()
         result = mathGlyph * factor
         copied = self._fromMathGlyph(result)
         return copied
@@ -1492,7 +1843,7 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         """
         Subclasses may override this method.
         """
-        mathGlyph = self._toMathGlyph()
+        mathGlyph = self._getMathGlyph()
         result = mathGlyph / factor
         copied = self._fromMathGlyph(result)
         return copied
@@ -1501,8 +1852,8 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         """
         Subclasses may override this method.
         """
-        selfMathGlyph = self._toMathGlyph()
-        otherMathGlyph = other._toMathGlyph()
+        selfMathGlyph = self._getMathGlyph()
+        otherMathGlyph = other._getMathGlyph()
         result = selfMathGlyph + otherMathGlyph
         copied = self._fromMathGlyph(result)
         return copied
@@ -1511,12 +1862,234 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         """
         Subclasses may override this method.
         """
-        selfMathGlyph = self._toMathGlyph()
-        otherMathGlyph = other._toMathGlyph()
+        selfMathGlyph = self._getMathGlyph()
+        otherMathGlyph = other._getMathGlyph()
         result = selfMathGlyph - otherMathGlyph
         copied = self._fromMathGlyph(result)
         return copied
 
+    # in place
+
+    def __imul__(self, factor):
+        """
+        Multiply the glyph by **factor** in place.
+
+            >>> glyph *= 2
+            >>> glyph *= (2, 0.5)
+
+        Unlike ``glyph * factor``, this changes the glyph
+        and keeps all of its points. Refer to
+        :meth:`BaseGlyph.applyMathExpression` for the
+        data that is changed.
+        """
+        factor = normalizers.normalizeInterpolationFactor(factor)
+        self._willChange()
+        self._applyMathExpression(self.getMathExpression() * factor, round=False)
+        return self
+
+    def __idiv__(self, factor):
+        """
+        Divide the glyph by **factor** in place.
+
+            >>> glyph /= 2
+        """
+        factor = normalizers.normalizeInterpolationFactor(factor)
+        self._willChange()
+        self._applyMathExpression(self.getMathExpression() / factor, round=False)
+        return self
+
+    __itruediv__ = __idiv__
+
+    def __iadd__(self, other):
+        """
+        Add **other** to the glyph in place.
+
+            >>> glyph += otherGlyph
+        """
+        if not isinstance(other, BaseGlyph):
+            raise FontPartsError("An instance of %r can not be added to an instance of %r." % (other.__class__.__name__, self.__class__.__name__))
+        expression = self.getMathExpression() + other.getMathExpression()
+        self._willChange()
+        self._applyMathExpression(expression, round=False)
+        return self
+
+    def __isub__(self, other):
+        """
+        Subtract **other** from the glyph in place.
+
+            >>> glyph -= otherGlyph
+        """
+        if not isinstance(other, BaseGlyph):
+            raise FontPartsError("An instance of %r can not be subtracted from an instance of %r." % (other.__class__.__name__, self.__class__.__name__))
+        expression = self.getMathExpression() - other.getMathExpression()
+        self._willChange()
+        self._applyMathExpression(expression, round=False)
+        return self
+
+    def imul(self, factor):
+        """
+        Multiply the glyph by **factor** in place.
+        This is the same as ``glyph *= factor``.
+
+            >>> glyph.imul(2)
+            >>> glyph.imul((2, 0.5))
+        """
+        self *= factor
+
+    def iadd(self, other):
+        """
+        Add **other** to the glyph in place.
+        This is the same as ``glyph += other``.
+
+            >>> glyph.iadd(otherGlyph)
+        """
+        self += other
+
+    # expressions
+
+    def getMathExpression(self):
+        """
+        Get a :class:`GlyphMathExpression` for the glyph.
+        Expressions can be combined without reading the
+        glyph data and applied to a glyph with
+        :meth:`BaseGlyph.applyMathExpression`.
+
+            >>> a = glyph1.getMathExpression()
+            >>> b = glyph2.getMathExpression()
+            >>> expression = a + (b - a) * 0.25
+        """
+        return GlyphMathExpression(self)
+
+    def applyMathExpression(self, expression, round=False):
+        """
+        Set the data of the glyph to the result of **expression**.
+
+            >>> glyph.applyMathExpression(a + (b - a) * 0.25)
+            >>> glyph.applyMathExpression(a * 2, round=True)
+
+        This changes the width, the height, the point
+        coordinates, the component transformations and the
+        anchor and guideline positions. Guideline angles and
+        the image are not changed. The glyphs in **expression**
+        must have the same number of contours, points,
+        components, anchors and guidelines. If the glyph does
+        not have the same number, the contours, components,
+        anchors and guidelines of the first glyph in
+        **expression** are copied into the glyph first.
+
+        **round** indicates if the result should be
+        rounded to integers.
+        """
+        if not isinstance(expression, GlyphMathExpression):
+            raise FontPartsError("An instance of %r can not be applied to a glyph." % expression.__class__.__name__)
+        round = normalizers.normalizeBoolean(round)
+        self._willChange()
+        self._applyMathExpression(expression, round=round)
+
+    def _applyMathExpression(self, expression, round=False):
+        """
+        **expression** will be a :class:`GlyphMathExpression`.
+        **round** will be a boolean.
+
+        Subclasses may override this method.
+        """
+        terms = expression.getTerms()
+        if not terms:
+            raise FontPartsError("The expression does not contain any glyphs.")
+        firstGlyph = None
+        structure = selfStructure = None
+        xValues = yValues = None
+        for glyph, xFactor, yFactor in terms:
+            glyphStructure, glyphXValues, glyphYValues = glyph._getMathValues()
+            if firstGlyph is None:
+                firstGlyph = glyph
+                structure = glyphStructure
+                xValues = [value * xFactor for value in glyphXValues]
+                yValues = [value * yFactor for value in glyphYValues]
+            else:
+                if glyphStructure != structure:
+                    raise FontPartsError("Glyphs '%s' and '%s' are not compatible." % (firstGlyph.name, glyph.name))
+                xValues = [value + other * xFactor for value, other in zip(xValues, glyphXValues)]
+                yValues = [value + other * yFactor for value, other in zip(yValues, glyphYValues)]
+            if glyph is self:
+                selfStructure = glyphStructure
+        if selfStructure is None:
+            selfStructure = self._getMathValues()[0]
+        if selfStructure != structure:
+            self.clear(image=False)
+            self.appendGlyph(firstGlyph)
+            for anchor in firstGlyph.anchors:
+                self.appendAnchor(anchor.name, (anchor.x, anchor.y), anchor.color)
+        self._setMathValues(xValues, yValues, round=round)
+
+    def _getMathValues(self):
+        """
+        Get the values used by glyph math. This returns
+        a tuple describing the number of contours, points,
+        components, anchors and guidelines in the glyph,
+        a list of the x values and a list of the y values.
+        The lists contain the width and the height, the
+        point coordinates, the scale, skew and offset values
+        of the component transformations and the anchor and
+        guideline positions, in this order.
+
+        Subclasses may override this method.
+        """
+        xValues = [self.width]
+        yValues = [self.height]
+        contourLengths = []
+        for contour in self.contours:
+            points = contour.points
+            contourLengths.append(len(points))
+            for point in points:
+                xValues.append(point.x)
+                yValues.append(point.y)
+        components = self.components
+        for component in components:
+            xScale, xyScale, yxScale, yScale, xOffset, yOffset = component.transformation
+            xValues.extend((xScale, xyScale, xOffset))
+            yValues.extend((yScale, yxScale, yOffset))
+        anchors = self.anchors
+        for anchor in anchors:
+            xValues.append(anchor.x)
+            yValues.append(anchor.y)
+        guidelines = self.guidelines
+        for guideline in guidelines:
+            xValues.append(guideline.x)
+            yValues.append(guideline.y)
+        structure = (tuple(contourLengths), len(components), len(anchors), len(guidelines))
+        return structure, xValues, yValues
+
+    def _setMathValues(self, xValues, yValues, round=False):
+        """
+        Set the values used by glyph math. **xValues**
+        and **yValues** will be lists of values in the
+        order described in :meth:`BaseGlyph._getMathValues`.
+        **round** will be a boolean.
+
+        Subclasses may override this method.
+        """
+        xValues = iter(xValues)
+        yValues = iter(yValues)
+        self.width = next(xValues)
+        self.height = next(yValues)
+        for contour in self.contours:
+            for point in contour.points:
+                point.x = next(xValues)
+                point.y = next(yValues)
+        for component in self.components:
+            xScale, xyScale, xOffset = next(xValues), next(xValues), next(xValues)
+            yScale, yxScale, yOffset = next(yValues), next(yValues), next(yValues)
+            component.transformation = (xScale, xyScale, yxScale, yScale, xOffset, yOffset)
+        for anchor in self.anchors:
+            anchor.x = next(xValues)
+            anchor.y = next(yValues)
+        for guideline in self.guidelines:
+            guideline.x = next(xValues)
+            guideline.y = next(yValues)
+        if round:
+            self.round()
+
     def interpolate(self, factor, minGlyph, maxGlyph, round=True, suppressError=True):
         """
         Interpolate all possible data in the glyph.
@@ -1545,14 +2118,15 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
             raise FontPartsError("Interpolation to an instance of %r can not be performed from an instance of %r." % (self.__class__.__name__, maxGlyph.__class__.__name__))
         round = normalizers.normalizeBoolean(round)
         suppressError = normalizers.normalizeBoolean(suppressError)
+        self._willChange()
         self._interpolate(factor, minGlyph, maxGlyph, round=round, suppressError=suppressError)
 
     def _interpolate(self, factor, minGlyph, maxGlyph, round=True, suppressError=True):
         """
         Subclasses may override this method.
         """
-        minGlyph = minGlyph._toMathGlyph()
-        maxGlyph = maxGlyph._toMathGlyph()
+        minGlyph = minGlyph._getMathGlyph()
+        maxGlyph = maxGlyph._getMathGlyph()
         try:
             result = interpolate(minGlyph, maxGlyph, factor)
         except IndexError:
@@ -1642,10 +2216,42 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         """
         Subclasses may override this method.
         """
-        from fontTools.pens.pointInsidePen import PointInsidePen
-        pen = PointInsidePen(glyphSet=None, testPoint=point, evenOdd=False)
-        self.draw(pen)
-        return pen.getResult()
+        return self._pointsInside([point], False)[0]
+
+    def pointsInside(self, points, evenOdd=False):
+        """
+        Determine if each point in a list of points is in
+        the black or white of the glyph. This is much faster
+        than calling :meth:`BaseGlyph.pointInside` for every
+        point.
+
+            >>> glyph.pointsInside([(40, 65), (0, 0)])
+            [True, False]
+
+        points must be a list of (x, y) tuples. The result
+        is a list of booleans in the same order. If evenOdd
+        is True the even-odd fill rule is used instead of
+        the nonzero fill rule.
+        """
+        points = [normalizers.normalizeCoordinateTuple(point) for point in points]
+        evenOdd = normalizers.normalizeBoolean(evenOdd)
+        return self._pointsInside(points, evenOdd)
+
+    def _pointsInside(self, points, evenOdd):
+        """
+        Subclasses may override this method.
+        """
+        outline = self._getFlattenedOutline()
+        return outline.pointsInside(points, evenOdd)
+
+    def _getFlattenedOutline(self):
+        """
+        Get the outline of the glyph, including components,
+        as a :class:`fontParts.base.geometry.FlattenedOutline`.
+
+        Subclasses may override this method.
+        """
+        return self._getDecomposedOutline().flattenedOutline
 
     bounds = dynamicProperty(
         "bounds",
@@ -1667,10 +2273,181 @@ class BaseGlyph(BaseObject, TransformationMixin, DeprecatedGlyph):
         """
         Subclasses may override this method.
         """
-        from fontTools.pens.boundsPen import BoundsPen
-        pen = BoundsPen(self.layer)
-        self.draw(pen)
-        return pen.bounds
+        return self._getDecomposedOutline().bounds
+
+    def _getContourSegments(self):
+        pen = geometry.ContourPointsPen()
+        self.drawPoints(pen, components=False)
+        return [
+            (points, geometry.contourSegments(points))
+            for points in pen.contours
+        ]
+
+    area = dynamicProperty(
+        "base_area",
+        """
+        The sum of the signed areas of the contours in
+        the glyph. With outer contours counter-clockwise
+        and inner contours clockwise this is the area
+        covered by the glyph. Components are ignored.
+
+            >>> glyph.area
+            41250.0
+        """
+    )
+
+    def _get_base_area(self):
+        return self._get_area()
+
+    def _get_area(self):
+        """
+        Subclasses may override this method.
+        """
+        area = 0
+        for points, segments in self._getContourSegments():
+            if not geometry.isOpen(points):
+                area += geometry.segmentsSignedArea(segments)
+        return area
+
+    length = dynamicProperty(
+        "base_length",
+        """
+        The sum of the arc lengths of the contours in
+        the glyph. Components are ignored.
+
+            >>> glyph.length
+            1873.6
+        """
+    )
+
+    def _get_base_length(self):
+        return self._get_length()
+
+    def _get_length(self):
+        """
+        Subclasses may override this method.
+        """
+        length = 0
+        for points, segments in self._getContourSegments():
+            length += geometry.segmentsLength(segments)
+        return length
+
+    centroid = dynamicProperty(
+        "base_centroid",
+        """
+        The centroid of the area covered by the contours
+        in the glyph: (x, y) or None if there is no area.
+        Components are ignored.
+
+            >>> glyph.centroid
+            (260.2, 338.7)
+        """
+    )
+
+    def _get_base_centroid(self):
+        value = self._get_centroid()
+        if value is not None:
+            value = normalizers.normalizeCoordinateTuple(value)
+        return value
+
+    def _get_centroid(self):
+        """
+        Subclasses may override this method.
+        """
+        totalArea = 0
+        x = 0
+        y = 0
+        for points, segments in self._getContourSegments():
+            if geometry.isOpen(points):
+                continue
+            area = geometry.segmentsSignedArea(segments)
+            if not area:
+                continue
+            centroidX, centroidY = geometry.segmentsCentroid(segments, area)
+            totalArea += area
+            x += centroidX * area
+            y += centroidY * area
+        if not totalArea:
+            return None
+        return (x / totalArea, y / totalArea)
+
+    def measureContours(self):
+        """
+        Measure all contours in the glyph at once. ::
+
+            >>> for measurements in glyph.measureContours():
+            ...     measurements["area"], measurements["length"]
+
+        A list with a dictionary for each contour is returned.
+        The dictionaries contain:
+
+        +----------------------+-------------------------------------------+
+        | ``area``             | The signed area of the contour.           |
+        +----------------------+-------------------------------------------+
+        | ``clockwise``        | The direction of the contour.             |
+        +----------------------+-------------------------------------------+
+        | ``length``           | The arc length of the contour.            |
+        +----------------------+-------------------------------------------+
+        | ``centroid``         | The centroid of the area of the contour.  |
+        +----------------------+-------------------------------------------+
+        | ``curvatureExtrema`` | See :attr:`BaseContour.curvatureExtrema`. |
+        +----------------------+-------------------------------------------+
+
+        Open contours have an area of 0 and their
+        direction and centroid are None.
+        """
+        return self._measureContours()
+
+    def _measureContours(self):
+        """
+        Subclasses may override this method.
+        """
+        pen = geometry.ContourPointsPen()
+        self.drawPoints(pen, components=False)
+        return geometry.measureContours(pen.contours)
+
+    def rasterize(self, size, transformation=None, antialias=True):
+        """
+        Fill the outline of the glyph, including
+        components, into a bitmap. ::
+
+            >>> bitmap = glyph.rasterize((50, 60), (0.05, 0, 0, 0.05, 0, 10))
+            >>> bitmap[30][25]
+            1.0
+
+        **size** is the ``(width, height)`` of the bitmap
+        in pixels. **transformation** is a
+        :ref:`type-transformation` that maps the glyph to
+        pixel coordinates, which have their origin in the
+        bottom left corner of the bitmap. The default is
+        no transformation.
+
+        The bitmap is a list of rows, from top to bottom,
+        and each row is a list of pixel values from left
+        to right. If **antialias** is True the values are
+        the covered fraction of the pixels. Otherwise they
+        are 1 for pixels with their center inside the
+        outline and 0 for all other pixels.
+        """
+        size = normalizers.normalizeBitmapSize(size)
+        if transformation is None:
+            transformation = (1, 0, 0, 1, 0, 0)
+        transformation = normalizers.normalizeTransformationMatrix(transformation)
+        antialias = normalizers.normalizeBoolean(antialias)
+        rasterizer = Rasterizer(size, antialias=antialias)
+        return self._rasterize(rasterizer, transformation)
+
+    def _rasterize(self, rasterizer, transformation):
+        """
+        **rasterizer** will be a
+        :class:`fontParts.base.rasterizer.Rasterizer` that
+        may be shared by many glyphs.
+
+        Subclasses may override this method.
+        """
+        pen = rasterizer.getPen(transformation)
+        self.draw(pen, decompose=True)
+        return rasterizer.rasterize(pen)
 
     # -----------------
     # Layer Interaction
@@ -0,0 +1,91 @@
+"""
+Glyph math expressions.
+
+    >>> a = glyph1.getMathExpression()
+    >>> b = glyph2.getMathExpression()
+    >>> glyph.applyMathExpression(a + (b - a) * 0.25)
+
+An expression is a sum of glyphs multiplied by factors.
+Building an expression does not read any glyph data, so
+``a + (b - a) * 0.25`` is kept as ``a * 0.75 + b * 0.25``
+and the glyph data is read and combined once when the
+expression is applied to a glyph.
+"""
+
+from fontParts.base.errors import FontPartsError
+from fontParts.base import normalizers
+
+
+class GlyphMathExpression(object):
+
+    """
+    A linear combination of glyphs. Expressions can be
+    added to and subtracted from each other and can be
+    multiplied and divided by a number or by a tuple of
+    x and y factors.
+    """
+
+    def __init__(self, glyph=None):
+        # glyph id -> [glyph, x factor, y factor]
+        self._terms = {}
+        self._order = []
+        if glyph is not None:
+            self._addTerm(glyph, 1.0, 1.0)
+
+    def _addTerm(self, glyph, xFactor, yFactor):
+        key = id(glyph)
+        term = self._terms.get(key)
+        if term is None:
+            self._terms[key] = [glyph, xFactor, yFactor]
+            self._order.append(key)
+        else:
+            term[1] += xFactor
+            term[2] += yFactor
+
+    def _combine(self, other, sign):
+        if not isinstance(other, GlyphMathExpression):
+            raise FontPartsError("A glyph math expression can not be combined with an instance of %r." % other.__class__.__name__)
+        result = self._scale(1.0, 1.0)
+        for glyph, xFactor, yFactor in other.getTerms():
+            result._addTerm(glyph, xFactor * sign, yFactor * sign)
+        return result
+
+    def _scale(self, xFactor, yFactor):
+        result = self.__class__()
+        for glyph, x, y in self.getTerms():
+            result._addTerm(glyph, x * xFactor, y * yFactor)
+        return result
+
+    def getTerms(self):
+        """
+        Get a list of ``(glyph, xFactor, yFactor)``
+        tuples for the glyphs in the expression.
+        """
+        return [tuple(self._terms[key]) for key in self._order]
+
+    # ----
+    # Math
+    # ----
+
+    def __add__(self, other):
+        return self._combine(other, 1.0)
+
+    def __sub__(self, other):
+        return self._combine(other, -1.0)
+
+    def __neg__(self):
+        return self._scale(-1.0, -1.0)
+
+    def __mul__(self, factor):
+        xFactor, yFactor = normalizers.normalizeInterpolationFactor(factor)
+        return self._scale(xFactor, yFactor)
+
+    __rmul__ = __mul__
+
+    def __div__(self, factor):
+        xFactor, yFactor = normalizers.normalizeInterpolationFactor(factor)
+        if not xFactor or not yFactor:
+            raise FontPartsError("A glyph math expression can not be divided by zero.")
+        return self._scale(1.0 / xFactor, 1.0 / yFactor)
+
+    __truediv__ = __div__
@@ -501,6 +501,7 @@ class BaseGuideline(BaseObject, TransformationMixin):
 
         * angle
         """
+        self._willChange()
         self._round()
 
     def _round(self, **kwargs):
@@ -5,6 +5,7 @@ from fontParts.base.base import (
     BaseObject, TransformationMixin, dynamicProperty)
 from fontParts.base import normalizers
 from fontParts.base.color import Color
+from fontParts.base.imageReference import ImageReference
 
 
 class BaseImage(BaseObject, TransformationMixin):
@@ -12,7 +13,7 @@ class BaseImage(BaseObject, TransformationMixin):
     copyAttributes = (
         "transformation",
         "color",
-        "data"
+        "reference"
     )
 
     def _reprContents(self):
@@ -261,6 +262,53 @@ class BaseImage(BaseObject, TransformationMixin):
         """
         self.raiseNotImplementedError()
 
+    # Reference
+
+    reference = dynamicProperty(
+        "base_reference",
+        """
+        The image's data as an :class:`ImageReference`
+        or ``None``. Image data can be moved between
+        images with this without copying the data. ::
+
+            >>> otherImage.reference = image.reference
+            >>> image.reference == otherImage.reference
+            True
+        """
+    )
+
+    def _get_base_reference(self):
+        value = self._get_reference()
+        if value is not None and not isinstance(value, ImageReference):
+            raise FontPartsError("The image reference must be an ImageReference.")
+        return value
+
+    def _set_base_reference(self, value):
+        if value is not None and not isinstance(value, ImageReference):
+            raise FontPartsError("The image reference must be an ImageReference, not %s." % type(value).__name__)
+        self._set_reference(value)
+
+    def _get_reference(self):
+        """
+        This must return an :class:`ImageReference` or ``None``.
+
+        Subclasses may override this method.
+        """
+        data = self.data
+        if data is None:
+            return None
+        return ImageReference(data=data)
+
+    def _set_reference(self, value):
+        """
+        value will be an :class:`ImageReference` or ``None``.
+
+        Subclasses may override this method.
+        """
+        if value is not None:
+            value = value.data
+        self.data = value
+
     # --------------
     # Transformation
     # --------------
@@ -283,6 +331,7 @@ class BaseImage(BaseObject, TransformationMixin):
         """
         Round offset coordinates.
         """
+        self._willChange()
         self._round()
 
     def _round(self):
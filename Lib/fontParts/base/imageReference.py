@@ -0,0 +1,116 @@
+import os
+import mmap
+import hashlib
+from fontParts.base.errors import FontPartsError
+
+
+class ImageReference(object):
+
+    """
+    A reference to raw image data. The data is either
+    held in memory or, when the reference was created
+    with a **path**, read lazily through a memory map
+    of the file. References are compared by the digest
+    of their data, so copying, comparing and
+    interpolating images only moves references around.
+
+        >>> reference = ImageReference(path="/path/to/image.png")
+        >>> reference = ImageReference(data=data)
+    """
+
+    def __init__(self, data=None, path=None, digest=None):
+        if data is None and path is None:
+            raise FontPartsError("Either data or path must be defined.")
+        if data is not None and path is not None:
+            raise FontPartsError("Only path or data may be defined, not both.")
+        if data is not None and not isinstance(data, bytes):
+            raise FontPartsError("The image data must be bytes.")
+        if path is not None and not os.path.exists(path):
+            raise FontPartsError("No image located at '%s'." % path)
+        self._data = data
+        self._path = path
+        self._digest = digest
+        self._file = None
+        self._map = None
+
+    def __repr__(self):
+        if self._path is not None:
+            return "<ImageReference path=%r>" % self._path
+        return "<ImageReference length=%d>" % len(self)
+
+    # ----------
+    # Attributes
+    # ----------
+
+    def _get_path(self):
+        return self._path
+
+    path = property(_get_path, doc="The path to the file backing the reference or ``None``.")
+
+    def _get_digest(self):
+        if self._digest is None:
+            m = hashlib.md5()
+            m.update(self.buffer)
+            self._digest = m.digest()
+        return self._digest
+
+    digest = property(_get_digest, doc="The MD5 digest of the image data.")
+
+    def _get_buffer(self):
+        if self._path is None:
+            return memoryview(self._data)
+        if self._map is None:
+            if os.path.getsize(self._path) == 0:
+                # empty files can not be mapped
+                return memoryview(b"")
+            self._file = open(self._path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self._map)
+
+    buffer = property(_get_buffer, doc="A read only :class:`memoryview` of the image data. This does not copy the data.")
+
+    def _get_data(self):
+        if self._path is None:
+            return self._data
+        return self.buffer.tobytes()
+
+    data = property(_get_data, doc="The image data as bytes.")
+
+    def __len__(self):
+        if self._path is None:
+            return len(self._data)
+        return os.path.getsize(self._path)
+
+    def close(self):
+        """
+        Release the memory map, if there is one. It will
+        be created again when the data is next needed.
+        """
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+            self._file = None
+
+    # ----------
+    # Comparison
+    # ----------
+
+    def __eq__(self, other):
+        if not isinstance(other, ImageReference):
+            return False
+        if other is self:
+            return True
+        if self._path is not None and self._path == other._path:
+            return True
+        if self._data is not None and self._data is other._data:
+            return True
+        if len(self) != len(other):
+            return False
+        return self.digest == other.digest
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.digest)
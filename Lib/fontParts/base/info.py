@@ -7,11 +7,7 @@ from fontParts.base import normalizers
 from fontParts.base.deprecated import DeprecatedInfo
 
 
-_copyAttributes = ()
-if isinstance(fontInfoAttributesVersion3, tuple):
-    _copyAttributes = fontInfoAttributesVersion3
-    _copyAttributes.remove("guidelines")
-    _copyAttributes = tuple(_copyAttributes)
+_copyAttributes = tuple(sorted(set(fontInfoAttributesVersion3) - set(["guidelines"])))
 
 
 class BaseInfo(BaseObject, DeprecatedInfo):
@@ -104,6 +100,7 @@ class BaseInfo(BaseObject, DeprecatedInfo):
         if attr != "guidelines" and attr in fontInfoAttributesVersion3:
             if value is not None:
                 value = self._validateFontInfoAttributeValue(attr, value)
+            self._willChange(attr, value)
             return self._setAttr(attr, value)
         return super(BaseInfo, self).__setattr__(attr, value)
 
@@ -2,7 +2,137 @@ import weakref
 from fontParts.base.errors import FontPartsError
 from fontParts.base.base import BaseObject, dynamicProperty
 from fontParts.base import normalizers
+from fontParts.base import geometry
+from fontParts.base.rasterizer import Rasterizer
+from fontParts.base.decomposition import DecomposedOutlineCache
+from fontParts.base.componentGraph import ComponentGraph
+from fontParts.base.characterMap import CharacterMap
+from fontParts.base.unicodeNames import UnicodeNameTable, defaultUnicodeNameTable
 from fontParts.base.color import Color
+from fontParts.base.transaction import openTransactions, willChangeGlyph
+
+
+_metricsKeys = (
+    "width",
+    "height",
+    "leftMargin",
+    "rightMargin",
+    "bottomMargin",
+    "topMargin",
+    "angledLeftMargin",
+    "angledRightMargin",
+    "bounds"
+)
+
+# in the order the values are applied
+_settableMetricsKeys = (
+    "width",
+    "leftMargin",
+    "rightMargin",
+    "angledLeftMargin",
+    "angledRightMargin",
+    "height",
+    "bottomMargin",
+    "topMargin"
+)
+
+_metricsNormalizers = dict(
+    width=normalizers.normalizeGlyphWidth,
+    height=normalizers.normalizeGlyphHeight,
+    leftMargin=normalizers.normalizeGlyphLeftMargin,
+    rightMargin=normalizers.normalizeGlyphRightMargin,
+    bottomMargin=normalizers.normalizeGlyphBottomMargin,
+    topMargin=normalizers.normalizeGlyphTopMargin,
+    angledLeftMargin=normalizers.normalizeGlyphLeftMargin,
+    angledRightMargin=normalizers.normalizeGlyphRightMargin
+)
+
+
+def _calculateMetrics(width, height, bounds, angledBounds):
+    """
+    Get the metrics of a glyph with **width**, **height**,
+    **bounds** and **angledBounds**. These are the same
+    values as the values of the glyph attributes with
+    the same names.
+    """
+    if bounds is None:
+        leftMargin = bottomMargin = 0
+        rightMargin = width
+        topMargin = height
+    else:
+        xMin, yMin, xMax, yMax = bounds
+        leftMargin = xMin
+        rightMargin = width - xMax
+        bottomMargin = yMin
+        topMargin = height - yMax
+    if angledBounds is None:
+        angledLeftMargin = 0
+        angledRightMargin = width
+    else:
+        angledLeftMargin = angledBounds[0]
+        angledRightMargin = width - angledBounds[2]
+    return dict(
+        width=width,
+        height=height,
+        leftMargin=leftMargin,
+        rightMargin=rightMargin,
+        bottomMargin=bottomMargin,
+        topMargin=topMargin,
+        angledLeftMargin=angledLeftMargin,
+        angledRightMargin=angledRightMargin,
+        bounds=bounds
+    )
+
+
+def _appendMetrics(metrics, width, height, bounds, angledBounds):
+    if bounds is not None:
+        bounds = normalizers.normalizeBoundingBox(bounds)
+    values = _calculateMetrics(width, height, bounds, angledBounds)
+    for key in _metricsKeys:
+        metrics[key].append(values[key])
+
+
+def _getMetricsValues(metrics, index):
+    values = []
+    for key in _settableMetricsKeys:
+        if key in metrics:
+            value = metrics[key][index]
+            if value is not None:
+                values.append((key, value))
+    return values
+
+
+def _solveMetrics(width, height, bounds, angledBounds, values):
+    """
+    Get the width, height and (x, y) offset of a glyph
+    with **width**, **height**, **bounds** and **angledBounds**
+    after the ``(key, value)`` pairs in **values** are applied.
+    """
+    dx = dy = 0
+    for key, value in values:
+        if key == "width":
+            width = value
+        elif key == "height":
+            height = value
+        elif key == "leftMargin":
+            diff = value - (0 if bounds is None else bounds[0] + dx)
+            dx += diff
+            width += diff
+        elif key == "rightMargin":
+            width = value if bounds is None else bounds[2] + dx + value
+        elif key == "angledLeftMargin":
+            diff = value - (0 if angledBounds is None else angledBounds[0] + dx)
+            dx += diff
+            width += diff
+        elif key == "angledRightMargin":
+            width = value if angledBounds is None else angledBounds[2] + dx + value
+        elif key == "bottomMargin":
+            diff = value - (0 if bounds is None else bounds[1] + dy)
+            dy += diff
+            height += diff
+        elif key == "topMargin":
+            height = value if bounds is None else bounds[3] + dy + value
+    return width, height, (dx, dy)
 
 
 class _BaseGlyphVendor(BaseObject):
@@ -25,6 +155,13 @@ class _BaseGlyphVendor(BaseObject):
                 layer = self.getLayer(self.defaultLayer)
             glyph.layer = layer
 
+    def _willChangeGlyph(self, name):
+        # tell the open font transactions that the
+        # glyph with name is about to be made, inserted
+        # or removed, or changed by the layer
+        if openTransactions:
+            willChangeGlyph(self, name)
+
     def __len__(self):
         """
         An ``int`` representing number of glyphs in the layer. ::
@@ -161,6 +298,7 @@ class _BaseGlyphVendor(BaseObject):
         name = normalizers.normalizeGlyphName(name)
         if name in self:
             self.removeGlyph(name)
+        self._willChangeGlyph(name)
         glyph = self._newGlyph(name)
         self._setLayerInGlyph(glyph)
         return glyph
@@ -189,6 +327,7 @@ class _BaseGlyphVendor(BaseObject):
         name = normalizers.normalizeGlyphName(name)
         if name not in self:
             raise FontPartsError("No glyph with the name '%s' exists." % name)
+        self._willChangeGlyph(name)
         self._removeGlyph(name)
 
     def _removeGlyph(self, name, **kwargs):
@@ -226,6 +365,7 @@ class _BaseGlyphVendor(BaseObject):
         if name in self:
             self.removeGlyph(name)
         # XXX validate that the glyph has the necessary attributes for copying.
+        self._willChangeGlyph(name)
         return self._insertGlyph(glyph, name=name)
 
     def _insertGlyph(self, glyph, name, **kwargs):
@@ -245,17 +385,7 @@ class _BaseGlyphVendor(BaseObject):
         Subclasses may override this method.
         """
         dest = self.newGlyph(name)
-        # XXX use dest.copyData(glyph) here
-        dest.appendGlyph(glyph)
-        dest.width = glyph.width
-        dest.height = glyph.height
-        dest.unicodes = glyph.unicodes
-        dest.note = glyph.note
-        dest.lib.update(glyph.lib.copy())
-        image = glyph.image
-        if image.data is not None:
-            destImage = dest.addImage(data=image.data, color=image.color)
-            destImage.transformation = image.transformation
+        dest._copyData(glyph)
         return dest
 
     # --------------------
@@ -501,25 +631,204 @@ class BaseLayer(_BaseGlyphVendor):
         for glyph in self:
             glyph.round()
 
-    def autoUnicodes(self):
+    def removeOverlap(self, glyphNames=None):
+        """
+        Perform a remove overlap operation on the contours
+        of all glyphs in the layer. ::
+
+            >>> layer.removeOverlap()
+
+        **glyphNames** may be a list of the names of the
+        glyphs that should be changed.
+        """
+        if glyphNames is not None:
+            glyphNames = [normalizers.normalizeGlyphName(glyphName) for glyphName in glyphNames]
+        self._removeOverlap(glyphNames)
+
+    def _removeOverlap(self, glyphNames):
+        """
+        This is the environment implementation of :meth:`BaseLayer.removeOverlap`.
+
+        Subclasses may override this method.
+        """
+        if glyphNames is None:
+            glyphNames = self.keys()
+        for glyphName in glyphNames:
+            self[glyphName].removeOverlap()
+
+    def autoContourOrder(self, glyphNames=None):
+        """
+        Sort the contours of all glyphs in the layer
+        based on their centers. ::
+
+            >>> layer.autoContourOrder()
+
+        See :meth:`BaseGlyph.autoContourOrder`.
+        **glyphNames** may be a list of the names of the
+        glyphs that should be changed.
+        """
+        if glyphNames is not None:
+            glyphNames = [normalizers.normalizeGlyphName(glyphName) for glyphName in glyphNames]
+        self._autoContourOrder(glyphNames)
+
+    def _autoContourOrder(self, glyphNames):
+        """
+        This is the environment implementation of :meth:`BaseLayer.autoContourOrder`.
+
+        Subclasses may override this method.
+        """
+        if glyphNames is None:
+            glyphNames = self.keys()
+        for glyphName in glyphNames:
+            self[glyphName].autoContourOrder()
+
+    def autoStartSegment(self, glyphNames=None):
+        """
+        Set the lower left on curve point as the start
+        of all contours of all glyphs in the layer. ::
+
+            >>> layer.autoStartSegment()
+
+        See :meth:`BaseContour.autoStartSegment`.
+        **glyphNames** may be a list of the names of the
+        glyphs that should be changed.
+        """
+        if glyphNames is not None:
+            glyphNames = [normalizers.normalizeGlyphName(glyphName) for glyphName in glyphNames]
+        self._autoStartSegment(glyphNames)
+
+    def _autoStartSegment(self, glyphNames):
+        """
+        This is the environment implementation of :meth:`BaseLayer.autoStartSegment`.
+
+        Subclasses may override this method.
+        """
+        if glyphNames is None:
+            glyphNames = self.keys()
+        for glyphName in glyphNames:
+            for contour in self[glyphName].contours:
+                contour.autoStartSegment()
+
+    def measureContours(self, glyphNames=None):
+        """
+        Measure the contours of all glyphs in the layer. ::
+
+            >>> measurements = layer.measureContours()
+            >>> measurements["A"][0]["area"]
+            41250.0
+
+        A dictionary mapping glyph names to the result of
+        :meth:`BaseGlyph.measureContours` is returned.
+        **glyphNames** may be a list of the names of the
+        glyphs that should be measured.
+        """
+        if glyphNames is not None:
+            glyphNames = [normalizers.normalizeGlyphName(glyphName) for glyphName in glyphNames]
+        return self._measureContours(glyphNames)
+
+    def _measureContours(self, glyphNames):
+        """
+        This is the environment implementation of :meth:`BaseLayer.measureContours`.
+
+        Subclasses may override this method.
+        """
+        if glyphNames is None:
+            glyphNames = self.keys()
+        pen = geometry.ContourPointsPen()
+        contours = pen.contours
+        counts = []
+        for glyphName in glyphNames:
+            count = len(contours)
+            self[glyphName].drawPoints(pen, components=False)
+            counts.append((glyphName, len(contours) - count))
+        measurements = geometry.measureContours(contours)
+        result = {}
+        index = 0
+        for glyphName, count in counts:
+            result[glyphName] = measurements[index:index + count]
+            index += count
+        return result
+
+    def rasterize(self, size, transformation=None, antialias=True, glyphNames=None):
+        """
+        Fill the outlines of all glyphs in the layer
+        into bitmaps. ::
+
+            >>> bitmaps = layer.rasterize((50, 60), (0.05, 0, 0, 0.05, 0, 10))
+            >>> bitmaps["A"][30][25]
+            1.0
+
+        A dictionary mapping glyph names to bitmaps is
+        returned. See :meth:`BaseGlyph.rasterize` for
+        a description of the arguments and the bitmaps.
+        **glyphNames** may be a list of the names of the
+        glyphs that should be rasterized.
+        """
+        size = normalizers.normalizeBitmapSize(size)
+        if transformation is None:
+            transformation = (1, 0, 0, 1, 0, 0)
+        transformation = normalizers.normalizeTransformationMatrix(transformation)
+        antialias = normalizers.normalizeBoolean(antialias)
+        if glyphNames is not None:
+            glyphNames = [normalizers.normalizeGlyphName(glyphName) for glyphName in glyphNames]
+        return self._rasterize(size, transformation, antialias, glyphNames)
+
+    def _rasterize(self, size, transformation, antialias, glyphNames):
+        """
+        This is the environment implementation of :meth:`BaseLayer.rasterize`.
+
+        Subclasses may override this method.
+        """
+        if glyphNames is None:
+            glyphNames = self.keys()
+        # one rasterizer, and its buffers, for all glyphs
+        rasterizer = Rasterizer(size, antialias=antialias)
+        result = {}
+        for glyphName in glyphNames:
+            result[glyphName] = self[glyphName]._rasterize(rasterizer, transformation)
+        return result
+
+    def autoUnicodes(self, overrides=None):
         """
         Use heuristics to set Unicode values in all glyphs. ::
 
             >>> layer.autoUnicodes()
+            >>> layer.autoUnicodes(overrides={"A.sc": [0x1D00]})
+
+        **overrides** may be a dictionary mapping glyph names
+        to lists of Unicode values that are used instead of
+        the values derived from the names.
 
         Environments will define their own heuristics for
         automatically determining values.
         """
-        self._autoUnicodes()
+        if overrides is not None:
+            overrides = dict(
+                (normalizers.normalizeGlyphName(glyphName), normalizers.normalizeGlyphUnicodes(unicodes))
+                for glyphName, unicodes in overrides.items()
+            )
+        if openTransactions:
+            for glyphName in self.keys():
+                self._willChangeGlyph(glyphName)
+        self._autoUnicodes(overrides)
 
-    def _autoUnicodes(self):
+    def _autoUnicodes(self, overrides):
         """
         This is the environment implementation of :meth:`BaseLayer.autoUnicodes`.
+        The values of all glyphs are derived from one
+        :class:`fontParts.base.unicodeNames.UnicodeNameTable`
+        and only glyphs with changed values are set.
 
         Subclasses may override this method.
         """
+        if overrides is None:
+            table = defaultUnicodeNameTable
+        else:
+            table = UnicodeNameTable(overrides)
         for glyph in self:
-            glyph.autoUnicodes()
+            unicodes = table.getUnicodes(glyph.name)
+            if unicodes is not None and unicodes != list(glyph.unicodes):
+                glyph.unicodes = unicodes
 
     # -------------
     # Interpolation
@@ -621,38 +930,381 @@ class BaseLayer(_BaseGlyphVendor):
 
     def getReverseComponentMapping(self):
         """
-        Create a dictionary of unicode -> [glyphname, ...] mappings.
-        All glyphs are loaded. Note that one glyph can have multiple unicode values,
-        and a unicode value can have multiple glyphs pointing to it.
+        Get a reversed map of component references in the layer.
+        {
+        'A' : ('Aacute', 'Aring')
+        'acute' : ('Aacute',)
+        'ring' : ('Aring',)
+        etc.
+        }
         """
         return self._getReverseComponentMapping()
 
     def _getReverseComponentMapping(self):
         """
         This is the environment implementation of
-        :meth:`BaseFont.getReverseComponentMapping`.
+        :meth:`BaseLayer.getReverseComponentMapping`.
 
         Subclasses may override this method.
         """
-        self.raiseNotImplementedError()
+        return self.getComponentGraph().getReverseComponentMapping()
+
+    def getComponentGraph(self):
+        """
+        Get the component dependency graph of the layer
+        as a :class:`fontParts.base.componentGraph.ComponentGraph`.
+
+            >>> graph = layer.getComponentGraph()
+            >>> graph.getAllComposites("A")
+            ('Aacute', 'Aring', 'Aringacute')
+            >>> graph.getTopologicalOrder()
+            ['A', 'acute', 'ring', 'Aacute', 'Aring', 'Aringacute']
+
+        The graph may be kept by the environment and
+        updated as components change. It must not be
+        edited by the caller.
+        """
+        return self._getComponentGraph()
+
+    def _getComponentGraph(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseLayer.getComponentGraph`. The base
+        implementation builds a new graph, so nothing
+        is kept between calls.
+
+        Subclasses may override this method to keep the graph
+        between calls. The graph must then be updated with
+        :meth:`ComponentGraph.update` and :meth:`ComponentGraph.remove`
+        for every changed, added, removed or renamed glyph.
+        """
+        graph = ComponentGraph()
+        for glyph in self:
+            baseGlyphNames = [component.baseGlyph for component in glyph.components]
+            graph.update(glyph.name, baseGlyphNames)
+        return graph
 
     def getCharacterMapping(self):
         """
-        Get a reversed map of component references in the font.
-        {
-        'A' : ['Aacute', 'Aring']
-        'acute' : ['Aacute']
-        'ring' : ['Aring']
-        etc.
-        }
+        Create a dictionary of unicode -> (glyphname, ...) mappings.
+        Note that one glyph can have multiple unicode values,
+        and a unicode value can have multiple glyphs pointing to it.
         """
         return self._getCharacterMapping()
 
     def _getCharacterMapping(self):
         """
         This is the environment implementation of
-        :meth:`BaseFont.getCharacterMapping`.
+        :meth:`BaseLayer.getCharacterMapping`.
 
         Subclasses may override this method.
         """
-        self.raiseNotImplementedError()
+        return self.getCharacterMap().getCharacterMapping()
+
+    def getCharacterMap(self):
+        """
+        Get the character map of the layer as a
+        :class:`fontParts.base.characterMap.CharacterMap`.
+
+            >>> cmap = layer.getCharacterMap()
+            >>> cmap.getGlyphNamesForText("Ab")
+            ['A', 'b']
+            >>> cmap.getDuplicates()
+            {65: ('A', 'A.alt')}
+
+        The map may be kept by the environment and
+        updated as unicode values change. It must not
+        be edited by the caller.
+        """
+        return self._getCharacterMap()
+
+    def _getCharacterMap(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseLayer.getCharacterMap`. The base
+        implementation builds a new map, so nothing
+        is kept between calls.
+
+        Subclasses may override this method to keep the map
+        between calls. The map must then be updated with
+        :meth:`CharacterMap.update` and :meth:`CharacterMap.remove`
+        for every changed, added, removed or renamed glyph.
+        """
+        characterMap = CharacterMap()
+        for glyph in self:
+            characterMap.update(glyph.name, glyph.unicodes)
+        return characterMap
+
+    # -------
+    # Metrics
+    # -------
+
+    def getMetrics(self, glyphNames=None):
+        """
+        Get the metrics of all glyphs in the layer. ::
+
+            >>> metrics = layer.getMetrics()
+            >>> metrics["glyphNames"]
+            ['A', 'B', 'C']
+            >>> metrics["leftMargin"]
+            [10, 35, 40]
+
+        A dictionary is returned with the glyph names under
+        ``"glyphNames"`` and lists of the values for the glyphs
+        under ``"width"``, ``"height"``, ``"leftMargin"``,
+        ``"rightMargin"``, ``"bottomMargin"``, ``"topMargin"``,
+        ``"angledLeftMargin"``, ``"angledRightMargin"`` and
+        ``"bounds"``. The values are the same as the values
+        of the glyph attributes with these names. The glyphs are
+        in the glyph order of the font, followed by glyphs that
+        are not in the glyph order sorted by name. **glyphNames**
+        may be a list of the names of the glyphs that should be
+        measured, in the order they should be listed.
+        """
+        if glyphNames is None:
+            glyphNames = self._getMetricsGlyphOrder()
+        else:
+            glyphNames = [normalizers.normalizeGlyphName(glyphName) for glyphName in glyphNames]
+        return self._getMetrics(glyphNames)
+
+    def _getMetricsGlyphOrder(self):
+        glyphNames = set(self.keys())
+        ordered = []
+        font = self.font
+        if font is not None:
+            for glyphName in font.glyphOrder:
+                if glyphName in glyphNames:
+                    ordered.append(glyphName)
+                    glyphNames.discard(glyphName)
+        ordered.extend(sorted(glyphNames))
+        return ordered
+
+    def _getMetrics(self, glyphNames):
+        """
+        This is the environment implementation of :meth:`BaseLayer.getMetrics`.
+        The bounds of every glyph are taken from the
+        decomposed outline cache of the layer once
+        and the margins are calculated from them.
+
+        Subclasses may override this method.
+        """
+        cache = self._getDecomposedOutlineCache()
+        italicAngle = self._getItalicAngle()
+        metrics = dict((key, []) for key in _metricsKeys)
+        metrics["glyphNames"] = list(glyphNames)
+        for glyphName in glyphNames:
+            glyph = self[glyphName]
+            width = glyph.width
+            height = glyph.height
+            outline = cache.getOutline(glyphName)
+            bounds = outline.bounds
+            angledBounds = outline.getSkewedBounds(italicAngle)
+            _appendMetrics(metrics, width, height, bounds, angledBounds)
+        return metrics
+
+    def _getItalicAngle(self):
+        """
+        Get the italic angle used by the angled margins.
+        This is the italic angle of the font or 0.
+
+        Subclasses may override this method.
+        """
+        font = self.font
+        if font is None:
+            return 0
+        return font.info.italicAngle or 0
+
+    def setMetrics(self, metrics):
+        """
+        Set the metrics of the glyphs in the layer. ::
+
+            >>> metrics = layer.getMetrics()
+            >>> metrics["leftMargin"] = [20, 20, 20]
+            >>> layer.setMetrics(metrics)
+
+        **metrics** must be a dictionary with a list of glyph
+        names under ``"glyphNames"`` and lists of new values for
+        these glyphs under any of ``"width"``, ``"height"``,
+        ``"leftMargin"``, ``"rightMargin"``, ``"bottomMargin"``,
+        ``"topMargin"``, ``"angledLeftMargin"`` and
+        ``"angledRightMargin"``. Glyphs with a value of None are
+        not changed. Values that are equal to the values of the
+        glyphs before any glyph is changed are skipped, so the
+        result of :meth:`BaseLayer.getMetrics` may be changed and
+        passed back. ``"bounds"`` is ignored. For each glyph the
+        width is set before the margins and the right margins
+        are set after the left margins.
+        """
+        if "glyphNames" not in metrics:
+            raise FontPartsError("The metrics must contain the glyph names.")
+        glyphNames = [normalizers.normalizeGlyphName(glyphName) for glyphName in metrics["glyphNames"]]
+        normalized = {}
+        for key, values in metrics.items():
+            if key in ("glyphNames", "bounds"):
+                continue
+            normalizer = _metricsNormalizers.get(key)
+            if normalizer is None:
+                raise FontPartsError("Unknown metrics key: %r." % key)
+            values = list(values)
+            if len(values) != len(glyphNames):
+                raise FontPartsError("The %s values do not match the number of glyph names." % key)
+            normalized[key] = [None if value is None else normalizer(value) for value in values]
+        for glyphName in glyphNames:
+            if glyphName not in self:
+                raise FontPartsError("No glyph with the name %r exists." % glyphName)
+        # values are compared before any glyph is changed,
+        # as changing a glyph changes the glyphs using it.
+        current = self._getMetrics(glyphNames)
+        for key, values in normalized.items():
+            for index, value in enumerate(values):
+                if value == current[key][index]:
+                    values[index] = None
+        for glyphName in glyphNames:
+            self._willChangeGlyph(glyphName)
+        self._setMetrics(glyphNames, normalized)
+
+    def _setMetrics(self, glyphNames, metrics):
+        """
+        This is the environment implementation of :meth:`BaseLayer.setMetrics`.
+        **metrics** is a dictionary mapping the keys of
+        the metrics to be set to lists of normalized values.
+        Values that do not change a glyph are None.
+        The bounds of every glyph are read once and
+        all values are set from them.
+
+        Subclasses may override this method.
+        """
+        cache = self._getDecomposedOutlineCache()
+        italicAngle = self._getItalicAngle()
+        for index, glyphName in enumerate(glyphNames):
+            values = _getMetricsValues(metrics, index)
+            if not values:
+                continue
+            glyph = self[glyphName]
+            outline = cache.getOutline(glyphName)
+            bounds = outline.bounds
+            angledBounds = outline.getSkewedBounds(italicAngle)
+            width, height, offset = _solveMetrics(glyph.width, glyph.height, bounds, angledBounds, values)
+            if offset != (0, 0):
+                glyph.moveBy(offset)
+            if width != glyph.width:
+                glyph.width = width
+            if height != glyph.height:
+                glyph.height = height
+            # the cache may not observe the glyph
+            cache.invalidate(glyphName)
+
+    # ------------
+    # Fingerprints
+    # ------------
+
+    def getFingerprints(self, glyphNames=None, lib=False):
+        """
+        Get the fingerprints of all glyphs in the layer. ::
+
+            >>> fingerprints = layer.getFingerprints()
+            >>> fingerprints["A"]
+            '5b2c7e0e4d0b6d8e1f3c3a9a1f0b8b6c2f1c9f0a'
+
+        A dictionary mapping glyph names to the result of
+        :meth:`BaseGlyph.getFingerprint` is returned.
+        **glyphNames** may be a list of the names of the
+        glyphs that should be included. If **lib** is True
+        the libs of the glyphs are included.
+        """
+        if glyphNames is not None:
+            glyphNames = [normalizers.normalizeGlyphName(glyphName) for glyphName in glyphNames]
+        lib = normalizers.normalizeBoolean(lib)
+        return self._getFingerprints(glyphNames, lib)
+
+    def _getFingerprints(self, glyphNames, lib):
+        """
+        This is the environment implementation of :meth:`BaseLayer.getFingerprints`.
+
+        Subclasses may override this method.
+        """
+        if glyphNames is None:
+            glyphNames = self.keys()
+        return dict(
+            (glyphName, self[glyphName].getFingerprint(lib=lib))
+            for glyphName in glyphNames
+        )
+
+    def findDuplicateGlyphs(self, lib=False):
+        """
+        Find the glyphs in the layer that have the same content. ::
+
+            >>> layer.findDuplicateGlyphs()
+            [('A', 'A.alt'), ('O', 'O.ss01', 'zero')]
+
+        A sorted list of sorted tuples of the names of glyphs
+        with the same fingerprint is returned. Glyphs without
+        contours, components and anchors are skipped. If **lib**
+        is True the libs of the glyphs must be the same too.
+        """
+        lib = normalizers.normalizeBoolean(lib)
+        return self._findDuplicateGlyphs(lib)
+
+    def _findDuplicateGlyphs(self, lib):
+        """
+        This is the environment implementation of :meth:`BaseLayer.findDuplicateGlyphs`.
+
+        Subclasses may override this method.
+        """
+        groups = {}
+        for glyphName, fingerprint in self.getFingerprints(lib=lib).items():
+            glyph = self[glyphName]
+            if not len(glyph) and not glyph.components and not glyph.anchors:
+                continue
+            groups.setdefault(fingerprint, []).append(glyphName)
+        return sorted(tuple(sorted(glyphNames)) for glyphNames in groups.values() if len(glyphNames) > 1)
+
+    def findIdenticalGlyphs(self, other, lib=False):
+        """
+        Find the glyphs that have the same content in
+        the layer and in **other**. ::
+
+            >>> layer.findIdenticalGlyphs(font.getLayer("background"))
+            ['period', 'space']
+
+        **other** must be a :class:`BaseLayer`, which may
+        be in another font. A sorted list of the names of
+        the glyphs that are in both layers and have the
+        same fingerprint in both is returned. If **lib**
+        is True the libs of the glyphs must be the same too.
+        """
+        if not isinstance(other, BaseLayer):
+            raise FontPartsError("Glyphs can not be compared with an instance of %r." % other.__class__.__name__)
+        lib = normalizers.normalizeBoolean(lib)
+        return self._findIdenticalGlyphs(other, lib)
+
+    def _findIdenticalGlyphs(self, other, lib):
+        """
+        This is the environment implementation of :meth:`BaseLayer.findIdenticalGlyphs`.
+
+        Subclasses may override this method.
+        """
+        glyphNames = [glyphName for glyphName in self.keys() if glyphName in other]
+        fingerprints = self.getFingerprints(glyphNames, lib=lib)
+        otherFingerprints = other.getFingerprints(glyphNames, lib=lib)
+        return sorted(
+            glyphName for glyphName in glyphNames
+            if fingerprints[glyphName] == otherFingerprints[glyphName]
+        )
+
+    # -------------------
+    # Decomposed Outlines
+    # -------------------
+
+    def _getDecomposedOutlineCache(self):
+        """
+        Get the :class:`fontParts.base.decomposition.DecomposedOutlineCache`
+        for the layer. The base implementation returns a new cache,
+        so nothing is kept between calls.
+
+        Subclasses may override this method to keep the cache
+        between calls. The cache must then be told about every
+        changed, added, removed or renamed glyph with
+        :meth:`DecomposedOutlineCache.invalidate`.
+        """
+        return DecomposedOutlineCache(self)
@@ -888,6 +888,63 @@ def normalizeTransformationScale(value):
         value = tuple([float(v) for v in value])
     return value
 
+
+# -------
+# Bitmaps
+# -------
+
+def normalizeBitmapSize(value):
+    """
+    Normalizes bitmap size.
+
+    * **value** must be a ``tuple`` or ``list``.
+    * **value** must have exactly two items. Each item
+      must be a positive ``int``.
+    * Returned value is a ``tuple`` of two ``int``.
+    """
+    if not isinstance(value, (tuple, list)):
+        raise FontPartsError("Bitmap sizes must be tuple instances, not %s." % type(value).__name__)
+    if not len(value) == 2:
+        raise FontPartsError("Bitmap sizes must contain two values, not %d." % len(value))
+    for v in value:
+        if not isinstance(v, int):
+            raise FontPartsError("Bitmap size values must be instances of int, not %s." % type(v).__name__)
+        if v < 1:
+            raise FontPartsError("Bitmap size values must be positive.")
+    return tuple(value)
+
+
+# ------------
+# Transactions
+# ------------
+
+def normalizeTransactionName(value):
+    """
+    Normalizes transaction name.
+
+    * **value** must be a :ref:`type-string`.
+    * Returned value is an unencoded ``unicode`` string
+    """
+    if not isinstance(value, basestring):
+        raise FontPartsError("Transaction names must be strings, not %s." % type(value).__name__)
+    return unicode(value)
+
+
+def normalizeUndoSizeLimit(value):
+    """
+    Normalizes undo size limit.
+
+    * **value** must be an ``int``.
+    * **value** must not be negative.
+    * Returned value is an ``int``.
+    """
+    if not isinstance(value, int):
+        raise FontPartsError("Undo size limits must be instances of int, not %s." % type(value).__name__)
+    if value < 0:
+        raise FontPartsError("Undo size limits must not be negative.")
+    return value
+
+
 def normalizeRounding(value):
     """
     Normalizes rounding.
@@ -454,6 +454,7 @@ class BasePoint(BaseObject, TransformationMixin, DeprecatedPoint):
         * x
         * y
         """
+        self._willChange()
         self._round()
 
     def _round(self, **kwargs):
@@ -0,0 +1,141 @@
+"""
+Outline rasterization.
+
+Outlines are filled into bitmaps with the nonzero fill
+rule. A bitmap is a list of rows, from top to bottom,
+and each row is a list of pixel values from left to
+right. With anti-aliasing the values are the covered
+fraction of the pixel, between 0 and 1. Without
+anti-aliasing a pixel is 1 if its center is inside the
+outline and 0 otherwise.
+
+    >>> rasterizer = Rasterizer((100, 120))
+    >>> pen = rasterizer.getPen((0.1, 0, 0, 0.1, 0, 20), glyphSet=layer)
+    >>> glyph.draw(pen)
+    >>> bitmap = rasterizer.rasterize(pen)
+
+Pixel coordinates have their origin in the bottom left
+corner of the bitmap, so the glyph has to be positioned
+with the transformation. The rasterizer keeps its work
+buffers between bitmaps, so one rasterizer should be
+used for many glyphs of the same size.
+"""
+
+import math
+from fontTools.pens.transformPen import TransformPen
+from fontParts.base import geometry
+
+
+class _RasterPen(TransformPen):
+
+    def __init__(self, transformation, glyphSet=None):
+        self.flattenPen = geometry.FlattenPen(glyphSet=glyphSet)
+        TransformPen.__init__(self, self.flattenPen, transformation)
+
+
+class Rasterizer(object):
+
+    """
+    A rasterizer for bitmaps of **size**, a ``(width, height)``
+    tuple. If **antialias** is True the pixels are sampled
+    with **oversample** scanlines per pixel row.
+    """
+
+    def __init__(self, size, antialias=True, oversample=4):
+        width, height = size
+        self.width = width
+        self.height = height
+        self.antialias = antialias
+        self.oversample = oversample
+        # reused for every row of every bitmap
+        self._coverage = [0.0] * (width + 1)
+        self._delta = [0.0] * (width + 1)
+
+    def getPen(self, transformation=(1, 0, 0, 1, 0, 0), glyphSet=None):
+        """
+        Get a pen that collects an outline to rasterize.
+        **transformation** maps the outline to pixel
+        coordinates. Components are drawn from **glyphSet**.
+        """
+        return _RasterPen(transformation, glyphSet)
+
+    def rasterize(self, pen):
+        """
+        Fill the outline collected by **pen** into a bitmap.
+        """
+        outline = geometry.FlattenedOutline(pen.flattenPen.polygons)
+        width = self.width
+        height = self.height
+        if self.antialias:
+            empty = 0.0
+            samples = [(i + .5) / self.oversample for i in range(self.oversample)]
+            weight = 1.0 / self.oversample
+        else:
+            empty = 0
+            samples = [.5]
+            weight = 1
+        bitmap = []
+        for row in range(height - 1, -1, -1):
+            if not outline.edges or row + 1 <= outline.yMin or row >= outline.yMax:
+                bitmap.append([empty] * width)
+                continue
+            spans = []
+            for sample in samples:
+                spans.extend(self._spans(outline.crossings(row + sample)))
+            bitmap.append(self._fillRow(spans, weight))
+        return bitmap
+
+    def _spans(self, crossings):
+        # the nonzero parts of a scanline, clipped to the bitmap
+        spans = []
+        width = self.width
+        winding = 0
+        start = None
+        for x, direction in crossings:
+            if winding == 0:
+                start = x
+            winding += direction
+            if winding == 0:
+                start = max(0, start)
+                end = min(width, x)
+                if end > start:
+                    spans.append((start, end))
+        return spans
+
+    def _fillRow(self, spans, weight):
+        width = self.width
+        coverage = self._coverage
+        delta = self._delta
+        if self.antialias:
+            if not spans:
+                return [0.0] * width
+            first = width
+            last = 0
+            for start, end in spans:
+                startIndex = int(start)
+                endIndex = int(end)
+                if startIndex == endIndex:
+                    coverage[startIndex] += (end - start) * weight
+                else:
+                    coverage[startIndex] += (startIndex + 1 - start) * weight
+                    delta[startIndex + 1] += weight
+                    delta[endIndex] -= weight
+                    coverage[endIndex] += (end - endIndex) * weight
+                first = min(first, startIndex)
+                last = max(last, endIndex)
+            last = min(last, width - 1)
+            row = [0.0] * width
+            running = 0.0
+            for i in range(first, last + 1):
+                running += delta[i]
+                value = running + coverage[i]
+                row[i] = min(1.0, max(0.0, value))
+                delta[i] = coverage[i] = 0.0
+            delta[width] = coverage[width] = 0.0
+            return row
+        row = [0] * width
+        for start, end in spans:
+            # pixels with their center in the span
+            for i in range(int(math.ceil(start - .5)), int(math.ceil(end - .5))):
+                row[i] = 1
+        return row
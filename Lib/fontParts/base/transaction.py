@@ -0,0 +1,616 @@
+"""
+Transactions.
+
+    >>> with glyph.transaction("Move"):
+    ...     glyph.moveBy((10, 0))
+    >>> glyph.undo()
+    u'Move'
+    >>> glyph.redo()
+    u'Move'
+
+A transaction records the changes made to a font or a glyph
+in a block. When the block ends only the values that changed
+are kept, before and after, so the changes can be undone and
+redone. Changing one point of a glyph keeps that contour, not
+the whole glyph, and changing one kerning pair keeps that pair.
+If the block raises an exception the changes are undone.
+
+A glyph transaction reads the glyph when the block begins. A
+font transaction reads a part of the font the first time the
+part is about to change: a glyph, a layer, the info, the groups,
+the kerning, the features, the lib, the guidelines or the layer
+and glyph orders. The objects tell the open font transactions
+about a change in the :class:`fontParts.base.base.dynamicProperty`
+setters, in the dictionary methods and in the methods that
+transform, append, insert, remove and clear. When the block ends
+the data that was read is compared with the font and dropped.
+
+Layers can not be renamed in a font transaction. Glyph images
+are not recorded.
+
+The changes are dictionaries like the change sets in
+:mod:`fontParts.base.fontDiff`. Every changed value is kept as a
+``[before, after]`` pair and every changed dictionary is kept as
+a pair of change sets that lead to the before and the after
+dictionary, so index ``0`` undoes and index ``1`` redoes.
+"""
+
+from copy import deepcopy
+from fontTools.misc.py23 import basestring
+from fontParts.base.errors import FontPartsError
+from fontParts.base.fontDiff import (
+    _color, _guidelinesData, _glyphData,
+    _diffDict, _patchDict, _diffKerning, _patchKerning,
+    _drawOutlineData, _appendAnchorsData, _appendGuidelinesData
+)
+
+# The open font transactions. The objects
+# only call willChange when this is not empty.
+openTransactions = []
+
+# The default size limit of an undo history,
+# measured with :func:`estimateSize`.
+defaultUndoSizeLimit = 10 * 1024 * 1024
+
+# Setting these attributes connects
+# an object to its parent. The data
+# of the object does not change.
+_parentAttributes = set(["font", "layer", "glyph", "contour"])
+
+
+def willChange(obj, attr=None, value=None):
+    """
+    Tell the open font transactions that **obj** is about
+    to change. **attr** is the name of the attribute that
+    will be set to **value**, if the change is a set.
+    """
+    if attr in _parentAttributes:
+        return
+    for transaction in openTransactions:
+        transaction.willChange(obj, attr, value)
+
+
+def willChangeGlyph(vendor, glyphName):
+    """
+    Tell the open font transactions that the glyph
+    named **glyphName** in **vendor**, a font or a
+    layer, is about to be made, inserted or removed.
+    """
+    for transaction in openTransactions:
+        transaction.willChangeGlyph(vendor, glyphName)
+
+
+def willChangeLayer(font, layerName):
+    """
+    Tell the open font transactions that the layer
+    named **layerName** in **font** is about to be
+    made or removed.
+    """
+    for transaction in openTransactions:
+        transaction.willChangeLayer(font, layerName)
+
+
+def estimateSize(value):
+    """
+    Estimate the memory used by **value** in bytes.
+    """
+    if isinstance(value, dict):
+        return 100 + sum(estimateSize(k) + estimateSize(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 60 + sum(estimateSize(v) for v in value)
+    if isinstance(value, basestring):
+        return 40 + len(value)
+    return 24
+
+
+# -------
+# History
+# -------
+
+class UndoHistory(object):
+
+    """
+    The undo and redo stacks of an object. The
+    stacks hold ``(name, changes, size)`` tuples.
+    The oldest transactions are dropped when the
+    size of the stacks is larger than **sizeLimit**.
+    """
+
+    def __init__(self, sizeLimit=defaultUndoSizeLimit):
+        self.sizeLimit = sizeLimit
+        self.undoStack = []
+        self.redoStack = []
+        # the open (name, transaction) pairs
+        self.openTransactions = []
+
+    def getSize(self):
+        return sum(item[2] for item in self.undoStack + self.redoStack)
+
+    def add(self, name, changes):
+        self.undoStack.append((name, changes, estimateSize(changes)))
+        del self.redoStack[:]
+        self.trim()
+
+    def trim(self):
+        size = self.getSize()
+        while size > self.sizeLimit and self.undoStack:
+            size -= self.undoStack.pop(0)[2]
+        while size > self.sizeLimit and self.redoStack:
+            size -= self.redoStack.pop(0)[2]
+
+    def clear(self):
+        del self.undoStack[:]
+        del self.redoStack[:]
+
+
+# -----
+# Lists
+# -----
+
+def _diffList(items, otherItems):
+    changed = []
+    for index in range(max(len(items), len(otherItems))):
+        item = otherItem = None
+        if index < len(items):
+            item = items[index]
+        if index < len(otherItems):
+            otherItem = otherItems[index]
+        if item != otherItem:
+            changed.append([index, item, otherItem])
+    if not changed:
+        return None
+    return [len(items), len(otherItems), changed]
+
+
+def _patchList(items, changes, index):
+    length = changes[index]
+    items = list(items[:length]) + [None] * (length - len(items))
+    for itemIndex, item, otherItem in changes[2]:
+        if itemIndex < length:
+            items[itemIndex] = (item, otherItem)[index]
+    return items
+
+
+def _diffValue(value, otherValue):
+    if value == otherValue:
+        return None
+    return [deepcopy(value), deepcopy(otherValue)]
+
+
+def _diffDicts(items, otherItems):
+    if items == otherItems:
+        return None
+    return [_diffDict(otherItems, items), _diffDict(items, otherItems)]
+
+
+# ------
+# Glyphs
+# ------
+
+_glyphValueKeys = ("name", "width", "height", "unicodes", "note", "markColor")
+_glyphListKeys = ("contours", "components", "anchors", "guidelines")
+
+
+def _readGlyph(glyph):
+    data = _glyphData(glyph)
+    data["name"] = glyph.name
+    return data
+
+
+def _emptyGlyphData():
+    return dict(
+        name=None,
+        width=0,
+        height=0,
+        unicodes=[],
+        note=None,
+        markColor=None,
+        contours=[],
+        components=[],
+        anchors=[],
+        guidelines=[],
+        lib={}
+    )
+
+
+def _diffGlyph(data, otherData):
+    changes = {}
+    if (data is None) != (otherData is None):
+        changes["exists"] = [data is not None, otherData is not None]
+    if data is None:
+        data = _emptyGlyphData()
+    if otherData is None:
+        otherData = _emptyGlyphData()
+    for key in _glyphValueKeys:
+        diffed = _diffValue(data[key], otherData[key])
+        if diffed is not None:
+            changes[key] = diffed
+    for key in _glyphListKeys:
+        diffed = _diffList(data[key], otherData[key])
+        if diffed is not None:
+            changes[key] = diffed
+    diffed = _diffDicts(data["lib"], otherData["lib"])
+    if diffed is not None:
+        changes["lib"] = diffed
+    return changes
+
+
+def _patchOutline(glyph, key, changes, index):
+    """
+    Replace only the changed contours or components,
+    so the others keep their objects and identifiers.
+    """
+    length = changes[index]
+    changed = {}
+    for itemIndex, item, otherItem in changes[2]:
+        if itemIndex < length:
+            changed[itemIndex] = (item, otherItem)[index]
+    for objectIndex in reversed(range(len(getattr(glyph, key)))):
+        if objectIndex >= length or objectIndex in changed:
+            if key == "contours":
+                glyph.removeContour(objectIndex)
+            else:
+                glyph.removeComponent(objectIndex)
+    # the changed items are drawn at the end of the
+    # glyph and moved into place in index order.
+    for itemIndex in sorted(changed):
+        if key == "contours":
+            _drawOutlineData(glyph, [changed[itemIndex]], [])
+        else:
+            _drawOutlineData(glyph, [], [changed[itemIndex]])
+        getattr(glyph, key)[-1].index = itemIndex
+
+
+def _patchGlyph(glyph, changes, index):
+    for key in ("name", "width", "height", "unicodes", "note"):
+        if key in changes:
+            setattr(glyph, key, deepcopy(changes[key][index]))
+    if "contours" in changes:
+        _patchOutline(glyph, "contours", changes["contours"], index)
+    if "components" in changes:
+        _patchOutline(glyph, "components", changes["components"], index)
+    if "anchors" in changes:
+        anchors = _patchList(_glyphData(glyph)["anchors"], changes["anchors"], index)
+        glyph.clearAnchors()
+        _appendAnchorsData(glyph, anchors)
+    if "guidelines" in changes:
+        guidelines = _patchList(_guidelinesData(glyph.guidelines), changes["guidelines"], index)
+        glyph.clearGuidelines()
+        _appendGuidelinesData(glyph, guidelines)
+    if "lib" in changes:
+        _patchDict(glyph.lib, changes["lib"][index])
+    # the mark color may be kept in the lib
+    if "markColor" in changes:
+        glyph.markColor = changes["markColor"][index]
+
+
+class GlyphTransaction(object):
+
+    """
+    A transaction that records the changes made to **glyph**.
+    """
+
+    def __init__(self, glyph):
+        self.glyph = glyph
+        self._data = None
+
+    def begin(self):
+        self._data = _readGlyph(self.glyph)
+
+    def end(self):
+        changes = _diffGlyph(self._data, _readGlyph(self.glyph))
+        self._data = None
+        return changes
+
+    @staticmethod
+    def apply(glyph, changes, index):
+        """
+        Apply **changes** to **glyph**. An **index**
+        of ``0`` undoes the changes and an **index**
+        of ``1`` redoes them.
+        """
+        _patchGlyph(glyph, changes, index)
+
+
+# -----
+# Fonts
+# -----
+
+_baseClasses = None
+
+
+def _getBaseClasses():
+    global _baseClasses
+    if _baseClasses is None:
+        from fontParts.base.font import BaseFont
+        from fontParts.base.layer import BaseLayer
+        from fontParts.base.glyph import BaseGlyph
+        from fontParts.base.info import BaseInfo
+        from fontParts.base.groups import BaseGroups
+        from fontParts.base.kerning import BaseKerning
+        from fontParts.base.features import BaseFeatures
+        from fontParts.base.lib import BaseLib
+        from fontParts.base.guideline import BaseGuideline
+        _baseClasses = dict(
+            font=BaseFont,
+            layer=BaseLayer,
+            glyph=BaseGlyph,
+            info=BaseInfo,
+            groups=BaseGroups,
+            kerning=BaseKerning,
+            features=BaseFeatures,
+            lib=BaseLib,
+            guideline=BaseGuideline
+        )
+    return _baseClasses
+
+
+def _readFontPart(font, key):
+    if key == "info":
+        info = font.info
+        return dict((attr, deepcopy(getattr(info, attr))) for attr in info.copyAttributes)
+    if key in ("groups", "lib"):
+        return deepcopy(dict(getattr(font, key)))
+    if key == "kerning":
+        return dict(font.kerning)
+    if key == "features":
+        return font.features.text
+    if key == "guidelines":
+        return _guidelinesData(font.guidelines)
+    return dict(
+        layerOrder=list(font.layerOrder),
+        defaultLayer=font.defaultLayer,
+        glyphOrder=list(font.glyphOrder)
+    )
+
+
+def _diffFontPart(key, data, otherData):
+    if key in ("info", "order"):
+        changes = {}
+        for attr, value in otherData.items():
+            diffed = _diffValue(data[attr], value)
+            if diffed is not None:
+                changes[attr] = diffed
+        return changes or None
+    if key in ("groups", "lib"):
+        return _diffDicts(data, otherData)
+    if key == "kerning":
+        if data == otherData:
+            return None
+        return [_diffKerning(otherData, data), _diffKerning(data, otherData)]
+    return _diffValue(data, otherData)
+
+
+def _readLayer(layer):
+    return dict(
+        color=_color(layer.color),
+        lib=deepcopy(dict(layer.lib))
+    )
+
+
+def _diffLayer(data, otherData):
+    changes = {}
+    if (data is None) != (otherData is None):
+        changes["exists"] = [data is not None, otherData is not None]
+    if data is None:
+        data = dict(color=None, lib={})
+    if otherData is None:
+        otherData = dict(color=None, lib={})
+    diffed = _diffValue(data["color"], otherData["color"])
+    if diffed is not None:
+        changes["color"] = diffed
+    diffed = _diffDicts(data["lib"], otherData["lib"])
+    if diffed is not None:
+        changes["lib"] = diffed
+    return changes
+
+
+def _patchLayerGlyph(layer, glyphName, changes, index):
+    exists = changes.get("exists")
+    if exists is not None and not exists[index]:
+        if glyphName in layer:
+            layer.removeGlyph(glyphName)
+        return
+    if glyphName in layer:
+        glyph = layer[glyphName]
+    else:
+        glyph = layer.newGlyph(glyphName)
+    changes = dict(changes)
+    changes.pop("name", None)
+    _patchGlyph(glyph, changes, index)
+
+
+class FontTransaction(object):
+
+    """
+    A transaction that records the changes made to **font**.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self._parts = {}
+        self._layers = {}
+        self._glyphs = {}
+
+    def begin(self):
+        openTransactions.append(self)
+
+    def end(self):
+        openTransactions.remove(self)
+        font = self.font
+        changes = {}
+        for key, data in self._parts.items():
+            diffed = _diffFontPart(key, data, _readFontPart(font, key))
+            if diffed is not None:
+                changes[key] = diffed
+        layerOrder = font.layerOrder
+        for layerName, data in self._layers.items():
+            otherData = None
+            if layerName in layerOrder:
+                otherData = _readLayer(font.getLayer(layerName))
+            diffed = _diffLayer(data, otherData)
+            if diffed:
+                changes.setdefault("layers", {})[layerName] = diffed
+        for (layerName, glyphName), data in self._glyphs.items():
+            otherData = None
+            if layerName in layerOrder:
+                layer = font.getLayer(layerName)
+                if glyphName in layer:
+                    otherData = _readGlyph(layer[glyphName])
+            diffed = _diffGlyph(data, otherData)
+            if diffed:
+                changes.setdefault("glyphs", {}).setdefault(layerName, {})[glyphName] = diffed
+        self._parts = {}
+        self._layers = {}
+        self._glyphs = {}
+        return changes
+
+    # reading
+
+    def _readPart(self, key):
+        if key not in self._parts:
+            self._parts[key] = _readFontPart(self.font, key)
+
+    def _readLayer(self, layerName):
+        if layerName not in self._layers:
+            data = None
+            if layerName in self.font.layerOrder:
+                data = _readLayer(self.font.getLayer(layerName))
+            self._layers[layerName] = data
+
+    def _readGlyph(self, layerName, glyphName):
+        key = (layerName, glyphName)
+        if key not in self._glyphs:
+            data = None
+            if layerName in self.font.layerOrder:
+                layer = self.font.getLayer(layerName)
+                if glyphName in layer:
+                    data = _readGlyph(layer[glyphName])
+            self._glyphs[key] = data
+
+    # notifications
+
+    def _isFont(self, font):
+        return font is not None and font == self.font
+
+    def willChange(self, obj, attr, value):
+        classes = _getBaseClasses()
+        if isinstance(obj, classes["font"]):
+            if self._isFont(obj):
+                if attr == "guidelines":
+                    self._readPart("guidelines")
+                else:
+                    self._readPart("order")
+            return
+        if isinstance(obj, classes["layer"]):
+            if not self._isFont(obj.font):
+                return
+            if attr == "base_name":
+                raise FontPartsError("Layers can not be renamed in a font transaction.")
+            self._readLayer(obj.name)
+            return
+        for key in ("info", "groups", "kerning", "features"):
+            if isinstance(obj, classes[key]):
+                if self._isFont(obj.font):
+                    self._readPart(key)
+                return
+        # the glyph is found through the environment, as
+        # the parents of obj may no longer be available.
+        location = obj._getGlyphLocation()
+        if location is not None:
+            font, layerName, glyphName = location
+            if not self._isFont(font):
+                return
+            self._readGlyph(layerName, glyphName)
+            # a renamed glyph is recorded as a removed
+            # glyph and a new glyph, and its place in
+            # the glyph order changes.
+            if isinstance(obj, classes["glyph"]) and attr == "base_name" and isinstance(value, basestring):
+                self._readPart("order")
+                self._readGlyph(layerName, value)
+            return
+        if isinstance(obj, classes["lib"]):
+            # the font of a layer lib is the layer
+            parent = obj.font
+            if isinstance(parent, classes["layer"]):
+                if self._isFont(parent.font):
+                    self._readLayer(parent.name)
+            elif self._isFont(parent):
+                self._readPart("lib")
+            return
+        if isinstance(obj, classes["guideline"]):
+            if self._isFont(obj.font):
+                self._readPart("guidelines")
+
+    def willChangeGlyph(self, vendor, glyphName):
+        classes = _getBaseClasses()
+        if isinstance(vendor, classes["font"]):
+            font = vendor
+            layer = font.getLayer(font.defaultLayer)
+        else:
+            font = vendor.font
+            layer = vendor
+        if not self._isFont(font):
+            return
+        self._readPart("order")
+        self._readGlyph(layer.name, glyphName)
+
+    def willChangeLayer(self, font, layerName):
+        if not self._isFont(font):
+            return
+        self._readPart("order")
+        self._readLayer(layerName)
+        if layerName in font.layerOrder:
+            layer = font.getLayer(layerName)
+            for glyphName in layer.keys():
+                self._readGlyph(layerName, glyphName)
+
+    @staticmethod
+    def apply(font, changes, index):
+        """
+        Apply **changes** to **font**. An **index**
+        of ``0`` undoes the changes and an **index**
+        of ``1`` redoes them.
+        """
+        layers = changes.get("layers", {})
+        order = changes.get("order", {})
+        for layerName, layerChanges in layers.items():
+            exists = layerChanges.get("exists")
+            if exists is not None and exists[index] and layerName not in font.layerOrder:
+                font.newLayer(layerName)
+            if layerName not in font.layerOrder:
+                continue
+            layer = font.getLayer(layerName)
+            if "color" in layerChanges:
+                layer.color = layerChanges["color"][index]
+            if "lib" in layerChanges:
+                _patchDict(layer.lib, layerChanges["lib"][index])
+        for layerName, glyphs in changes.get("glyphs", {}).items():
+            if layerName not in font.layerOrder:
+                continue
+            layer = font.getLayer(layerName)
+            for glyphName, glyphChanges in glyphs.items():
+                _patchLayerGlyph(layer, glyphName, glyphChanges, index)
+        # the default layer can not be removed
+        if "defaultLayer" in order:
+            font.defaultLayer = order["defaultLayer"][index]
+        for layerName, layerChanges in layers.items():
+            exists = layerChanges.get("exists")
+            if exists is not None and not exists[index] and layerName in font.layerOrder:
+                font.removeLayer(layerName)
+        for key in ("layerOrder", "glyphOrder"):
+            if key in order:
+                setattr(font, key, order[key][index])
+        for attr, values in changes.get("info", {}).items():
+            setattr(font.info, attr, deepcopy(values[index]))
+        if "groups" in changes:
+            _patchDict(font.groups, changes["groups"][index])
+        if "kerning" in changes:
+            _patchKerning(font.kerning, changes["kerning"][index])
+        if "lib" in changes:
+            _patchDict(font.lib, changes["lib"][index])
+        if "features" in changes:
+            font.features.text = changes["features"][index]
+        if "guidelines" in changes:
+            font.clearGuidelines()
+            _appendGuidelinesData(font, changes["guidelines"][index])
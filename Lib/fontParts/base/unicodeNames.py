@@ -0,0 +1,80 @@
+"""
+Unicode values derived from glyph names.
+
+    >>> table = UnicodeNameTable(overrides={"A.sc": [0x1D00]})
+    >>> table.getUnicodes("Aacute")
+    [193]
+    >>> table.getUnicodes("uni0416")
+    [1046]
+    >>> table.getUnicodes("u1F600")
+    [128512]
+    >>> table.getUnicodes("A.sc")
+    [7424]
+    >>> table.getUnicodes("A.alt") is None
+    True
+
+Names are looked up in the overrides, then in the Adobe
+Glyph List for New Fonts and are then parsed as ``uniXXXX``
+or ``uXXXX`` to ``uXXXXXX`` names. Names with a suffix,
+such as ``A.alt``, and ligature names, such as ``f_f``,
+only get values from the overrides. The result for every
+name is kept, so each name is only resolved once.
+"""
+
+import re
+from fontTools.agl import AGL2UV
+
+_uniNameRE = re.compile(r"uni([0-9A-F]{4})$")
+_uNameRE = re.compile(r"u([0-9A-F]{4,6})$")
+
+
+def _isValidUnicode(value):
+    # surrogates can not be assigned
+    return value <= 0x10FFFF and not 0xD800 <= value <= 0xDFFF
+
+
+class UnicodeNameTable(object):
+
+    """
+    A table of glyph name to unicode value mappings.
+    **overrides** may be a dictionary mapping glyph names
+    to lists of unicode values that take precedence over
+    the values derived from the names.
+    """
+
+    def __init__(self, overrides=None):
+        self._overrides = {}
+        if overrides is not None:
+            for glyphName, unicodes in overrides.items():
+                self._overrides[glyphName] = list(unicodes)
+        self._cache = {}
+
+    def getUnicodes(self, glyphName):
+        """
+        Get a list of the unicode values for **glyphName**.
+        None is returned if no values can be derived
+        from the name.
+        """
+        try:
+            unicodes = self._cache[glyphName]
+        except KeyError:
+            unicodes = self._cache[glyphName] = self._resolve(glyphName)
+        if unicodes is None:
+            return None
+        return list(unicodes)
+
+    def _resolve(self, glyphName):
+        if glyphName in self._overrides:
+            return tuple(self._overrides[glyphName])
+        value = AGL2UV.get(glyphName)
+        if value is not None:
+            return (value,)
+        match = _uniNameRE.match(glyphName) or _uNameRE.match(glyphName)
+        if match is not None:
+            value = int(match.group(1), 16)
+            if _isValidUnicode(value):
+                return (value,)
+        return None
+
+
+defaultUnicodeNameTable = UnicodeNameTable()
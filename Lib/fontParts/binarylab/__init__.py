@@ -0,0 +1,4 @@
+from fontParts.base.errors import FontPartsError
+from fontParts.binarylab.font import RFont
+from fontParts.binarylab.layer import RLayer
+from fontParts.binarylab.glyph import RGlyph
@@ -0,0 +1,20 @@
+from fontParts.nonelab.anchor import RAnchor as NoneLabRAnchor
+from fontParts.binarylab.base import RReadOnlyMixin
+
+
+class RAnchor(RReadOnlyMixin, NoneLabRAnchor):
+
+    def _set_x(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_y(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_name(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_color(self, value):
+        self.raiseReadOnlyError()
+
+    def _transformBy(self, matrix, origin=None, originOffset=None, **kwargs):
+        self.raiseReadOnlyError()
@@ -0,0 +1,11 @@
+from fontParts.base import FontPartsError
+
+
+class RReadOnlyMixin(object):
+
+    def raiseReadOnlyError(self):
+        """
+        Compiled binaries are read only, so
+        this is raised by all editing methods.
+        """
+        raise FontPartsError("The {className} object is read only.".format(className=self.__class__.__name__))
@@ -0,0 +1,20 @@
+from fontParts.nonelab.component import RComponent as NoneLabRComponent
+from fontParts.binarylab.base import RReadOnlyMixin
+
+
+class RComponent(RReadOnlyMixin, NoneLabRComponent):
+
+    def _set_baseGlyph(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_transformation(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_index(self, value):
+        self.raiseReadOnlyError()
+
+    def _transformBy(self, matrix, origin=None, originOffset=None, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _decompose(self):
+        self.raiseReadOnlyError()
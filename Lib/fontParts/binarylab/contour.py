@@ -0,0 +1,26 @@
+from fontParts.nonelab.contour import RContour as NoneLabRContour
+from fontParts.binarylab.base import RReadOnlyMixin
+from fontParts.binarylab.point import RPoint
+
+
+class RContour(RReadOnlyMixin, NoneLabRContour):
+
+    pointClass = RPoint
+
+    def _set_index(self, value):
+        self.raiseReadOnlyError()
+
+    def _reverseContour(self, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _setStartSegment(self, segmentIndex, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _insertPoint(self, index, position, type=None, smooth=None, name=None, identifier=None, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _removePoint(self, index, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _transformBy(self, matrix, origin=None, originOffset=None, **kwargs):
+        self.raiseReadOnlyError()
@@ -0,0 +1,155 @@
+"""
+Helpers for decoding font level data from the tables
+of a compiled binary into defcon objects.
+"""
+
+# ----
+# Info
+# ----
+
+_nameIDs = [
+    (1, "familyName"),
+    (2, "styleName"),
+    (0, "copyright"),
+    (7, "trademark"),
+    (6, "postscriptFontName"),
+    (4, "postscriptFullName"),
+    (16, "openTypeNamePreferredFamilyName"),
+    (17, "openTypeNamePreferredSubfamilyName"),
+    (8, "openTypeNameManufacturer"),
+    (9, "openTypeNameDesigner"),
+    (10, "openTypeNameDescription"),
+    (13, "openTypeNameLicense"),
+    (14, "openTypeNameLicenseURL"),
+]
+
+
+def extractInfo(ttFont, info):
+    """
+    Set the values that can be decoded from **ttFont**
+    in the defcon **info** object.
+    """
+    head = ttFont["head"]
+    info.unitsPerEm = head.unitsPerEm
+    versionMajor = int(head.fontRevision)
+    info.versionMajor = versionMajor
+    info.versionMinor = int(round((head.fontRevision - versionMajor) * 1000))
+    if "name" in ttFont:
+        nameTable = ttFont["name"]
+        for nameID, attr in _nameIDs:
+            record = nameTable.getName(nameID, 3, 1, 0x409)
+            if record is None:
+                record = nameTable.getName(nameID, 1, 0, 0)
+            if record is not None:
+                setattr(info, attr, record.toUnicode())
+    if "hhea" in ttFont:
+        hhea = ttFont["hhea"]
+        info.ascender = hhea.ascent
+        info.descender = hhea.descent
+    if "OS/2" in ttFont:
+        os2 = ttFont["OS/2"]
+        info.openTypeOS2WeightClass = os2.usWeightClass
+        info.openTypeOS2WidthClass = os2.usWidthClass
+        if os2.version >= 2:
+            info.xHeight = os2.sxHeight
+            info.capHeight = os2.sCapHeight
+    if "post" in ttFont:
+        post = ttFont["post"]
+        info.italicAngle = post.italicAngle
+        info.postscriptUnderlinePosition = post.underlinePosition
+        info.postscriptUnderlineThickness = post.underlineThickness
+        info.postscriptIsFixedPitch = bool(post.isFixedPitch)
+
+# -------
+# Kerning
+# -------
+
+
+def extractKerning(ttFont, kerning, groups):
+    """
+    Set the pairs that can be decoded from **ttFont**
+    in the defcon **kerning** object. Class kerning
+    is stored with kerning groups added to the defcon
+    **groups** object. Pairs are read from the ``kern``
+    feature in the GPOS table and, if there is no
+    GPOS table, from the ``kern`` table. Only the
+    horizontal advance adjustments are read.
+    """
+    pairs = {}
+    newGroups = {}
+    if "GPOS" in ttFont:
+        _extractGPOSKerning(ttFont["GPOS"].table, pairs, newGroups)
+    elif "kern" in ttFont:
+        for subtable in ttFont["kern"].kernTables:
+            for pair, value in subtable.kernTable.items():
+                pairs.setdefault(pair, value)
+    groups.update(newGroups)
+    kerning.update(pairs)
+
+
+def _iterateKernLookups(table):
+    if table.FeatureList is None or table.LookupList is None:
+        return
+    lookupIndexes = set()
+    for record in table.FeatureList.FeatureRecord:
+        if record.FeatureTag == "kern":
+            lookupIndexes.update(record.Feature.LookupListIndex)
+    for lookupIndex in sorted(lookupIndexes):
+        lookup = table.LookupList.Lookup[lookupIndex]
+        for subtableIndex, subtable in enumerate(lookup.SubTable):
+            if lookup.LookupType == 9:
+                if subtable.ExtensionLookupType != 2:
+                    continue
+                subtable = subtable.ExtSubTable
+            elif lookup.LookupType != 2:
+                continue
+            yield lookupIndex, subtableIndex, subtable
+
+
+def _getXAdvance(valueRecord):
+    if valueRecord is None:
+        return 0
+    return getattr(valueRecord, "XAdvance", 0)
+
+
+def _extractGPOSKerning(table, pairs, groups):
+    # subtables that come first take precedence,
+    # so existing pairs are never replaced.
+    for lookupIndex, subtableIndex, subtable in _iterateKernLookups(table):
+        if subtable.Format == 1:
+            for glyphName, pairSet in zip(subtable.Coverage.glyphs, subtable.PairSet):
+                for record in pairSet.PairValueRecord:
+                    value = _getXAdvance(record.Value1)
+                    pairs.setdefault((glyphName, record.SecondGlyph), value)
+        elif subtable.Format == 2:
+            prefix = "%d_%d_" % (lookupIndex, subtableIndex)
+            # first side
+            classDef1 = subtable.ClassDef1.classDefs
+            classes1 = {}
+            for glyphName in subtable.Coverage.glyphs:
+                classes1.setdefault(classDef1.get(glyphName, 0), []).append(glyphName)
+            # second side, class 0 is every other glyph
+            classes2 = {}
+            for glyphName, classIndex in subtable.ClassDef2.classDefs.items():
+                if classIndex:
+                    classes2.setdefault(classIndex, []).append(glyphName)
+            names1 = {}
+            for classIndex, glyphNames in classes1.items():
+                name = "public.kern1." + prefix + str(classIndex)
+                names1[classIndex] = name
+                groups[name] = sorted(glyphNames)
+            names2 = {}
+            for classIndex, glyphNames in classes2.items():
+                name = "public.kern2." + prefix + str(classIndex)
+                names2[classIndex] = name
+                groups[name] = sorted(glyphNames)
+            for class1Index, class1Record in enumerate(subtable.Class1Record):
+                if class1Index not in names1:
+                    continue
+                for class2Index, class2Record in enumerate(class1Record.Class2Record):
+                    if class2Index not in names2:
+                        continue
+                    value = _getXAdvance(class2Record.Value1)
+                    if not value:
+                        continue
+                    pairs.setdefault((names1[class1Index], names2[class2Index]), value)
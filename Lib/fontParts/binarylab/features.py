@@ -0,0 +1,8 @@
+from fontParts.nonelab.features import RFeatures as NoneLabRFeatures
+from fontParts.binarylab.base import RReadOnlyMixin
+
+
+class RFeatures(RReadOnlyMixin, NoneLabRFeatures):
+
+    def _set_text(self, value):
+        self.raiseReadOnlyError()
@@ -0,0 +1,162 @@
+from fontTools.misc.py23 import basestring
+from fontTools.ttLib import TTFont
+from fontParts.base import FontPartsError
+from fontParts.nonelab.font import RFont as NoneLabRFont
+from fontParts.binarylab.base import RReadOnlyMixin
+from fontParts.binarylab.info import RInfo
+from fontParts.binarylab.groups import RGroups
+from fontParts.binarylab.kerning import RKerning
+from fontParts.binarylab.features import RFeatures
+from fontParts.binarylab.lib import RLib
+from fontParts.binarylab.layer import RLayer
+from fontParts.binarylab.guideline import RGuideline
+from fontParts.binarylab.glyphSet import BinaryGlyphSet
+from fontParts.binarylab.extract import extractInfo, extractKerning
+
+
+class RFont(RReadOnlyMixin, NoneLabRFont):
+
+    """
+    A read only font backed by a compiled OTF or TTF.
+    Glyphs are decoded when they are first accessed
+    and info, kerning and groups are decoded when
+    they are first requested. The decoded info, kerning,
+    groups, features and lib are copies of the binary
+    data and they are read only as well. Copies of the
+    font are editable nonelab fonts.
+    """
+
+    infoClass = RInfo
+    groupsClass = RGroups
+    kerningClass = RKerning
+    featuresClass = RFeatures
+    libClass = RLib
+    layerClass = RLayer
+    guidelineClass = RGuideline
+    copyClass = NoneLabRFont
+    binaryLayerName = "public.default"
+
+    # ---------------
+    # File Operations
+    # ---------------
+
+    # Initialize
+
+    def _init(self, pathOrObject=None, showInterface=True, **kwargs):
+        if isinstance(pathOrObject, basestring):
+            path = pathOrObject
+            ttFont = TTFont(path, lazy=True)
+        elif isinstance(pathOrObject, TTFont):
+            path = None
+            ttFont = pathOrObject
+        else:
+            raise FontPartsError("A path to a compiled binary or a TTFont must be given.")
+        font = self.wrapClass()
+        # replace the default layer with a
+        # layer that loads from the binary.
+        layers = font.layers
+        emptyLayer = layers.defaultLayer
+        layer = layers.newLayer(self.binaryLayerName + ".binary", glyphSet=BinaryGlyphSet(ttFont))
+        layers.defaultLayer = layer
+        del layers[emptyLayer.name]
+        layer.name = self.binaryLayerName
+        font.glyphOrder = ttFont.getGlyphOrder()
+        font.dirty = False
+        self._wrapped = font
+        self._ttFont = ttFont
+        self._binaryPath = path
+        self._wrappedInfo = None
+        self._wrappedGroups = None
+        self._wrappedKerning = None
+        self._wrappedFeatures = None
+        self._wrappedLib = None
+        self._compiler = None
+        self._kerningExtracted = False
+
+    # path
+
+    def _get_path(self, **kwargs):
+        return self._binaryPath
+
+    # save
+
+    def _save(self, path=None, showProgress=False, formatVersion=None, **kwargs):
+        self.raiseReadOnlyError()
+
+    # close
+
+    def _close(self, **kwargs):
+        self._ttFont.close()
+        del self._ttFont
+        del self._wrapped
+
+    # -----------
+    # Sub-Objects
+    # -----------
+
+    # info
+
+    def _get_info(self):
+        if self._wrappedInfo is None:
+            info = self.naked().info
+            info.disableNotifications()
+            extractInfo(self._ttFont, info)
+            info.enableNotifications()
+            info.dirty = False
+        return super(RFont, self)._get_info()
+
+    # groups
+
+    def _get_groups(self):
+        self._extractKerning()
+        return super(RFont, self)._get_groups()
+
+    # kerning
+
+    def _get_kerning(self):
+        self._extractKerning()
+        return super(RFont, self)._get_kerning()
+
+    def _extractKerning(self):
+        if self._kerningExtracted:
+            return
+        font = self.naked()
+        font.kerning.disableNotifications()
+        font.groups.disableNotifications()
+        extractKerning(self._ttFont, font.kerning, font.groups)
+        font.kerning.enableNotifications()
+        font.groups.enableNotifications()
+        font.kerning.dirty = False
+        font.groups.dirty = False
+        self._kerningExtracted = True
+
+    # ------
+    # Layers
+    # ------
+
+    def _set_layerOrder(self, value, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _set_defaultLayer(self, value, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _newLayer(self, name, color, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _removeLayer(self, name, **kwargs):
+        self.raiseReadOnlyError()
+
+    # Glyphs
+
+    def _set_glyphOrder(self, value):
+        self.raiseReadOnlyError()
+
+    # ----------
+    # Guidelines
+    # ----------
+
+    def _appendGuideline(self, position, angle, name=None, color=None, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _removeGuideline(self, index, **kwargs):
+        self.raiseReadOnlyError()
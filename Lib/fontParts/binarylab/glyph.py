@@ -0,0 +1,130 @@
+from fontParts.nonelab.glyph import RGlyph as NoneLabRGlyph
+from fontParts.binarylab.base import RReadOnlyMixin
+from fontParts.binarylab.contour import RContour
+from fontParts.binarylab.component import RComponent
+from fontParts.binarylab.anchor import RAnchor
+from fontParts.binarylab.guideline import RGuideline
+from fontParts.binarylab.image import RImage
+from fontParts.binarylab.lib import RLib
+
+
+class RGlyph(RReadOnlyMixin, NoneLabRGlyph):
+
+    """
+    A read only glyph decoded from a compiled binary.
+    The outline is decoded when the glyph is first
+    loaded from the layer. Copies of the glyph and
+    the results of glyph math are editable nonelab
+    glyphs.
+    """
+
+    contourClass = RContour
+    componentClass = RComponent
+    anchorClass = RAnchor
+    guidelineClass = RGuideline
+    imageClass = RImage
+    libClass = RLib
+    copyClass = NoneLabRGlyph
+
+    # ----
+    # Copy
+    # ----
+
+    def _copyData(self, source):
+        self.raiseReadOnlyError()
+
+    # --------------
+    # Identification
+    # --------------
+
+    def _set_name(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_unicodes(self, value):
+        self.raiseReadOnlyError()
+
+    # -------
+    # Metrics
+    # -------
+
+    def _set_width(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_height(self, value):
+        self.raiseReadOnlyError()
+
+    # ----
+    # Pens
+    # ----
+
+    def getPen(self):
+        self.raiseReadOnlyError()
+
+    def getPointPen(self):
+        self.raiseReadOnlyError()
+
+    # -----------------------------------------
+    # Contour, Component and Anchor Interaction
+    # -----------------------------------------
+
+    def _removeContour(self, index, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _removeComponent(self, index, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _appendAnchor(self, name, position=None, color=None, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _removeAnchor(self, index, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _appendGuideline(self, position, angle, name=None, color=None, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _removeGuideline(self, index, **kwargs):
+        self.raiseReadOnlyError()
+
+    # --------------
+    # Transformation
+    # --------------
+
+    def _transformBy(self, matrix, origin=None, originOffset=None, **kwargs):
+        self.raiseReadOnlyError()
+
+    # --------------------
+    # Interpolation & Math
+    # --------------------
+
+    def _setMathValues(self, xValues, yValues, round=False):
+        self.raiseReadOnlyError()
+
+    # -----------------
+    # Layer Interaction
+    # -----------------
+
+    def _newLayer(self, name, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _removeLayer(self, name, **kwargs):
+        self.raiseReadOnlyError()
+
+    # -----
+    # Image
+    # -----
+
+    def _addImage(self, data, transformation=None, color=None):
+        self.raiseReadOnlyError()
+
+    def _clearImage(self):
+        self.raiseReadOnlyError()
+
+    # ----
+    # Note
+    # ----
+
+    def _set_markColor(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_note(self, value):
+        self.raiseReadOnlyError()
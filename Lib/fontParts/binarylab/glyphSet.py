@@ -0,0 +1,115 @@
+from ufoLib.pointPen import SegmentToPointPen
+
+
+class BinaryGlyphSet(object):
+
+    """
+    A glyph set that reads glyphs from a fontTools
+    TTFont. This implements the parts of the ufoLib
+    GlyphSet API that a defcon Layer uses to load
+    glyphs on demand, so glyphs are only decoded
+    when they are first accessed.
+    """
+
+    def __init__(self, ttFont):
+        self._ttFont = ttFont
+        self._glyphOrder = ttFont.getGlyphOrder()
+        self._glyphNames = set(self._glyphOrder)
+        self._glyphs = None
+        self._unicodes = None
+        self._contents = None
+
+    def _get_glyphs(self):
+        if self._glyphs is None:
+            self._glyphs = self._ttFont.getGlyphSet()
+        return self._glyphs
+
+    glyphs = property(_get_glyphs)
+
+    # ----
+    # Keys
+    # ----
+
+    def keys(self):
+        return list(self._glyphOrder)
+
+    def __contains__(self, glyphName):
+        return glyphName in self._glyphNames
+
+    def __len__(self):
+        return len(self._glyphOrder)
+
+    def _get_contents(self):
+        if self._contents is None:
+            self._contents = dict((glyphName, glyphName) for glyphName in self._glyphOrder)
+        return self._contents
+
+    contents = property(_get_contents)
+
+    # there are no GLIF files behind the glyphs
+
+    def getGLIF(self, glyphName):
+        return None
+
+    def getGLIFModificationTime(self, glyphName):
+        return None
+
+    # -------
+    # Reading
+    # -------
+
+    def readLayerInfo(self, layer):
+        pass
+
+    def readGlyph(self, glyphName, glyphObject=None, pointPen=None):
+        ttFont = self._ttFont
+        if glyphObject is not None:
+            width, lsb = ttFont["hmtx"][glyphName]
+            glyphObject.width = width
+            if "vmtx" in ttFont:
+                height, tsb = ttFont["vmtx"][glyphName]
+                glyphObject.height = height
+            glyphObject.unicodes = self._getUnicodeMapping().get(glyphName, [])
+        if pointPen is not None:
+            pen = SegmentToPointPen(pointPen)
+            self.glyphs[glyphName].draw(pen)
+
+    # ------------
+    # Bulk Queries
+    # ------------
+
+    def _getUnicodeMapping(self):
+        if self._unicodes is None:
+            unicodes = {}
+            if "cmap" in self._ttFont:
+                cmap = self._ttFont["cmap"].getBestCmap()
+                if cmap is not None:
+                    for value, glyphName in sorted(cmap.items()):
+                        if glyphName not in unicodes:
+                            unicodes[glyphName] = []
+                        unicodes[glyphName].append(value)
+            self._unicodes = unicodes
+        return self._unicodes
+
+    def getUnicodes(self, glyphNames=None):
+        mapping = self._getUnicodeMapping()
+        if glyphNames is None:
+            glyphNames = self._glyphOrder
+        return dict((glyphName, list(mapping.get(glyphName, []))) for glyphName in glyphNames)
+
+    def getComponentReferences(self, glyphNames=None):
+        if glyphNames is None:
+            glyphNames = self._glyphOrder
+        references = {}
+        if "glyf" not in self._ttFont:
+            # CFF outlines do not have components
+            return references
+        glyfTable = self._ttFont["glyf"]
+        for glyphName in glyphNames:
+            glyph = glyfTable[glyphName]
+            if glyph.isComposite():
+                references[glyphName] = [component.glyphName for component in glyph.components]
+        return references
+
+    def getImageReferences(self, glyphNames=None):
+        return {}
@@ -0,0 +1,11 @@
+from fontParts.nonelab.groups import RGroups as NoneLabRGroups
+from fontParts.binarylab.base import RReadOnlyMixin
+
+
+class RGroups(RReadOnlyMixin, NoneLabRGroups):
+
+    def _setItem(self, key, value):
+        self.raiseReadOnlyError()
+
+    def _delItem(self, key):
+        self.raiseReadOnlyError()
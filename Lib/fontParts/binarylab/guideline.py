@@ -0,0 +1,23 @@
+from fontParts.nonelab.guideline import RGuideline as NoneLabRGuideline
+from fontParts.binarylab.base import RReadOnlyMixin
+
+
+class RGuideline(RReadOnlyMixin, NoneLabRGuideline):
+
+    def _set_x(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_y(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_angle(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_name(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_color(self, value):
+        self.raiseReadOnlyError()
+
+    def _transformBy(self, matrix, origin=None, originOffset=None, **kwargs):
+        self.raiseReadOnlyError()
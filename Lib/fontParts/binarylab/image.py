@@ -0,0 +1,20 @@
+from fontParts.nonelab.image import RImage as NoneLabRImage
+from fontParts.binarylab.base import RReadOnlyMixin
+
+
+class RImage(RReadOnlyMixin, NoneLabRImage):
+
+    def _set_transformation(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_color(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_data(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_reference(self, value):
+        self.raiseReadOnlyError()
+
+    def _transformBy(self, matrix, origin=None, originOffset=None, **kwargs):
+        self.raiseReadOnlyError()
@@ -0,0 +1,8 @@
+from fontParts.nonelab.info import RInfo as NoneLabRInfo
+from fontParts.binarylab.base import RReadOnlyMixin
+
+
+class RInfo(RReadOnlyMixin, NoneLabRInfo):
+
+    def _setAttr(self, attr, value):
+        self.raiseReadOnlyError()
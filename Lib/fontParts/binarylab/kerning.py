@@ -0,0 +1,11 @@
+from fontParts.nonelab.kerning import RKerning as NoneLabRKerning
+from fontParts.binarylab.base import RReadOnlyMixin
+
+
+class RKerning(RReadOnlyMixin, NoneLabRKerning):
+
+    def _setItem(self, key, value):
+        self.raiseReadOnlyError()
+
+    def _delItem(self, key):
+        self.raiseReadOnlyError()
@@ -0,0 +1,44 @@
+from fontParts.nonelab.layer import RLayer as NoneLabRLayer
+from fontParts.binarylab.base import RReadOnlyMixin
+from fontParts.binarylab.glyph import RGlyph
+from fontParts.binarylab.lib import RLib
+
+
+class RLayer(RReadOnlyMixin, NoneLabRLayer):
+
+    libClass = RLib
+    glyphClass = RGlyph
+
+    # --------------
+    # Identification
+    # --------------
+
+    def _set_name(self, value, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _set_color(self, value, **kwargs):
+        self.raiseReadOnlyError()
+
+    # -----------------
+    # Glyph Interaction
+    # -----------------
+
+    def _newGlyph(self, name, **kwargs):
+        self.raiseReadOnlyError()
+
+    def _removeGlyph(self, name, **kwargs):
+        self.raiseReadOnlyError()
+
+    # -----------------
+    # Global Operations
+    # -----------------
+
+    def _autoUnicodes(self, overrides):
+        self.raiseReadOnlyError()
+
+    # -------
+    # Metrics
+    # -------
+
+    def _setMetrics(self, glyphNames, metrics):
+        self.raiseReadOnlyError()
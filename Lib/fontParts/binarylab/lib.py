@@ -0,0 +1,11 @@
+from fontParts.nonelab.lib import RLib as NoneLabRLib
+from fontParts.binarylab.base import RReadOnlyMixin
+
+
+class RLib(RReadOnlyMixin, NoneLabRLib):
+
+    def _setItem(self, key, value):
+        self.raiseReadOnlyError()
+
+    def _delItem(self, key):
+        self.raiseReadOnlyError()
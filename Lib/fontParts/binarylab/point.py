@@ -0,0 +1,23 @@
+from fontParts.nonelab.point import RPoint as NoneLabRPoint
+from fontParts.binarylab.base import RReadOnlyMixin
+
+
+class RPoint(RReadOnlyMixin, NoneLabRPoint):
+
+    def _set_type(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_smooth(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_x(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_y(self, value):
+        self.raiseReadOnlyError()
+
+    def _set_name(self, value):
+        self.raiseReadOnlyError()
+
+    def _transformBy(self, matrix, origin=None, originOffset=None, **kwargs):
+        self.raiseReadOnlyError()
@@ -0,0 +1,235 @@
+import os
+import shutil
+import tempfile
+import unittest
+from fontParts.base import FontPartsError
+from fontParts.nonelab.font import RFont as NoneLabRFont
+from fontParts.nonelab.glyph import RGlyph as NoneLabRGlyph
+from fontParts.binarylab.font import RFont
+
+
+def _makeSourceFont():
+    font = NoneLabRFont()
+    font.info.familyName = "Binary"
+    font.info.styleName = "Regular"
+    font.info.unitsPerEm = 1000
+    font.info.ascender = 750
+    font.info.descender = -250
+    glyph = font.newGlyph(".notdef")
+    glyph.width = 500
+    for glyphName, value in (("A", 0x41), ("B", 0x42)):
+        glyph = font.newGlyph(glyphName)
+        glyph.unicodes = [value]
+        glyph.width = 500
+        pen = glyph.getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 100))
+        pen.lineTo((100, 100))
+        pen.closePath()
+    glyph = font.newGlyph("C")
+    glyph.width = 600
+    glyph.appendComponent("A", offset=(10, 0))
+    font.glyphOrder = [".notdef", "A", "B", "C"]
+    return font
+
+
+class TestBinaryFont(unittest.TestCase):
+
+    format = "otfttf"
+
+    def setUp(self):
+        self.tempDir = tempfile.mkdtemp()
+        path = os.path.join(self.tempDir, "Binary.otf")
+        _makeSourceFont().generate(self.format, path)
+        self.font = RFont(path)
+
+    def tearDown(self):
+        self.font.close()
+        shutil.rmtree(self.tempDir)
+
+    def assertReadOnly(self, function, *args, **kwargs):
+        with self.assertRaises(FontPartsError):
+            function(*args, **kwargs)
+
+    # -------
+    # Reading
+    # -------
+
+    def test_read(self):
+        font = self.font
+        self.assertEqual(
+            font.glyphOrder,
+            [".notdef", "A", "B", "C"]
+        )
+        glyph = font["A"]
+        self.assertEqual(
+            (glyph.width, glyph.unicodes, glyph.bounds),
+            (500, (0x41,), (0, 0, 100, 100))
+        )
+        self.assertEqual(
+            sorted((point.x, point.y) for point in glyph.contours[0].points),
+            [(0, 0), (0, 100), (100, 100)]
+        )
+        self.assertEqual(
+            font["C"].bounds,
+            (10, 0, 110, 100)
+        )
+        self.assertEqual(
+            (font.info.familyName, font.info.unitsPerEm),
+            ("Binary", 1000)
+        )
+
+    def test_copy(self):
+        copied = self.font["A"].copy()
+        self.assertIsInstance(copied, NoneLabRGlyph)
+        copied.moveBy((10, 0))
+        self.assertEqual(
+            copied.bounds,
+            (10, 0, 110, 100)
+        )
+        self.assertEqual(
+            self.font["A"].bounds,
+            (0, 0, 100, 100)
+        )
+
+    def test_copy_font(self):
+        copied = self.font.copy()
+        self.assertIsInstance(copied, NoneLabRFont)
+        self.assertEqual(
+            (copied.info.familyName, sorted(copied.keys())),
+            ("Binary", [".notdef", "A", "B", "C"])
+        )
+        copied["A"].moveBy((10, 0))
+        self.assertEqual(
+            (copied["A"].bounds, self.font["A"].bounds),
+            ((10, 0, 110, 100), (0, 0, 100, 100))
+        )
+
+    def test_copyData(self):
+        copied = NoneLabRFont()
+        copied.copyData(self.font)
+        self.assertEqual(
+            (copied.info.familyName, copied.info.unitsPerEm),
+            ("Binary", 1000)
+        )
+        self.assertEqual(
+            sorted(copied.keys()),
+            [".notdef", "A", "B", "C"]
+        )
+        self.assertEqual(
+            copied["C"].bounds,
+            (10, 0, 110, 100)
+        )
+
+    # -------
+    # Writing
+    # -------
+
+    def test_readOnly_font(self):
+        font = self.font
+        self.assertReadOnly(font.save, os.path.join(self.tempDir, "Binary.ufo"))
+        self.assertReadOnly(font.newGlyph, "D")
+        self.assertReadOnly(font.removeGlyph, "A")
+        self.assertReadOnly(font.insertGlyph, NoneLabRGlyph(), name="D")
+        self.assertReadOnly(font.newLayer, "background")
+        self.assertReadOnly(setattr, font, "glyphOrder", ["A"])
+        self.assertReadOnly(font.appendGuideline, (0, 0), 0)
+        self.assertReadOnly(font.autoUnicodes)
+        self.assertReadOnly(font.setMetrics, dict(glyphNames=["A"], width=[100]))
+        self.assertReadOnly(setattr, font.info, "familyName", "Edited")
+        self.assertReadOnly(font.info.round)
+        self.assertReadOnly(font.kerning.__setitem__, ("A", "B"), -20)
+        self.assertReadOnly(font.groups.__setitem__, "group", ["A"])
+        self.assertReadOnly(font.lib.__setitem__, "key", "value")
+        self.assertReadOnly(setattr, font.features, "text", "# features")
+        layer = font.getLayer(font.defaultLayer)
+        self.assertReadOnly(setattr, layer, "name", "edited")
+        self.assertReadOnly(setattr, layer, "color", (1, 0, 0, 1))
+        self.assertReadOnly(layer.lib.__setitem__, "key", "value")
+        self.assertEqual(
+            (font.info.familyName, dict(font.kerning), sorted(font.keys())),
+            ("Binary", {}, [".notdef", "A", "B", "C"])
+        )
+
+    def test_readOnly_glyph(self):
+        glyph = self.font["A"]
+        self.assertReadOnly(setattr, glyph, "name", "D")
+        self.assertReadOnly(setattr, glyph, "unicodes", [0x44])
+        self.assertReadOnly(setattr, glyph, "width", 100)
+        self.assertReadOnly(setattr, glyph, "leftMargin", 100)
+        self.assertReadOnly(setattr, glyph, "markColor", (1, 0, 0, 1))
+        self.assertReadOnly(setattr, glyph, "note", "note")
+        self.assertReadOnly(glyph.getPen)
+        self.assertReadOnly(glyph.getPointPen)
+        self.assertReadOnly(glyph.moveBy, (10, 0))
+        self.assertReadOnly(glyph.transformBy, (2, 0, 0, 2, 0, 0))
+        self.assertReadOnly(glyph.round)
+        self.assertReadOnly(glyph.clear)
+        self.assertReadOnly(glyph.appendContour, glyph.contours[0])
+        self.assertReadOnly(glyph.removeContour, 0)
+        self.assertReadOnly(glyph.appendComponent, "B")
+        self.assertReadOnly(glyph.appendAnchor, "top", (50, 100))
+        self.assertReadOnly(glyph.appendGuideline, (0, 0), 0)
+        self.assertReadOnly(glyph.correctDirection, trueType=not glyph.contours[0].clockwise)
+        self.assertReadOnly(self.font["C"].autoUnicodes)
+        self.assertReadOnly(glyph.copyData, NoneLabRGlyph())
+        self.assertReadOnly(glyph.__imul__, 2)
+        self.assertReadOnly(glyph.lib.__setitem__, "key", "value")
+        self.assertReadOnly(glyph.newLayer, "background")
+        self.assertEqual(
+            (glyph.width, glyph.bounds),
+            (500, (0, 0, 100, 100))
+        )
+
+    def test_readOnly_contour(self):
+        contour = self.font["A"].contours[0]
+        points = [(point.x, point.y) for point in contour.points]
+        point = contour.points[0]
+        self.assertReadOnly(setattr, point, "x", 10)
+        self.assertReadOnly(setattr, point, "y", 10)
+        self.assertReadOnly(setattr, point, "type", "curve")
+        self.assertReadOnly(setattr, point, "smooth", True)
+        self.assertReadOnly(setattr, point, "name", "name")
+        self.assertReadOnly(point.moveBy, (10, 0))
+        self.assertReadOnly(point.round)
+        self.assertReadOnly(setattr, contour.bPoints[0], "anchor", (10, 10))
+        self.assertReadOnly(contour.segments[0].moveBy, (10, 0))
+        self.assertReadOnly(contour.moveBy, (10, 0))
+        self.assertReadOnly(contour.reverse)
+        self.assertReadOnly(contour.setStartSegment, 1)
+        self.assertReadOnly(contour.insertPoint, 0, (50, 50))
+        self.assertReadOnly(contour.removePoint, 0)
+        self.assertEqual(
+            [(point.x, point.y) for point in contour.points],
+            points
+        )
+
+    def test_readOnly_component(self):
+        component = self.font["C"].components[0]
+        self.assertReadOnly(setattr, component, "baseGlyph", "B")
+        self.assertReadOnly(setattr, component, "offset", (20, 0))
+        self.assertReadOnly(setattr, component, "scale", (2, 2))
+        self.assertReadOnly(component.moveBy, (10, 0))
+        self.assertReadOnly(component.round)
+        self.assertReadOnly(component.decompose)
+        self.assertReadOnly(self.font["C"].decompose)
+        self.assertEqual(
+            component.offset,
+            (10, 0)
+        )
+
+
+class TestBinaryFontCFF(TestBinaryFont):
+
+    format = "otfcff"
+
+    def test_readOnly_component(self):
+        # CFF outlines do not have components
+        self.assertEqual(
+            len(self.font["C"].components),
+            0
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
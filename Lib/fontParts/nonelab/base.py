@@ -1,3 +1,91 @@
+import weakref
+import defcon
+from defcon.tools.notifications import Notification
+from fontParts.base.transaction import UndoHistory
+
+# The undo histories of the defcon objects. The
+# wrappers are made when they are needed, so the
+# histories can not be kept in the wrappers.
+_undoHistories = weakref.WeakKeyDictionary()
+
+
+# The notifications that tell observers that an object
+# has changed. defcon keeps itself up to date with the
+# other notifications, so those are never held. These
+# are released from the glyphs to the font, so the ones
+# posted while releasing are merged with the held ones.
+_heldChangeNotifications = (
+    "Glyph.Changed",
+    "Layer.GlyphChanged",
+    "Layer.Changed",
+    "LayerSet.LayerChanged",
+    "LayerSet.Changed",
+    "Info.Changed",
+    "Kerning.Changed",
+    "Groups.Changed",
+    "Features.Changed",
+    "ImageSet.Changed",
+    "DataSet.Changed",
+    "Font.Changed"
+)
+
+
+class _HeldNotifications(list):
+
+    """
+    The list that defcon keeps held notifications in.
+    defcon looks for a notification in the list before
+    appending it, so the notifications are also kept in
+    a set to make the lookup fast when many are held.
+
+    The representations of the changed object are
+    destroyed during the lookup, so that they are not
+    out of date while the notification is held.
+    """
+
+    def __init__(self, notifications=()):
+        super(_HeldNotifications, self).__init__()
+        self._found = set()
+        for notification in notifications:
+            self.append(notification)
+
+    def __contains__(self, notification):
+        name, observableRef, data = notification
+        observable = observableRef()
+        if observable is not None and hasattr(observable, "_destroyRepresentationsForNotification"):
+            observable._destroyRepresentationsForNotification(Notification(name, observableRef, data))
+        try:
+            return notification in self._found
+        except TypeError:
+            return super(_HeldNotifications, self).__contains__(notification)
+
+    def append(self, notification):
+        try:
+            self._found.add(notification)
+        except TypeError:
+            pass
+        super(_HeldNotifications, self).append(notification)
+
+
+def _getGlyphLocation(glyph):
+    """
+    Get the location of the defcon **glyph** as
+    :meth:`BaseObject._getGlyphLocation` returns it.
+    The wrappers of the parents of an object may
+    already be gone, so the glyph is found through
+    the defcon objects.
+    """
+    if glyph is None:
+        return None
+    layer = glyph.layer
+    font = glyph.font
+    if layer is None or font is None:
+        return None
+    # the font module imports this module
+    from fontParts.nonelab.font import RFont
+    return RFont(font), layer.name, glyph.name
+
+
 class RBaseObject(object):
 
     wrapClass = None
@@ -17,3 +105,41 @@ class RBaseObject(object):
         if hasattr(self, "_wrapped"):
             return self._wrapped
         return None
+
+    def _holdChanges(self):
+        # the dispatcher is remembered so that the
+        # same one is released if the object is
+        # added to a font inside of the block
+        dispatcher = getattr(self.naked(), "dispatcher", None)
+        if not hasattr(self, "_heldDispatchers"):
+            self._heldDispatchers = []
+        self._heldDispatchers.append(dispatcher)
+        if dispatcher is None:
+            return
+        for name in _heldChangeNotifications:
+            dispatcher.holdNotifications(notification=name)
+            # this depends on how defcon keeps held notifications,
+            # TestDefcon in the nonelab tests checks that it works
+            hold = dispatcher._holds[name, None, None]
+            if not isinstance(hold["notifications"], _HeldNotifications):
+                hold["notifications"] = _HeldNotifications(hold["notifications"])
+
+    def _releaseHeldChanges(self):
+        dispatcher = self._heldDispatchers.pop()
+        if dispatcher is None:
+            return
+        for name in _heldChangeNotifications:
+            dispatcher.releaseHeldNotifications(notification=name)
+
+    def _getGlyphLocation(self):
+        naked = self.naked()
+        if isinstance(naked, defcon.Glyph):
+            return _getGlyphLocation(naked)
+        return _getGlyphLocation(getattr(naked, "glyph", None))
+
+    def _getUndoHistory(self):
+        naked = self.naked()
+        history = _undoHistories.get(naked)
+        if history is None:
+            history = _undoHistories[naked] = UndoHistory()
+        return history
@@ -0,0 +1,273 @@
+import hashlib
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.basePen import DecomposingPen
+from fontTools.pens.boundsPen import BoundsPen
+from fontTools.pens.t2CharStringPen import T2CharStringPen
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import newTable
+from fontTools.ttLib.tables._c_m_a_p import cmap_classes
+from fontParts.base import FontPartsError
+from fontParts.nonelab.glyph import _getGlyphFingerprint
+
+
+class FontCompiler(object):
+
+    """
+    Compile a defcon font into an OpenType binary.
+
+    The compiled outline data for each glyph is cached
+    under a hash of the glyph's outline. Subsequent
+    compilations with the same compiler only compile
+    the glyphs whose outlines (or the outlines of the
+    glyphs they reference with components) have changed.
+    The caches are pruned after each compilation so that
+    they only hold the data for the latest outlines.
+    """
+
+    supportedFormats = ("otfcff", "otfttf")
+
+    def __init__(self):
+        self._charStrings = {}
+        self._ttGlyphs = {}
+
+    def compile(self, font, format, path):
+        if format not in self.supportedFormats:
+            raise FontPartsError("The format '%s' is not supported." % format)
+        isTTF = format == "otfttf"
+        layer = font.layers.defaultLayer
+        glyphOrder = self._makeGlyphOrder(font, layer)
+        # outline keys
+        keys = {}
+        for glyphName in glyphOrder:
+            if glyphName in layer:
+                self._makeOutlineKey(layer[glyphName], layer, keys)
+        # build
+        info = font.info
+        unitsPerEm = info.unitsPerEm
+        if unitsPerEm is None:
+            unitsPerEm = 1000
+        builder = FontBuilder(int(unitsPerEm), isTTF=isTTF)
+        builder.setupGlyphOrder(glyphOrder)
+        cmap = self._makeCharacterMapping(layer, glyphOrder)
+        if cmap:
+            builder.setupCharacterMap(cmap)
+        else:
+            # the builder can not set up an empty character map
+            builder.font["cmap"] = self._makeEmptyCharacterMapTable()
+        if isTTF:
+            glyphs = self._compileTTGlyphs(layer, glyphOrder, keys)
+            builder.setupGlyf(glyphs)
+            glyfTable = builder.font["glyf"]
+            metrics = {}
+            for glyphName in glyphOrder:
+                glyph = glyfTable[glyphName]
+                metrics[glyphName] = (
+                    self._getWidth(layer, glyphName),
+                    getattr(glyph, "xMin", 0)
+                )
+        else:
+            charStrings, metrics = self._compileCharStrings(layer, glyphOrder, keys)
+            builder.setupCFF(
+                self._getPostscriptFontName(info),
+                dict(FullName=self._getFullName(info)),
+                charStrings,
+                dict()
+            )
+        builder.setupHorizontalMetrics(metrics)
+        ascender, descender = self._getVerticalMetrics(info, unitsPerEm)
+        builder.setupHorizontalHeader(ascent=ascender, descent=descender)
+        builder.setupNameTable(
+            dict(
+                familyName=info.familyName or "Untitled",
+                styleName=info.styleName or "Regular",
+                uniqueFontIdentifier=self._getPostscriptFontName(info),
+                fullName=self._getFullName(info),
+                psName=self._getPostscriptFontName(info),
+                version="Version %d.%03d" % (info.versionMajor or 0, info.versionMinor or 0)
+            )
+        )
+        os2 = dict(
+            sTypoAscender=ascender,
+            sTypoDescender=descender,
+            usWinAscent=max(ascender, 0),
+            usWinDescent=max(-descender, 0)
+        )
+        if info.xHeight is not None:
+            os2["sxHeight"] = int(round(info.xHeight))
+        if info.capHeight is not None:
+            os2["sCapHeight"] = int(round(info.capHeight))
+        if info.openTypeOS2WeightClass is not None:
+            os2["usWeightClass"] = info.openTypeOS2WeightClass
+        builder.setupOS2(**os2)
+        post = {}
+        if info.italicAngle is not None:
+            post["italicAngle"] = info.italicAngle
+        builder.setupPost(**post)
+        builder.save(path)
+        # prune the caches
+        used = set(keys.values())
+        for cache in (self._charStrings, self._ttGlyphs):
+            for key in list(cache.keys()):
+                if key not in used:
+                    del cache[key]
+
+    # -------------
+    # Glyph Helpers
+    # -------------
+
+    def _makeGlyphOrder(self, font, layer):
+        glyphOrder = [".notdef"]
+        for glyphName in font.glyphOrder:
+            if glyphName in layer and glyphName not in glyphOrder:
+                glyphOrder.append(glyphName)
+        for glyphName in sorted(layer.keys()):
+            if glyphName not in glyphOrder:
+                glyphOrder.append(glyphName)
+        return glyphOrder
+
+    def _makeCharacterMapping(self, layer, glyphOrder):
+        cmap = {}
+        for glyphName in reversed(glyphOrder):
+            if glyphName not in layer:
+                continue
+            for value in layer[glyphName].unicodes:
+                cmap[value] = glyphName
+        return cmap
+
+    def _makeEmptyCharacterMapTable(self):
+        subtable = cmap_classes[4](4)
+        subtable.platformID = 3
+        subtable.platEncID = 1
+        subtable.language = 0
+        subtable.cmap = {}
+        table = newTable("cmap")
+        table.tableVersion = 0
+        table.tables = [subtable]
+        return table
+
+    def _makeOutlineKey(self, glyph, layer, keys):
+        """
+        Make a hash of everything that goes into the compiled
+        outline of **glyph**. The fingerprint of the glyph is
+        kept until the glyph changes, so unchanged glyphs are
+        not read again. Components are included by the keys of
+        their base glyphs so that a change to a base glyph
+        changes the keys of all glyphs that use it.
+        """
+        glyphName = glyph.name
+        if glyphName in keys:
+            return keys[glyphName]
+        # guard against recursive components
+        keys[glyphName] = None
+        data = [_getGlyphFingerprint(glyph)]
+        for component in glyph.components:
+            baseGlyph = component.baseGlyph
+            baseKey = None
+            if baseGlyph in layer:
+                baseKey = self._makeOutlineKey(layer[baseGlyph], layer, keys)
+            data.append((baseGlyph, baseKey))
+        key = hashlib.sha1(repr(data).encode("utf-8")).hexdigest()
+        keys[glyphName] = key
+        return key
+
+    def _getWidth(self, layer, glyphName):
+        if glyphName not in layer:
+            return 0
+        return int(round(layer[glyphName].width))
+
+    # --------
+    # Outlines
+    # --------
+
+    def _compileCharStrings(self, layer, glyphOrder, keys):
+        charStrings = {}
+        metrics = {}
+        for glyphName in glyphOrder:
+            key = keys.get(glyphName)
+            if key is None or key not in self._charStrings:
+                width = self._getWidth(layer, glyphName)
+                pen = T2CharStringPen(width, layer)
+                boundsPen = BoundsPen(layer)
+                if glyphName in layer:
+                    glyph = layer[glyphName]
+                    glyph.draw(pen)
+                    glyph.draw(boundsPen)
+                lsb = 0
+                if boundsPen.bounds is not None:
+                    lsb = int(round(boundsPen.bounds[0]))
+                compiled = (pen.getCharString(), (width, lsb))
+                if key is None:
+                    charStrings[glyphName], metrics[glyphName] = compiled
+                    continue
+                self._charStrings[key] = compiled
+            charStrings[glyphName], metrics[glyphName] = self._charStrings[key]
+        return charStrings, metrics
+
+    def _compileTTGlyphs(self, layer, glyphOrder, keys):
+        from cu2qu.pens import Cu2QuPen
+        glyphs = {}
+        for glyphName in glyphOrder:
+            key = keys.get(glyphName)
+            if key is None or key not in self._ttGlyphs:
+                ttPen = TTGlyphPen(layer)
+                pen = Cu2QuPen(ttPen, max_err=1.0, reverse_direction=True)
+                if glyphName in layer:
+                    glyph = layer[glyphName]
+                    if len(glyph) and len(glyph.components):
+                        # TrueType glyphs can not mix contours and components
+                        pen = _DecomposingPen(layer, pen)
+                    glyph.draw(pen)
+                compiled = ttPen.glyph()
+                if key is None:
+                    glyphs[glyphName] = compiled
+                    continue
+                self._ttGlyphs[key] = compiled
+            glyphs[glyphName] = self._ttGlyphs[key]
+        return glyphs
+
+    # ----
+    # Info
+    # ----
+
+    def _getPostscriptFontName(self, info):
+        if info.postscriptFontName is not None:
+            return info.postscriptFontName
+        name = "%s-%s" % (info.familyName or "Untitled", info.styleName or "Regular")
+        return name.replace(" ", "")
+
+    def _getFullName(self, info):
+        return "%s %s" % (info.familyName or "Untitled", info.styleName or "Regular")
+
+    def _getVerticalMetrics(self, info, unitsPerEm):
+        ascender = info.ascender
+        if ascender is None:
+            ascender = unitsPerEm * 0.75
+        descender = info.descender
+        if descender is None:
+            descender = -unitsPerEm * 0.25
+        return int(round(ascender)), int(round(descender))
+
+
+class _DecomposingPen(DecomposingPen):
+
+    def __init__(self, glyphSet, outPen):
+        super(_DecomposingPen, self).__init__(glyphSet)
+        self._outPen = outPen
+
+    def moveTo(self, pt):
+        self._outPen.moveTo(pt)
+
+    def lineTo(self, pt):
+        self._outPen.lineTo(pt)
+
+    def curveTo(self, *points):
+        self._outPen.curveTo(*points)
+
+    def qCurveTo(self, *points):
+        self._outPen.qCurveTo(*points)
+
+    def closePath(self):
+        self._outPen.closePath()
+
+    def endPath(self):
+        self._outPen.endPath()
@@ -36,7 +36,7 @@ class RComponent(RBaseObject, BaseComponent):
     def _set_index(self, value):
         component = self.naked()
         glyph = component.glyph
-        if value > glyph.component.index(component):
+        if value > glyph.componentIndex(component):
             value -= 1
         glyph.removeComponent(component)
         glyph.insertComponent(value, component)
@@ -50,12 +50,3 @@ class RComponent(RBaseObject, BaseComponent):
     def _generateIdentifier(self):
         component = self.naked()
         return component.generateIdentifier()
-
-    # -------------
-    # Normalization
-    # -------------
-
-    def _decompose(self):
-        component = self.naked()
-        glyph = component.glyph
-        glyph.decomposeComponent(component)
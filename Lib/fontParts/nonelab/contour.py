@@ -22,7 +22,7 @@ class RContour(RBaseObject, BaseContour):
     def _set_index(self, value):
         contour = self.naked()
         glyph = contour.glyph
-        if value > glyph.contours.index(contour):
+        if value > glyph.contourIndex(contour):
             value -= 1
         glyph.removeContour(contour)
         glyph.insertContour(value, contour)
@@ -53,12 +53,29 @@ class RContour(RBaseObject, BaseContour):
     # Direction
     # ---------
 
-    def _get_clockwise(self):
-        return self.naked().clockwise
-
     def _reverseContour(self, **kwargs):
         self.naked().reverse()
 
+    # ----
+    # Pens
+    # ----
+
+    def _drawPoints(self, pen, **kwargs):
+        self.naked().drawPoints(pen)
+
+    # --------
+    # Segments
+    # --------
+
+    def _setStartSegment(self, segmentIndex, **kwargs):
+        contour = self.naked()
+        if contour.open:
+            super(RContour, self)._setStartSegment(segmentIndex, **kwargs)
+            return
+        onCurves = [i for i, point in enumerate(contour) if point.segmentType is not None]
+        # segments end at the on curve point after their index
+        contour.setStartPoint(onCurves[(segmentIndex + 1) % len(onCurves)])
+
     # ------
     # Points
     # ------
@@ -1,5 +1,8 @@
 import os
+import weakref
+from copy import deepcopy
 import defcon
+from ufoLib.glifLib import GlyphSet
 from fontTools.misc.py23 import basestring
 from fontParts.base import BaseFont, FontPartsError
 from fontParts.nonelab.base import RBaseObject
@@ -9,7 +12,84 @@ from fontParts.nonelab.kerning import RKerning
 from fontParts.nonelab.features import RFeatures
 from fontParts.nonelab.lib import RLib
 from fontParts.nonelab.layer import RLayer
+from fontParts.nonelab.glyph import _copyGlyphData
 from fontParts.nonelab.guideline import RGuideline
+from fontParts.nonelab.compiler import FontCompiler
+
+# layers that read some of their glyphs
+# from the glyph set of another font.
+_sharingLayers = weakref.WeakSet()
+
+
+def _shareGlyphs(layer, sourceLayer):
+    """
+    Let the empty defcon **layer** read the glyphs of
+    **sourceLayer** that have not been loaded from the
+    glyph set of **sourceLayer**. The names of the
+    shared glyphs are returned.
+    """
+    glyphSet = sourceLayer._glyphSet
+    if not isinstance(glyphSet, GlyphSet):
+        return set()
+    if layer._glyphSet is not None or len(layer):
+        return set()
+    glyphNames = set(glyphSet.keys())
+    # the glyph set must not have glyphs that have
+    # been deleted or renamed in the source layer.
+    if not glyphNames.issubset(sourceLayer.keys()):
+        return set()
+    # loaded glyphs may have been changed.
+    glyphNames -= set(sourceLayer._glyphs.keys())
+    layer._glyphSet = glyphSet
+    layer._keys = set(glyphNames)
+    _sharingLayers.add(layer)
+    return glyphNames
+
+
+def _copyGlyph(layer, sourceGlyph):
+    """
+    Copy the defcon glyph **sourceGlyph** into the
+    defcon **layer**. This follows Layer.newGlyph, but
+    the data is copied while the notifications of the
+    glyph are disabled.
+    """
+    glyphName = sourceGlyph.name
+    layer.postNotification("Layer.GlyphWillBeAdded", data=dict(name=glyphName))
+    if glyphName in layer and layer._unicodeData is not None:
+        layer._unicodeData.removeGlyphData(glyphName, layer[glyphName].unicodes)
+    glyph = layer.instantiateGlyphObject()
+    glyph.disableNotifications()
+    glyph.name = glyphName
+    _copyGlyphData(glyph, sourceGlyph)
+    # a glyph without an image has no image object.
+    sourceImage = sourceGlyph._image
+    if sourceImage is not None and sourceImage.fileName is not None:
+        glyph.image = sourceImage
+    glyph.dirty = True
+    layer._insertGlyph(glyph)
+    glyph.enableNotifications()
+    layer.postNotification("Layer.GlyphAdded", data=dict(name=glyphName))
+
+
+def _unshareGlyphs(path):
+    """
+    Load the shared glyphs of all layers
+    that read glyphs from the UFO at **path**.
+    """
+    path = os.path.normcase(os.path.abspath(path))
+    for layer in list(_sharingLayers):
+        glyphSet = layer._glyphSet
+        if glyphSet is None:
+            _sharingLayers.discard(layer)
+            continue
+        dirName = os.path.normcase(os.path.abspath(glyphSet.dirName))
+        if os.path.dirname(dirName) != path:
+            continue
+        for glyphName in layer.keys():
+            if glyphName not in layer._glyphs:
+                layer.loadGlyph(glyphName)
+        layer._glyphSet = None
+        _sharingLayers.discard(layer)
 
 
 class RFont(RBaseObject, BaseFont):
@@ -22,6 +102,67 @@ class RFont(RBaseObject, BaseFont):
     libClass = RLib
     layerClass = RLayer
     guidelineClass = RGuideline
+    compilerClass = FontCompiler
+
+    # ----
+    # Copy
+    # ----
+
+    def _copyData(self, source, shareGlyphs=False):
+        if not isinstance(source, RFont):
+            super(RFont, self)._copyData(source, shareGlyphs=shareGlyphs)
+            return
+        font = self.naked()
+        sourceFont = source.naked()
+        # the info, groups and kerning are read through
+        # the source's objects, subclasses may fill them
+        # when they are requested or keep them elsewhere.
+        info = font.info
+        sourceInfo = source.info.naked()
+        for attr in self.infoClass.copyAttributes:
+            setattr(info, attr, deepcopy(getattr(sourceInfo, attr)))
+        for sourceGuideline in sourceFont.guidelines:
+            font.appendGuideline(font.instantiateGuideline(dict(sourceGuideline)))
+        # groups, kerning, features and lib
+        font.groups.update(deepcopy(dict(source.groups.items())))
+        font.kerning.update(dict(source.kerning.items()))
+        font.features.text = sourceFont.features.text
+        font.lib.update(deepcopy(dict(sourceFont.lib)))
+        # the images are copied with their file
+        # names, so the glyphs can refer to them.
+        images = font.images
+        sourceImages = sourceFont.images
+        for fileName in sourceImages.fileNames:
+            images[fileName] = sourceImages[fileName]
+        # layers
+        layers = font.layers
+        sourceLayers = sourceFont.layers
+        # an empty default layer takes the
+        # name of the source's default layer.
+        defaultLayerName = sourceLayers.defaultLayer.name
+        defaultLayer = layers.defaultLayer
+        if defaultLayerName not in layers and not len(defaultLayer):
+            defaultLayer.name = defaultLayerName
+        for layerName in sourceLayers.layerOrder:
+            sourceLayer = sourceLayers[layerName]
+            if layerName in layers:
+                layer = layers[layerName]
+            else:
+                layer = layers.newLayer(layerName)
+            layer.color = sourceLayer.color
+            layer.lib.update(deepcopy(dict(sourceLayer.lib)))
+            sharedGlyphNames = set()
+            if shareGlyphs:
+                sharedGlyphNames = _shareGlyphs(layer, sourceLayer)
+            for glyphName in sourceLayer.keys():
+                if glyphName in sharedGlyphNames:
+                    continue
+                _copyGlyph(layer, sourceLayer[glyphName])
+            if sourceLayer.keys():
+                layer.dirty = True
+        layers.layerOrder = sourceLayers.layerOrder
+        layers.defaultLayer = layers[defaultLayerName]
+        font.glyphOrder = sourceFont.glyphOrder
 
     # ---------------
     # File Operations
@@ -42,6 +183,7 @@ class RFont(RBaseObject, BaseFont):
         self._wrappedKerning = None
         self._wrappedFeatures = None
         self._wrappedLib = None
+        self._compiler = None
 
     # path
 
@@ -51,7 +193,26 @@ class RFont(RBaseObject, BaseFont):
     # save
 
     def _save(self, path=None, showProgress=False, formatVersion=None, **kwargs):
-        self.naked().save(path=path, formatVersion=formatVersion)
+        font = self.naked()
+        # copies that share glyphs with a font read
+        # from the same path must read their glyphs
+        # before the files are overwritten.
+        if path is None:
+            path = font.path
+        if path is not None:
+            _unshareGlyphs(path)
+        font.save(path=path, formatVersion=formatVersion)
+
+    # generate
+
+    def _generate(self, format, path, **kwargs):
+        if format not in self.compilerClass.supportedFormats:
+            raise FontPartsError("The format '%s' is not supported." % format)
+        # the compiler is kept so that subsequent
+        # generations can reuse unchanged glyph data.
+        if self._compiler is None:
+            self._compiler = self.compilerClass()
+        self._compiler.compile(self.naked(), format, path)
 
     # close
 
@@ -1,5 +1,9 @@
+from copy import deepcopy
 import defcon
+from ufoLib.pointPen import AbstractPointPen
 from fontParts.base import BaseGlyph
+from fontParts.base import normalizers
+from fontParts.base.fingerprint import makeGlyphFingerprint
 from fontParts.nonelab.base import RBaseObject
 from fontParts.nonelab.contour import RContour
 from fontParts.nonelab.component import RComponent
@@ -9,6 +13,113 @@ from fontParts.nonelab.image import RImage
 from fontParts.nonelab.lib import RLib
 
 
+def _copyGlyphData(glyph, sourceGlyph):
+    """
+    Copy the data of the defcon glyph **sourceGlyph**,
+    except for the name and the image, into **glyph**.
+    """
+    # the glyph posts its notifications once,
+    # after all data has been copied.
+    if glyph.dispatcher is not None:
+        glyph.holdNotifications()
+    try:
+        glyph.unicodes = list(sourceGlyph.unicodes)
+        glyph.width = sourceGlyph.width
+        glyph.height = sourceGlyph.height
+        glyph.note = sourceGlyph.note
+        # glyphs that have been read but not drawn keep
+        # their outlines in a light form that is drawn
+        # without creating contour objects.
+        sourceGlyph.drawPoints(_CopyPointPen(glyph))
+        for sourceAnchor in sourceGlyph.anchors:
+            glyph.appendAnchor(glyph.instantiateAnchor(dict(sourceAnchor)))
+        for sourceGuideline in sourceGlyph.guidelines:
+            glyph.appendGuideline(glyph.instantiateGuideline(dict(sourceGuideline)))
+        glyph.lib.update(deepcopy(dict(sourceGlyph.lib)))
+    finally:
+        if glyph.dispatcher is not None:
+            glyph.releaseHeldNotifications()
+
+
+def _keepValue(value):
+    return value
+
+
+class _CopyPointPen(AbstractPointPen):
+
+    """
+    A point pen that adds contours and components
+    to a defcon glyph. The points of a contour
+    are set in one step.
+    """
+
+    def __init__(self, glyph):
+        self._glyph = glyph
+        self._contourClass = glyph.contourClass
+        self._pointClass = glyph.pointClass
+        self._contour = None
+
+    def beginPath(self, identifier=None, **kwargs):
+        self._contour = self._contourClass(pointClass=self._pointClass)
+        self._contour.identifier = identifier
+        self._points = []
+
+    def addPoint(self, pt, segmentType=None, smooth=False, name=None, identifier=None, **kwargs):
+        self._points.append(
+            self._pointClass(pt, segmentType=segmentType, smooth=smooth, name=name, identifier=identifier)
+        )
+
+    def endPath(self):
+        # the contour is not in a glyph yet, so it has
+        # no identifiers to update. the glyph checks the
+        # identifiers when the contour is appended.
+        self._contour._points = self._points
+        self._glyph.appendContour(self._contour)
+        self._contour = None
+        self._points = None
+
+    def addComponent(self, baseGlyphName, transformation, identifier=None, **kwargs):
+        component = self._glyph.instantiateComponent()
+        component.baseGlyph = baseGlyphName
+        component.transformation = transformation
+        component.identifier = identifier
+        self._glyph.appendComponent(component)
+
+
+def _mathGlyphFactory(glyph):
+    return RGlyph(wrap=glyph)._toMathGlyph()
+
+defcon.registerRepresentationFactory(
+    defcon.Glyph,
+    "fontParts.mathGlyph",
+    _mathGlyphFactory
+)
+
+
+def _fingerprintFactory(glyph, lib=False):
+    # the defcon glyph has everything
+    # the fingerprint is made from.
+    return makeGlyphFingerprint(glyph, lib=lib)
+
+defcon.registerRepresentationFactory(
+    defcon.Glyph,
+    "fontParts.fingerprint",
+    _fingerprintFactory
+)
+
+
+def _getGlyphFingerprint(glyph, lib=False):
+    """
+    Get the fingerprint of the defcon **glyph**. The
+    fingerprint is kept until the glyph is changed.
+    """
+    # without a dispatcher changes can not
+    # be observed and nothing is kept.
+    if glyph.dispatcher is None:
+        return makeGlyphFingerprint(glyph, lib=lib)
+    return glyph.getRepresentation("fontParts.fingerprint", lib=lib)
+
+
 class RGlyph(RBaseObject, BaseGlyph):
 
     wrapClass = defcon.Glyph
@@ -19,6 +130,25 @@ class RGlyph(RBaseObject, BaseGlyph):
     imageClass = RImage
     libClass = RLib
 
+    # ----
+    # Copy
+    # ----
+
+    def _copyData(self, source):
+        if not isinstance(source, RGlyph):
+            super(RGlyph, self)._copyData(source)
+            return
+        _copyGlyphData(self.naked(), source.naked())
+        # images may need to be moved to another
+        # font, which the wrappers take care of.
+        sourceImage = source.image
+        reference = sourceImage.reference
+        if reference is not None:
+            selfImage = self.image
+            selfImage.reference = reference
+            selfImage.transformation = sourceImage.transformation
+            selfImage.color = sourceImage.color
+
     # --------------
     # Identification
     # --------------
@@ -51,6 +181,14 @@ class RGlyph(RBaseObject, BaseGlyph):
     def _set_width(self, value):
         self.naked().width = value
 
+    # angled
+
+    def _getItalicAngle(self):
+        font = self.naked().font
+        if font is None:
+            return 0
+        return font.info.italicAngle or 0
+
     # vertical
 
     def _get_height(self):
@@ -64,9 +202,11 @@ class RGlyph(RBaseObject, BaseGlyph):
     # ----
 
     def getPen(self):
+        self._willChange()
         return self.naked().getPen()
 
     def getPointPen(self):
+        self._willChange()
         return self.naked().getPointPen()
 
     # -----------------------------------------
@@ -154,6 +294,89 @@ class RGlyph(RBaseObject, BaseGlyph):
         guideline = glyph.guidelines[index]
         glyph.removeGuideline(guideline)
 
+    # -----------
+    # Fingerprint
+    # -----------
+
+    def _getFingerprint(self, lib):
+        return _getGlyphFingerprint(self.naked(), lib=lib)
+
+    # --------------------
+    # Interpolation & Math
+    # --------------------
+
+    def _getMathGlyph(self):
+        glyph = self.naked()
+        if glyph.dispatcher is None:
+            return super(RGlyph, self)._getMathGlyph()
+        # the math glyph is kept until the glyph posts
+        # a change notification. changes inside lib
+        # values are not seen by the glyph.
+        return glyph.getRepresentation("fontParts.mathGlyph")
+
+    def _getMathValues(self):
+        glyph = self.naked()
+        xValues = [glyph.width]
+        yValues = [glyph.height]
+        contourLengths = []
+        for contour in glyph:
+            contourLengths.append(len(contour))
+            for point in contour:
+                xValues.append(point.x)
+                yValues.append(point.y)
+        components = glyph.components
+        for component in components:
+            xScale, xyScale, yxScale, yScale, xOffset, yOffset = component.transformation
+            xValues.extend((xScale, xyScale, xOffset))
+            yValues.extend((yScale, yxScale, yOffset))
+        anchors = glyph.anchors
+        for anchor in anchors:
+            xValues.append(anchor.x)
+            yValues.append(anchor.y)
+        guidelines = glyph.guidelines
+        for guideline in guidelines:
+            xValues.append(guideline.x)
+            yValues.append(guideline.y)
+        structure = (tuple(contourLengths), len(components), len(anchors), len(guidelines))
+        return structure, xValues, yValues
+
+    def _setMathValues(self, xValues, yValues, round=False):
+        glyph = self.naked()
+        if round:
+            roundValue = normalizers.normalizeRounding
+        else:
+            roundValue = _keepValue
+        xValues = iter(xValues)
+        yValues = iter(yValues)
+        # the glyph posts its notifications once,
+        # after all values have been set.
+        if glyph.dispatcher is not None:
+            glyph.holdNotifications()
+        try:
+            glyph.width = roundValue(next(xValues))
+            glyph.height = next(yValues)
+            # defcon points do not post notifications,
+            # so each contour posts one for its points.
+            for contour in glyph:
+                for point in contour:
+                    point.x = roundValue(next(xValues))
+                    point.y = roundValue(next(yValues))
+                contour.postNotification("Contour.PointsChanged")
+                contour.dirty = True
+            for component in glyph.components:
+                xScale, xyScale, xOffset = next(xValues), next(xValues), roundValue(next(xValues))
+                yScale, yxScale, yOffset = next(yValues), next(yValues), roundValue(next(yValues))
+                component.transformation = (xScale, xyScale, yxScale, yScale, xOffset, yOffset)
+            for anchor in glyph.anchors:
+                anchor.x = roundValue(next(xValues))
+                anchor.y = roundValue(next(yValues))
+            for guideline in glyph.guidelines:
+                guideline.x = roundValue(next(xValues))
+                guideline.y = roundValue(next(yValues))
+        finally:
+            if glyph.dispatcher is not None:
+                glyph.releaseHeldNotifications()
+
     # -----------------
     # Layer Interaction
     # -----------------
@@ -203,8 +426,7 @@ class RGlyph(RBaseObject, BaseGlyph):
         return self.imageClass(image)
 
     def _addImage(self, data, transformation=None, color=None):
-        image = self.naked().image
-        image = self.imageClass(image)
+        image = self.image
         image.data = data
         image.transformation = transformation
         image.color = color
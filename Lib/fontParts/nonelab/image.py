@@ -1,12 +1,11 @@
 import defcon
-from fontParts.base import BaseImage, FontPartsError
+from fontParts.base import BaseImage, ImageReference, FontPartsError
 from fontParts.nonelab.base import RBaseObject
 
 
 class RImage(RBaseObject, BaseImage):
 
     wrapClass = defcon.Image
-    _orphanData = None
     _orphanColor = None
 
     # ----------
@@ -24,7 +23,7 @@ class RImage(RBaseObject, BaseImage):
     # Color
 
     def _get_color(self):
-        if self.font is None:
+        if self.naked().font is None:
             return self._orphanColor
         value = self.naked().color
         if value is not None:
@@ -32,7 +31,7 @@ class RImage(RBaseObject, BaseImage):
         return value
 
     def _set_color(self, value):
-        if self.font is None:
+        if self.naked().font is None:
             self._orphanColor = value
         else:
             self.naked().color = value
@@ -40,14 +39,10 @@ class RImage(RBaseObject, BaseImage):
     # Data
 
     def _get_data(self):
-        if self.font is None:
-            return self._orphanData
-        image = self.naked()
-        images = self.font.naked().images
-        fileName = image.fileName
-        if fileName is None:
+        reference = self.reference
+        if reference is None:
             return None
-        return images[fileName]
+        return reference.data
 
     def _set_data(self, value):
         from ufoLib.validators import pngValidator
@@ -55,13 +50,36 @@ class RImage(RBaseObject, BaseImage):
             raise FontPartsError("The image data provided is not valid.")
         if not pngValidator(data=value):
             raise FontPartsError("The image must be in PNG format.")
-        if self.font is None:
-            self._orphanData = value
-        else:
-            image = self.naked()
-            images = image.font.images
-            fileName = images.findDuplicateImage(value)
-            if fileName is None:
-                fileName = images.makeFileName("image")
-                images[fileName] = value
-            image.fileName = fileName
+        self._set_reference(ImageReference(data=value))
+
+    # Reference
+
+    def _get_reference(self):
+        if self.naked().font is None:
+            # the wrapper is recreated for every access,
+            # so orphan data is kept on the wrapped image.
+            return getattr(self.naked(), "_fontPartsReference", None)
+        fileName = self.naked().fileName
+        if fileName is None:
+            return None
+        # the data is read into memory, a reference to
+        # the file in the UFO would change or break
+        # when the file is written or removed.
+        images = self.naked().font.images
+        return ImageReference(data=images[fileName])
+
+    def _set_reference(self, value):
+        if self.naked().font is None:
+            self.naked()._fontPartsReference = value
+            return
+        image = self.naked()
+        if value is None:
+            image.fileName = None
+            return
+        images = image.font.images
+        data = value.data
+        fileName = images.findDuplicateImage(data)
+        if fileName is None:
+            fileName = images.makeFileName("image")
+            images[fileName] = data
+        image.fileName = fileName
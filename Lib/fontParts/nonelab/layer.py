@@ -1,8 +1,154 @@
+import weakref
 import defcon
 from fontParts.base import BaseLayer, FontPartsError
+from fontParts.base.layer import _metricsKeys, _appendMetrics, _getMetricsValues, _solveMetrics
+from fontParts.base.decomposition import DecomposedOutlineCache
+from fontParts.base.componentGraph import ComponentGraph
+from fontParts.base.characterMap import CharacterMap
+from fontParts.base.unicodeNames import UnicodeNameTable, defaultUnicodeNameTable
 from fontParts.nonelab.base import RBaseObject
 from fontParts.nonelab.lib import RLib
-from fontParts.nonelab.glyph import RGlyph
+from fontParts.nonelab.glyph import RGlyph, _getGlyphFingerprint
+
+
+class _ObservingDecomposedOutlineCache(DecomposedOutlineCache):
+
+    """
+    A decomposed outline cache that is kept as a
+    representation of a defcon layer and invalidates
+    itself through the notifications of the layer.
+    """
+
+    def __init__(self, layer):
+        super(_ObservingDecomposedOutlineCache, self).__init__(RLayer(wrap=layer))
+        self._layer = weakref.ref(layer)
+        # the outline notifications are not held by holdChanges
+        layer.dispatcher.addObserver(self, "_glyphChanged", "Glyph.ContoursChanged")
+        layer.dispatcher.addObserver(self, "_glyphChanged", "Glyph.ComponentsChanged")
+        layer.addObserver(self, "_layerGlyphsChanged", "Layer.GlyphAdded")
+        layer.addObserver(self, "_layerGlyphsChanged", "Layer.GlyphDeleted")
+        layer.addObserver(self, "_layerGlyphNameChanged", "Layer.GlyphNameChanged")
+
+    def _glyphChanged(self, notification):
+        glyph = notification.object
+        if glyph.layer is self._layer():
+            self.invalidate(glyph.name)
+
+    def _layerGlyphsChanged(self, notification):
+        self.invalidate(notification.data["name"])
+
+    def _layerGlyphNameChanged(self, notification):
+        self.invalidate(notification.data["oldValue"])
+        self.invalidate(notification.data["newValue"])
+
+
+def _decomposedOutlineCacheFactory(layer):
+    return _ObservingDecomposedOutlineCache(layer)
+
+defcon.registerRepresentationFactory(
+    defcon.Layer,
+    "fontParts.decomposedOutlineCache",
+    _decomposedOutlineCacheFactory,
+    # the representation updates itself
+    destructiveNotifications=()
+)
+
+
+class _ObservingComponentGraph(ComponentGraph):
+
+    """
+    A component graph that is kept as a representation
+    of a defcon layer and updates itself through the
+    notifications of the layer.
+    """
+
+    def __init__(self, layer):
+        super(_ObservingComponentGraph, self).__init__()
+        self._layer = weakref.ref(layer)
+        for glyph in layer:
+            self._updateGlyph(glyph)
+        layer.dispatcher.addObserver(self, "_glyphComponentsChanged", "Glyph.ComponentsChanged")
+        layer.addObserver(self, "_layerGlyphAdded", "Layer.GlyphAdded")
+        layer.addObserver(self, "_layerGlyphDeleted", "Layer.GlyphDeleted")
+        layer.addObserver(self, "_layerGlyphNameChanged", "Layer.GlyphNameChanged")
+
+    def _updateGlyph(self, glyph):
+        self.update(glyph.name, [component.baseGlyph for component in glyph.components])
+
+    def _glyphComponentsChanged(self, notification):
+        glyph = notification.object
+        if glyph.layer is self._layer():
+            self._updateGlyph(glyph)
+
+    def _layerGlyphAdded(self, notification):
+        self._updateGlyph(self._layer()[notification.data["name"]])
+
+    def _layerGlyphDeleted(self, notification):
+        self.remove(notification.data["name"])
+
+    def _layerGlyphNameChanged(self, notification):
+        self.remove(notification.data["oldValue"])
+        self._updateGlyph(self._layer()[notification.data["newValue"]])
+
+
+def _componentGraphFactory(layer):
+    return _ObservingComponentGraph(layer)
+
+defcon.registerRepresentationFactory(
+    defcon.Layer,
+    "fontParts.componentGraph",
+    _componentGraphFactory,
+    # the representation updates itself
+    destructiveNotifications=()
+)
+
+
+class _ObservingCharacterMap(CharacterMap):
+
+    """
+    A character map that is kept as a representation
+    of a defcon layer and updates itself through the
+    notifications of the layer.
+    """
+
+    def __init__(self, layer):
+        super(_ObservingCharacterMap, self).__init__()
+        self._layer = weakref.ref(layer)
+        for glyph in layer:
+            self.update(glyph.name, glyph.unicodes)
+        layer.dispatcher.addObserver(self, "_glyphUnicodesChanged", "Glyph.UnicodesChanged")
+        layer.addObserver(self, "_layerGlyphAdded", "Layer.GlyphAdded")
+        layer.addObserver(self, "_layerGlyphDeleted", "Layer.GlyphDeleted")
+        layer.addObserver(self, "_layerGlyphNameChanged", "Layer.GlyphNameChanged")
+
+    def _glyphUnicodesChanged(self, notification):
+        glyph = notification.object
+        if glyph.layer is self._layer():
+            self.update(glyph.name, glyph.unicodes)
+
+    def _layerGlyphAdded(self, notification):
+        glyph = self._layer()[notification.data["name"]]
+        self.update(glyph.name, glyph.unicodes)
+
+    def _layerGlyphDeleted(self, notification):
+        self.remove(notification.data["name"])
+
+    def _layerGlyphNameChanged(self, notification):
+        self.remove(notification.data["oldValue"])
+        glyph = self._layer()[notification.data["newValue"]]
+        self.update(glyph.name, glyph.unicodes)
+
+
+def _characterMapFactory(layer):
+    return _ObservingCharacterMap(layer)
+
+defcon.registerRepresentationFactory(
+    defcon.Layer,
+    "fontParts.characterMap",
+    _characterMapFactory,
+    # the representation updates itself
+    destructiveNotifications=()
+)
 
 
 class RLayer(RBaseObject, BaseLayer):
@@ -64,12 +210,143 @@ class RLayer(RBaseObject, BaseLayer):
         layer = self.naked()
         del layer[name]
 
+    # -----------------
+    # Global Operations
+    # -----------------
+
+    def _autoUnicodes(self, overrides):
+        if overrides is None:
+            table = defaultUnicodeNameTable
+        else:
+            table = UnicodeNameTable(overrides)
+        layer = self.naked()
+        # the layer posts its change notifications
+        # once, after all glyphs have been set.
+        held = ("Layer.GlyphChanged", "Layer.Changed")
+        if layer.dispatcher is not None:
+            for notification in held:
+                layer.holdNotifications(notification)
+        try:
+            # work on the defcon glyphs to skip the wrappers
+            for glyph in layer:
+                unicodes = table.getUnicodes(glyph.name)
+                if unicodes is not None and unicodes != glyph.unicodes:
+                    glyph.unicodes = unicodes
+        finally:
+            if layer.dispatcher is not None:
+                for notification in held:
+                    layer.releaseHeldNotifications(notification)
+
     # -------
-    # mapping
+    # Metrics
     # -------
 
-    def _getReverseComponentMapping(self):
-        return self.naked().componentReferences
+    def _getMetrics(self, glyphNames):
+        layer = self.naked()
+        cache = self._getDecomposedOutlineCache()
+        italicAngle = self._getItalicAngle()
+        metrics = dict((key, []) for key in _metricsKeys)
+        metrics["glyphNames"] = list(glyphNames)
+        # work on the defcon glyphs to skip the wrappers
+        for glyphName in glyphNames:
+            glyph = layer[glyphName]
+            outline = cache.getOutline(glyphName)
+            angledBounds = outline.getSkewedBounds(italicAngle)
+            _appendMetrics(metrics, glyph.width, glyph.height, outline.bounds, angledBounds)
+        return metrics
+
+    def _getItalicAngle(self):
+        font = self.naked().font
+        if font is None:
+            return 0
+        return font.info.italicAngle or 0
 
-    def _getCharacterMapping(self):
-        return self.naked().unicodeData
+    def _setMetrics(self, glyphNames, metrics):
+        layer = self.naked()
+        cache = self._getDecomposedOutlineCache()
+        italicAngle = self._getItalicAngle()
+        held = ("Layer.GlyphChanged", "Layer.Changed")
+        if layer.dispatcher is not None:
+            for notification in held:
+                layer.holdNotifications(notification)
+        try:
+            for index, glyphName in enumerate(glyphNames):
+                values = _getMetricsValues(metrics, index)
+                if not values:
+                    continue
+                glyph = layer[glyphName]
+                outline = cache.getOutline(glyphName)
+                angledBounds = outline.getSkewedBounds(italicAngle)
+                width, height, (dx, dy) = _solveMetrics(glyph.width, glyph.height, outline.bounds, angledBounds, values)
+                # each glyph posts its notifications once,
+                # before the glyphs using it are read.
+                if glyph.dispatcher is not None:
+                    glyph.holdNotifications()
+                try:
+                    if dx or dy:
+                        glyph.move((dx, dy))
+                        for guideline in glyph.guidelines:
+                            guideline.x += dx
+                            guideline.y += dy
+                    glyph.width = width
+                    glyph.height = height
+                finally:
+                    if glyph.dispatcher is not None:
+                        glyph.releaseHeldNotifications()
+                # without a dispatcher the cache
+                # does not observe the glyph.
+                cache.invalidate(glyphName)
+        finally:
+            if layer.dispatcher is not None:
+                for notification in held:
+                    layer.releaseHeldNotifications(notification)
+
+    # ------------
+    # Fingerprints
+    # ------------
+
+    def _getFingerprints(self, glyphNames, lib):
+        layer = self.naked()
+        if glyphNames is None:
+            glyphNames = layer.keys()
+        # work on the defcon glyphs to skip the wrappers
+        return dict(
+            (glyphName, _getGlyphFingerprint(layer[glyphName], lib=lib))
+            for glyphName in glyphNames
+        )
+
+    # -------------
+    # Character Map
+    # -------------
+
+    def _getCharacterMap(self):
+        layer = self.naked()
+        # without a dispatcher changes can not
+        # be observed and nothing is kept.
+        if layer.dispatcher is None:
+            return super(RLayer, self)._getCharacterMap()
+        return layer.getRepresentation("fontParts.characterMap")
+
+    # ---------------
+    # Component Graph
+    # ---------------
+
+    def _getComponentGraph(self):
+        layer = self.naked()
+        # without a dispatcher changes can not
+        # be observed and nothing is kept.
+        if layer.dispatcher is None:
+            return super(RLayer, self)._getComponentGraph()
+        return layer.getRepresentation("fontParts.componentGraph")
+
+    # -------------------
+    # Decomposed Outlines
+    # -------------------
+
+    def _getDecomposedOutlineCache(self):
+        layer = self.naked()
+        # without a dispatcher changes can not
+        # be observed and nothing is kept.
+        if layer.dispatcher is None:
+            return super(RLayer, self)._getDecomposedOutlineCache()
+        return layer.getRepresentation("fontParts.decomposedOutlineCache")
@@ -1,6 +1,6 @@
 import defcon
 from fontParts.base import BasePoint, FontPartsError
-from fontParts.nonelab.base import RBaseObject
+from fontParts.nonelab.base import RBaseObject, _getGlyphLocation
 
 
 class RPoint(RBaseObject, BasePoint):
@@ -12,6 +12,29 @@ class RPoint(RBaseObject, BasePoint):
             wrap = self.wrapClass((0, 0))
         super(RPoint, self)._init(wrap=wrap)
 
+    _nakedContour = None
+
+    def _set_contour(self, contour):
+        super(RPoint, self)._set_contour(contour)
+        # the contour wrapper may be gone before
+        # the point, so the defcon contour is kept.
+        if contour is not None:
+            self._nakedContour = contour.naked()
+
+    def _postChangeNotification(self):
+        # defcon points do not post notifications,
+        # so the contour is told about the change.
+        contour = self._nakedContour
+        if contour is not None:
+            contour.dirty = True
+
+    def _getGlyphLocation(self):
+        # defcon points do not know their contour
+        contour = self._nakedContour
+        if contour is None:
+            return None
+        return _getGlyphLocation(contour.glyph)
+
     # ----------
     # Attributes
     # ----------
@@ -28,6 +51,7 @@ class RPoint(RBaseObject, BasePoint):
         if value == "offcurve":
             value = None
         self.naked().segmentType = value
+        self._postChangeNotification()
 
     # smooth
 
@@ -36,6 +60,7 @@ class RPoint(RBaseObject, BasePoint):
 
     def _set_smooth(self, value):
         self.naked().smooth = value
+        self._postChangeNotification()
 
     # x
 
@@ -44,6 +69,7 @@ class RPoint(RBaseObject, BasePoint):
 
     def _set_x(self, value):
         self.naked().x = value
+        self._postChangeNotification()
 
     # y
 
@@ -52,6 +78,7 @@ class RPoint(RBaseObject, BasePoint):
 
     def _set_y(self, value):
         self.naked().y = value
+        self._postChangeNotification()
 
     # --------------
     # Identification
@@ -64,6 +91,7 @@ class RPoint(RBaseObject, BasePoint):
 
     def _set_name(self, value):
         self.naked().name = value
+        self._postChangeNotification()
 
     # identifier
 
@@ -1,4 +1,13 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import defcon
+from fontTools.pens.boundsPen import BoundsPen
+from fontTools.ttLib import TTFont
 from fontParts.test import testEnvironment
+from fontParts.nonelab.base import _HeldNotifications
 from fontParts.nonelab.font import RFont
 from fontParts.nonelab.info import RInfo
 from fontParts.nonelab.groups import RGroups
@@ -40,5 +49,232 @@ def noneLabObjectGenerator(cls):
     obj = classMapping[cls]()
     return obj, []
 
+
+
+class TestDefcon(unittest.TestCase):
+
+    """
+    Tests of the parts of the environment that depend
+    on how defcon handles notifications and
+    representations. These fail if a defcon version
+    works differently.
+    """
+
+    def getLayer_composite(self):
+        font = RFont()
+        layer = font.getLayer(font.defaultLayer)
+        glyph = layer.newGlyph("A")
+        pen = glyph.getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 100))
+        pen.lineTo((100, 100))
+        pen.closePath()
+        layer.newGlyph("B").appendComponent("A")
+        layer.newGlyph("C")
+        return font, layer
+
+    def test_decomposedOutlineCache_changed(self):
+        font, layer = self.getLayer_composite()
+        cache = layer._getDecomposedOutlineCache()
+        outline = cache.getOutline("B")
+        # the cache is not destroyed by layer changes
+        layer["C"].width = 300
+        layer.newGlyph("D")
+        self.assertIs(
+            layer._getDecomposedOutlineCache(),
+            cache
+        )
+        self.assertIs(
+            cache.getOutline("B"),
+            outline
+        )
+        # base glyph changes replace the outline
+        layer["A"].moveBy((50, 0))
+        self.assertEqual(
+            cache.getOutline("B").bounds,
+            (50, 0, 150, 100)
+        )
+
+    # holdChanges
+
+    def test_holdChanges_coalesced(self):
+        font = RFont()
+        glyph = font.newGlyph("A")
+        naked = glyph.naked()
+        posted = []
+        observer = _NotificationObserver(posted)
+        naked.addObserver(observer, "observe", "Glyph.Changed")
+        dispatcher = naked.dispatcher
+        with font.holdChanges():
+            glyph.width = 100
+            glyph.width = 200
+            glyph.unicodes = [0x41]
+            # the held notifications are kept in the list
+            # that holdChanges swaps into the defcon hold
+            held = dispatcher._holds["Glyph.Changed", None, None]["notifications"]
+            self.assertIsInstance(held, _HeldNotifications)
+            self.assertEqual(
+                [(name, observableRef()) for name, observableRef, data in held],
+                [("Glyph.Changed", naked)]
+            )
+            self.assertEqual(posted, [])
+        self.assertEqual(
+            posted,
+            [("Glyph.Changed", naked)]
+        )
+        naked.removeObserver(observer, "Glyph.Changed")
+
+    def test_holdChanges_representations(self):
+        font = RFont()
+        glyph = font.newGlyph("A")
+        naked = glyph.naked()
+        glyph.width = 100
+        self.assertEqual(
+            naked.getRepresentation("fontParts.test.width"),
+            100
+        )
+        with font.holdChanges():
+            glyph.width = 200
+            # the representation is destroyed while
+            # the notification is held
+            self.assertEqual(
+                naked.getRepresentation("fontParts.test.width"),
+                200
+            )
+            glyph.width = 300
+            self.assertEqual(
+                naked.getRepresentation("fontParts.test.width"),
+                300
+            )
+
+
+class _NotificationObserver(object):
+
+    def __init__(self, posted):
+        self._posted = posted
+
+    def observe(self, notification):
+        self._posted.append((notification.name, notification.object))
+
+
+def _widthFactory(glyph):
+    return glyph.width
+
+defcon.registerRepresentationFactory(
+    defcon.Glyph,
+    "fontParts.test.width",
+    _widthFactory,
+    destructiveNotifications=("Glyph.Changed",)
+)
+
+
+class TestFontCompiler(unittest.TestCase):
+
+    def setUp(self):
+        self.tempDir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempDir)
+
+    def getFont_compile(self):
+        font = RFont()
+        font.info.familyName = "Compiled"
+        for glyphName, value in (("A", 0x41), ("B", 0x42)):
+            glyph = font.newGlyph(glyphName)
+            glyph.unicodes = [value]
+            glyph.width = 500
+            pen = glyph.getPen()
+            pen.moveTo((0, 0))
+            pen.lineTo((0, 100))
+            pen.lineTo((100, 100))
+            pen.closePath()
+        glyph = font.newGlyph("C")
+        glyph.width = 600
+        glyph.appendComponent("A", offset=(10, 0))
+        font.glyphOrder = ["A", "B", "C"]
+        return font
+
+    def generate(self, font, format):
+        path = os.path.join(self.tempDir, "Compiled.otf")
+        font.generate(format, path)
+        return TTFont(path)
+
+    def getBounds(self, compiled, glyphName):
+        glyphSet = compiled.getGlyphSet()
+        pen = BoundsPen(glyphSet)
+        glyphSet[glyphName].draw(pen)
+        return pen.bounds
+
+    def test_compile(self):
+        for format in ("otfttf", "otfcff"):
+            font = self.getFont_compile()
+            compiled = self.generate(font, format)
+            self.assertEqual(
+                compiled.getGlyphOrder(),
+                [".notdef", "A", "B", "C"]
+            )
+            self.assertEqual(
+                compiled["cmap"].getBestCmap(),
+                {0x41: "A", 0x42: "B"}
+            )
+            self.assertEqual(
+                compiled["hmtx"]["C"],
+                (600, 10)
+            )
+            self.assertEqual(
+                self.getBounds(compiled, "C"),
+                (10, 0, 110, 100)
+            )
+            compiled.close()
+
+    def test_compile_unencoded(self):
+        for format in ("otfttf", "otfcff"):
+            font = self.getFont_compile()
+            for glyph in font:
+                glyph.unicodes = []
+            compiled = self.generate(font, format)
+            self.assertEqual(
+                compiled["cmap"].getBestCmap(),
+                {}
+            )
+            self.assertEqual(
+                compiled.getGlyphOrder(),
+                [".notdef", "A", "B", "C"]
+            )
+            compiled.close()
+
+    def test_compile_changed(self):
+        for format in ("otfttf", "otfcff"):
+            font = self.getFont_compile()
+            self.generate(font, format).close()
+            # glyph edit
+            font["B"].moveBy((50, 0))
+            compiled = self.generate(font, format)
+            self.assertEqual(
+                self.getBounds(compiled, "B"),
+                (50, 0, 150, 100)
+            )
+            compiled.close()
+            # base glyph edit
+            font["A"].moveBy((0, 20))
+            compiled = self.generate(font, format)
+            self.assertEqual(
+                self.getBounds(compiled, "A"),
+                (0, 20, 100, 120)
+            )
+            self.assertEqual(
+                self.getBounds(compiled, "C"),
+                (10, 20, 110, 120)
+            )
+            compiled.close()
+
+
 if __name__ == "__main__":
-    testEnvironment(noneLabObjectGenerator)
\ No newline at end of file
+    succes = testEnvironment(noneLabObjectGenerator, inApp=True)
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite([
+        loader.loadTestsFromTestCase(TestDefcon),
+        loader.loadTestsFromTestCase(TestFontCompiler)
+    ])
+    succes = unittest.TextTestRunner().run(suite).wasSuccessful() and succes
+    sys.exit(not succes)
\ No newline at end of file
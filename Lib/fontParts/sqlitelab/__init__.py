@@ -0,0 +1,6 @@
+from fontParts.base.errors import FontPartsError
+from fontParts.sqlitelab.font import RFont
+from fontParts.sqlitelab.kerning import RKerning
+from fontParts.sqlitelab.groups import RGroups
+from fontParts.sqlitelab.database import FontDatabase
+from fontParts.sqlitelab.ufo import importUFO, exportUFO
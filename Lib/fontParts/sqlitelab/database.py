@@ -0,0 +1,432 @@
+import sqlite3
+import struct
+from ufoLib import plistlib, fontInfoAttributesVersion3
+
+_schema = """
+CREATE TABLE IF NOT EXISTS font (
+    key TEXT PRIMARY KEY,
+    value BLOB
+);
+CREATE TABLE IF NOT EXISTS layers (
+    name TEXT PRIMARY KEY,
+    position INTEGER,
+    info BLOB
+);
+CREATE TABLE IF NOT EXISTS glyphs (
+    layer TEXT,
+    name TEXT,
+    width REAL,
+    height REAL,
+    glif TEXT,
+    points BLOB,
+    PRIMARY KEY (layer, name)
+);
+CREATE TABLE IF NOT EXISTS unicodes (
+    layer TEXT,
+    glyph TEXT,
+    position INTEGER,
+    value INTEGER
+);
+CREATE INDEX IF NOT EXISTS unicodesGlyph ON unicodes (layer, glyph);
+CREATE INDEX IF NOT EXISTS unicodesValue ON unicodes (value);
+CREATE TABLE IF NOT EXISTS components (
+    layer TEXT,
+    glyph TEXT,
+    position INTEGER,
+    baseGlyph TEXT,
+    transformation TEXT,
+    identifier TEXT
+);
+CREATE INDEX IF NOT EXISTS componentsGlyph ON components (layer, glyph);
+CREATE INDEX IF NOT EXISTS componentsBaseGlyph ON components (layer, baseGlyph);
+CREATE TABLE IF NOT EXISTS kerning (
+    side1 TEXT,
+    side2 TEXT,
+    value NUMERIC,
+    PRIMARY KEY (side1, side2)
+);
+CREATE TABLE IF NOT EXISTS groups (
+    name TEXT,
+    position INTEGER,
+    glyph TEXT
+);
+CREATE INDEX IF NOT EXISTS groupsName ON groups (name);
+CREATE INDEX IF NOT EXISTS groupsGlyph ON groups (glyph);
+CREATE TABLE IF NOT EXISTS images (
+    fileName TEXT PRIMARY KEY,
+    data BLOB
+);
+"""
+
+# ------
+# Points
+# ------
+
+_segmentTypeToCode = {
+    None: 0,
+    "move": 1,
+    "line": 2,
+    "curve": 3,
+    "qcurve": 4
+}
+_codeToSegmentType = dict((v, k) for k, v in _segmentTypeToCode.items())
+_countStruct = struct.Struct("<I")
+
+
+def _packString(value):
+    if value is None:
+        return _countStruct.pack(0)
+    value = value.encode("utf-8")
+    return _countStruct.pack(len(value) + 1) + value
+
+
+def _unpackString(data, offset):
+    length = _countStruct.unpack_from(data, offset)[0]
+    offset += _countStruct.size
+    if not length:
+        return None, offset
+    end = offset + length - 1
+    return data[offset:end].decode("utf-8"), end
+
+
+def packContours(contours):
+    """
+    Pack a list of contours into a blob. Each contour
+    is an ``(identifier, points)`` tuple and the points
+    are ``(x, y, segmentType, smooth, name, identifier)``
+    tuples. The blob is a little endian point count for
+    each contour followed by an ``x, y`` pair of doubles
+    and a segment type code and smooth flag byte per point.
+    If any contour or point has an identifier or a name,
+    the contour identifiers and the point names and
+    identifiers follow as length prefixed UTF-8 strings.
+    """
+    data = [_countStruct.pack(len(contours))]
+    strings = []
+    for identifier, points in contours:
+        data.append(_countStruct.pack(len(points)))
+        values = []
+        strings.append(identifier)
+        for x, y, segmentType, smooth, name, pointIdentifier in points:
+            values.extend((x, y, _segmentTypeToCode[segmentType], bool(smooth)))
+            strings.append(name)
+            strings.append(pointIdentifier)
+        data.append(struct.pack("<" + "ddBB" * len(points), *values))
+    if any(string is not None for string in strings):
+        data.extend(_packString(string) for string in strings)
+    return b"".join(data)
+
+
+def unpackContours(data):
+    """
+    Unpack a blob made with :func:`packContours`.
+    """
+    contours = []
+    if not data:
+        return contours
+    data = bytes(data)
+    contourCount = _countStruct.unpack_from(data, 0)[0]
+    offset = _countStruct.size
+    for i in range(contourCount):
+        pointCount = _countStruct.unpack_from(data, offset)[0]
+        offset += _countStruct.size
+        fmt = "<" + "ddBB" * pointCount
+        values = struct.unpack_from(fmt, data, offset)
+        offset += struct.calcsize(fmt)
+        points = []
+        for index in range(0, len(values), 4):
+            x, y, code, smooth = values[index:index + 4]
+            points.append([x, y, _codeToSegmentType[code], bool(smooth), None, None])
+        contours.append([None, points])
+    if offset < len(data):
+        for contour in contours:
+            contour[0], offset = _unpackString(data, offset)
+            for point in contour[1]:
+                point[4], offset = _unpackString(data, offset)
+                point[5], offset = _unpackString(data, offset)
+    return [(identifier, [tuple(point) for point in points]) for identifier, points in contours]
+
+
+# --------
+# Database
+# --------
+
+class FontDatabase(object):
+
+    """
+    The SQLite database behind a font. Glyph outlines
+    are stored as packed point blobs and the other glyph
+    data is stored as GLIF text. Unicodes, components,
+    kerning and groups are stored in indexed tables so
+    that they can be queried without loading glyphs.
+
+    Changes are made in a transaction that is committed
+    by :meth:`commit`. The database may be used from
+    another thread than the one that created it, as
+    :func:`fontParts.world.saveAll` does, but not from
+    two threads at the same time.
+    """
+
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript(_schema)
+        self.connection.commit()
+
+    def execute(self, sql, parameters=()):
+        return self.connection.execute(sql, parameters)
+
+    def commit(self):
+        self.connection.commit()
+
+    def rollback(self):
+        self.connection.rollback()
+
+    def close(self):
+        self.connection.close()
+
+    def copyTo(self, path):
+        """
+        Copy the database, including any uncommitted
+        changes, into a new database at **path**.
+        """
+        database = FontDatabase(path)
+        script = "\n".join(line for line in self.connection.iterdump() if not line.startswith("CREATE "))
+        database.connection.executescript(script)
+        return database
+
+    # ---------
+    # Font Data
+    # ---------
+
+    def getFontValue(self, key, default=None):
+        row = self.execute("SELECT value FROM font WHERE key=?", (key,)).fetchone()
+        if row is None:
+            return default
+        return plistlib.loads(bytes(row[0]))
+
+    def setFontValue(self, key, value):
+        value = plistlib.dumps(value)
+        self.execute("INSERT OR REPLACE INTO font (key, value) VALUES (?, ?)", (key, sqlite3.Binary(value)))
+
+    def readInfo(self, info):
+        """
+        Set the stored font info values in **info**.
+        """
+        values = self.getFontValue("info", {})
+        for attr, value in values.items():
+            setattr(info, attr, value)
+
+    def writeInfo(self, info):
+        """
+        Store the font info values in **info**.
+        """
+        values = {}
+        for attr in sorted(fontInfoAttributesVersion3):
+            value = getattr(info, attr, None)
+            if value is None:
+                continue
+            if attr == "guidelines":
+                value = [dict((k, v) for k, v in dict(guideline).items() if v is not None) for guideline in value]
+            values[attr] = value
+        self.setFontValue("info", values)
+
+    # ------
+    # Layers
+    # ------
+
+    def getLayerNames(self):
+        return [row[0] for row in self.execute("SELECT name FROM layers ORDER BY position")]
+
+    def setLayerNames(self, layerNames):
+        existing = set(self.getLayerNames())
+        for layerName in existing - set(layerNames):
+            self.deleteLayer(layerName)
+        for position, layerName in enumerate(layerNames):
+            if layerName in existing:
+                self.execute("UPDATE layers SET position=? WHERE name=?", (position, layerName))
+            else:
+                self.execute("INSERT INTO layers (name, position, info) VALUES (?, ?, NULL)", (layerName, position))
+
+    def renameLayer(self, oldName, newName):
+        for table in ("glyphs", "unicodes", "components"):
+            self.execute("UPDATE %s SET layer=? WHERE layer=?" % table, (newName, oldName))
+        self.execute("UPDATE layers SET name=? WHERE name=?", (newName, oldName))
+
+    def deleteLayer(self, layerName):
+        for table in ("glyphs", "unicodes", "components"):
+            self.execute("DELETE FROM %s WHERE layer=?" % table, (layerName,))
+        self.execute("DELETE FROM layers WHERE name=?", (layerName,))
+
+    def getLayerInfo(self, layerName):
+        row = self.execute("SELECT info FROM layers WHERE name=?", (layerName,)).fetchone()
+        if row is None or row[0] is None:
+            return {}
+        return plistlib.loads(bytes(row[0]))
+
+    def setLayerInfo(self, layerName, info):
+        info = sqlite3.Binary(plistlib.dumps(info))
+        self.execute("UPDATE layers SET info=? WHERE name=?", (info, layerName))
+
+    # ------
+    # Glyphs
+    # ------
+
+    def getGlyphNames(self, layerName):
+        return [row[0] for row in self.execute("SELECT name FROM glyphs WHERE layer=?", (layerName,))]
+
+    def hasGlyph(self, layerName, glyphName):
+        row = self.execute("SELECT 1 FROM glyphs WHERE layer=? AND name=?", (layerName, glyphName)).fetchone()
+        return row is not None
+
+    def countGlyphs(self, layerName):
+        return self.execute("SELECT COUNT(*) FROM glyphs WHERE layer=?", (layerName,)).fetchone()[0]
+
+    def getGlyph(self, layerName, glyphName):
+        """
+        Get ``(glif, contours, components)`` for a glyph.
+        ``components`` is a list of ``(baseGlyph, transformation,
+        identifier)`` tuples.
+        """
+        row = self.execute("SELECT glif, points FROM glyphs WHERE layer=? AND name=?", (layerName, glyphName)).fetchone()
+        if row is None:
+            raise KeyError(glyphName)
+        glif, points = row
+        components = [
+            (baseGlyph, tuple(float(i) for i in transformation.split(" ")), identifier)
+            for baseGlyph, transformation, identifier in self.execute(
+                "SELECT baseGlyph, transformation, identifier FROM components WHERE layer=? AND glyph=? ORDER BY position",
+                (layerName, glyphName)
+            )
+        ]
+        return glif, unpackContours(points), components
+
+    def setGlyph(self, layerName, glyphName, width, height, unicodes, glif, contours, components):
+        self.deleteGlyph(layerName, glyphName)
+        self.execute(
+            "INSERT INTO glyphs (layer, name, width, height, glif, points) VALUES (?, ?, ?, ?, ?, ?)",
+            (layerName, glyphName, width, height, glif, sqlite3.Binary(packContours(contours)))
+        )
+        self.connection.executemany(
+            "INSERT INTO unicodes (layer, glyph, position, value) VALUES (?, ?, ?, ?)",
+            [(layerName, glyphName, position, value) for position, value in enumerate(unicodes)]
+        )
+        self.connection.executemany(
+            "INSERT INTO components (layer, glyph, position, baseGlyph, transformation, identifier) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (layerName, glyphName, position, baseGlyph, " ".join(repr(float(i)) for i in transformation), identifier)
+                for position, (baseGlyph, transformation, identifier) in enumerate(components)
+            ]
+        )
+
+    def deleteGlyph(self, layerName, glyphName):
+        for table, column in (("glyphs", "name"), ("unicodes", "glyph"), ("components", "glyph")):
+            self.execute("DELETE FROM %s WHERE layer=? AND %s=?" % (table, column), (layerName, glyphName))
+
+    # queries
+
+    def getUnicodes(self, layerName, glyphNames=None):
+        found = {}
+        for glyphName, value in self.execute("SELECT glyph, value FROM unicodes WHERE layer=? ORDER BY glyph, position", (layerName,)):
+            found.setdefault(glyphName, []).append(value)
+        if glyphNames is not None:
+            found = dict((glyphName, found.get(glyphName, [])) for glyphName in glyphNames)
+        return found
+
+    def getGlyphsForUnicode(self, layerName, value):
+        return [row[0] for row in self.execute("SELECT glyph FROM unicodes WHERE layer=? AND value=?", (layerName, value))]
+
+    def getComponentReferences(self, layerName, glyphNames=None):
+        """
+        Get a dict of ``{glyph name : [base glyphs]}``.
+        """
+        found = {}
+        for glyphName, baseGlyph in self.execute("SELECT glyph, baseGlyph FROM components WHERE layer=? ORDER BY glyph, position", (layerName,)):
+            found.setdefault(glyphName, []).append(baseGlyph)
+        if glyphNames is not None:
+            glyphNames = set(glyphNames)
+            found = dict((glyphName, bases) for glyphName, bases in found.items() if glyphName in glyphNames)
+        return found
+
+    def getGlyphsUsingBaseGlyph(self, layerName, baseGlyph):
+        return sorted(set(row[0] for row in self.execute("SELECT glyph FROM components WHERE layer=? AND baseGlyph=?", (layerName, baseGlyph))))
+
+    # -------
+    # Kerning
+    # -------
+
+    def getKerningItems(self):
+        return [((side1, side2), value) for side1, side2, value in self.execute("SELECT side1, side2, value FROM kerning")]
+
+    def getKerningValue(self, pair):
+        row = self.execute("SELECT value FROM kerning WHERE side1=? AND side2=?", pair).fetchone()
+        if row is None:
+            raise KeyError(pair)
+        return row[0]
+
+    def hasKerningPair(self, pair):
+        return self.execute("SELECT 1 FROM kerning WHERE side1=? AND side2=?", pair).fetchone() is not None
+
+    def setKerningValue(self, pair, value):
+        side1, side2 = pair
+        self.execute("INSERT OR REPLACE INTO kerning (side1, side2, value) VALUES (?, ?, ?)", (side1, side2, value))
+
+    def deleteKerningPair(self, pair):
+        self.execute("DELETE FROM kerning WHERE side1=? AND side2=?", pair)
+
+    def clearKerning(self):
+        self.execute("DELETE FROM kerning")
+
+    # ------
+    # Groups
+    # ------
+
+    def getGroupItems(self):
+        found = {}
+        for name, glyphName in self.execute("SELECT name, glyph FROM groups ORDER BY name, position"):
+            glyphNames = found.setdefault(name, [])
+            # an empty group is stored as a single NULL member
+            if glyphName is not None:
+                glyphNames.append(glyphName)
+        return list(found.items())
+
+    def hasGroup(self, name):
+        return self.execute("SELECT 1 FROM groups WHERE name=?", (name,)).fetchone() is not None
+
+    def getGroup(self, name):
+        rows = self.execute("SELECT glyph FROM groups WHERE name=? ORDER BY position", (name,)).fetchall()
+        if not rows:
+            raise KeyError(name)
+        return [row[0] for row in rows if row[0] is not None]
+
+    def setGroup(self, name, glyphNames):
+        self.deleteGroup(name)
+        rows = [(name, position, glyphName) for position, glyphName in enumerate(glyphNames)]
+        if not rows:
+            rows = [(name, 0, None)]
+        self.connection.executemany("INSERT INTO groups (name, position, glyph) VALUES (?, ?, ?)", rows)
+
+    def deleteGroup(self, name):
+        self.execute("DELETE FROM groups WHERE name=?", (name,))
+
+    def findGroupsForGlyph(self, glyphName):
+        return [row[0] for row in self.execute("SELECT DISTINCT name FROM groups WHERE glyph=?", (glyphName,))]
+
+    # ------
+    # Images
+    # ------
+
+    def getImageFileNames(self):
+        return [row[0] for row in self.execute("SELECT fileName FROM images")]
+
+    def getImage(self, fileName):
+        row = self.execute("SELECT data FROM images WHERE fileName=?", (fileName,)).fetchone()
+        if row is None:
+            raise KeyError(fileName)
+        return bytes(row[0])
+
+    def setImage(self, fileName, data):
+        self.execute("INSERT OR REPLACE INTO images (fileName, data) VALUES (?, ?)", (fileName, sqlite3.Binary(data)))
+
+    def deleteImage(self, fileName):
+        self.execute("DELETE FROM images WHERE fileName=?", (fileName,))
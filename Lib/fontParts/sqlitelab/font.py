@@ -0,0 +1,171 @@
+import os
+from fontTools.misc.py23 import basestring
+from fontParts.base import FontPartsError
+from fontParts.nonelab.font import RFont as NoneLabRFont
+from fontParts.sqlitelab.database import FontDatabase
+from fontParts.sqlitelab.glyphSet import SQLiteGlyphSet
+from fontParts.sqlitelab.imageSet import SQLiteImageSet
+from fontParts.sqlitelab.kerning import RKerning
+from fontParts.sqlitelab.groups import RGroups
+
+
+class RFont(NoneLabRFont):
+
+    """
+    A font stored in a SQLite database. Glyphs are loaded
+    from the database when they are first accessed and
+    kerning and groups are read and written directly in
+    the database. Changes are written to the database
+    file when the font is saved.
+
+        >>> font = RFont("/path/to/font.sqlite")
+    """
+
+    kerningClass = RKerning
+    groupsClass = RGroups
+
+    # ----
+    # Copy
+    # ----
+
+    def _copyData(self, source, shareGlyphs=False):
+        # glyphs are not shared with fonts that
+        # are not stored in the same database.
+        super(RFont, self)._copyData(source, shareGlyphs=False)
+        if not isinstance(source, NoneLabRFont):
+            return
+        # groups and kerning are kept in the database.
+        database = self._database
+        for groupName, glyphNames in source.groups.items():
+            database.setGroup(groupName, glyphNames)
+        for pair, value in source.kerning.items():
+            database.setKerningValue(pair, value)
+
+    # ---------------
+    # File Operations
+    # ---------------
+
+    # Initialize
+
+    def _init(self, pathOrObject=None, showInterface=True, **kwargs):
+        if isinstance(pathOrObject, basestring):
+            database = FontDatabase(pathOrObject)
+        elif pathOrObject is None:
+            database = FontDatabase()
+        elif isinstance(pathOrObject, FontDatabase):
+            database = pathOrObject
+        else:
+            raise FontPartsError("A path to a database or a FontDatabase must be given.")
+        self._wrapped = self._loadFont(database)
+        self._database = database
+        self._wrappedInfo = None
+        self._wrappedGroups = None
+        self._wrappedKerning = None
+        self._wrappedFeatures = None
+        self._wrappedLib = None
+        self._compiler = None
+
+    def _loadFont(self, database):
+        font = self.wrapClass(imageSetClass=SQLiteImageSet)
+        font.disableNotifications()
+        layers = font.layers
+        layerNames = database.getLayerNames()
+        if layerNames:
+            emptyLayer = layers.defaultLayer
+            emptyLayer.name = "public.empty"
+            for layerName in layerNames:
+                layers.newLayer(layerName, glyphSet=SQLiteGlyphSet(database, layerName))
+            defaultLayerName = database.getFontValue("defaultLayer", layerNames[0])
+            layers.defaultLayer = layers[defaultLayerName]
+            del layers[emptyLayer.name]
+            layers.layerOrder = layerNames
+        database.readInfo(font.info)
+        font.features.text = database.getFontValue("features")
+        font.lib.update(database.getFontValue("lib", {}))
+        images = font.images
+        images.database = database
+        images.fileNames = database.getImageFileNames()
+        font.enableNotifications()
+        font.dirty = False
+        for layer in layers:
+            layer.dirty = False
+        font.info.dirty = False
+        font.features.dirty = False
+        font.lib.dirty = False
+        images.dirty = False
+        return font
+
+    # path
+
+    def _get_path(self, **kwargs):
+        path = self._database.path
+        if path == ":memory:":
+            return None
+        return path
+
+    # save
+
+    def _save(self, path=None, showProgress=False, formatVersion=None, **kwargs):
+        if path is not None and path != self.path:
+            # copy the database, including the uncommitted
+            # kerning and group changes, to the new path.
+            if os.path.exists(path):
+                os.remove(path)
+            database = self._database.copyTo(path)
+            self._database.rollback()
+            self._database.close()
+            self._database = database
+            self._wrappedKerning = None
+            self._wrappedGroups = None
+        database = self._database
+        font = self.naked()
+        layers = font.layers
+        # renamed layers
+        for layer in layers:
+            glyphSet = layer._glyphSet
+            if glyphSet is not None and glyphSet.layerName != layer.name:
+                database.renameLayer(glyphSet.layerName, layer.name)
+        database.setLayerNames(layers.layerOrder)
+        for layer in layers:
+            glyphSet = layer._glyphSet
+            if glyphSet is None:
+                glyphSet = SQLiteGlyphSet(database, layer.name)
+            glyphSet.database = database
+            glyphSet.layerName = layer.name
+            layer.save(glyphSet)
+            glyphSet.writeLayerInfo(layer)
+            layer.dirty = False
+        database.setFontValue("defaultLayer", layers.defaultLayer.name)
+        database.writeInfo(font.info)
+        if font.features.text is not None:
+            database.setFontValue("features", font.features.text)
+        database.setFontValue("lib", dict(font.lib))
+        font.images.writeToDatabase(database)
+        database.commit()
+        font.dirty = False
+
+    # close
+
+    def _close(self, **kwargs):
+        self._database.rollback()
+        self._database.close()
+        del self._database
+        del self._wrapped
+
+    # -----------
+    # Sub-Objects
+    # -----------
+
+    # groups
+
+    def _get_groups(self):
+        if self._wrappedGroups is None:
+            self._wrappedGroups = self.groupsClass(wrap=self._database)
+        return self._wrappedGroups
+
+    # kerning
+
+    def _get_kerning(self):
+        if self._wrappedKerning is None:
+            self._wrappedKerning = self.kerningClass(wrap=self._database)
+        return self._wrappedKerning
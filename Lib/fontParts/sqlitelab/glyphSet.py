@@ -0,0 +1,167 @@
+from ufoLib.glifLib import readGlyphFromString, writeGlyphToString, _fetchImageFileName
+from ufoLib.pointPen import AbstractPointPen
+
+
+class SQLiteGlyphSet(object):
+
+    """
+    A glyph set that reads and writes the glyphs of one
+    layer in a :class:`FontDatabase`. This implements the
+    parts of the ufoLib GlyphSet API that a defcon Layer
+    uses, so glyphs are only loaded when they are first
+    accessed and only changed glyphs are written.
+    """
+
+    def __init__(self, database, layerName):
+        self.database = database
+        self.layerName = layerName
+        self.contents = _GlyphSetContents(self)
+
+    # ----
+    # Keys
+    # ----
+
+    def keys(self):
+        return self.database.getGlyphNames(self.layerName)
+
+    def __contains__(self, glyphName):
+        return self.database.hasGlyph(self.layerName, glyphName)
+
+    def __len__(self):
+        return self.database.countGlyphs(self.layerName)
+
+    # there are no GLIF files behind the glyphs
+
+    def getGLIF(self, glyphName):
+        return None
+
+    def getGLIFModificationTime(self, glyphName):
+        return None
+
+    # ----------
+    # Layer Info
+    # ----------
+
+    def readLayerInfo(self, layer):
+        info = self.database.getLayerInfo(self.layerName)
+        if info.get("color") is not None:
+            layer.color = info["color"]
+        if info.get("lib"):
+            layer.lib.update(info["lib"])
+
+    def writeLayerInfo(self, layer):
+        info = dict(lib=dict(layer.lib))
+        if layer.color is not None:
+            info["color"] = str(layer.color)
+        self.database.setLayerInfo(self.layerName, info)
+
+    # ------
+    # Glyphs
+    # ------
+
+    def readGlyph(self, glyphName, glyphObject=None, pointPen=None):
+        glif, contours, components = self.database.getGlyph(self.layerName, glyphName)
+        readGlyphFromString(glif, glyphObject, None)
+        if pointPen is None:
+            return
+        for identifier, points in contours:
+            pointPen.beginPath(identifier=identifier)
+            for x, y, segmentType, smooth, name, pointIdentifier in points:
+                pointPen.addPoint((x, y), segmentType=segmentType, smooth=smooth, name=name, identifier=pointIdentifier)
+            pointPen.endPath()
+        for baseGlyph, transformation, identifier in components:
+            if identifier is None:
+                pointPen.addComponent(baseGlyph, transformation)
+            else:
+                pointPen.addComponent(baseGlyph, transformation, identifier=identifier)
+
+    def writeGlyph(self, glyphName, glyphObject=None, drawPointsFunc=None):
+        pen = _PackingPointPen()
+        if drawPointsFunc is not None:
+            drawPointsFunc(pen)
+        # the outline is stored separately, so the
+        # GLIF only holds the rest of the glyph data.
+        glif = writeGlyphToString(glyphName, glyphObject, None)
+        self.database.setGlyph(
+            self.layerName,
+            glyphName,
+            getattr(glyphObject, "width", 0),
+            getattr(glyphObject, "height", 0),
+            list(getattr(glyphObject, "unicodes", [])),
+            glif,
+            pen.contours,
+            pen.components
+        )
+
+    def deleteGlyph(self, glyphName):
+        self.database.deleteGlyph(self.layerName, glyphName)
+
+    def writeContents(self):
+        pass
+
+    # ------------
+    # Bulk Queries
+    # ------------
+
+    def getUnicodes(self, glyphNames=None):
+        return self.database.getUnicodes(self.layerName, glyphNames)
+
+    def getComponentReferences(self, glyphNames=None):
+        return self.database.getComponentReferences(self.layerName, glyphNames)
+
+    def getImageReferences(self, glyphNames=None):
+        references = {}
+        cursor = self.database.execute(
+            "SELECT name, glif FROM glyphs WHERE layer=? AND glif LIKE '%<image%'",
+            (self.layerName,)
+        )
+        for glyphName, glif in cursor:
+            if glyphNames is not None and glyphName not in glyphNames:
+                continue
+            fileName = _fetchImageFileName(glif)
+            if fileName is not None:
+                references[glyphName] = fileName
+        return references
+
+
+class _GlyphSetContents(object):
+
+    """
+    A stand in for the ``contents`` mapping of a
+    ufoLib GlyphSet that queries the database.
+    """
+
+    def __init__(self, glyphSet):
+        self._glyphSet = glyphSet
+
+    def __contains__(self, glyphName):
+        return glyphName in self._glyphSet
+
+    def __len__(self):
+        return len(self._glyphSet)
+
+    def keys(self):
+        return self._glyphSet.keys()
+
+    def items(self):
+        return [(glyphName, glyphName) for glyphName in self.keys()]
+
+
+class _PackingPointPen(AbstractPointPen):
+
+    def __init__(self):
+        self.contours = []
+        self.components = []
+
+    def beginPath(self, identifier=None, **kwargs):
+        self.contours.append((identifier, []))
+
+    def addPoint(self, pt, segmentType=None, smooth=False, name=None, identifier=None, **kwargs):
+        x, y = pt
+        self.contours[-1][1].append((x, y, segmentType, smooth, name, identifier))
+
+    def endPath(self):
+        pass
+
+    def addComponent(self, baseGlyphName, transformation, identifier=None, **kwargs):
+        self.components.append((baseGlyphName, tuple(transformation), identifier))
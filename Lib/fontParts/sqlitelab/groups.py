@@ -0,0 +1,26 @@
+from fontParts.base import BaseGroups
+from fontParts.nonelab.base import RBaseObject
+from fontParts.sqlitelab.database import FontDatabase
+
+
+class RGroups(RBaseObject, BaseGroups):
+
+    wrapClass = FontDatabase
+
+    def _items(self):
+        return self.naked().getGroupItems()
+
+    def _contains(self, key):
+        return self.naked().hasGroup(key)
+
+    def _setItem(self, key, value):
+        self.naked().setGroup(key, value)
+
+    def _getItem(self, key):
+        return self.naked().getGroup(key)
+
+    def _delItem(self, key):
+        self.naked().deleteGroup(key)
+
+    def _findGlyph(self, glyphName):
+        return self.naked().findGroupsForGlyph(glyphName)
@@ -0,0 +1,35 @@
+from defcon.objects.imageSet import ImageSet, _makeDigest
+
+
+class SQLiteImageSet(ImageSet):
+
+    """
+    A defcon ImageSet that loads image data from a
+    :class:`FontDatabase` when it is first requested.
+    """
+
+    database = None
+
+    def __getitem__(self, fileName):
+        d = self._data[fileName]
+        if d["data"] is None and self.database is not None:
+            data = self.database.getImage(fileName)
+            d["data"] = data
+            d["digest"] = _makeDigest(data)
+            d["onDisk"] = True
+        return super(SQLiteImageSet, self).__getitem__(fileName)
+
+    def writeToDatabase(self, database):
+        """
+        Write changed images to **database** and
+        remove deleted images from it.
+        """
+        for fileName in self._scheduledForDeletion:
+            database.deleteImage(fileName)
+        self._scheduledForDeletion.clear()
+        for fileName, d in self._data.items():
+            if d["dirty"]:
+                database.setImage(fileName, d["data"])
+                d["dirty"] = False
+        self.database = database
+        self.dirty = False
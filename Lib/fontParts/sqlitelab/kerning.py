@@ -0,0 +1,23 @@
+from fontParts.base import BaseKerning
+from fontParts.nonelab.base import RBaseObject
+from fontParts.sqlitelab.database import FontDatabase
+
+
+class RKerning(RBaseObject, BaseKerning):
+
+    wrapClass = FontDatabase
+
+    def _items(self):
+        return self.naked().getKerningItems()
+
+    def _contains(self, key):
+        return self.naked().hasKerningPair(key)
+
+    def _setItem(self, key, value):
+        self.naked().setKerningValue(key, value)
+
+    def _getItem(self, key):
+        return self.naked().getKerningValue(key)
+
+    def _delItem(self, key):
+        self.naked().deleteKerningPair(key)
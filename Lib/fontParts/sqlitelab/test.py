@@ -0,0 +1,217 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from fontParts.test import testEnvironment
+from fontParts.nonelab.test import classMapping as noneLabClassMapping
+from fontParts.nonelab.font import RFont as NoneLabRFont
+from fontParts.sqlitelab.font import RFont
+from fontParts.sqlitelab.ufo import importUFO, exportUFO
+from fontParts.sqlitelab.groups import RGroups
+from fontParts.sqlitelab.kerning import RKerning
+
+classMapping = dict(noneLabClassMapping)
+classMapping.update(
+    font=RFont,
+    groups=RGroups,
+    kerning=RKerning
+)
+
+def sqliteLabObjectGenerator(cls):
+    unrequested = []
+    obj = classMapping[cls]()
+    return obj, []
+
+
+class TestUFO(unittest.TestCase):
+
+    def setUp(self):
+        self.tempDir = tempfile.mkdtemp()
+        self.ufoPath = os.path.join(self.tempDir, "Source.ufo")
+        self.databasePath = os.path.join(self.tempDir, "Source.sqlite")
+        font = NoneLabRFont()
+        font.info.familyName = "Source"
+        font.info.unitsPerEm = 1000
+        for name in "AB":
+            glyph = font.newGlyph(name)
+            glyph.width = 500
+            pen = glyph.getPen()
+            pen.moveTo((0, 0))
+            pen.lineTo((0, 100))
+            pen.lineTo((100, 100))
+            pen.closePath()
+        font["A"].unicodes = [0x41]
+        font.groups["public.kern1.A"] = ["A"]
+        font.kerning["public.kern1.A", "B"] = -20
+        font.save(self.ufoPath)
+        font.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempDir)
+
+    def getGlyphData(self, glyph):
+        return (
+            glyph.width,
+            glyph.unicodes,
+            [[(point.x, point.y, point.type) for point in contour.points] for contour in glyph.contours]
+        )
+
+    def test_importUFO(self):
+        font = importUFO(self.ufoPath, self.databasePath)
+        self.assertEqual(
+            sorted(font.keys()),
+            ["A", "B"]
+        )
+        self.assertEqual(
+            self.getGlyphData(font["A"]),
+            (500, (0x41,), [[(0, 0, "line"), (0, 100, "line"), (100, 100, "line")]])
+        )
+        self.assertEqual(
+            (font.info.familyName, font.info.unitsPerEm),
+            ("Source", 1000)
+        )
+        self.assertEqual(
+            dict(font.groups),
+            {"public.kern1.A": ["A"]}
+        )
+        self.assertEqual(
+            dict(font.kerning),
+            {("public.kern1.A", "B"): -20}
+        )
+        font.close()
+
+    def test_save(self):
+        font = importUFO(self.ufoPath, self.databasePath)
+        font["A"].width = 600
+        font["A"].moveBy((10, 0))
+        font.newGlyph("C").width = 300
+        font.removeGlyph("B")
+        font.info.familyName = "Changed"
+        font.groups["public.kern2.C"] = ["C"]
+        del font.groups["public.kern1.A"]
+        font.kerning["A", "public.kern2.C"] = 15
+        del font.kerning["public.kern1.A", "B"]
+        font.save()
+        font.close()
+        font = RFont(self.databasePath)
+        self.assertEqual(
+            sorted(font.keys()),
+            ["A", "C"]
+        )
+        self.assertEqual(
+            self.getGlyphData(font["A"]),
+            (600, (0x41,), [[(10, 0, "line"), (10, 100, "line"), (110, 100, "line")]])
+        )
+        self.assertEqual(
+            font["C"].width,
+            300
+        )
+        self.assertEqual(
+            font.info.familyName,
+            "Changed"
+        )
+        self.assertEqual(
+            dict(font.groups),
+            {"public.kern2.C": ["C"]}
+        )
+        self.assertEqual(
+            dict(font.kerning),
+            {("A", "public.kern2.C"): 15}
+        )
+        font.close()
+
+    def test_exportUFO(self):
+        font = importUFO(self.ufoPath, self.databasePath)
+        font["B"].width = 700
+        font.info.familyName = "Exported"
+        font.kerning["A", "A"] = 10
+        path = os.path.join(self.tempDir, "Exported.ufo")
+        exportUFO(font, path)
+        font.close()
+        exported = NoneLabRFont(path)
+        self.assertEqual(
+            sorted(exported.keys()),
+            ["A", "B"]
+        )
+        self.assertEqual(
+            self.getGlyphData(exported["A"]),
+            (500, (0x41,), [[(0, 0, "line"), (0, 100, "line"), (100, 100, "line")]])
+        )
+        self.assertEqual(
+            exported["B"].width,
+            700
+        )
+        self.assertEqual(
+            exported.info.familyName,
+            "Exported"
+        )
+        self.assertEqual(
+            dict(exported.groups),
+            {"public.kern1.A": ["A"]}
+        )
+        self.assertEqual(
+            dict(exported.kerning),
+            {("public.kern1.A", "B"): -20, ("A", "A"): 10}
+        )
+        exported.close()
+
+    def test_copy(self):
+        font = importUFO(self.ufoPath, self.databasePath)
+        copied = NoneLabRFont()
+        copied.copyData(font)
+        for copied in (font.copy(), copied):
+            self.assertEqual(
+                sorted(copied.keys()),
+                ["A", "B"]
+            )
+            self.assertEqual(
+                self.getGlyphData(copied["A"]),
+                self.getGlyphData(font["A"])
+            )
+            self.assertEqual(
+                copied.info.familyName,
+                "Source"
+            )
+            self.assertEqual(
+                dict(copied.groups),
+                {"public.kern1.A": ["A"]}
+            )
+            self.assertEqual(
+                dict(copied.kerning),
+                {("public.kern1.A", "B"): -20}
+            )
+        font.close()
+
+    def test_pointAttributes(self):
+        font = importUFO(self.ufoPath, self.databasePath)
+        pen = font["B"].getPointPen()
+        pen.beginPath(identifier="contour1")
+        pen.addPoint((0, 0), "line", name="corner", identifier="point1")
+        pen.addPoint((0, 200), "line")
+        pen.addPoint((200, 200), "line", identifier="point2")
+        pen.endPath()
+        font.save()
+        path = os.path.join(self.tempDir, "Exported.ufo")
+        exportUFO(font, path)
+        font.close()
+        font = RFont(self.databasePath)
+        exported = NoneLabRFont(path)
+        for glyph in (font["B"], exported["B"]):
+            self.assertEqual(
+                [contour.identifier for contour in glyph.contours],
+                [None, "contour1"]
+            )
+            self.assertEqual(
+                [(point.name, point.identifier) for point in glyph.contours[1].points],
+                [("corner", "point1"), (None, None), (None, "point2")]
+            )
+        font.close()
+        exported.close()
+
+
+if __name__ == "__main__":
+    succes = testEnvironment(sqliteLabObjectGenerator, inApp=True)
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestUFO)
+    succes = unittest.TextTestRunner().run(suite).wasSuccessful() and succes
+    sys.exit(not succes)
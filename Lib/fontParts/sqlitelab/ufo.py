@@ -0,0 +1,89 @@
+import os
+import shutil
+import defcon
+from ufoLib import UFOReader, UFOWriter
+from fontParts.sqlitelab.database import FontDatabase
+from fontParts.sqlitelab.glyphSet import SQLiteGlyphSet
+
+
+def importUFO(ufoPath, databasePath):
+    """
+    Import the UFO at **ufoPath** into a new database at
+    **databasePath** and return the font. Glyphs are
+    copied one at a time so the UFO is never fully loaded.
+
+        >>> font = importUFO("/path/to/font.ufo", "/path/to/font.sqlite")
+    """
+    from fontParts.sqlitelab.font import RFont
+    if os.path.exists(databasePath):
+        os.remove(databasePath)
+    reader = UFOReader(ufoPath)
+    database = FontDatabase(databasePath)
+    # font data
+    font = defcon.Font()
+    reader.readInfo(font.info)
+    database.writeInfo(font.info)
+    database.setFontValue("features", reader.readFeatures())
+    database.setFontValue("lib", reader.readLib())
+    for name, glyphNames in reader.readGroups().items():
+        database.setGroup(name, glyphNames)
+    for pair, value in reader.readKerning().items():
+        database.setKerningValue(pair, value)
+    # layers
+    layerNames = reader.getLayerNames()
+    database.setLayerNames(layerNames)
+    database.setFontValue("defaultLayer", reader.getDefaultLayerName())
+    for layerName in layerNames:
+        sourceGlyphSet = reader.getGlyphSet(layerName)
+        glyphSet = SQLiteGlyphSet(database, layerName)
+        layer = defcon.Layer()
+        sourceGlyphSet.readLayerInfo(layer)
+        glyphSet.writeLayerInfo(layer)
+        for glyphName in sourceGlyphSet.keys():
+            glyph = defcon.Glyph()
+            sourceGlyphSet.readGlyph(glyphName, glyph, glyph.getPointPen())
+            glyphSet.writeGlyph(glyphName, glyph, glyph.drawPoints)
+    # images
+    for fileName in reader.getImageDirectoryListing():
+        database.setImage(fileName, reader.readImage(fileName))
+    database.commit()
+    return RFont(database)
+
+
+def exportUFO(font, ufoPath, formatVersion=3):
+    """
+    Export **font**, including unsaved changes, to a UFO
+    at **ufoPath**. Glyphs that have not been loaded are
+    read from the database one at a time.
+
+        >>> exportUFO(font, "/path/to/font.ufo")
+    """
+    if os.path.exists(ufoPath):
+        shutil.rmtree(ufoPath)
+    writer = UFOWriter(ufoPath, formatVersion=formatVersion)
+    naked = font.naked()
+    writer.writeInfo(naked.info)
+    writer.writeGroups(dict(font.groups.items()))
+    writer.writeKerning(dict(font.kerning.items()))
+    if naked.features.text:
+        writer.writeFeatures(naked.features.text)
+    writer.writeLib(dict(naked.lib))
+    layers = naked.layers
+    defaultLayer = layers.defaultLayer
+    for layer in layers:
+        glyphSet = writer.getGlyphSet(layer.name, defaultLayer=layer is defaultLayer)
+        sourceGlyphSet = layer._glyphSet
+        for glyphName in sorted(layer.keys()):
+            if sourceGlyphSet is None or glyphName in layer._glyphs:
+                glyph = layer[glyphName]
+            else:
+                # read without adding the glyph to the layer
+                glyph = defcon.Glyph()
+                sourceGlyphSet.readGlyph(glyphName, glyph, glyph.getPointPen())
+            glyphSet.writeGlyph(glyphName, glyph, glyph.drawPoints)
+        glyphSet.writeContents()
+        glyphSet.writeLayerInfo(layer)
+    writer.writeLayerContents(layers.layerOrder)
+    images = naked.images
+    for fileName in images.fileNames:
+        writer.writeImage(fileName, images[fileName])
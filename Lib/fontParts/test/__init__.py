@@ -16,6 +16,7 @@ from fontParts.test import test_component
 from fontParts.test import test_anchor
 from fontParts.test import test_image
 from fontParts.test import test_guideline
+from fontParts.test import test_world
 
 
 def testEnvironment(objectGenerator, inApp=False):
@@ -34,7 +35,8 @@ def testEnvironment(objectGenerator, inApp=False):
         test_component,
         test_anchor,
         test_image,
-        test_guideline
+        test_guideline,
+        test_world
     ]
     globalSuite = unittest.TestSuite()
     loader = unittest.TestLoader()
@@ -75,3 +75,69 @@ class TestComponent(unittest.TestCase):
         # set
         with self.assertRaises(FontPartsError):
             component.bounds = (0, 0, 100, 100)
+
+    # ------------
+    # Data Queries
+    # ------------
+
+    def test_pointInside(self):
+        component, unrequested = self.getComponent_bounds()
+        component.transformation = (2, 0, 0, 1, 100, 0)
+        self.assertTrue(component.pointInside((150, 50)))
+        self.assertTrue(component.pointInside((250, 50)))
+        self.assertFalse(component.pointInside((50, 50)))
+        component.baseGlyph = "C"
+        self.assertFalse(component.pointInside((150, 50)))
+
+    # -------------
+    # Normalization
+    # -------------
+
+    def test_decompose(self):
+        component, unrequested = self.getComponent_bounds()
+        font = component.font
+        glyph = font.newGlyph("C")
+        unrequested.append(glyph)
+        # nested components
+        component = glyph.appendComponent("B", offset=(0, 200))
+        component.decompose()
+        self.assertEqual(
+            len(glyph.components),
+            0
+        )
+        self.assertEqual(
+            [contour.bounds for contour in glyph.contours],
+            [(0, 200, 100, 300)]
+        )
+
+    def test_decompose_pointAttributes(self):
+        font, unrequested = self.objectGenerator("font")
+        unrequested.append(font)
+        glyph = font.newGlyph("A")
+        unrequested.append(glyph)
+        pen = glyph.getPointPen()
+        pen.beginPath(identifier="contour")
+        pen.addPoint((0, 0), "line", name="corner", identifier="point")
+        pen.addPoint((0, 100), "line")
+        pen.addPoint((100, 100), "line")
+        pen.endPath()
+        glyph = font.newGlyph("B")
+        unrequested.append(glyph)
+        # the base glyph's identifiers are already used
+        pen = glyph.getPointPen()
+        pen.beginPath(identifier="contour")
+        pen.addPoint((0, 0), "line", identifier="point")
+        pen.addPoint((0, 100), "line")
+        pen.addPoint((100, 100), "line")
+        pen.endPath()
+        component = glyph.appendComponent("A", offset=(200, 0))
+        component.decompose()
+        contour = glyph.contours[1]
+        self.assertEqual(
+            contour.points[0].name,
+            "corner"
+        )
+        self.assertEqual(
+            (contour.identifier, contour.points[0].identifier),
+            (None, None)
+        )
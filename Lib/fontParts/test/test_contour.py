@@ -49,3 +49,106 @@ class TestContour(unittest.TestCase):
         # set
         with self.assertRaises(FontPartsError):
             contour.bounds = (1, 2, 3, 4)
+
+    # --------
+    # Geometry
+    # --------
+
+    def test_area(self):
+        contour, unrequested = self.getContour_bounds()
+        self.assertEqual(
+            contour.area,
+            -10000
+        )
+        self.assertTrue(contour.clockwise)
+        contour.reverse()
+        self.assertEqual(
+            contour.area,
+            10000
+        )
+        self.assertFalse(contour.clockwise)
+        # curve
+        contour, unrequested = self.getContour_boundsExtrema()
+        self.assertAlmostEqual(
+            contour.area,
+            -9020
+        )
+        # set
+        with self.assertRaises(FontPartsError):
+            contour.area = 100
+
+    def test_length(self):
+        contour, unrequested = self.getContour_bounds()
+        self.assertEqual(
+            contour.length,
+            400
+        )
+
+    def test_centroid(self):
+        contour, unrequested = self.getContour_bounds()
+        self.assertEqual(
+            contour.centroid,
+            (50, 50)
+        )
+        contour, unrequested = self.getContour_boundsExtrema()
+        x, y = contour.centroid
+        self.assertAlmostEqual(y, 50)
+
+    def test_curvatureExtrema(self):
+        contour, unrequested = self.getContour_bounds()
+        self.assertEqual(
+            contour.curvatureExtrema,
+            ()
+        )
+        contour, unrequested = self.getContour_boundsExtrema()
+        extrema = contour.curvatureExtrema
+        self.assertEqual(
+            len(extrema),
+            2
+        )
+        (x1, y1), curvature1 = extrema[0]
+        (x2, y2), curvature2 = extrema[1]
+        self.assertAlmostEqual(x1, x2, places=3)
+        self.assertAlmostEqual(y1 + y2, 100, places=3)
+        self.assertAlmostEqual(curvature1, curvature2)
+
+    # ------------------
+    # Data Normalization
+    # ------------------
+
+    def test_autoStartSegment(self):
+        contour, unrequested = self.objectGenerator("contour")
+        contour.appendPoint((100, 100), "line")
+        contour.appendPoint((100, 0), "line")
+        contour.appendPoint((0, 0), "line")
+        contour.appendPoint((0, 100), "line")
+        contour.autoStartSegment()
+        self.assertEqual(
+            [(point.x, point.y) for point in contour.points],
+            [(0, 0), (0, 100), (100, 100), (100, 0)]
+        )
+        # curves
+        contour, unrequested = self.objectGenerator("contour")
+        contour.appendPoint((50, 100), "line")
+        contour.appendPoint((117, 100), "offcurve")
+        contour.appendPoint((117, 0), "offcurve")
+        contour.appendPoint((50, 0), "curve")
+        contour.appendPoint((0, 0), "line")
+        contour.appendPoint((0, 100), "line")
+        segments = [
+            [(point.x, point.y) for point in segment]
+            for segment in contour.segments
+        ]
+        contour.autoStartSegment()
+        self.assertEqual(
+            [(point.x, point.y) for point in contour.points if point.type != "offcurve"][0],
+            (0, 0)
+        )
+        newSegments = [
+            [(point.x, point.y) for point in segment]
+            for segment in contour.segments
+        ]
+        self.assertEqual(
+            sorted(newSegments),
+            sorted(segments)
+        )
@@ -1,3 +1,7 @@
+import os
+import json
+import shutil
+import tempfile
 import unittest
 from fontParts.base import FontPartsError
 
@@ -29,4 +33,622 @@ class TestFont(unittest.TestCase):
         self.assertEqual(
             len(font),
             4
-        )
\ No newline at end of file
+        )
+
+    # -------
+    # Mapping
+    # -------
+
+    def test_getCharacterMapping(self):
+        font, unrequested = self.getFont_glyphs()
+        font["A"].unicode = 0x41
+        layer = font.newLayer("test")
+        layer.newGlyph("B").unicode = 0x42
+        self.assertEqual(
+            font.getCharacterMapping(),
+            {0x41: ("A",)}
+        )
+        self.assertEqual(
+            font.getCharacterMap().getGlyphName(0x41),
+            "A"
+        )
+
+    def test_getReverseComponentMapping(self):
+        font, unrequested = self.getFont_glyphs()
+        font["B"].appendComponent("A")
+        self.assertEqual(
+            font.getReverseComponentMapping(),
+            {"A": ("B",)}
+        )
+
+    # -------
+    # Metrics
+    # -------
+
+    def test_getMetrics(self):
+        font, unrequested = self.getFont_glyphs()
+        font.glyphOrder = ["D", "C"]
+        font["C"].width = 200
+        self.assertEqual(
+            font.getMetrics()["glyphNames"],
+            ["D", "C", "A", "B"]
+        )
+        metrics = font.getMetrics(["C"])
+        self.assertEqual(
+            metrics["width"],
+            [200]
+        )
+        metrics["width"] = [300]
+        font.setMetrics(metrics)
+        self.assertEqual(
+            font["C"].width,
+            300
+        )
+
+    def getFont_italic(self):
+        font, unrequested = self.getFont_glyphs()
+        font.info.italicAngle = -45
+        glyph = font["A"]
+        glyph.width = 500
+        pen = glyph.getPen()
+        pen.moveTo((100, 0))
+        pen.lineTo((200, 100))
+        pen.lineTo((300, 100))
+        pen.lineTo((200, 0))
+        pen.closePath()
+        font["B"].appendComponent("A", offset=(50, 0))
+        font["B"].width = 500
+        return font, unrequested
+
+    def test_angledMargins(self):
+        font, unrequested = self.getFont_italic()
+        glyph = font["A"]
+        self.assertEqual(
+            (glyph.leftMargin, glyph.rightMargin),
+            (100, 200)
+        )
+        self.assertEqual(
+            (glyph.angledLeftMargin, glyph.angledRightMargin),
+            (100, 300)
+        )
+        glyph.angledLeftMargin = 50
+        glyph.angledRightMargin = 100
+        self.assertEqual(
+            (glyph.angledLeftMargin, glyph.angledRightMargin, glyph.width),
+            (50, 100, 250)
+        )
+        font.info.italicAngle = 0
+        self.assertEqual(
+            (glyph.angledLeftMargin, glyph.angledRightMargin),
+            (glyph.leftMargin, glyph.rightMargin)
+        )
+
+    def test_setMetrics_angled(self):
+        font, unrequested = self.getFont_italic()
+        metrics = font.getMetrics(["A", "B"])
+        self.assertEqual(
+            metrics["angledLeftMargin"],
+            [100, 150]
+        )
+        metrics["angledLeftMargin"] = [50, None]
+        metrics["angledRightMargin"] = [100, 100]
+        font.setMetrics(metrics)
+        self.assertEqual(
+            [(font[glyphName].angledLeftMargin, font[glyphName].angledRightMargin) for glyphName in "AB"],
+            [(50, 100), (100, 100)]
+        )
+
+    # ------------
+    # Fingerprints
+    # ------------
+
+    def test_findDuplicateGlyphs_changed(self):
+        font, unrequested = self.getFont_glyphs()
+        for glyphName in "AB":
+            pen = font[glyphName].getPointPen()
+            pen.beginPath()
+            pen.addPoint((0, 0), "line")
+            pen.addPoint((0, 100), "line")
+            pen.addPoint((100, 100), "line")
+            pen.endPath()
+        self.assertEqual(
+            font.findDuplicateGlyphs(),
+            [("A", "B")]
+        )
+        # the fingerprints are made again after a change
+        font["A"].contours[0].points[0].smooth = True
+        self.assertEqual(
+            font.findDuplicateGlyphs(),
+            []
+        )
+
+    # ----
+    # Copy
+    # ----
+
+    def getFont_copyable(self):
+        font, unrequested = self.getFont_glyphs()
+        font.info.familyName = "Copy"
+        font.groups["group"] = ["A", "B"]
+        font.kerning[("A", "B")] = -10
+        font.features.text = "# features"
+        font.lib["key"] = ["value"]
+        font.appendGuideline((1, 2), 3, name="guideline")
+        glyph = font["A"]
+        glyph.width = 500
+        glyph.unicodes = [0x41]
+        pen = glyph.getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 100))
+        pen.lineTo((100, 100))
+        pen.closePath()
+        glyph.appendAnchor("top", (50, 100))
+        font["B"].appendComponent("A", offset=(10, 20))
+        layer = font.newLayer("background")
+        layer.newGlyph("A").width = 200
+        return font, unrequested
+
+    def assertFontDataEqual(self, font, other):
+        self.assertEqual(font.info.familyName, other.info.familyName)
+        self.assertEqual(dict(font.groups), dict(other.groups))
+        self.assertEqual(dict(font.kerning), dict(other.kerning))
+        self.assertEqual(font.features.text, other.features.text)
+        self.assertEqual(dict(font.lib), dict(other.lib))
+        self.assertEqual(
+            [(guideline.x, guideline.y, guideline.angle, guideline.name) for guideline in font.guidelines],
+            [(guideline.x, guideline.y, guideline.angle, guideline.name) for guideline in other.guidelines]
+        )
+        self.assertEqual(font.layerOrder, other.layerOrder)
+        self.assertEqual(font.defaultLayer, other.defaultLayer)
+        for layerName in font.layerOrder:
+            layer = font.getLayer(layerName)
+            otherLayer = other.getLayer(layerName)
+            self.assertEqual(sorted(layer.keys()), sorted(otherLayer.keys()))
+            for glyphName in layer.keys():
+                glyph = layer[glyphName]
+                otherGlyph = otherLayer[glyphName]
+                self.assertEqual(glyph.width, otherGlyph.width)
+                self.assertEqual(glyph.unicodes, otherGlyph.unicodes)
+                self.assertEqual(
+                    [[(point.x, point.y) for point in contour.points] for contour in glyph.contours],
+                    [[(point.x, point.y) for point in contour.points] for contour in otherGlyph.contours]
+                )
+                self.assertEqual(
+                    [(component.baseGlyph, component.offset) for component in glyph.components],
+                    [(component.baseGlyph, component.offset) for component in otherGlyph.components]
+                )
+                self.assertEqual(
+                    [(anchor.name, anchor.position) for anchor in glyph.anchors],
+                    [(anchor.name, anchor.position) for anchor in otherGlyph.anchors]
+                )
+
+    def test_copy(self):
+        font, unrequested = self.getFont_copyable()
+        copied = font.copy()
+        self.assertFontDataEqual(copied, font)
+        # the copy is independent
+        copied["A"].width = 0
+        copied.getLayer("background").newGlyph("B")
+        copied.lib["key"].append("other")
+        self.assertEqual(
+            font["A"].width,
+            500
+        )
+        self.assertEqual(
+            sorted(font.getLayer("background").keys()),
+            ["A"]
+        )
+        self.assertEqual(
+            font.lib["key"],
+            ["value"]
+        )
+
+    def test_copy_shareGlyphs(self):
+        font, unrequested = self.getFont_copyable()
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "test.ufo")
+            font.save(path)
+            source = font.__class__(path)
+            copied = source.copy(shareGlyphs=True)
+            # changes to either font do not
+            # change the glyphs of the other
+            source["A"].width = 0
+            source.removeGlyph("C")
+            source.save()
+            self.assertFontDataEqual(copied, font)
+            copied["D"].width = 100
+            self.assertEqual(
+                source["D"].width,
+                0
+            )
+        finally:
+            shutil.rmtree(directory)
+
+    # -----------
+    # Differences
+    # -----------
+
+    def test_diff(self):
+        font, unrequested = self.getFont_copyable()
+        other = font.copy()
+        self.assertEqual(
+            font.diff(other),
+            {}
+        )
+        other["A"].width = 600
+        other.kerning[("A", "C")] = 20
+        changes = font.diff(other)
+        self.assertEqual(
+            sorted(changes.keys()),
+            ["kerning", "layers"]
+        )
+        self.assertEqual(
+            changes["kerning"],
+            dict(set=[["A", "C", 20]])
+        )
+        # only the changed glyph is included
+        self.assertEqual(
+            list(changes["layers"].keys()),
+            [font.defaultLayer]
+        )
+        glyphs = changes["layers"][font.defaultLayer]["glyphs"]
+        self.assertEqual(
+            list(glyphs.keys()),
+            ["A"]
+        )
+        self.assertEqual(
+            glyphs["A"]["width"],
+            600
+        )
+        with self.assertRaises(FontPartsError):
+            font.diff(other.getLayer(other.defaultLayer))
+
+    def test_diff_outlineAttributes(self):
+        font, unrequested = self.getFont_copyable()
+
+        def drawPointIdentifier(glyph):
+            glyph.clearContours()
+            pen = glyph.getPointPen()
+            pen.beginPath()
+            pen.addPoint((0, 0), "line", identifier="point")
+            pen.addPoint((0, 100), "line")
+            pen.addPoint((100, 100), "line")
+            pen.endPath()
+
+        edits = (
+            lambda other: setattr(other["A"].contours[0].points[0], "name", "corner"),
+            lambda other: setattr(other["A"].anchors[0], "color", (1, 0, 0, 1)),
+            lambda other: other["A"].contours[0].generateIdentifier(),
+            lambda other: drawPointIdentifier(other["A"]),
+            lambda other: other["B"].components[0].generateIdentifier()
+        )
+        for edit in edits:
+            other = font.copy()
+            edit(other)
+            changes = font.diff(other)
+            self.assertNotEqual(
+                changes,
+                {}
+            )
+            patched = font.copy()
+            patched.patch(changes)
+            self.assertEqual(
+                patched.diff(other),
+                {}
+            )
+
+    def test_patch(self):
+        font, unrequested = self.getFont_copyable()
+        other = font.copy()
+        other.info.styleName = "Bold"
+        other.groups["other"] = ["C"]
+        del other.groups["group"]
+        del other.kerning[("A", "B")]
+        other.features.text = "# other"
+        other.lib["key"] = ["other"]
+        other.appendGuideline((10, 20), 90)
+        glyph = other["A"]
+        glyph.unicodes = [0x61]
+        glyph.note = "note"
+        glyph.contours[0].points[1].y = 150
+        glyph.appendGuideline((0, 100), 0, name="guideline")
+        other.removeGlyph("C")
+        other.newGlyph("E").appendComponent("A")
+        other.removeLayer("background")
+        other.newLayer("other").newGlyph("A").width = 10
+        other.glyphOrder = ["E", "A"]
+        # the change set survives serialization
+        changes = json.loads(json.dumps(font.diff(other)))
+        font.patch(changes)
+        self.assertEqual(
+            font.diff(other),
+            {}
+        )
+        self.assertFontDataEqual(font, other)
+        with self.assertRaises(FontPartsError):
+            font.patch([])
+
+    # -------
+    # Changes
+    # -------
+
+    def test_holdChanges(self):
+        font, unrequested = self.getFont_glyphs()
+        for glyph in font:
+            pen = glyph.getPen()
+            pen.moveTo((0, 0))
+            pen.lineTo((0, 100))
+            pen.lineTo((100, 100))
+            pen.closePath()
+        self.assertEqual(
+            font["A"].bounds,
+            (0, 0, 100, 100)
+        )
+        with font.holdChanges() as held:
+            self.assertIs(held, font)
+            with font.holdChanges():
+                for glyph in font:
+                    glyph.moveBy((10, 0))
+                    glyph.width = 200
+            font["B"].contours[0].points[0].y = -10
+        self.assertEqual(
+            [font[name].bounds for name in "AB"],
+            [(10, 0, 110, 100), (10, -10, 110, 100)]
+        )
+        self.assertEqual(
+            font.getMetrics(["A"])["rightMargin"],
+            [90]
+        )
+        # the changes are released after an exception
+        with self.assertRaises(ZeroDivisionError):
+            with font.holdChanges():
+                font["A"].moveBy((10, 0))
+                1 / 0
+        self.assertEqual(
+            font["A"].bounds,
+            (20, 0, 120, 100)
+        )
+
+    def test_holdChanges_glyphs(self):
+        font, unrequested = self.getFont_glyphs()
+        other, unrequested = self.objectGenerator("glyph")
+        other.width = 300
+        with font.holdChanges():
+            font.newGlyph("E")
+            font["E"].width = 100
+            font["A"].name = "F"
+            self.assertEqual(
+                ("A" in font, "F" in font),
+                (False, True)
+            )
+            self.assertEqual(
+                font["F"].name,
+                "F"
+            )
+        with font.getLayer(font.defaultLayer).holdChanges():
+            font.insertGlyph(other, name="G")
+            font["G"].unicodes = [0x47]
+        self.assertEqual(
+            sorted(font.keys()),
+            ["B", "C", "D", "E", "F", "G"]
+        )
+        self.assertEqual(
+            [font[name].width for name in "EG"],
+            [100, 300]
+        )
+        self.assertEqual(
+            font.getCharacterMapping(),
+            {0x47: ("G",)}
+        )
+
+    # ------------
+    # Transactions
+    # ------------
+
+    def test_transaction(self):
+        font, unrequested = self.getFont_copyable()
+        original = font.copy()
+        with font.transaction("Edit") as edited:
+            self.assertIs(edited, font)
+            font.info.styleName = "Bold"
+            font.groups["other"] = ["C"]
+            del font.kerning[("A", "B")]
+            font.kerning[("A", "C")] = 20
+            font.features.text = "# other"
+            font.lib["key"] = ["other"]
+            font.appendGuideline((10, 20), 90)
+            glyph = font["A"]
+            glyph.unicodes = [0x61]
+            glyph.contours[0].points[1].y = 150
+            glyph.appendAnchor("bottom", (50, 0))
+            font["B"].moveBy((10, 0))
+            font["D"].name = "E"
+            font.removeGlyph("C")
+            font.newGlyph("F").appendComponent("A")
+            font.removeLayer("background")
+            font.newLayer("other").newGlyph("A").width = 10
+            font.glyphOrder = ["F", "A"]
+        other = font.copy()
+        self.assertTrue(font.canUndo())
+        self.assertFalse(font.canRedo())
+        self.assertEqual(
+            font.undo(),
+            "Edit"
+        )
+        self.assertEqual(
+            font.diff(original),
+            {}
+        )
+        self.assertFontDataEqual(font, original)
+        self.assertFalse(font.canUndo())
+        self.assertEqual(
+            font.redo(),
+            "Edit"
+        )
+        self.assertEqual(
+            font.diff(other),
+            {}
+        )
+        self.assertFontDataEqual(font, other)
+        self.assertIsNone(font.redo())
+
+    def test_transaction_rollBack(self):
+        font, unrequested = self.getFont_copyable()
+        original = font.copy()
+        with self.assertRaises(ZeroDivisionError):
+            with font.transaction("Edit"):
+                font["A"].width = 0
+                font.kerning[("B", "A")] = 10
+                font.newGlyph("E")
+                1 / 0
+        self.assertEqual(
+            font.diff(original),
+            {}
+        )
+        self.assertFalse(font.canUndo())
+        # only the changes of a failed inner block are undone
+        with font.transaction("Outer"):
+            font["A"].width = 10
+            try:
+                with font.transaction("Inner"):
+                    font["A"].width = 20
+                    font["B"].width = 20
+                    1 / 0
+            except ZeroDivisionError:
+                pass
+            with self.assertRaises(FontPartsError):
+                font.undo()
+        self.assertEqual(
+            (font["A"].width, font["B"].width),
+            (10, 0)
+        )
+        self.assertEqual(
+            font.undo(),
+            "Outer"
+        )
+        self.assertEqual(
+            font.diff(original),
+            {}
+        )
+
+    def test_transaction_parts(self):
+        font, unrequested = self.getFont_copyable()
+        original = font.copy()
+        # the parents of the changed objects are not kept
+        contour = font["A"].contours[0]
+
+        def edit():
+            font["A"].contours[0].points[0].x = 77
+            font["A"].anchors[0].y = 99
+            font["A"].contours[0].reverse()
+            font["A"].lib["key"] = "value"
+            contour.points[1].y = 55
+            font["B"].components[0].offset = (30, 40)
+
+        with self.assertRaises(ZeroDivisionError):
+            with font.transaction("Edit"):
+                edit()
+                1 / 0
+        self.assertEqual(
+            font.diff(original),
+            {}
+        )
+        with font.transaction("Edit"):
+            edit()
+        edited = font.copy()
+        self.assertNotEqual(
+            font.diff(original),
+            {}
+        )
+        font.undo()
+        self.assertEqual(
+            font.diff(original),
+            {}
+        )
+        font.redo()
+        self.assertEqual(
+            font.diff(edited),
+            {}
+        )
+
+    def test_transaction_rename(self):
+        font, unrequested = self.getFont_glyphs()
+        font.glyphOrder = ["A", "B", "C", "D"]
+        with font.transaction("Rename"):
+            font["A"].name = "E"
+        self.assertEqual(
+            font.glyphOrder,
+            ["E", "B", "C", "D"]
+        )
+        font.undo()
+        self.assertEqual(
+            (sorted(font.keys()), font.glyphOrder),
+            (["A", "B", "C", "D"], ["A", "B", "C", "D"])
+        )
+        font.redo()
+        self.assertEqual(
+            (sorted(font.keys()), font.glyphOrder),
+            (["B", "C", "D", "E"], ["E", "B", "C", "D"])
+        )
+
+    def test_transaction_identifiers(self):
+        font, unrequested = self.getFont_glyphs()
+        glyph = font["A"]
+        pen = glyph.getPointPen()
+        for index in range(2):
+            pen.beginPath(identifier="contour%d" % index)
+            pen.addPoint((0, 0), "line", name="corner", identifier="point%d" % index)
+            pen.addPoint((0, 100), "line")
+            pen.addPoint((100, 100), "line")
+            pen.endPath()
+        pen.addComponent("B", (1, 0, 0, 1, 0, 0), identifier="component")
+        # the contour that is not changed is kept
+        untouched = glyph.contours[0].naked()
+
+        def getIdentifiers():
+            return (
+                [contour.identifier for contour in glyph.contours],
+                [(point.name, point.identifier) for point in glyph.contours[1].points],
+                [component.identifier for component in glyph.components]
+            )
+
+        identifiers = getIdentifiers()
+        with font.transaction("Move"):
+            glyph.contours[1].points[1].x = 50
+        for undo in (font.undo, font.redo):
+            undo()
+            self.assertEqual(
+                getIdentifiers(),
+                identifiers
+            )
+            self.assertIs(
+                glyph.contours[0].naked(),
+                untouched
+            )
+        self.assertEqual(
+            glyph.contours[1].points[1].x,
+            50
+        )
+
+    def test_undoSizeLimit(self):
+        font, unrequested = self.getFont_copyable()
+        for width in (100, 200, 300):
+            with font.transaction("Width"):
+                font["A"].width = width
+        font.undoSizeLimit = 0
+        self.assertEqual(
+            font.undoSizeLimit,
+            0
+        )
+        self.assertFalse(font.canUndo())
+        font.undoSizeLimit = 10000
+        with font.transaction("Width"):
+            font["A"].width = 400
+        self.assertTrue(font.canUndo())
+        font.clearUndoHistory()
+        self.assertFalse(font.canUndo())
+        with self.assertRaises(FontPartsError):
+            font.undoSizeLimit = -1
+        with self.assertRaises(FontPartsError):
+            font.transaction(1)
@@ -17,6 +17,72 @@ class TestGlyph(unittest.TestCase):
         pen.closePath()
         return glyph, unrequested
 
+    # ----
+    # Copy
+    # ----
+
+    def assertGlyphDataEqual(self, glyph, other):
+        for attr in ("unicodes", "width", "height", "note", "markColor"):
+            self.assertEqual(getattr(glyph, attr), getattr(other, attr))
+        self.assertEqual(
+            [[(point.x, point.y, point.type) for point in contour.points] for contour in glyph.contours],
+            [[(point.x, point.y, point.type) for point in contour.points] for contour in other.contours]
+        )
+        self.assertEqual(
+            [(component.baseGlyph, component.transformation) for component in glyph.components],
+            [(component.baseGlyph, component.transformation) for component in other.components]
+        )
+        self.assertEqual(
+            [(anchor.name, anchor.x, anchor.y) for anchor in glyph.anchors],
+            [(anchor.name, anchor.x, anchor.y) for anchor in other.anchors]
+        )
+        self.assertEqual(
+            [(guideline.name, guideline.x, guideline.y, guideline.angle) for guideline in glyph.guidelines],
+            [(guideline.name, guideline.x, guideline.y, guideline.angle) for guideline in other.guidelines]
+        )
+        self.assertEqual(dict(glyph.lib), dict(other.lib))
+
+    def getGlyph_copyable(self):
+        glyph, unrequested = self.getGlyph_generic()
+        glyph.note = "note"
+        glyph.markColor = (1, 0, 0, 1)
+        glyph.appendComponent("A", offset=(10, 20))
+        glyph.appendAnchor("top", (100, 200))
+        glyph.appendGuideline((10, 20), 45, "guide")
+        glyph.lib["test"] = [1, 2]
+        return glyph, unrequested
+
+    def test_copy(self):
+        glyph, unrequested = self.getGlyph_copyable()
+        copied = glyph.copy()
+        self.assertEqual(copied.name, glyph.name)
+        self.assertGlyphDataEqual(copied, glyph)
+        # the copy is independent
+        copied.contours[0].points[0].x = 500
+        copied.lib["test"].append(3)
+        self.assertEqual(glyph.contours[0].points[0].x, 100)
+        self.assertEqual(glyph.lib["test"], [1, 2])
+
+    # --------
+    # Unicodes
+    # --------
+
+    def test_autoUnicodes(self):
+        glyph, unrequested = self.getGlyph_generic()
+        for name, expected in [
+                ("Aacute", (0xC1,)),
+                ("uni0416", (0x416,)),
+                ("u1F600", (0x1F600,)),
+                ("uniD800", (0x58,)),
+                ("A.alt", (0x58,))]:
+            glyph.unicodes = [0x58]
+            glyph.name = name
+            glyph.autoUnicodes()
+            self.assertEqual(
+                tuple(glyph.unicodes),
+                expected
+            )
+
     # -------
     # Metrics
     # -------
@@ -49,3 +115,593 @@ class TestGlyph(unittest.TestCase):
             glyph.width = "abc"
         with self.assertRaises(FontPartsError):
             glyph.width = None
+
+    # --------
+    # Contours
+    # --------
+
+    def getGlyph_overlapping(self):
+        glyph, unrequested = self.objectGenerator("glyph")
+        pen = glyph.getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((100, 0))
+        pen.lineTo((100, 100))
+        pen.lineTo((0, 100))
+        pen.closePath()
+        pen.moveTo((50, 50))
+        pen.lineTo((150, 50))
+        pen.lineTo((150, 150))
+        pen.lineTo((50, 150))
+        pen.closePath()
+        return glyph, unrequested
+
+    def test_removeOverlap(self):
+        glyph, unrequested = self.getGlyph_overlapping()
+        glyph.removeOverlap()
+        self.assertEqual(
+            len(glyph.contours),
+            1
+        )
+        points = sorted((point.x, point.y) for point in glyph.contours[0].points)
+        self.assertEqual(
+            points,
+            [(0, 0), (0, 100), (50, 100), (50, 150), (100, 0), (100, 50), (150, 50), (150, 150)]
+        )
+        # no overlap
+        glyph, unrequested = self.getGlyph_generic()
+        glyph.removeOverlap()
+        self.assertEqual(
+            [(point.x, point.y) for point in glyph.contours[0].points],
+            [(100, 0), (100, 100), (200, 100), (200, 0)]
+        )
+
+    def getGlyph_o(self):
+        glyph, unrequested = self.objectGenerator("glyph")
+        pen = glyph.getPointPen()
+        for (xMin, yMin, xMax, yMax) in ((0, 0, 400, 400), (100, 100, 300, 300)):
+            xMid = (xMin + xMax) / 2
+            yMid = (yMin + yMax) / 2
+            pen.beginPath()
+            pen.addPoint((xMin, yMid), "curve", smooth=True, name="left")
+            pen.addPoint((xMin, yMax))
+            pen.addPoint((xMin, yMax))
+            pen.addPoint((xMid, yMax), "curve", smooth=True)
+            pen.addPoint((xMax, yMax))
+            pen.addPoint((xMax, yMax))
+            pen.addPoint((xMax, yMid), "curve", smooth=True)
+            pen.addPoint((xMax, yMin))
+            pen.addPoint((xMax, yMin))
+            pen.addPoint((xMid, yMin), "curve", smooth=True)
+            pen.addPoint((xMin, yMin))
+            pen.addPoint((xMin, yMin))
+            pen.endPath()
+        glyph.contours[1].reverse()
+        return glyph, unrequested
+
+    def test_removeOverlap_unchanged(self):
+        glyph, unrequested = self.getGlyph_o()
+        before = [
+            [(point.x, point.y, point.type, point.smooth, point.name) for point in contour.points]
+            for contour in glyph.contours
+        ]
+        glyph.removeOverlap()
+        self.assertEqual(
+            [
+                [(point.x, point.y, point.type, point.smooth, point.name) for point in contour.points]
+                for contour in glyph.contours
+            ],
+            before
+        )
+        # overlap in other contours
+        glyph.correctDirection()
+        before = [
+            [(point.x, point.y, point.type, point.smooth, point.name) for point in contour.points]
+            for contour in glyph.contours
+        ]
+        pen = glyph.getPen()
+        pen.moveTo((500, 0))
+        pen.lineTo((600, 0))
+        pen.lineTo((600, 100))
+        pen.lineTo((500, 100))
+        pen.closePath()
+        pen.moveTo((550, 0))
+        pen.lineTo((650, 0))
+        pen.lineTo((650, 100))
+        pen.lineTo((550, 100))
+        pen.closePath()
+        glyph.removeOverlap()
+        self.assertEqual(
+            len(glyph.contours),
+            3
+        )
+        self.assertEqual(
+            [
+                [(point.x, point.y, point.type, point.smooth, point.name) for point in contour.points]
+                for contour in glyph.contours[:2]
+            ],
+            before
+        )
+
+    # --------
+    # Geometry
+    # --------
+
+    def test_area(self):
+        glyph, unrequested = self.getGlyph_nested()
+        glyph.correctDirection()
+        self.assertAlmostEqual(
+            glyph.area,
+            250000 - 90000 + glyph.contours[2].area + 10000
+        )
+
+    def test_centroid(self):
+        glyph, unrequested = self.getGlyph_generic()
+        self.assertEqual(
+            glyph.centroid,
+            (150, 50)
+        )
+        glyph, unrequested = self.objectGenerator("glyph")
+        self.assertIsNone(glyph.centroid)
+
+    def test_measureContours(self):
+        glyph, unrequested = self.getGlyph_nested()
+        measurements = glyph.measureContours()
+        self.assertEqual(
+            [m["clockwise"] for m in measurements],
+            [contour.clockwise for contour in glyph.contours]
+        )
+        self.assertEqual(
+            [m["length"] for m in measurements],
+            [2000, 1200, glyph.contours[2].length, 400]
+        )
+        self.assertEqual(
+            measurements[0]["centroid"],
+            (250, 250)
+        )
+
+    # ----
+    # Math
+    # ----
+
+    def getGlyph_math(self):
+        glyph, unrequested = self.getGlyph_generic()
+        glyph.appendComponent("base", offset=(10, 20), scale=(1, 2))
+        glyph.appendAnchor("top", (150, 100))
+        glyph.appendGuideline((0, 50), 0)
+        return glyph, unrequested
+
+    def getMathData(self, glyph):
+        return (
+            glyph.width,
+            [[(point.x, point.y) for point in contour.points] for contour in glyph.contours],
+            [component.transformation for component in glyph.components],
+            [(anchor.x, anchor.y) for anchor in glyph.anchors],
+            [(guideline.x, guideline.y) for guideline in glyph.guidelines]
+        )
+
+    def test_imul(self):
+        glyph, unrequested = self.getGlyph_math()
+        glyph *= (2, 0.5)
+        self.assertEqual(
+            self.getMathData(glyph),
+            (
+                500,
+                [[(200, 0), (200, 50), (400, 50), (400, 0)]],
+                [(2, 0, 0, 1, 20, 10)],
+                [(300, 50)],
+                [(0, 25)]
+            )
+        )
+        glyph /= (2, 0.5)
+        self.assertEqual(
+            self.getMathData(glyph),
+            self.getMathData(self.getGlyph_math()[0])
+        )
+
+    def test_iadd_isub(self):
+        glyph, unrequested = self.getGlyph_math()
+        other, unrequested = self.getGlyph_math()
+        other.moveBy((10, 10))
+        glyph += other
+        self.assertEqual(
+            [(point.x, point.y) for point in glyph.contours[0].points],
+            [(210, 10), (210, 210), (410, 210), (410, 10)]
+        )
+        glyph -= other
+        self.assertEqual(
+            self.getMathData(glyph),
+            self.getMathData(self.getGlyph_math()[0])
+        )
+
+    def test_imul_iadd_methods(self):
+        glyph, unrequested = self.getGlyph_math()
+        expected, unrequested = self.getGlyph_math()
+        glyph.imul((2, 0.5))
+        expected *= (2, 0.5)
+        self.assertEqual(
+            self.getMathData(glyph),
+            self.getMathData(expected)
+        )
+        other, unrequested = self.getGlyph_math()
+        glyph.iadd(other)
+        expected += other
+        self.assertEqual(
+            self.getMathData(glyph),
+            self.getMathData(expected)
+        )
+        with self.assertRaises(FontPartsError):
+            glyph.iadd(123)
+
+    def test_applyMathExpression(self):
+        minGlyph, unrequested = self.getGlyph_math()
+        maxGlyph, unrequested = self.getGlyph_math()
+        maxGlyph.width = 500
+        maxGlyph.moveBy((100, 50))
+        a = minGlyph.getMathExpression()
+        b = maxGlyph.getMathExpression()
+        glyph, unrequested = self.objectGenerator("glyph")
+        glyph.applyMathExpression(a + (b - a) * 0.25)
+        expected, unrequested = self.objectGenerator("glyph")
+        expected.interpolate(0.25, minGlyph, maxGlyph, round=False)
+        self.assertEqual(
+            self.getMathData(glyph),
+            self.getMathData(expected)
+        )
+        self.assertEqual(
+            [(term[1], term[2]) for term in (a + (b - a) * 0.25).getTerms()],
+            [(0.75, 0.75), (0.25, 0.25)]
+        )
+
+    def test_applyMathExpression_incompatible(self):
+        glyph, unrequested = self.getGlyph_math()
+        other, unrequested = self.getGlyph_math()
+        other.appendAnchor("bottom", (0, 0))
+        with self.assertRaises(FontPartsError):
+            glyph += other
+
+    def test_mul_afterChange(self):
+        glyph, unrequested = self.getGlyph_math()
+        self.assertEqual(
+            self.getMathData(glyph * 1),
+            self.getMathData(glyph)
+        )
+        # the math data follows changes to the glyph
+        glyph.width = 300
+        glyph.contours[0].points[0].x = 50
+        glyph.anchors[0].x = 10
+        glyph.components[0].offset = (0, 0)
+        self.assertEqual(
+            self.getMathData(glyph * 1),
+            self.getMathData(glyph)
+        )
+
+    # -----------
+    # Fingerprint
+    # -----------
+
+    def test_getFingerprint(self):
+        glyph, unrequested = self.getGlyph_math()
+        other, unrequested = self.getGlyph_math()
+        other.name = "other"
+        fingerprint = glyph.getFingerprint()
+        self.assertEqual(
+            other.getFingerprint(),
+            fingerprint
+        )
+        # integral floats are the same as integers
+        glyph.width = float(glyph.width)
+        self.assertEqual(
+            glyph.getFingerprint(),
+            fingerprint
+        )
+        glyph.contours[0].points[0].x += 1
+        self.assertNotEqual(
+            glyph.getFingerprint(),
+            fingerprint
+        )
+        glyph.contours[0].points[0].x -= 1
+        self.assertEqual(
+            glyph.getFingerprint(),
+            fingerprint
+        )
+        glyph.anchors[0].x += 1
+        self.assertNotEqual(
+            glyph.getFingerprint(),
+            fingerprint
+        )
+
+    def test_getFingerprint_lib(self):
+        glyph, unrequested = self.getGlyph_math()
+        fingerprint = glyph.getFingerprint()
+        libFingerprint = glyph.getFingerprint(lib=True)
+        glyph.lib["key"] = [1, 2]
+        self.assertEqual(
+            glyph.getFingerprint(),
+            fingerprint
+        )
+        self.assertNotEqual(
+            glyph.getFingerprint(lib=True),
+            libFingerprint
+        )
+
+    # -------
+    # Changes
+    # -------
+
+    def test_holdChanges(self):
+        glyph, unrequested = self.getGlyph_generic()
+        bounds = glyph.bounds
+        with glyph.holdChanges():
+            glyph.moveBy((10, 20))
+            glyph.width += 10
+        self.assertEqual(
+            glyph.bounds,
+            (bounds[0] + 10, bounds[1] + 20, bounds[2] + 10, bounds[3] + 20)
+        )
+        self.assertEqual(
+            glyph.getFingerprint(),
+            (glyph * 1).getFingerprint()
+        )
+
+    # ------------
+    # Transactions
+    # ------------
+
+    def test_transaction(self):
+        glyph, unrequested = self.getGlyph_generic()
+        glyph.name = "A"
+        fingerprint = glyph.getFingerprint(lib=True)
+        with glyph.transaction("Move"):
+            glyph.moveBy((10, 20))
+            glyph.width = 300
+            glyph.name = "B"
+            glyph.contours[0].reverse()
+            glyph.appendAnchor("top", (0, 0))
+            glyph.lib["key"] = "value"
+        moved = glyph.getFingerprint(lib=True)
+        self.assertEqual(
+            glyph.undo(),
+            "Move"
+        )
+        self.assertEqual(
+            (glyph.getFingerprint(lib=True), glyph.name),
+            (fingerprint, "A")
+        )
+        self.assertEqual(
+            glyph.redo(),
+            "Move"
+        )
+        self.assertEqual(
+            (glyph.getFingerprint(lib=True), glyph.name),
+            (moved, "B")
+        )
+        # nothing is kept when nothing changes
+        glyph.clearUndoHistory()
+        with glyph.transaction("Nothing"):
+            glyph.width = 300
+        self.assertFalse(glyph.canUndo())
+
+    # ------------------
+    # Data Normalization
+    # ------------------
+
+    def getGlyph_nested(self):
+        glyph, unrequested = self.objectGenerator("glyph")
+        pen = glyph.getPen()
+        # outer, clockwise
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 500))
+        pen.lineTo((500, 500))
+        pen.lineTo((500, 0))
+        pen.closePath()
+        # counter, clockwise
+        pen.moveTo((100, 100))
+        pen.lineTo((100, 400))
+        pen.lineTo((400, 400))
+        pen.lineTo((400, 100))
+        pen.closePath()
+        # island, counter-clockwise curve
+        pen.moveTo((250, 150))
+        pen.curveTo((330, 150), (350, 200), (350, 250))
+        pen.curveTo((350, 300), (330, 350), (250, 350))
+        pen.curveTo((170, 350), (150, 300), (150, 250))
+        pen.curveTo((150, 200), (170, 150), (250, 150))
+        pen.closePath()
+        # separate shape, counter-clockwise
+        pen.moveTo((600, 0))
+        pen.lineTo((700, 0))
+        pen.lineTo((700, 100))
+        pen.lineTo((600, 100))
+        pen.closePath()
+        return glyph, unrequested
+
+    def test_correctDirection(self):
+        # PostScript
+        glyph, unrequested = self.getGlyph_nested()
+        glyph.correctDirection()
+        self.assertEqual(
+            [contour.clockwise for contour in glyph.contours],
+            [False, True, False, False]
+        )
+        # TrueType
+        glyph.correctDirection(trueType=True)
+        self.assertEqual(
+            [contour.clockwise for contour in glyph.contours],
+            [True, False, True, True]
+        )
+        # contours touching the outer contour
+        glyph, unrequested = self.objectGenerator("glyph")
+        pen = glyph.getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 500))
+        pen.lineTo((500, 500))
+        pen.lineTo((500, 0))
+        pen.closePath()
+        pen.moveTo((0, 0))
+        pen.lineTo((250, 0))
+        pen.lineTo((250, 250))
+        pen.closePath()
+        glyph.correctDirection()
+        self.assertEqual(
+            [contour.clockwise for contour in glyph.contours],
+            [False, True]
+        )
+
+    def test_autoContourOrder(self):
+        glyph, unrequested = self.getGlyph_nested()
+        glyph.autoContourOrder()
+        self.assertEqual(
+            [contour.bounds for contour in glyph.contours],
+            [
+                (0, 0, 500, 500),
+                (100, 100, 400, 400),
+                (150, 150, 350, 350),
+                (600, 0, 700, 100)
+            ]
+        )
+        glyph.contours[3].index = 0
+        glyph.autoContourOrder()
+        self.assertEqual(
+            [contour.bounds for contour in glyph.contours][-1],
+            (600, 0, 700, 100)
+        )
+
+    def getGlyph_composite(self):
+        font, unrequested = self.objectGenerator("font")
+        unrequested.append(font)
+        glyph = font.newGlyph("A")
+        unrequested.append(glyph)
+        pen = glyph.getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 100))
+        pen.lineTo((100, 100))
+        pen.lineTo((100, 0))
+        pen.closePath()
+        glyph = font.newGlyph("B")
+        unrequested.append(glyph)
+        glyph.appendComponent("A", offset=(100, 0))
+        glyph = font.newGlyph("C")
+        pen = glyph.getPen()
+        pen.moveTo((0, 500))
+        pen.lineTo((0, 600))
+        pen.lineTo((100, 600))
+        pen.closePath()
+        glyph.appendComponent("B", offset=(0, 100))
+        glyph.appendComponent("A", scale=(2, 1))
+        return glyph, unrequested
+
+    def test_decompose(self):
+        glyph, unrequested = self.getGlyph_composite()
+        glyph.decompose()
+        self.assertEqual(
+            len(glyph.components),
+            0
+        )
+        self.assertEqual(
+            [contour.bounds for contour in glyph.contours],
+            [(0, 500, 100, 600), (100, 100, 200, 200), (0, 0, 200, 100)]
+        )
+
+    def test_decompose_pointAttributes(self):
+        font, unrequested = self.objectGenerator("font")
+        unrequested.append(font)
+        glyph = font.newGlyph("A")
+        unrequested.append(glyph)
+        pen = glyph.getPointPen()
+        pen.beginPath(identifier="contour")
+        pen.addPoint((0, 0), "line", name="corner", identifier="point")
+        pen.addPoint((0, 100), "line")
+        pen.addPoint((100, 100), "line")
+        pen.endPath()
+        glyph = font.newGlyph("B")
+        unrequested.append(glyph)
+        glyph.appendComponent("A")
+        glyph.appendComponent("A", offset=(200, 0))
+        glyph.decompose()
+        self.assertEqual(
+            [contour.points[0].name for contour in glyph.contours],
+            ["corner", "corner"]
+        )
+        # identifiers are kept unless they are already used
+        self.assertEqual(
+            [contour.identifier for contour in glyph.contours],
+            ["contour", None]
+        )
+        self.assertEqual(
+            [contour.points[0].identifier for contour in glyph.contours],
+            ["point", None]
+        )
+
+    def test_drawDecomposed(self):
+        glyph, unrequested = self.getGlyph_composite()
+        pen = glyph.font.newGlyph("D").getPen()
+        glyph.draw(pen, decompose=True)
+        decomposed = glyph.font["D"]
+        self.assertEqual(
+            len(decomposed.components),
+            0
+        )
+        self.assertEqual(
+            len(decomposed.contours),
+            3
+        )
+        self.assertEqual(
+            decomposed.bounds,
+            glyph.bounds
+        )
+
+    def test_boundsComponentChanged(self):
+        glyph, unrequested = self.getGlyph_composite()
+        self.assertEqual(
+            glyph.bounds,
+            (0, 0, 200, 600)
+        )
+        self.assertTrue(glyph.pointInside((150, 150)))
+        glyph.font["A"].moveBy((-100, 0))
+        self.assertEqual(
+            glyph.bounds,
+            (-200, 0, 100, 600)
+        )
+        self.assertFalse(glyph.pointInside((150, 150)))
+
+    def test_pointsInside(self):
+        glyph, unrequested = self.getGlyph_nested()
+        points = [(50, 50), (120, 120), (250, 250), (550, 50), (650, 50)]
+        self.assertEqual(
+            glyph.pointsInside(points),
+            [True, True, True, False, True]
+        )
+        self.assertEqual(
+            glyph.pointsInside(points, evenOdd=True),
+            [True, False, True, False, True]
+        )
+        self.assertEqual(
+            glyph.pointsInside(points),
+            [glyph.pointInside(point) for point in points]
+        )
+        self.assertEqual(glyph.pointsInside([]), [])
+
+    def test_rasterize(self):
+        glyph, unrequested = self.getGlyph_nested()
+        glyph.correctDirection()
+        transformation = (0.02, 0, 0, 0.02, 0, 0)
+        bitmap = glyph.rasterize((15, 10), transformation, antialias=False)
+        self.assertEqual(len(bitmap), 10)
+        self.assertEqual(set(len(row) for row in bitmap), set([15]))
+        # rows are from top to bottom
+        self.assertEqual(
+            [bitmap[9][x] for x in (0, 2, 5, 10, 12)],
+            [1, 1, 1, 0, 1]
+        )
+        self.assertEqual(
+            [bitmap[5][x] for x in (0, 2, 5, 10, 12)],
+            [1, 0, 1, 0, 0]
+        )
+        # the covered area
+        bitmap = glyph.rasterize((15, 10), transformation)
+        self.assertAlmostEqual(
+            sum(sum(row) for row in bitmap),
+            glyph.area * 0.0004,
+            delta=0.5
+        )
+        self.assertTrue(all(0 <= value <= 1 for row in bitmap for value in row))
@@ -1,4 +1,8 @@
+import os
+import shutil
+import tempfile
 import unittest
+from binascii import unhexlify
 from fontParts.base import FontPartsError
 
 
@@ -284,3 +288,53 @@ class TestImage(unittest.TestCase):
         # set: invalid
         with self.assertRaises(FontPartsError):
             image.data = 123
+
+    # ---------
+    # Reference
+    # ---------
+
+    def test_reference(self):
+        image, unrequested = self.getImage_generic()
+        # get
+        reference = image.reference
+        self.assertEqual(
+            reference.data,
+            testImageData
+        )
+        # set: valid
+        other, unrequested = self.getImage_generic()
+        other.reference = reference
+        self.assertEqual(
+            other.reference,
+            reference
+        )
+        self.assertEqual(
+            other.data,
+            testImageData
+        )
+        # set: invalid
+        with self.assertRaises(FontPartsError):
+            image.reference = testImageData
+
+    def test_reference_sourceChanged(self):
+        data = unhexlify(testImageData)
+        font, unrequested = self.objectGenerator("font")
+        font.newGlyph("A").addImage(data=data)
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "test.ufo")
+            font.save(path)
+            source = font.__class__(path)
+            copied = source["A"].copy()
+            reference = source["A"].image.reference
+            # the files of the source may change after
+            # the image has been read from the source.
+            imagesDirectory = os.path.join(path, "images")
+            if os.path.isdir(imagesDirectory):
+                shutil.rmtree(imagesDirectory)
+            self.assertEqual(
+                (copied.image.data, reference.data),
+                (data, data)
+            )
+        finally:
+            shutil.rmtree(directory)
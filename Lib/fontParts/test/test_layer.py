@@ -21,4 +21,386 @@ class TestLayer(unittest.TestCase):
         self.assertEqual(
             len(layer),
             4
-        )
\ No newline at end of file
+        )
+
+    # insertGlyph
+
+    def test_insertGlyph(self):
+        layer, unrequested = self.getLayer_glyphs()
+        glyph = layer["A"]
+        glyph.unicodes = [0x41]
+        pen = glyph.getPointPen()
+        pen.beginPath()
+        pen.addPoint((0, 0), "line")
+        pen.addPoint((0, 100), "line")
+        pen.addPoint((100, 0), "line")
+        pen.endPath()
+        glyph.appendAnchor("top", (50, 100))
+        glyph.appendGuideline((0, 50), 0, "middle")
+        other, unrequested = self.objectGenerator("layer")
+        unrequested.append(layer)
+        for destination in (layer, other):
+            inserted = destination.insertGlyph(glyph, name="A.copy")
+            self.assertEqual(inserted.name, "A.copy")
+            self.assertEqual(inserted.unicodes, glyph.unicodes)
+            self.assertEqual(
+                [(point.x, point.y) for point in inserted.contours[0].points],
+                [(0, 0), (0, 100), (100, 0)]
+            )
+            self.assertEqual(
+                [anchor.name for anchor in inserted.anchors],
+                ["top"]
+            )
+            self.assertEqual(
+                [guideline.name for guideline in inserted.guidelines],
+                ["middle"]
+            )
+        self.assertEqual(
+            layer.getCharacterMap().getGlyphNames(0x41),
+            ("A", "A.copy")
+        )
+
+    # -----------------
+    # Global Operations
+    # -----------------
+
+    def test_removeOverlap(self):
+        layer, unrequested = self.getLayer_glyphs()
+        for name in "AB":
+            pen = layer[name].getPen()
+            pen.moveTo((0, 0))
+            pen.lineTo((100, 0))
+            pen.lineTo((100, 100))
+            pen.lineTo((0, 100))
+            pen.closePath()
+            pen.moveTo((50, 0))
+            pen.lineTo((150, 0))
+            pen.lineTo((150, 100))
+            pen.lineTo((50, 100))
+            pen.closePath()
+        layer.removeOverlap(["A"])
+        self.assertEqual(
+            [len(layer[name].contours) for name in "AB"],
+            [1, 2]
+        )
+        layer.removeOverlap()
+        self.assertEqual(
+            [len(layer[name].contours) for name in "AB"],
+            [1, 1]
+        )
+
+    def test_autoStartSegment(self):
+        layer, unrequested = self.getLayer_glyphs()
+        for name in "AB":
+            pen = layer[name].getPen()
+            pen.moveTo((100, 100))
+            pen.lineTo((100, 0))
+            pen.lineTo((0, 0))
+            pen.lineTo((0, 100))
+            pen.closePath()
+        layer.autoStartSegment(["A"])
+        points = [layer[name].contours[0].points[0] for name in "AB"]
+        self.assertEqual(
+            [(point.x, point.y) for point in points],
+            [(0, 0), (100, 100)]
+        )
+        layer.autoStartSegment()
+        points = [layer[name].contours[0].points[0] for name in "AB"]
+        self.assertEqual(
+            [(point.x, point.y) for point in points],
+            [(0, 0), (0, 0)]
+        )
+
+    def test_measureContours(self):
+        layer, unrequested = self.getLayer_glyphs()
+        pen = layer["A"].getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((100, 0))
+        pen.lineTo((100, 100))
+        pen.lineTo((0, 100))
+        pen.closePath()
+        measurements = layer.measureContours()
+        self.assertEqual(
+            sorted(measurements.keys()),
+            ["A", "B", "C", "D"]
+        )
+        self.assertEqual(
+            [m["area"] for m in measurements["A"]],
+            [10000]
+        )
+        self.assertEqual(
+            measurements["B"],
+            []
+        )
+        measurements = layer.measureContours(["A"])
+        self.assertEqual(
+            list(measurements.keys()),
+            ["A"]
+        )
+
+    def test_rasterize(self):
+        layer, unrequested = self.getLayer_glyphs()
+        pen = layer["A"].getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 100))
+        pen.lineTo((200, 100))
+        pen.lineTo((200, 0))
+        pen.closePath()
+        layer["B"].appendComponent("A", offset=(100, 100))
+        bitmaps = layer.rasterize((4, 4), (0.01, 0, 0, 0.01, 0, 0), antialias=False)
+        self.assertEqual(
+            sorted(bitmaps.keys()),
+            ["A", "B", "C", "D"]
+        )
+        self.assertEqual(
+            bitmaps["A"],
+            [[0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [1, 1, 0, 0]]
+        )
+        self.assertEqual(
+            bitmaps["B"],
+            [[0, 0, 0, 0], [0, 0, 0, 0], [0, 1, 1, 0], [0, 0, 0, 0]]
+        )
+        self.assertEqual(
+            bitmaps["C"],
+            [[0, 0, 0, 0]] * 4
+        )
+        bitmaps = layer.rasterize((4, 4), (0.01, 0, 0, 0.01, 0, 0), glyphNames=["A"])
+        self.assertEqual(
+            list(bitmaps.keys()),
+            ["A"]
+        )
+
+    def test_autoUnicodes(self):
+        layer, unrequested = self.getLayer_glyphs()
+        layer.newGlyph("A.sc")
+        layer.newGlyph("f_f").unicodes = [0xFB00]
+        layer["B"].unicodes = [0x41]
+        layer.autoUnicodes(overrides={"A.sc": ["1D00"]})
+        self.assertEqual(
+            [tuple(layer[name].unicodes) for name in ("A", "B", "A.sc", "f_f")],
+            [(0x41,), (0x42,), (0x1D00,), (0xFB00,)]
+        )
+        with self.assertRaises(FontPartsError):
+            layer.autoUnicodes(overrides={"A.sc": "1D00"})
+
+    # ---------------
+    # Component Graph
+    # ---------------
+
+    def getLayer_composites(self):
+        layer, unrequested = self.getLayer_glyphs()
+        layer["B"].appendComponent("A")
+        layer["C"].appendComponent("B")
+        layer["C"].appendComponent("D")
+        return layer, unrequested
+
+    def test_getComponentGraph(self):
+        layer, unrequested = self.getLayer_composites()
+        graph = layer.getComponentGraph()
+        self.assertEqual(
+            graph.getBaseGlyphs("C"),
+            ("B", "D")
+        )
+        self.assertEqual(
+            graph.getAllComposites("A"),
+            ("B", "C")
+        )
+        self.assertEqual(
+            graph.getAllBaseGlyphs("C"),
+            ("A", "B", "D")
+        )
+        self.assertEqual(
+            graph.getTopologicalOrder(),
+            ["A", "B", "D", "C"]
+        )
+        self.assertEqual(
+            graph.getCycles(),
+            []
+        )
+
+    def test_getComponentGraph_changed(self):
+        layer, unrequested = self.getLayer_composites()
+        layer.getComponentGraph()
+        layer["B"].clearComponents()
+        layer["A"].appendComponent("D")
+        layer.removeGlyph("C")
+        graph = layer.getComponentGraph()
+        self.assertEqual(
+            graph.getAllComposites("D"),
+            ("A",)
+        )
+        self.assertEqual(
+            graph.getComposites("A"),
+            ()
+        )
+        self.assertEqual(
+            graph.getTopologicalOrder(),
+            ["B", "D", "A"]
+        )
+
+    def test_getReverseComponentMapping(self):
+        layer, unrequested = self.getLayer_composites()
+        self.assertEqual(
+            layer.getReverseComponentMapping(),
+            {"A": ("B",), "B": ("C",), "D": ("C",)}
+        )
+
+    # -------------
+    # Character Map
+    # -------------
+
+    def getLayer_unicodes(self):
+        layer, unrequested = self.getLayer_glyphs()
+        layer["A"].unicodes = [0x41]
+        layer["B"].unicodes = [0x42, 0x410]
+        layer["C"].unicodes = [0x41]
+        return layer, unrequested
+
+    def test_getCharacterMap(self):
+        layer, unrequested = self.getLayer_unicodes()
+        characterMap = layer.getCharacterMap()
+        self.assertEqual(
+            characterMap.getGlyphNamesForText("ABx"),
+            ["A", "B", None]
+        )
+        self.assertEqual(
+            characterMap.getUnicodes("B"),
+            (0x42, 0x410)
+        )
+        self.assertEqual(
+            characterMap.getDuplicates(),
+            {0x41: ("A", "C")}
+        )
+        self.assertEqual(
+            characterMap.getUnicodesInRange(0x40, 0x100),
+            (0x41, 0x42)
+        )
+        self.assertEqual(
+            characterMap.getBlocks(),
+            {"Basic Latin": (0x41, 0x42), "Cyrillic": (0x410,)}
+        )
+
+    def test_getCharacterMap_changed(self):
+        layer, unrequested = self.getLayer_unicodes()
+        layer.getCharacterMap()
+        layer["A"].unicodes = [0x61]
+        layer["D"].unicode = 0x41
+        layer.removeGlyph("C")
+        characterMap = layer.getCharacterMap()
+        self.assertEqual(
+            characterMap.getGlyphNamesForText("Aa"),
+            ["D", "A"]
+        )
+        self.assertEqual(
+            characterMap.getDuplicates(),
+            {}
+        )
+
+    def test_getCharacterMapping(self):
+        layer, unrequested = self.getLayer_unicodes()
+        self.assertEqual(
+            layer.getCharacterMapping(),
+            {0x41: ("A", "C"), 0x42: ("B",), 0x410: ("B",)}
+        )
+
+    # -------
+    # Metrics
+    # -------
+
+    def getLayer_metrics(self):
+        layer, unrequested = self.getLayer_composites()
+        glyph = layer["A"]
+        glyph.width = 500
+        glyph.height = 700
+        pen = glyph.getPen()
+        pen.moveTo((50, 0))
+        pen.lineTo((50, 600))
+        pen.lineTo((400, 600))
+        pen.closePath()
+        layer["B"].width = 600
+        layer["B"].components[0].offset = (100, 10)
+        return layer, unrequested
+
+    def test_getMetrics(self):
+        layer, unrequested = self.getLayer_metrics()
+        metrics = layer.getMetrics()
+        self.assertEqual(
+            metrics["glyphNames"],
+            ["A", "B", "C", "D"]
+        )
+        for key in ("width", "height", "leftMargin", "rightMargin", "bottomMargin", "topMargin", "bounds"):
+            self.assertEqual(
+                metrics[key],
+                [getattr(layer[glyphName], key) for glyphName in metrics["glyphNames"]]
+            )
+        self.assertEqual(
+            layer.getMetrics(["D", "B"])["leftMargin"],
+            [0, 150]
+        )
+
+    def test_setMetrics(self):
+        layer, unrequested = self.getLayer_metrics()
+        metrics = layer.getMetrics(["A", "B", "D"])
+        metrics["leftMargin"] = [70, None, 10]
+        metrics["rightMargin"] = [30, 40, None]
+        metrics["topMargin"] = [None, 50, None]
+        layer.setMetrics(metrics)
+        glyph = layer["A"]
+        self.assertEqual(
+            (glyph.leftMargin, glyph.rightMargin, glyph.width, glyph.bounds),
+            (70, 30, 450, (70, 0, 420, 600))
+        )
+        # the component follows the changed base glyph
+        glyph = layer["B"]
+        self.assertEqual(
+            (glyph.leftMargin, glyph.rightMargin, glyph.width, glyph.topMargin, glyph.height),
+            (170, 40, 560, 50, 660)
+        )
+        glyph = layer["D"]
+        self.assertEqual(
+            (glyph.leftMargin, glyph.width),
+            (0, 10)
+        )
+
+    def test_setMetrics_invalid(self):
+        layer, unrequested = self.getLayer_metrics()
+        with self.assertRaises(FontPartsError):
+            layer.setMetrics(dict(width=[100]))
+        with self.assertRaises(FontPartsError):
+            layer.setMetrics(dict(glyphNames=["A", "B"], width=[100]))
+        with self.assertRaises(FontPartsError):
+            layer.setMetrics(dict(glyphNames=["A"], depth=[100]))
+        with self.assertRaises(FontPartsError):
+            layer.setMetrics(dict(glyphNames=["X"], width=[100]))
+
+    # ------------
+    # Fingerprints
+    # ------------
+
+    def test_findDuplicateGlyphs(self):
+        layer, unrequested = self.getLayer_glyphs()
+        for glyphName in "ABC":
+            layer[glyphName].appendAnchor("top", (100, 200))
+        layer["C"].width = 100
+        self.assertEqual(
+            layer.findDuplicateGlyphs(),
+            [("A", "B")]
+        )
+        layer["A"].lib["key"] = "value"
+        self.assertEqual(
+            layer.findDuplicateGlyphs(lib=True),
+            []
+        )
+
+    def test_findIdenticalGlyphs(self):
+        layer, unrequested = self.getLayer_glyphs()
+        other, unrequested = self.getLayer_glyphs()
+        other.newGlyph("E")
+        other["A"].width = 100
+        other["B"].appendComponent("A")
+        self.assertEqual(
+            layer.findIdenticalGlyphs(other),
+            ["C", "D"]
+        )
+        with self.assertRaises(FontPartsError):
+            layer.findIdenticalGlyphs("layer")
@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+import unittest
+from fontParts.base import FontPartsError
+from fontParts.world import OpenFonts, saveAll, dispatcher
+
+
+class TestWorld(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def getFonts_saved(self, count):
+        fonts = []
+        for index in range(count):
+            font, unrequested = self.objectGenerator("font")
+            font.info.familyName = "Font %d" % index
+            font.save(os.path.join(self.directory, "font%d.ufo" % index))
+            fonts.append(font)
+        return fonts
+
+    # ---------
+    # OpenFonts
+    # ---------
+
+    def test_OpenFonts(self):
+        fonts = self.getFonts_saved(3)
+        fontClass = fonts[0].__class__
+        paths = [font.path for font in fonts]
+        badPath = os.path.join(self.directory, "missing.ufo")
+        paths.insert(1, badPath)
+        # open the fonts with the environment being tested
+        previous = dispatcher._registry["OpenFont"]
+        def openFont(path, showInterface=True):
+            if not os.path.exists(path):
+                raise FontPartsError("No font located at %s." % path)
+            return fontClass(path, showInterface=showInterface)
+        dispatcher["OpenFont"] = openFont
+        try:
+            opened, errors = OpenFonts(paths, showInterface=False, workers=2)
+        finally:
+            dispatcher["OpenFont"] = previous
+        self.assertEqual(
+            [font is None for font in opened],
+            [False, True, False, False]
+        )
+        self.assertEqual(
+            [font.info.familyName for font in opened if font is not None],
+            ["Font 0", "Font 1", "Font 2"]
+        )
+        self.assertEqual(
+            [path for path, error in errors],
+            [badPath]
+        )
+        self.assertIsInstance(errors[0][1], FontPartsError)
+
+    # -------
+    # saveAll
+    # -------
+
+    def test_saveAll(self):
+        fonts = self.getFonts_saved(2)
+        unsaved, unrequested = self.objectGenerator("font")
+        fonts.insert(1, unsaved)
+        for font in fonts:
+            font.info.styleName = "Saved"
+        errors = saveAll(fonts, workers=3)
+        self.assertEqual(
+            [font for font, error in errors],
+            [unsaved]
+        )
+        self.assertIsInstance(errors[0][1], FontPartsError)
+        for font in (fonts[0], fonts[2]):
+            reopened = font.__class__(font.path)
+            self.assertEqual(
+                reopened.info.styleName,
+                "Saved"
+            )
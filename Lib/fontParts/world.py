@@ -1,3 +1,10 @@
+import threading
+try:
+    from queue import Queue, Empty
+except ImportError:
+    from Queue import Queue, Empty
+
+
 def OpenFont(path, showInterface=True):
     """
     Open font located at **path**. If **showInterface**
@@ -81,6 +88,104 @@ def AllFonts():
     """
     return dispatcher["AllFonts"]()
 
+def OpenFonts(paths, showInterface=True, workers=None):
+    """
+    Open the fonts located at **paths**. The fonts are
+    opened concurrently, with no more than **workers** fonts
+    being opened at the same time. If **workers** is ``None``,
+    a default number of workers will be used. **showInterface**
+    is passed to :func:`OpenFont`.
+
+    This returns a tuple of ``(fonts, errors)``. ``fonts`` is a
+    list of the opened fonts, in the order of **paths**. If a
+    font could not be opened, ``None`` will be in its place
+    in ``fonts`` and ``errors`` will contain a ``(path, error)``
+    tuple for it.
+
+    ::
+
+        from fontParts.world import *
+
+        fonts, errors = OpenFonts(paths, showInterface=False, workers=8)
+        for path, error in errors:
+            print(path, error)
+    """
+    paths = list(paths)
+    func = dispatcher["OpenFont"]
+    def openFont(path):
+        return func(path=path, showInterface=showInterface)
+    results = _runConcurrently(openFont, paths, workers)
+    fonts = []
+    errors = []
+    for path, (font, error) in zip(paths, results):
+        fonts.append(font)
+        if error is not None:
+            errors.append((path, error))
+    return fonts, errors
+
+def saveAll(fonts, workers=None):
+    """
+    Save all **fonts** to their current paths. The fonts are
+    saved concurrently, with no more than **workers** fonts
+    being saved at the same time. If **workers** is ``None``,
+    a default number of workers will be used.
+
+    This returns a list of ``(font, error)`` tuples for
+    the fonts that could not be saved.
+
+    ::
+
+        from fontParts.world import *
+
+        errors = saveAll(fonts, workers=8)
+        for font, error in errors:
+            print(font.path, error)
+    """
+    fonts = list(fonts)
+    def saveFont(font):
+        font.save()
+    results = _runConcurrently(saveFont, fonts, workers)
+    errors = []
+    for font, (result, error) in zip(fonts, results):
+        if error is not None:
+            errors.append((font, error))
+    return errors
+
+_defaultWorkers = 4
+
+def _runConcurrently(func, items, workers=None):
+    """
+    Call **func** with each of **items** in a pool of
+    threads. This returns a list of ``(result, error)``
+    tuples in the order of **items**.
+    """
+    if workers is None:
+        workers = _defaultWorkers
+    workers = max(1, min(int(workers), len(items)))
+    results = [(None, None)] * len(items)
+    queue = Queue()
+    for index, item in enumerate(items):
+        queue.put((index, item))
+    def work():
+        while True:
+            try:
+                index, item = queue.get_nowait()
+            except Empty:
+                return
+            try:
+                results[index] = (func(item), None)
+            except Exception as error:
+                results[index] = (None, error)
+    if workers == 1:
+        work()
+        return results
+    threads = [threading.Thread(target=work) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
 def RFont(path=None, showInterface=True):
     return dispatcher["RFont"](path=path, showInterface=showInterface)
 
@@ -9,6 +9,8 @@ setup(
         'fontParts',
         'fontParts.base',
         'fontParts.nonelab',
+        'fontParts.binarylab',
+        'fontParts.sqlitelab',
         'fontParts.test'
     ],
     url='http://github.com/robofab-developers/fontParts',